@@ -4,19 +4,38 @@
 Experimental Features Lab for PsychSync
 A/B testing framework, gamification engine, and feature flags.
 
+Experiment and gamification state lives in a pluggable store. The in-memory
+stores (the default) are per-process; pass the Redis stores to share state
+across workers and restarts:
+
+    from app.core.cache import redis_client
+    ab_framework = ABTestingFramework(store=RedisExperimentStore(redis_client))
+    gamification = GamificationEngine(store=RedisGamificationStore(redis_client))
+
 Requirements:
     pip install pydantic
+    pip install redis  # for the Redis stores
 """
 
 import random
 import hashlib
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+import heapq
+import math
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import json
 
 
+def _text(value: Any) -> Optional[str]:
+    """Redis replies as str whether or not the client decodes responses"""
+    if value is None:
+        return None
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
 # ============================================================================
 # A/B Testing Framework
 # ============================================================================
@@ -54,6 +73,13 @@ class ABTest:
         data['start_date'] = self.start_date.isoformat()
         data['end_date'] = self.end_date.isoformat() if self.end_date else None
         return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ABTest':
+        data = dict(data)
+        data['start_date'] = datetime.fromisoformat(data['start_date'])
+        data['end_date'] = datetime.fromisoformat(data['end_date']) if data.get('end_date') else None
+        return cls(**data)
 
 
 @dataclass
@@ -70,15 +96,238 @@ class ABTestAssignment:
         return data
 
 
+# Standardized effect size the mSPRT mixing distribution is scaled to
+MSPRT_EFFECT_SIZE = 0.1
+
+
+@dataclass
+class RunningStats:
+    """Streaming count, mean and sum of squared deviations (Welford)."""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+    
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """Combined statistics of two disjoint samples (Chan et al.)"""
+        count = self.count + other.count
+        if count == 0:
+            return RunningStats()
+        delta = other.mean - self.mean
+        return RunningStats(
+            count=count,
+            mean=self.mean + delta * other.count / count,
+            m2=self.m2 + other.m2 + delta * delta * self.count * other.count / count
+        )
+    
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+
+def _normal_cdf(x: float) -> float:
+    return 0.5 * (1 + math.erf(x / math.sqrt(2)))
+
+
+def _normal_ppf(p: float) -> float:
+    """Inverse normal CDF by bisection; only used for a handful of quantiles"""
+    low, high = -10.0, 10.0
+    for _ in range(80):
+        mid = (low + high) / 2
+        if _normal_cdf(mid) < p:
+            low = mid
+        else:
+            high = mid
+    return (low + high) / 2
+
+
+def _msprt(difference: float, variance: float, tau_squared: float, alpha: float) -> Tuple[float, float]:
+    """
+    Mixture SPRT for a difference in means with a N(0, tau²) mixing prior.
+    
+    Returns the instantaneous always-valid p-value and the half-width of
+    the (1 - alpha) confidence sequence; both stay valid however often the
+    test is checked.
+    """
+    total = variance + tau_squared
+    log_likelihood_ratio = (
+        0.5 * math.log(variance / total)
+        + difference * difference * tau_squared / (2 * variance * total)
+    )
+    p_value = math.exp(-log_likelihood_ratio) if log_likelihood_ratio > 0 else 1.0
+    half_width = math.sqrt(variance * total / tau_squared * (math.log(total / variance) - 2 * math.log(alpha)))
+    return p_value, half_width
+
+
+class InMemoryExperimentStore:
+    """
+    Per-process experiment storage.
+    
+    Assignments are kept as variant indexes, alongside running per-variant
+    counts so statistics never scan the assignments.
+    """
+    
+    def __init__(self):
+        self.tests: Dict[str, ABTest] = {}
+        self.assignments: Dict[str, Dict[str, int]] = {}
+        self.counts: Dict[str, Dict[int, int]] = {}
+        self.metrics: Dict[Tuple[str, str], Dict[int, RunningStats]] = {}
+        self.sequential_p: Dict[Tuple[str, str], Dict[int, float]] = {}
+        self._lock = threading.Lock()
+    
+    def save_test(self, test: ABTest):
+        self.tests[test.test_id] = test
+    
+    def get_test(self, test_id: str) -> Optional[ABTest]:
+        return self.tests.get(test_id)
+    
+    def get_assignment(self, test_id: str, user_id: str) -> Optional[int]:
+        return self.assignments.get(test_id, {}).get(user_id)
+    
+    def record_assignment(self, test_id: str, user_id: str, variant_index: int) -> int:
+        """Store an assignment unless one exists; returns the stored index"""
+        with self._lock:
+            assignments = self.assignments.setdefault(test_id, {})
+            if user_id in assignments:
+                return assignments[user_id]
+            assignments[user_id] = variant_index
+            counts = self.counts.setdefault(test_id, {})
+            counts[variant_index] = counts.get(variant_index, 0) + 1
+            return variant_index
+    
+    def variant_counts(self, test_id: str) -> Dict[int, int]:
+        return dict(self.counts.get(test_id, {}))
+    
+    def add_observation(self, test_id: str, metric: str, variant_index: int, value: float):
+        with self._lock:
+            stats = self.metrics.setdefault((test_id, metric), {})
+            stats.setdefault(variant_index, RunningStats()).add(value)
+    
+    def metric_stats(self, test_id: str, metric: str) -> Dict[int, RunningStats]:
+        with self._lock:
+            return {i: RunningStats(**asdict(s)) for i, s in self.metrics.get((test_id, metric), {}).items()}
+    
+    def update_sequential_p(self, test_id: str, metric: str, variant_index: int, p_value: float) -> float:
+        """Keep the running minimum p-value; returns it"""
+        with self._lock:
+            values = self.sequential_p.setdefault((test_id, metric), {})
+            values[variant_index] = min(values.get(variant_index, 1.0), p_value)
+            return values[variant_index]
+
+
+class RedisExperimentStore:
+    """
+    Experiment storage shared by all workers through Redis.
+    
+    Keys per test: {prefix}:{test_id} holds the test as JSON,
+    {prefix}:{test_id}:assignments maps user -> variant index, and
+    {prefix}:{test_id}:counts maps variant index -> participants. Recording
+    an assignment and counting it happen in one Lua script, so concurrent
+    workers never double count a user.
+    """
+    
+    RECORD_ASSIGNMENT = """
+        local existing = redis.call('HGET', KEYS[1], ARGV[1])
+        if existing then
+            return tonumber(existing)
+        end
+        redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+        redis.call('HINCRBY', KEYS[2], ARGV[2], 1)
+        return tonumber(ARGV[2])
+    """
+    
+    ADD_OBSERVATION = """
+        local count = tonumber(redis.call('HGET', KEYS[1], ARGV[1] .. ':count') or '0') + 1
+        local mean = tonumber(redis.call('HGET', KEYS[1], ARGV[1] .. ':mean') or '0')
+        local m2 = tonumber(redis.call('HGET', KEYS[1], ARGV[1] .. ':m2') or '0')
+        local value = tonumber(ARGV[2])
+        local delta = value - mean
+        mean = mean + delta / count
+        m2 = m2 + delta * (value - mean)
+        redis.call('HSET', KEYS[1],
+            ARGV[1] .. ':count', count,
+            ARGV[1] .. ':mean', string.format('%.17g', mean),
+            ARGV[1] .. ':m2', string.format('%.17g', m2))
+        return count
+    """
+    
+    UPDATE_SEQUENTIAL_P = """
+        local current = tonumber(redis.call('HGET', KEYS[1], ARGV[1]) or '1')
+        if tonumber(ARGV[2]) < current then
+            redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+            return ARGV[2]
+        end
+        return tostring(current)
+    """
+    
+    def __init__(self, client, prefix: str = "experiments:ab"):
+        self.client = client
+        self.prefix = prefix
+        self._record_assignment = client.register_script(self.RECORD_ASSIGNMENT)
+        self._add_observation = client.register_script(self.ADD_OBSERVATION)
+        self._update_sequential_p = client.register_script(self.UPDATE_SEQUENTIAL_P)
+    
+    def _key(self, test_id: str, suffix: str = "") -> str:
+        return f"{self.prefix}:{test_id}{':' + suffix if suffix else ''}"
+    
+    def save_test(self, test: ABTest):
+        self.client.set(self._key(test.test_id), json.dumps(test.to_dict()))
+    
+    def get_test(self, test_id: str) -> Optional[ABTest]:
+        data = _text(self.client.get(self._key(test_id)))
+        return ABTest.from_dict(json.loads(data)) if data else None
+    
+    def get_assignment(self, test_id: str, user_id: str) -> Optional[int]:
+        value = _text(self.client.hget(self._key(test_id, "assignments"), user_id))
+        return int(value) if value is not None else None
+    
+    def record_assignment(self, test_id: str, user_id: str, variant_index: int) -> int:
+        return int(self._record_assignment(
+            keys=[self._key(test_id, "assignments"), self._key(test_id, "counts")],
+            args=[user_id, variant_index]
+        ))
+    
+    def variant_counts(self, test_id: str) -> Dict[int, int]:
+        counts = self.client.hgetall(self._key(test_id, "counts"))
+        return {int(_text(index)): int(_text(count)) for index, count in counts.items()}
+    
+    def add_observation(self, test_id: str, metric: str, variant_index: int, value: float):
+        self._add_observation(keys=[self._key(test_id, f"metric:{metric}")], args=[variant_index, repr(float(value))])
+    
+    def metric_stats(self, test_id: str, metric: str) -> Dict[int, RunningStats]:
+        fields = {_text(k): _text(v) for k, v in self.client.hgetall(self._key(test_id, f"metric:{metric}")).items()}
+        stats: Dict[int, RunningStats] = {}
+        for field, value in fields.items():
+            index, name = field.split(":")
+            entry = stats.setdefault(int(index), RunningStats())
+            setattr(entry, name, int(value) if name == "count" else float(value))
+        return stats
+    
+    def update_sequential_p(self, test_id: str, metric: str, variant_index: int, p_value: float) -> float:
+        return float(_text(self._update_sequential_p(
+            keys=[self._key(test_id, f"sequential_p:{metric}")],
+            args=[variant_index, repr(float(p_value))]
+        )))
+
+
 class ABTestingFramework:
     """
     Framework for managing A/B tests and feature experiments.
     """
     
-    def __init__(self):
-        """Initialize A/B testing framework."""
-        self.active_tests: Dict[str, ABTest] = {}
-        self.assignments: Dict[str, Dict[str, ABTestAssignment]] = {}
+    def __init__(self, store=None):
+        """
+        Initialize A/B testing framework.
+        
+        Args:
+            store: Experiment store (defaults to an InMemoryExperimentStore)
+        """
+        self.store = store or InMemoryExperimentStore()
     
     def create_test(
         self,
@@ -117,11 +366,16 @@ class ABTestingFramework:
             is_active=True
         )
         
-        self.active_tests[test_id] = test
-        self.assignments[test_id] = {}
+        self.store.save_test(test)
         
         return test
     
+    def _get_test(self, test_id: str) -> ABTest:
+        test = self.store.get_test(test_id)
+        if test is None:
+            raise ValueError(f"Test {test_id} does not exist")
+        return test
+    
     def assign_variant(
         self,
         user_id: str,
@@ -140,20 +394,18 @@ class ABTestingFramework:
         Returns:
             Assigned variant name
         """
-        if test_id not in self.active_tests:
-            raise ValueError(f"Test {test_id} does not exist")
-        
-        test = self.active_tests[test_id]
+        test = self._get_test(test_id)
         
         # Check if already assigned
-        if test_id in self.assignments and user_id in self.assignments[test_id]:
-            return self.assignments[test_id][user_id].variant
+        existing = self.store.get_assignment(test_id, user_id)
+        if existing is not None:
+            return test.variants[existing]
         
         # Force variant if specified
         if force_variant:
             if force_variant not in test.variants:
                 raise ValueError(f"Invalid variant: {force_variant}")
-            variant = force_variant
+            variant_index = test.variants.index(force_variant)
         else:
             # Consistent hashing for deterministic assignment
             hash_input = f"{user_id}:{test_id}".encode()
@@ -162,49 +414,34 @@ class ABTestingFramework:
             
             # Determine variant based on allocation
             cumulative = 0.0
-            variant = test.variants[-1]  # Default to last
+            variant_index = len(test.variants) - 1  # Default to last
             
             for i, percentage in enumerate(test.allocation_percentages):
                 cumulative += percentage
                 if random_value < cumulative:
-                    variant = test.variants[i]
+                    variant_index = i
                     break
         
-        # Record assignment
-        assignment = ABTestAssignment(
-            user_id=user_id,
-            test_id=test_id,
-            variant=variant,
-            assigned_at=datetime.utcnow()
-        )
-        
-        if test_id not in self.assignments:
-            self.assignments[test_id] = {}
-        
-        self.assignments[test_id][user_id] = assignment
+        # Record assignment; a concurrent worker may have won the race
+        variant_index = self.store.record_assignment(test_id, user_id, variant_index)
         
-        return variant
+        return test.variants[variant_index]
     
     def get_variant(self, user_id: str, test_id: str) -> Optional[str]:
         """Get user's assigned variant if exists."""
-        if test_id in self.assignments and user_id in self.assignments[test_id]:
-            return self.assignments[test_id][user_id].variant
-        return None
+        test = self.store.get_test(test_id)
+        existing = self.store.get_assignment(test_id, user_id) if test else None
+        return test.variants[existing] if existing is not None else None
     
     def get_test_statistics(self, test_id: str) -> Dict:
         """Get statistics for a test."""
-        if test_id not in self.active_tests:
-            raise ValueError(f"Test {test_id} does not exist")
-        
-        test = self.active_tests[test_id]
-        assignments = self.assignments.get(test_id, {})
+        test = self._get_test(test_id)
+        counts = self.store.variant_counts(test_id)
         
         # Count assignments per variant
-        variant_counts = {variant: 0 for variant in test.variants}
-        for assignment in assignments.values():
-            variant_counts[assignment.variant] += 1
+        variant_counts = {variant: counts.get(i, 0) for i, variant in enumerate(test.variants)}
         
-        total_assignments = len(assignments)
+        total_assignments = sum(variant_counts.values())
         
         # Calculate actual allocation percentages
         actual_percentages = {
@@ -225,11 +462,128 @@ class ABTestingFramework:
             }
         }
     
+    def record_metric(self, user_id: str, test_id: str, value: float = 1.0, metric: str = "conversion"):
+        """
+        Record a metric observation for an assigned user.
+        
+        Updates the variant's running mean and variance in O(1). Record at
+        most one value per user and metric (e.g. 1 on conversion, or the
+        user's revenue); participants without a value count as 0 in
+        per-participant results.
+        
+        Args:
+            user_id: User identifier
+            test_id: Test identifier
+            value: Observed value
+            metric: Metric name
+        """
+        variant_index = self.store.get_assignment(test_id, user_id)
+        if variant_index is None:
+            raise ValueError(f"User {user_id} is not assigned in test {test_id}")
+        self.store.add_observation(test_id, metric, variant_index, value)
+    
+    def get_experiment_results(
+        self,
+        test_id: str,
+        metric: str = "conversion",
+        alpha: float = 0.05,
+        per_participant: bool = True
+    ) -> Dict:
+        """
+        Lift and confidence of every variant against the control (the first
+        variant), computed from running statistics in O(variants).
+        
+        Alongside the fixed-horizon z-test, a mixture sequential probability
+        ratio test (mSPRT) gives an always-valid p-value and confidence
+        sequence, so results may be checked continuously and a variant called
+        as soon as its sequential p-value drops below alpha.
+        
+        Args:
+            test_id: Test identifier
+            metric: Metric name
+            alpha: Significance level
+            per_participant: Average over all participants, counting those
+                without an observation as 0 (conversion rate, revenue per
+                user); otherwise average over observations only
+            
+        Returns:
+            Dictionary with per-variant summaries and comparisons to control
+        """
+        test = self._get_test(test_id)
+        participants = self.store.variant_counts(test_id)
+        observed = self.store.metric_stats(test_id, metric)
+        
+        summaries = []
+        for i in range(len(test.variants)):
+            stats = observed.get(i, RunningStats())
+            if per_participant:
+                missing = max(participants.get(i, 0) - stats.count, 0)
+                stats = stats.merge(RunningStats(count=missing))
+            summaries.append(stats)
+        
+        control = summaries[0]
+        z_critical = _normal_ppf(1 - alpha / 2)
+        comparisons = {}
+        for i, variant in enumerate(test.variants[1:], 1):
+            stats = summaries[i]
+            comparison = {
+                'lift': None,
+                'relative_lift': None,
+                'std_error': None,
+                'confidence_interval': None,
+                'p_value': None,
+                'sequential_p_value': None,
+                'confidence_sequence': None,
+                'significant': False
+            }
+            comparisons[variant] = comparison
+            if control.count < 2 or stats.count < 2:
+                continue
+            
+            lift = stats.mean - control.mean
+            variance = control.variance / control.count + stats.variance / stats.count
+            comparison['lift'] = lift
+            comparison['relative_lift'] = lift / control.mean if control.mean else None
+            if variance <= 0:
+                continue
+            
+            std_error = math.sqrt(variance)
+            comparison['std_error'] = std_error
+            comparison['confidence_interval'] = [lift - z_critical * std_error, lift + z_critical * std_error]
+            comparison['p_value'] = 2 * (1 - _normal_cdf(abs(lift) / std_error))
+            
+            pooled_variance = control.merge(stats).variance
+            tau_squared = MSPRT_EFFECT_SIZE ** 2 * pooled_variance
+            p_value, half_width = _msprt(lift, variance, tau_squared, alpha)
+            sequential_p = self.store.update_sequential_p(test_id, metric, i, p_value)
+            comparison['sequential_p_value'] = sequential_p
+            comparison['confidence_sequence'] = [lift - half_width, lift + half_width]
+            comparison['significant'] = sequential_p < alpha
+        
+        return {
+            'test_id': test_id,
+            'metric': metric,
+            'alpha': alpha,
+            'control': test.variants[0],
+            'variants': {
+                variant: {
+                    'participants': participants.get(i, 0),
+                    'observations': observed.get(i, RunningStats()).count,
+                    'mean': summaries[i].mean,
+                    'std': math.sqrt(summaries[i].variance)
+                }
+                for i, variant in enumerate(test.variants)
+            },
+            'comparisons': comparisons
+        }
+    
     def end_test(self, test_id: str):
         """End an active test."""
-        if test_id in self.active_tests:
-            self.active_tests[test_id].is_active = False
-            self.active_tests[test_id].end_date = datetime.utcnow()
+        test = self.store.get_test(test_id)
+        if test is not None:
+            test.is_active = False
+            test.end_date = datetime.utcnow()
+            self.store.save_test(test)
 
 
 # ============================================================================
@@ -277,15 +631,215 @@ class UserProgress:
         return data
 
 
+POINTS_PER_LEVEL = 100
+
+
+def _level(total_points: int) -> int:
+    return total_points // POINTS_PER_LEVEL + 1
+
+
+def _epoch(moment: datetime) -> str:
+    """Naive UTC datetime as epoch seconds, the form stored in Redis"""
+    return repr(moment.replace(tzinfo=timezone.utc).timestamp())
+
+
+def _from_epoch(value: str) -> datetime:
+    return datetime.fromtimestamp(float(value), timezone.utc).replace(tzinfo=None)
+
+
+class InMemoryGamificationStore:
+    """
+    Per-process gamification storage.
+    
+    Every update holds one lock, so points, achievements and streaks are
+    updated atomically within the process.
+    """
+    
+    def __init__(self):
+        self.user_progress: Dict[str, UserProgress] = {}
+        self._lock = threading.Lock()
+    
+    def _ensure(self, user_id: str, now: datetime) -> UserProgress:
+        if user_id not in self.user_progress:
+            self.user_progress[user_id] = UserProgress(
+                user_id=user_id,
+                total_points=0,
+                level=1,
+                achievements_earned=[],
+                streak_days=0,
+                last_activity=now
+            )
+        return self.user_progress[user_id]
+    
+    def get_progress(self, user_id: str, now: datetime) -> UserProgress:
+        """Progress snapshot, creating an empty record on first use"""
+        with self._lock:
+            progress = self._ensure(user_id, now)
+            return UserProgress(**{**asdict(progress), 'achievements_earned': list(progress.achievements_earned)})
+    
+    def add_points(self, user_id: str, points: int, now: datetime) -> int:
+        """Add points and return the new total"""
+        with self._lock:
+            progress = self._ensure(user_id, now)
+            progress.total_points += points
+            progress.level = _level(progress.total_points)
+            progress.last_activity = now
+            return progress.total_points
+    
+    def add_achievement(self, user_id: str, achievement_id: str, points: int, now: datetime) -> Optional[int]:
+        """Record an achievement and its points; None if it was already earned"""
+        with self._lock:
+            progress = self._ensure(user_id, now)
+            if achievement_id in progress.achievements_earned:
+                return None
+            progress.achievements_earned.append(achievement_id)
+            progress.total_points += points
+            progress.level = _level(progress.total_points)
+            progress.last_activity = now
+            return progress.total_points
+    
+    def update_streak(self, user_id: str, now: datetime) -> Tuple[int, datetime]:
+        """Advance or reset the streak; returns (streak_days, last_activity)"""
+        with self._lock:
+            progress = self._ensure(user_id, now)
+            days_since = (now - progress.last_activity).days
+            if days_since == 1:
+                # Consecutive day, increment streak
+                progress.streak_days += 1
+                progress.last_activity = now
+            elif days_since != 0:
+                # Streak broken
+                progress.streak_days = 1
+                progress.last_activity = now
+            return progress.streak_days, progress.last_activity
+    
+    def top(self, limit: int) -> List[UserProgress]:
+        with self._lock:
+            return heapq.nlargest(limit, self.user_progress.values(), key=lambda x: x.total_points)
+
+
+class RedisGamificationStore:
+    """
+    Gamification storage shared by all workers through Redis.
+    
+    Points live in the {prefix}:leaderboard sorted set, so a top-N query is
+    O(log n + N); {prefix}:user:{user_id} holds streak_days and
+    last_activity (epoch seconds) and {prefix}:achievements:{user_id} the
+    earned achievements. Each update is a single atomic command or Lua
+    script.
+    """
+    
+    ADD_ACHIEVEMENT = """
+        if redis.call('SADD', KEYS[1], ARGV[1]) == 0 then
+            return false
+        end
+        local total = redis.call('ZINCRBY', KEYS[2], ARGV[2], ARGV[3])
+        redis.call('HSET', KEYS[3], 'last_activity', ARGV[4])
+        redis.call('HSETNX', KEYS[3], 'streak_days', 0)
+        return total
+    """
+    
+    UPDATE_STREAK = """
+        local last = redis.call('HGET', KEYS[1], 'last_activity') or ARGV[1]
+        local streak = tonumber(redis.call('HGET', KEYS[1], 'streak_days') or '0')
+        local days = math.floor((tonumber(ARGV[1]) - tonumber(last)) / 86400)
+        if days == 1 then
+            streak = streak + 1
+            last = ARGV[1]
+        elseif days ~= 0 then
+            streak = 1
+            last = ARGV[1]
+        end
+        redis.call('HSET', KEYS[1], 'streak_days', streak, 'last_activity', last)
+        redis.call('ZADD', KEYS[2], 'NX', 0, ARGV[2])
+        return {streak, last}
+    """
+    
+    def __init__(self, client, prefix: str = "gamification"):
+        self.client = client
+        self.prefix = prefix
+        self.leaderboard_key = f"{prefix}:leaderboard"
+        self._add_achievement = client.register_script(self.ADD_ACHIEVEMENT)
+        self._update_streak = client.register_script(self.UPDATE_STREAK)
+    
+    def _user_key(self, user_id: str) -> str:
+        return f"{self.prefix}:user:{user_id}"
+    
+    def _achievements_key(self, user_id: str) -> str:
+        return f"{self.prefix}:achievements:{user_id}"
+    
+    def _progress(self, user_id: str, score, fields: Dict, achievements) -> UserProgress:
+        fields = {_text(k): _text(v) for k, v in (fields or {}).items()}
+        total_points = int(float(score or 0))
+        return UserProgress(
+            user_id=user_id,
+            total_points=total_points,
+            level=_level(total_points),
+            achievements_earned=sorted(_text(a) for a in achievements or ()),
+            streak_days=int(fields.get('streak_days') or 0),
+            last_activity=_from_epoch(fields['last_activity'])
+        )
+    
+    def get_progress(self, user_id: str, now: datetime) -> UserProgress:
+        pipe = self.client.pipeline()
+        pipe.zadd(self.leaderboard_key, {user_id: 0}, nx=True)
+        pipe.hsetnx(self._user_key(user_id), 'last_activity', _epoch(now))
+        pipe.hsetnx(self._user_key(user_id), 'streak_days', 0)
+        pipe.zscore(self.leaderboard_key, user_id)
+        pipe.hgetall(self._user_key(user_id))
+        pipe.smembers(self._achievements_key(user_id))
+        *_, score, fields, achievements = pipe.execute()
+        return self._progress(user_id, score, fields, achievements)
+    
+    def add_points(self, user_id: str, points: int, now: datetime) -> int:
+        pipe = self.client.pipeline()
+        pipe.zincrby(self.leaderboard_key, points, user_id)
+        pipe.hset(self._user_key(user_id), 'last_activity', _epoch(now))
+        pipe.hsetnx(self._user_key(user_id), 'streak_days', 0)
+        total, *_ = pipe.execute()
+        return int(float(total))
+    
+    def add_achievement(self, user_id: str, achievement_id: str, points: int, now: datetime) -> Optional[int]:
+        total = self._add_achievement(
+            keys=[self._achievements_key(user_id), self.leaderboard_key, self._user_key(user_id)],
+            args=[achievement_id, points, user_id, _epoch(now)]
+        )
+        return int(float(_text(total))) if total else None
+    
+    def update_streak(self, user_id: str, now: datetime) -> Tuple[int, datetime]:
+        streak, last_activity = self._update_streak(
+            keys=[self._user_key(user_id), self.leaderboard_key],
+            args=[_epoch(now), user_id]
+        )
+        return int(streak), _from_epoch(_text(last_activity))
+    
+    def top(self, limit: int) -> List[UserProgress]:
+        leaders = self.client.zrevrange(self.leaderboard_key, 0, limit - 1, withscores=True)
+        pipe = self.client.pipeline()
+        for member, _ in leaders:
+            pipe.hgetall(self._user_key(_text(member)))
+            pipe.smembers(self._achievements_key(_text(member)))
+        replies = pipe.execute()
+        return [
+            self._progress(_text(member), score, replies[2 * i], replies[2 * i + 1])
+            for i, (member, score) in enumerate(leaders)
+        ]
+
+
 class GamificationEngine:
     """
     Gamification system for increasing client engagement.
     """
     
-    def __init__(self):
-        """Initialize gamification engine."""
+    def __init__(self, store=None):
+        """
+        Initialize gamification engine.
+        
+        Args:
+            store: Progress store (defaults to an InMemoryGamificationStore)
+        """
         self.achievements: Dict[str, Achievement] = {}
-        self.user_progress: Dict[str, UserProgress] = {}
+        self.store = store or InMemoryGamificationStore()
         self._initialize_achievements()
     
     def _initialize_achievements(self):
@@ -354,16 +908,7 @@ class GamificationEngine:
     
     def get_user_progress(self, user_id: str) -> UserProgress:
         """Get or create user progress."""
-        if user_id not in self.user_progress:
-            self.user_progress[user_id] = UserProgress(
-                user_id=user_id,
-                total_points=0,
-                level=1,
-                achievements_earned=[],
-                streak_days=0,
-                last_activity=datetime.utcnow()
-            )
-        return self.user_progress[user_id]
+        return self.store.get_progress(user_id, datetime.utcnow())
     
     def award_points(self, user_id: str, points: int, reason: str) -> Dict:
         """
@@ -377,26 +922,17 @@ class GamificationEngine:
         Returns:
             Dictionary with updated progress
         """
-        progress = self.get_user_progress(user_id)
-        
-        old_points = progress.total_points
-        old_level = progress.level
-        
-        progress.total_points += points
-        progress.last_activity = datetime.utcnow()
+        total_points = self.store.add_points(user_id, points, datetime.utcnow())
         
-        # Calculate new level (100 points per level)
-        new_level = (progress.total_points // 100) + 1
-        progress.level = new_level
-        
-        level_up = new_level > old_level
+        level = _level(total_points)
+        level_up = level > _level(total_points - points)
         
         return {
             'user_id': user_id,
             'points_awarded': points,
             'reason': reason,
-            'total_points': progress.total_points,
-            'level': progress.level,
+            'total_points': total_points,
+            'level': level,
             'level_up': level_up,
             'timestamp': datetime.utcnow().isoformat()
         }
@@ -415,32 +951,26 @@ class GamificationEngine:
         if achievement_id not in self.achievements:
             raise ValueError(f"Achievement {achievement_id} does not exist")
         
-        progress = self.get_user_progress(user_id)
         achievement = self.achievements[achievement_id]
         
-        # Check if already unlocked
-        if achievement_id in progress.achievements_earned:
+        # Unlock achievement; the store refuses a second unlock atomically
+        total_points = self.store.add_achievement(user_id, achievement_id, achievement.points, datetime.utcnow())
+        if total_points is None:
             return {
                 'success': False,
                 'message': 'Achievement already unlocked'
             }
         
-        # Unlock achievement
-        progress.achievements_earned.append(achievement_id)
-        progress.total_points += achievement.points
-        progress.last_activity = datetime.utcnow()
-        
         # Check for level up
-        new_level = (progress.total_points // 100) + 1
-        level_up = new_level > progress.level
-        progress.level = new_level
+        level = _level(total_points)
+        level_up = level > _level(total_points - achievement.points)
         
         return {
             'success': True,
             'achievement': achievement.to_dict(),
             'points_awarded': achievement.points,
-            'total_points': progress.total_points,
-            'level': progress.level,
+            'total_points': total_points,
+            'level': level,
             'level_up': level_up,
             'timestamp': datetime.utcnow().isoformat()
         }
@@ -455,34 +985,16 @@ class GamificationEngine:
         Returns:
             Dictionary with streak information
         """
-        progress = self.get_user_progress(user_id)
-        
-        now = datetime.utcnow()
-        last_activity = progress.last_activity
-        
-        # Calculate days since last activity
-        days_since = (now - last_activity).days
+        streak_days, last_activity = self.store.update_streak(user_id, datetime.utcnow())
         
-        if days_since == 0:
-            # Same day, no change
-            pass
-        elif days_since == 1:
-            # Consecutive day, increment streak
-            progress.streak_days += 1
-            progress.last_activity = now
-            
-            # Check for streak achievements
-            if progress.streak_days == 7 and 'week_streak' not in progress.achievements_earned:
-                self.unlock_achievement(user_id, 'week_streak')
-        else:
-            # Streak broken
-            progress.streak_days = 1
-            progress.last_activity = now
+        # Check for streak achievements
+        if streak_days == 7:
+            self.unlock_achievement(user_id, 'week_streak')
         
         return {
             'user_id': user_id,
-            'streak_days': progress.streak_days,
-            'last_activity': progress.last_activity.isoformat()
+            'streak_days': streak_days,
+            'last_activity': last_activity.isoformat()
         }
     
     def get_leaderboard(self, limit: int = 10) -> List[Dict]:
@@ -495,14 +1007,8 @@ class GamificationEngine:
         Returns:
             List of user progress dictionaries
         """
-        sorted_users = sorted(
-            self.user_progress.values(),
-            key=lambda x: x.total_points,
-            reverse=True
-        )
-        
         leaderboard = []
-        for rank, progress in enumerate(sorted_users[:limit], 1):
+        for rank, progress in enumerate(self.store.top(limit), 1):
             leaderboard.append({
                 'rank': rank,
                 'user_id': progress.user_id,
@@ -6,6 +6,9 @@ Requirements:
     pip install pandas numpy scipy statsmodels
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import pandas as pd
 from scipy import stats
@@ -125,15 +128,16 @@ class LongitudinalAnalyzer:
         last_date = pd.to_datetime(data[date_column].iloc[-1])
         prediction_interval = (X[-1] - X[-2]) if len(X) > 1 else 1
         
+        # Confidence interval (simplified): same residual spread for every period
+        residuals = y - predict_fn(X)
+        std_error = np.std(residuals)
+        
         predicted_values = []
         for i in range(1, prediction_periods + 1):
             pred_x = X[-1] + (prediction_interval * i)
             pred_y = predict_fn(pred_x)
             pred_date = last_date + timedelta(days=int(prediction_interval * i))
             
-            # Calculate confidence interval (simplified)
-            residuals = y - np.array([predict_fn(x) for x in X])
-            std_error = np.std(residuals)
             ci_lower = pred_y - 1.96 * std_error
             ci_upper = pred_y + 1.96 * std_error
             
@@ -166,6 +170,155 @@ class LongitudinalAnalyzer:
             interpretation=interpretation
         )
     
+    def analyze_cohort_trajectories(
+        self,
+        data: pd.DataFrame,
+        client_column: str = 'client_id',
+        value_column: str = 'score',
+        date_column: str = 'date',
+        trajectory_type: str = 'auto',
+        prediction_periods: int = 4
+    ) -> pd.DataFrame:
+        """
+        Fit growth trajectories for many clients at once.
+        
+        Vectorized counterpart of analyze_trajectory for long-format data
+        (one row per client measurement). The frame is sorted and grouped
+        once; linear, quadratic and cubic fits for every client are solved
+        together from per-client normal equations built with np.bincount,
+        so the cost is a few passes over the rows rather than a Python
+        loop per client. Time is rescaled to [-1, 1] per client to keep the
+        cubic systems well conditioned.
+        
+        Args:
+            data: Long-format DataFrame with client, date and value columns
+            client_column: Column identifying the client
+            value_column: Column containing outcome values
+            date_column: Column containing dates
+            trajectory_type: 'linear', 'quadratic', 'cubic' or 'auto'
+            prediction_periods: Number of future periods to predict
+            
+        Returns:
+            DataFrame indexed by client with the GrowthTrajectory fields as
+            columns, plus n_observations, residual_std and, per period i,
+            prediction_date_i, predicted_value_i, ci_lower_i and ci_upper_i.
+            Clients with fewer than two measurements get
+            interpretation 'insufficient_data' and NaN statistics. Without
+            any complete rows the frame is empty but has the same columns.
+        """
+        degrees = {'linear': 1, 'quadratic': 2, 'cubic': 3}
+        if trajectory_type != 'auto' and trajectory_type not in degrees:
+            trajectory_type = 'linear'
+        candidates = list(degrees) if trajectory_type == 'auto' else [trajectory_type]
+        max_degree = max(degrees[name] for name in candidates)
+        
+        frame = data[[client_column, date_column, value_column]].dropna()
+        codes, clients = pd.factorize(frame[client_column], sort=True)
+        dates = pd.to_datetime(frame[date_column]).values
+        order = np.lexsort((dates, codes))
+        codes, dates = codes[order], dates[order]
+        y = frame[value_column].to_numpy(dtype=float)[order]
+        
+        n_clients = len(clients)
+        if n_clients == 0:
+            columns = [
+                'n_observations', 'trajectory_type', 'baseline_value', 'current_value', 'rate_of_change',
+                'model_fit', 'confidence', 'interpretation', 'residual_std'
+            ] + [
+                f'{field}_{i}'
+                for i in range(1, prediction_periods + 1)
+                for field in ('prediction_date', 'predicted_value', 'ci_lower', 'ci_upper')
+            ]
+            return pd.DataFrame(columns=columns, index=pd.Index([], name=client_column))
+        
+        counts = np.bincount(codes, minlength=n_clients)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        ends = starts + counts - 1
+        
+        # Days since each client's first measurement, rescaled to [-1, 1]
+        days = (dates - dates[starts][codes]) / np.timedelta64(1, 'D')
+        span = days[ends]
+        half_span = np.where(span > 0, span / 2, 1.0)
+        t = (days - (span / 2)[codes]) / half_span[codes]
+        
+        powers = np.vander(t, 2 * max_degree + 1, increasing=True)
+        moments = np.stack([np.bincount(codes, powers[:, k], n_clients) for k in range(2 * max_degree + 1)], axis=1)
+        cross = np.stack([np.bincount(codes, powers[:, k] * y, n_clients) for k in range(max_degree + 1)], axis=1)
+        y_mean = np.bincount(codes, y, n_clients) / np.maximum(counts, 1)
+        sst = np.bincount(codes, (y - y_mean[codes]) ** 2, n_clients)
+        
+        fits = {}
+        for name in candidates:
+            degree = degrees[name]
+            idx = np.arange(degree + 1)
+            normal = moments[:, idx[:, None] + idx[None, :]]
+            coeffs = (np.linalg.pinv(normal) @ cross[:, :degree + 1, None])[:, :, 0]
+            fitted = np.einsum('ij,ij->i', powers[:, :degree + 1], coeffs[codes])
+            residuals = y - fitted
+            sse = np.bincount(codes, residuals ** 2, n_clients)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                r_squared = np.where(sst > 0, 1 - sse / sst, 1.0)
+            # A fit needs a spare observation beyond its parameters (linear: two points)
+            eligible = counts >= (degree + 2 if degree > 1 else 2)
+            fits[name] = (coeffs, r_squared, eligible, np.sqrt(sse / np.maximum(counts, 1)))
+        
+        # Penalize complexity (AIC-like), as in _select_best_trajectory
+        penalties = {'linear': 0, 'quadratic': 0.02, 'cubic': 0.05}
+        adjusted = np.stack([
+            np.where(fits[name][2], fits[name][1] - penalties[name], -np.inf) for name in candidates
+        ], axis=1)
+        choice = np.argmax(adjusted, axis=1)
+        valid = counts >= 2
+        
+        def pick(position: int) -> np.ndarray:
+            return np.choose(choice, [fits[name][position] for name in candidates])
+        
+        r_squared = pick(1)
+        residual_std = pick(3)
+        coeffs = np.zeros((n_clients, max_degree + 1))
+        for j, name in enumerate(candidates):
+            rows = choice == j
+            coeffs[rows, :degrees[name] + 1] = fits[name][0][rows]
+        
+        def predict(x: np.ndarray) -> np.ndarray:
+            # x: (n_clients, k) days since each client's first measurement
+            scaled_x = (x - (span / 2)[:, None]) / half_span[:, None]
+            return np.polynomial.polynomial.polyval(scaled_x.T, coeffs.T, tensor=False).T
+        
+        last_day = span
+        interval = np.where(counts > 1, days[ends] - days[np.maximum(ends - 1, starts)], 1.0)
+        rate_of_change = (predict(np.stack([last_day + 1, last_day], axis=1)) @ np.array([1.0, -1.0]))
+        
+        interpretation = np.select(
+            [~valid, np.abs(rate_of_change) < 0.1, rate_of_change < -0.1],
+            ['insufficient_data', 'stable', 'improving'],  # Assuming lower scores are better
+            'declining'
+        )
+        
+        result = pd.DataFrame({
+            'n_observations': counts,
+            'trajectory_type': np.array(candidates, dtype=object)[choice],
+            'baseline_value': y[starts],
+            'current_value': y[ends],
+            'rate_of_change': np.where(valid, rate_of_change, np.nan),
+            'model_fit': np.where(valid, r_squared, np.nan),
+            'confidence': np.where(valid, r_squared, np.nan),
+            'interpretation': interpretation,
+            'residual_std': np.where(valid, residual_std, np.nan),
+        }, index=pd.Index(clients, name=client_column))
+        
+        periods = np.arange(1, prediction_periods + 1)
+        steps = interval[:, None] * periods[None, :]
+        predictions = np.where(valid[:, None], predict(last_day[:, None] + steps), np.nan)
+        last_dates = dates[ends].astype('datetime64[D]')
+        for i in range(prediction_periods):
+            result[f'prediction_date_{i + 1}'] = last_dates + steps[:, i].astype('timedelta64[D]')
+            result[f'predicted_value_{i + 1}'] = predictions[:, i]
+            result[f'ci_lower_{i + 1}'] = predictions[:, i] - 1.96 * result['residual_std'].to_numpy()
+            result[f'ci_upper_{i + 1}'] = predictions[:, i] + 1.96 * result['residual_std'].to_numpy()
+        
+        return result
+    
     def _fit_linear(self, X: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, float]:
         """Fit linear model and return coefficients and R²."""
         slope, intercept, r_value, p_value, std_err = stats.linregress(X, y)
@@ -342,8 +495,8 @@ class LongitudinalAnalyzer:
         Returns:
             InterventionEffect object
         """
-        # Ensure date column is datetime
-        data[date_column] = pd.to_datetime(data[date_column])
+        # Convert a copy of the dates; the caller's frame is left untouched
+        dates = pd.to_datetime(data[date_column])
         
         # Define windows
         pre_start = intervention_date - timedelta(days=pre_window_days)
@@ -351,13 +504,13 @@ class LongitudinalAnalyzer:
         
         # Extract data
         pre_data = data[
-            (data[date_column] >= pre_start) &
-            (data[date_column] < intervention_date)
+            (dates >= pre_start) &
+            (dates < intervention_date)
         ][value_column]
         
         post_data = data[
-            (data[date_column] >= intervention_date) &
-            (data[date_column] <= post_end)
+            (dates >= intervention_date) &
+            (dates <= post_end)
         ][value_column]
         
         if len(pre_data) < 3 or len(post_data) < 3:
@@ -417,6 +570,190 @@ class LongitudinalAnalyzer:
             interpretation=interpretation
         )
     
+    def analyze_cohort_interventions(
+        self,
+        data: pd.DataFrame,
+        interventions: pd.DataFrame,
+        client_column: str = 'client_id',
+        value_column: str = 'score',
+        date_column: str = 'date',
+        pre_window_days: int = 30,
+        post_window_days: int = 30,
+        resampling: Optional[str] = None,
+        n_resamples: int = 1000,
+        confidence_level: float = 0.95,
+        random_state: Optional[int] = None,
+        n_jobs: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Evaluate many interventions across many clients in one pass.
+        
+        Cohort counterpart of analyze_intervention_effectiveness. The scores
+        are sorted once by (client, date). Each intervention's pre and post
+        windows are then located with a single vectorized searchsorted over
+        that order, and window means and variances come from prefix sums,
+        so the t-tests and effect sizes for every intervention are computed
+        together.
+        
+        Args:
+            data: Long-format scores, one row per client measurement
+            interventions: One row per intervention with client_column,
+                'intervention_name' and 'start_date' columns
+            client_column: Column identifying the client in both frames
+            value_column: Column with scores
+            date_column: Column with dates
+            pre_window_days: Days before intervention to analyze
+            post_window_days: Days after intervention to analyze
+            resampling: None, 'bootstrap' (percentile confidence interval
+                of the change in means) or 'permutation' (permutation
+                p-value for the change in means)
+            n_resamples: Resamples per intervention
+            confidence_level: Bootstrap interval coverage
+            random_state: Seed; results are reproducible for a given seed
+                regardless of n_jobs
+            n_jobs: Worker processes for resampling (default: CPU count;
+                1 runs in-process)
+            
+        Returns:
+            DataFrame with one row per intervention (in input order) and the
+            InterventionEffect fields as columns, plus client_column,
+            n_before and n_after, and either ci_lower/ci_upper or
+            permutation_p_value when resampling is requested
+        """
+        if resampling not in (None, 'bootstrap', 'permutation'):
+            raise ValueError(f"Unknown resampling method: {resampling}")
+        
+        # Sort scores once by (client, time)
+        scores = data[[client_column, date_column, value_column]].dropna()
+        codes, clients = pd.factorize(scores[client_column])
+        seconds = pd.to_datetime(scores[date_column]).values.astype('datetime64[s]').astype(np.int64)
+        y = scores[value_column].to_numpy(dtype=float)
+        
+        starts = pd.to_datetime(interventions['start_date']).values.astype('datetime64[s]').astype(np.int64)
+        intervention_codes = clients.get_indexer(interventions[client_column])
+        n_interventions = len(interventions)
+        
+        # One sorted key for every (client, time) pair: client blocks are laid
+        # end to end, with room for the widest window on either side
+        pre_seconds = pre_window_days * 86400
+        post_seconds = post_window_days * 86400
+        origin = min(seconds.min(initial=0), starts.min(initial=0)) - pre_seconds
+        stride = max(seconds.max(initial=0), starts.max(initial=0)) + post_seconds - origin + 1
+        keys = codes.astype(np.int64) * stride + (seconds - origin)
+        order = np.argsort(keys, kind='stable')
+        keys, y = keys[order], y[order]
+        
+        known = intervention_codes >= 0
+        base = np.where(known, intervention_codes, 0).astype(np.int64) * stride - origin
+        pre_lo = np.searchsorted(keys, base + starts - pre_seconds, side='left')
+        split = np.searchsorted(keys, base + starts, side='left')
+        post_hi = np.searchsorted(keys, base + starts + post_seconds, side='right')
+        pre_lo = np.where(known, pre_lo, 0)
+        split = np.where(known, split, 0)
+        post_hi = np.where(known, post_hi, 0)
+        
+        # Window sums from prefix sums
+        total = np.concatenate(([0.0], np.cumsum(y)))
+        total_sq = np.concatenate(([0.0], np.cumsum(y ** 2)))
+        n_before = split - pre_lo
+        n_after = post_hi - split
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean_before = (total[split] - total[pre_lo]) / n_before
+            mean_after = (total[post_hi] - total[split]) / n_after
+            ss_before = np.maximum(total_sq[split] - total_sq[pre_lo] - n_before * mean_before ** 2, 0)
+            ss_after = np.maximum(total_sq[post_hi] - total_sq[split] - n_after * mean_after ** 2, 0)
+            var_before = ss_before / (n_before - 1)
+            var_after = ss_after / (n_after - 1)
+            
+            # Student's t-test with pooled variance, as stats.ttest_ind
+            dof = n_before + n_after - 2
+            pooled_var = (ss_before + ss_after) / dof
+            t_stat = (mean_before - mean_after) / np.sqrt(pooled_var * (1 / n_before + 1 / n_after))
+            p_value = 2 * stats.t.sf(np.abs(t_stat), dof)
+            
+            # Effect size (Cohen's d)
+            pooled_std = np.sqrt((var_before + var_after) / 2)
+            cohens_d = np.where(pooled_std > 0, (mean_before - mean_after) / pooled_std, 0.0)
+            change = mean_after - mean_before
+            percent_change = np.where(mean_before != 0, change / mean_before * 100, 0.0)
+        
+        sufficient = (n_before >= 3) & (n_after >= 3)
+        p_value = np.where(sufficient, np.nan_to_num(p_value, nan=1.0), 1.0)
+        
+        interpretation = np.select(
+            [
+                ~sufficient,
+                p_value >= 0.05,
+                cohens_d > 0.5,
+                cohens_d > 0.2,
+                cohens_d > 0,
+                cohens_d < -0.5,
+                cohens_d < -0.2,
+            ],
+            [
+                'insufficient_data',
+                'no_significant_effect',
+                'large_positive_effect',
+                'moderate_positive_effect',
+                'small_positive_effect',
+                'large_negative_effect',
+                'moderate_negative_effect',
+            ],
+            'small_negative_effect'
+        )
+        
+        def sufficient_only(values: np.ndarray) -> np.ndarray:
+            return np.where(sufficient, values, 0.0)
+        
+        result = pd.DataFrame({
+            client_column: interventions[client_column].to_numpy(),
+            'intervention_name': interventions['intervention_name'].to_numpy(),
+            'start_date': pd.to_datetime(interventions['start_date']).dt.strftime('%Y-%m-%d').to_numpy(),
+            'n_before': n_before,
+            'n_after': n_after,
+            'effect_size': sufficient_only(cohens_d),
+            'p_value': p_value,
+            'is_significant': sufficient & (p_value < 0.05),
+            'mean_before': sufficient_only(mean_before),
+            'mean_after': sufficient_only(mean_after),
+            'change': sufficient_only(change),
+            'percent_change': sufficient_only(percent_change),
+            'interpretation': interpretation,
+        }, index=interventions.index)
+        
+        if resampling is None:
+            return result
+        
+        # Resample in fixed-size chunks, each with its own child seed, so the
+        # output depends on random_state but not on n_jobs
+        eligible = np.flatnonzero(sufficient)
+        chunks = [eligible[i:i + INTERVENTION_RESAMPLE_CHUNK] for i in range(0, len(eligible), INTERVENTION_RESAMPLE_CHUNK)]
+        seeds = np.random.SeedSequence(random_state).spawn(len(chunks))
+        tasks = [
+            (
+                [(y[pre_lo[i]:split[i]], y[split[i]:post_hi[i]]) for i in chunk],
+                resampling, n_resamples, confidence_level, seed
+            )
+            for chunk, seed in zip(chunks, seeds)
+        ]
+        
+        n_jobs = n_jobs or os.cpu_count() or 1
+        if n_jobs == 1 or len(tasks) <= 1:
+            outputs = [_resample_interventions(*task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=min(n_jobs, len(tasks))) as pool:
+                outputs = list(pool.map(_resample_interventions, *zip(*tasks)))
+        
+        columns = ['ci_lower', 'ci_upper'] if resampling == 'bootstrap' else ['permutation_p_value']
+        for position, column in enumerate(columns):
+            values = np.full(n_interventions, np.nan)
+            for chunk, output in zip(chunks, outputs):
+                values[chunk] = output[position]
+            result[column] = values
+        
+        return result
+    
     def calculate_growth_metrics(
         self,
         data: pd.DataFrame,
@@ -480,6 +817,43 @@ class LongitudinalAnalyzer:
         }
 
 
+# Interventions per resampling task in analyze_cohort_interventions
+INTERVENTION_RESAMPLE_CHUNK = 256
+
+
+def _resample_interventions(
+    samples: List[Tuple[np.ndarray, np.ndarray]],
+    method: str,
+    n_resamples: int,
+    confidence_level: float,
+    seed: np.random.SeedSequence
+) -> Tuple[np.ndarray, ...]:
+    """
+    Bootstrap interval or permutation p-value of the change in means
+    (post - pre) for each (pre, post) sample pair. Runs in worker processes,
+    so it lives at module level.
+    """
+    rng = np.random.default_rng(seed)
+    alpha = (1 - confidence_level) / 2
+    lower = np.empty(len(samples))
+    upper = np.empty(len(samples))
+    p_values = np.empty(len(samples))
+    
+    for i, (pre, post) in enumerate(samples):
+        if method == 'bootstrap':
+            pre_means = pre[rng.integers(0, len(pre), (n_resamples, len(pre)))].mean(axis=1)
+            post_means = post[rng.integers(0, len(post), (n_resamples, len(post)))].mean(axis=1)
+            lower[i], upper[i] = np.quantile(post_means - pre_means, [alpha, 1 - alpha])
+        else:
+            pooled = np.concatenate([pre, post])
+            shuffled = rng.permuted(np.broadcast_to(pooled, (n_resamples, len(pooled))), axis=1)
+            diffs = shuffled[:, len(pre):].mean(axis=1) - shuffled[:, :len(pre)].mean(axis=1)
+            observed = abs(post.mean() - pre.mean())
+            p_values[i] = (np.sum(np.abs(diffs) >= observed - 1e-12) + 1) / (n_resamples + 1)
+    
+    return (lower, upper) if method == 'bootstrap' else (p_values,)
+
+
 class TimeSeriesForecaster:
     """
     Forecast future values using time-series analysis.
@@ -5,16 +5,56 @@
 # ============================================================================
 
 from typing import Dict, List, Tuple, Optional
+from dataclasses import dataclass, asdict
 import numpy as np
 from scipy import stats, signal
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.metrics import silhouette_score
 from sklearn.ensemble import IsolationForest
 from sklearn.preprocessing import StandardScaler
 from datetime import datetime, timedelta
+import joblib
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Populations above this size are clustered with cluster_large_population
+LARGE_POPULATION_THRESHOLD = 20000
+
+
+def _fit_minibatch_kmeans(
+    features: np.ndarray,
+    n_clusters: int,
+    batch_size: int,
+    silhouette_sample_size: int,
+    random_state: int
+) -> Tuple[MiniBatchKMeans, float]:
+    """Fit one candidate k and score it by sampled silhouette (run in workers)"""
+    model = MiniBatchKMeans(
+        n_clusters=n_clusters,
+        batch_size=batch_size,
+        n_init=3,
+        random_state=random_state
+    ).fit(features)
+    return model, _sampled_silhouette(features, model.labels_, silhouette_sample_size, random_state)
+
+
+def _sampled_silhouette(
+    features: np.ndarray,
+    labels: np.ndarray,
+    sample_size: int,
+    random_state: int
+) -> float:
+    """Silhouette estimated on a random sample, O(sample_size²) instead of O(n²)"""
+    if len(np.unique(labels)) < 2:
+        return 0.0
+    return float(silhouette_score(
+        features,
+        labels,
+        sample_size=min(sample_size, len(features)),
+        random_state=random_state
+    ))
+
 class PatternDetector:
     """Detect behavioral patterns in time-series data"""
     
@@ -172,6 +212,8 @@ class PatternDetector:
         """
         if len(client_profiles) < n_clusters:
             return {"error": "insufficient_clients"}
+        if len(client_profiles) > LARGE_POPULATION_THRESHOLD:
+            return self.cluster_large_population(client_profiles, n_clusters)
         
         # Extract features
         features = self._extract_clustering_features(client_profiles)
@@ -186,8 +228,8 @@ class PatternDetector:
         
         # Analyze clusters
         clusters = {}
-        for i in range(n_clusters):
-            cluster_members = [j for j, label in enumerate(cluster_labels) if label == i]
+        for i, cluster_members in enumerate(self._group_labels(cluster_labels, n_clusters)):
+            cluster_members = cluster_members.tolist()
             cluster_profiles = [client_profiles[j] for j in cluster_members]
             
             clusters[f"cluster_{i}"] = {
@@ -203,6 +245,96 @@ class PatternDetector:
             "silhouette_score": self._calculate_silhouette(features_scaled, cluster_labels)
         }
     
+    def cluster_large_population(
+        self,
+        client_profiles: List[Dict],
+        n_clusters: Optional[int] = 5,
+        k_range: Tuple[int, int] = (2, 10),
+        batch_size: int = 4096,
+        silhouette_sample_size: int = 10000,
+        include_members: bool = True,
+        n_jobs: int = -1,
+        random_state: int = 42
+    ) -> Dict:
+        """
+        Cluster a large client population in bounded memory
+        
+        Uses MiniBatchKMeans, a silhouette estimated on a sample, and groups
+        members with one argsort, so memory stays linear in the number of
+        clients. With n_clusters=None, every k in k_range (inclusive) is
+        fitted in parallel and the best sampled silhouette wins.
+        
+        Args:
+            client_profiles: List of client feature dicts
+            n_clusters: Number of clusters, or None to select automatically
+            k_range: Inclusive range of k tried by automatic selection
+            batch_size: Mini-batch size
+            silhouette_sample_size: Clients sampled for the silhouette
+            include_members: Whether to return member index lists
+            n_jobs: Parallel jobs for automatic selection; all CPUs by default,
+                1 to fit the candidates in-process
+            random_state: Seed for fitting and sampling
+            
+        Returns:
+            Dict shaped like cluster_clients, plus the method used and,
+            for automatic selection, the silhouette of each candidate k
+        """
+        features = self._extract_clustering_features(client_profiles)
+        candidates = [n_clusters] if n_clusters else list(range(k_range[0], k_range[1] + 1))
+        candidates = [k for k in candidates if 2 <= k <= len(features)]
+        if not candidates:
+            return {"error": "insufficient_clients"}
+        
+        features_scaled = StandardScaler().fit_transform(features)
+        
+        if len(candidates) == 1:
+            fits = [_fit_minibatch_kmeans(features_scaled, candidates[0], batch_size, silhouette_sample_size, random_state)]
+        else:
+            # joblib memory-maps the feature matrix into the workers
+            fits = joblib.Parallel(n_jobs=n_jobs)(
+                joblib.delayed(_fit_minibatch_kmeans)(features_scaled, k, batch_size, silhouette_sample_size, random_state)
+                for k in candidates
+            )
+        
+        best = int(np.argmax([silhouette for _, silhouette in fits]))
+        kmeans, silhouette = fits[best]
+        k = candidates[best]
+        labels = kmeans.labels_
+        
+        # Per-cluster means of the raw features in one pass each
+        sizes = np.bincount(labels, minlength=k)
+        safe_sizes = np.maximum(sizes, 1)
+        means = {
+            name: np.bincount(labels, weights=features[:, column], minlength=k) / safe_sizes
+            for name, column in (("avg_sentiment", 0), ("avg_engagement", 3), ("avg_severity", 4))
+        }
+        members = self._group_labels(labels, k) if include_members else None
+        
+        clusters = {}
+        for i in range(k):
+            clusters[f"cluster_{i}"] = {
+                "size": int(sizes[i]),
+                "member_ids": members[i].tolist() if include_members else None,
+                "characteristics": {name: float(values[i]) for name, values in means.items()},
+                "centroid": kmeans.cluster_centers_[i].tolist()
+            }
+        
+        result = {
+            "n_clusters": k,
+            "clusters": clusters,
+            "silhouette_score": silhouette,
+            "method": "minibatch_kmeans"
+        }
+        if len(candidates) > 1:
+            result["k_selection"] = {str(c): fit[1] for c, fit in zip(candidates, fits)}
+        return result
+    
+    def _group_labels(self, labels: np.ndarray, n_clusters: int) -> List[np.ndarray]:
+        """Member indices for each cluster label, via one stable argsort"""
+        order = np.argsort(labels, kind='stable')
+        boundaries = np.cumsum(np.bincount(labels, minlength=n_clusters))[:-1]
+        return np.split(order, boundaries)
+    
     def _calculate_pattern_strength(self, detrended_data: np.ndarray) -> float:
         """Calculate strength of cyclical pattern"""
         # Use autocorrelation
@@ -261,17 +393,11 @@ class PatternDetector:
     
     def _extract_clustering_features(self, profiles: List[Dict]) -> np.ndarray:
         """Extract features for clustering"""
-        features = []
-        for profile in profiles:
-            feature_vec = [
-                profile.get("avg_sentiment", 0),
-                profile.get("sentiment_variance", 0),
-                profile.get("session_frequency", 0),
-                profile.get("engagement_score", 0),
-                profile.get("symptom_severity", 0)
-            ]
-            features.append(feature_vec)
-        return np.array(features)
+        keys = ("avg_sentiment", "sentiment_variance", "session_frequency", "engagement_score", "symptom_severity")
+        return np.array(
+            [[profile.get(key, 0) for key in keys] for profile in profiles],
+            dtype=float
+        ).reshape(len(profiles), len(keys))
     
     def _characterize_cluster(self, profiles: List[Dict]) -> Dict:
         """Characterize a cluster"""
@@ -283,7 +409,6 @@ class PatternDetector:
     
     def _calculate_silhouette(self, features: np.ndarray, labels: np.ndarray) -> float:
         """Calculate silhouette score"""
-        from sklearn.metrics import silhouette_score
         try:
             return float(silhouette_score(features, labels))
         except:
@@ -295,17 +420,207 @@ class PatternDetector:
 # Behavioral pattern recognition and anomaly detection (CONTINUED)
 # ============================================================================
 
+class PopulationAnomalyModel:
+    """
+    IsolationForest fitted once on a population (an organization or any
+    group of clients sharing a feature set) and persisted, so new data
+    points are scored against it without refitting. Scoring a point walks
+    each tree once, independent of how much history the client has.
+    """
+    
+    def __init__(
+        self,
+        feature_keys: List[str],
+        contamination: float = 0.1,
+        n_estimators: int = 100,
+        random_state: int = 42
+    ):
+        self.feature_keys = list(feature_keys)
+        self.scaler = StandardScaler()
+        self.model = IsolationForest(
+            n_estimators=n_estimators,
+            contamination=contamination,
+            random_state=random_state
+        )
+        # Sorted training scores, for severity percentiles of new points
+        self.training_scores = np.empty(0)
+        self.trained_at: Optional[str] = None
+        self.is_trained = False
+    
+    def _features(self, data_points: List[Dict]) -> np.ndarray:
+        return np.array(
+            [[point.get(key, 0) for key in self.feature_keys] for point in data_points],
+            dtype=float
+        ).reshape(len(data_points), len(self.feature_keys))
+    
+    def fit(self, data_points: List[Dict]) -> 'PopulationAnomalyModel':
+        """Fit scaler and forest on the population's data points"""
+        features_scaled = self.scaler.fit_transform(self._features(data_points))
+        self.model.fit(features_scaled)
+        self.training_scores = np.sort(self.model.score_samples(features_scaled))
+        self.trained_at = datetime.utcnow().isoformat()
+        self.is_trained = True
+        return self
+    
+    def score(self, data_points: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score new data points
+        
+        Returns:
+            (anomaly_scores, is_anomaly) arrays; lower scores are more anomalous
+        """
+        if not self.is_trained:
+            raise RuntimeError("Model must be trained before scoring")
+        if not data_points:
+            return np.empty(0), np.empty(0, dtype=bool)
+        
+        anomaly_scores = self.model.score_samples(self.scaler.transform(self._features(data_points)))
+        return anomaly_scores, anomaly_scores < self.model.offset_
+    
+    def percentile(self, score: float) -> float:
+        """Percentile of a score within the training population"""
+        if len(self.training_scores) == 0:
+            return 50.0
+        return 100.0 * np.searchsorted(self.training_scores, score, side='right') / len(self.training_scores)
+    
+    def save_model(self, filepath: str):
+        """Save trained model to disk"""
+        if not self.is_trained:
+            raise RuntimeError("Cannot save untrained model")
+        joblib.dump(self, filepath)
+    
+    @classmethod
+    def load_model(cls, filepath: str, mmap_mode: Optional[str] = None) -> 'PopulationAnomalyModel':
+        """Load a model written by save_model"""
+        return joblib.load(filepath, mmap_mode=mmap_mode)
+
+
+@dataclass
+class ChangePointState:
+    """
+    Running change-point state for one client's time series
+    
+    Holds exponentially weighted level, mean and variance of successive
+    changes and two-sided CUSUM sums, so each new observation is processed
+    in constant time without revisiting history.
+    """
+    count: int = 0
+    last_value: Optional[float] = None
+    last_timestamp: Optional[str] = None
+    level_mean: float = 0.0
+    diff_mean: float = 0.0
+    diff_var: float = 0.0
+    cusum_pos: float = 0.0
+    cusum_neg: float = 0.0
+    
+    def to_dict(self) -> Dict:
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> 'ChangePointState':
+        return cls(**data) if data else cls()
+
+
+class StreamingChangeDetector:
+    """
+    EWMA spike detection on successive changes plus CUSUM shift detection
+    on the level
+    
+    A change whose z-score against the EWMA of earlier changes exceeds the
+    threshold is a spike. Values drifting away from the slow EWMA level
+    accumulate in a two-sided CUSUM (noise scale from the change variance);
+    crossing cusum_h is a sustained shift, after which the level re-baselines.
+    """
+    
+    def __init__(
+        self,
+        alpha: float = 0.05,
+        warmup: int = 10,
+        cusum_k: float = 0.5,
+        cusum_h: float = 6.0
+    ):
+        self.alpha = alpha
+        self.warmup = warmup
+        self.cusum_k = cusum_k
+        self.cusum_h = cusum_h
+    
+    def is_warm(self, state: ChangePointState) -> bool:
+        """Whether enough changes have been seen for update to score new ones"""
+        return state.count - 1 > self.warmup
+    
+    def update(
+        self,
+        state: ChangePointState,
+        value: float,
+        timestamp: Optional[datetime] = None,
+        threshold: float = 2.0
+    ) -> Optional[Dict]:
+        """Fold one observation into state; returns a change event or None"""
+        previous = state.last_value
+        n_diffs = max(state.count - 1, 0)
+        value = float(value)
+        state.count += 1
+        state.last_value = value
+        state.last_timestamp = timestamp.isoformat() if timestamp else None
+        if previous is None:
+            state.level_mean = value
+            return None
+        
+        diff = value - previous
+        event = None
+        
+        if n_diffs >= self.warmup and state.diff_var > 0:
+            std = np.sqrt(state.diff_var)
+            z_score = (diff - state.diff_mean) / std
+            spike = abs(z_score) > threshold
+            
+            # Spikes are reported on their own and kept out of the CUSUM;
+            # differencing doubles the variance of independent noise
+            shift = False
+            if not spike:
+                level_z = (value - state.level_mean) / (std / np.sqrt(2))
+                state.cusum_pos = max(0.0, state.cusum_pos + level_z - self.cusum_k)
+                state.cusum_neg = max(0.0, state.cusum_neg - level_z - self.cusum_k)
+                shift = max(state.cusum_pos, state.cusum_neg) > self.cusum_h
+            
+            if spike or shift:
+                increase = diff > 0 if spike else state.cusum_pos > state.cusum_neg
+                event = {
+                    "timestamp": state.last_timestamp,
+                    "change_magnitude": diff if spike else value - state.level_mean,
+                    "z_score": float(abs(z_score)),
+                    "direction": "increase" if increase else "decrease",
+                    "severity": "high" if abs(z_score) > 3 or shift else "moderate",
+                    "change_type": "spike" if spike else "shift"
+                }
+            if shift:
+                state.cusum_pos = state.cusum_neg = 0.0
+                state.level_mean = value
+        
+        # Exact running means/variance until 1/n drops below alpha, then EWMA
+        weight = max(self.alpha, 1.0 / (n_diffs + 1))
+        delta = diff - state.diff_mean
+        state.diff_mean += weight * delta
+        state.diff_var = (1 - weight) * (state.diff_var + weight * delta ** 2)
+        if event is None or event["change_type"] != "spike":
+            state.level_mean += max(self.alpha, 1.0 / (n_diffs + 2)) * (value - state.level_mean)
+        
+        return event
+
+
 class AnomalyDetector:
     """Detect anomalous patterns in client behavior"""
     
     def __init__(self):
         self.model = IsolationForest(contamination=0.1, random_state=42)
         self.scaler = StandardScaler()
+        self.change_detector = StreamingChangeDetector()
     
     def detect_anomalies(
         self,
         data_points: List[Dict],
-        feature_keys: List[str]
+        feature_keys: List[str],
+        population_model: Optional[PopulationAnomalyModel] = None
     ) -> Dict:
         """
         Detect anomalies in behavioral data
@@ -313,10 +628,16 @@ class AnomalyDetector:
         Args:
             data_points: List of data points with features
             feature_keys: Keys to extract as features
+            population_model: Pre-trained model to score against; when
+                given, the points are scored without refitting and no
+                minimum history is required
             
         Returns:
             Dict with anomaly detection results
         """
+        if population_model is not None:
+            return self._score_with_population_model(data_points, feature_keys, population_model)
+        
         if len(data_points) < 10:
             return {"sufficient_data": False, "reason": "need_at_least_10_points"}
         
@@ -359,30 +680,99 @@ class AnomalyDetector:
             "risk_level": self._assess_risk_level(len(anomalies), len(data_points))
         }
     
+    def _score_with_population_model(
+        self,
+        data_points: List[Dict],
+        feature_keys: List[str],
+        population_model: PopulationAnomalyModel
+    ) -> Dict:
+        """Score new points against a persisted population model"""
+        anomaly_scores, is_anomaly = population_model.score(data_points)
+        
+        anomalies = []
+        for idx in np.flatnonzero(is_anomaly):
+            anomalies.append({
+                "index": int(idx),
+                "timestamp": data_points[idx].get("timestamp"),
+                "anomaly_score": float(anomaly_scores[idx]),
+                "severity": self._severity_from_percentile(population_model.percentile(anomaly_scores[idx])),
+                "features": {key: data_points[idx].get(key) for key in feature_keys},
+                "description": self._describe_anomaly(data_points[idx], feature_keys)
+            })
+        
+        return {
+            "sufficient_data": True,
+            "total_points": len(data_points),
+            "anomalies_detected": len(anomalies),
+            "anomaly_rate": len(anomalies) / len(data_points) if data_points else 0.0,
+            "anomalies": anomalies,
+            "risk_level": self._assess_risk_level(len(anomalies), len(data_points)),
+            "model_trained_at": population_model.trained_at
+        }
+    
     def detect_sudden_changes(
         self,
         time_series: List[float],
         timestamps: List[datetime],
-        threshold: float = 2.0
+        threshold: float = 2.0,
+        state: Optional[ChangePointState] = None
     ) -> Dict:
         """
         Detect sudden changes in time-series data
         
+        Runs the streaming change detector over the values. Pass the state
+        returned by the previous call (see ChangePointState.to_dict/from_dict)
+        together with only the values observed since, and each value is
+        processed once across calls.
+        
+        The streaming detector only scores changes after its warm-up. A new
+        series too short to get past it is scored by z-score against the
+        series' own changes instead; a continued series still inside the
+        warm-up reports insufficient data.
+        
         Args:
-            time_series: Time-series values
+            time_series: Time-series values, oldest first
             timestamps: Corresponding timestamps
             threshold: Number of standard deviations for change detection
+            state: Running state from an earlier call, if any
             
         Returns:
-            Dict with detected changes
+            Dict with detected changes and the updated state
         """
-        if len(time_series) < 5:
-            return {"sufficient_data": False}
+        fresh = state is None or state.count == 0
+        state = state or ChangePointState()
         
-        # Calculate differences
-        diffs = np.diff(time_series)
+        sudden_changes = []
+        for i, (value, timestamp) in enumerate(zip(time_series, timestamps)):
+            event = self.change_detector.update(state, value, timestamp, threshold)
+            if event:
+                sudden_changes.append({"index": i, **event})
+        
+        if state.count < 5:
+            return {"sufficient_data": False, "state": state}
+        
+        if not self.change_detector.is_warm(state):
+            if not fresh:
+                return {"sufficient_data": False, "state": state}
+            return {**self._batch_sudden_changes(time_series, timestamps, threshold), "state": state}
         
-        # Find outlier changes
+        return {
+            "sufficient_data": True,
+            "changes_detected": len(sudden_changes),
+            "changes": sudden_changes,
+            "mean_change": float(state.diff_mean),
+            "change_volatility": float(np.sqrt(state.diff_var)),
+            "state": state
+        }
+    
+    def _batch_sudden_changes(
+        self,
+        time_series: List[float],
+        timestamps: List[datetime],
+        threshold: float
+    ) -> Dict:
+        """Changes whose z-score against all of the series' changes exceeds threshold"""
+        diffs = np.diff(time_series)
         mean_diff = np.mean(diffs)
         std_diff = np.std(diffs)
         
@@ -397,7 +787,8 @@ class AnomalyDetector:
                     "change_magnitude": float(diff),
                     "z_score": float(z_score),
                     "direction": "increase" if diff > 0 else "decrease",
-                    "severity": "high" if z_score > 3 else "moderate"
+                    "severity": "high" if z_score > 3 else "moderate",
+                    "change_type": "spike"
                 })
         
         return {
@@ -410,8 +801,9 @@ class AnomalyDetector:
     
     def _calculate_severity(self, score: float, all_scores: np.ndarray) -> str:
         """Calculate anomaly severity"""
-        percentile = stats.percentileofscore(all_scores, score)
-        
+        return self._severity_from_percentile(stats.percentileofscore(all_scores, score))
+    
+    def _severity_from_percentile(self, percentile: float) -> str:
         if percentile < 5:
             return "critical"
         elif percentile < 15:
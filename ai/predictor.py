@@ -65,10 +65,14 @@ class ClientFeatures:
     
     def to_feature_vector(self) -> np.ndarray:
         """Convert to numerical feature vector."""
+        return np.array(self.to_feature_row()).reshape(1, -1)
+    
+    def to_feature_row(self) -> List[float]:
+        """Numerical features in get_feature_names() order."""
         # Encode categorical variables
         gender_encoded = 1 if self.gender.lower() == 'male' else 0
         
-        features = [
+        return [
             self.age,
             gender_encoded,
             self.baseline_severity,
@@ -83,8 +87,14 @@ class ClientFeatures:
             self.between_session_contacts,
             self.crisis_contacts
         ]
-        
-        return np.array(features).reshape(1, -1)
+    
+    @staticmethod
+    def to_feature_matrix(features_list: List['ClientFeatures']) -> np.ndarray:
+        """Stack many clients into one (n_clients, n_features) matrix."""
+        return np.array(
+            [f.to_feature_row() for f in features_list],
+            dtype=float
+        ).reshape(len(features_list), len(ClientFeatures.get_feature_names()))
     
     @staticmethod
     def get_feature_names() -> List[str]:
@@ -197,39 +207,40 @@ class OutcomePredictor:
         Returns:
             PredictionResult with prediction and confidence
         """
+        return self.predict_batch([features])[0]
+    
+    def predict_batch(self, features_list: List[ClientFeatures]) -> List[PredictionResult]:
+        """
+        Predict outcomes for multiple clients.
+        
+        Scales and predicts the whole batch in one call, so per-call
+        scikit-learn overhead is paid once rather than per client.
+        """
         if not self.is_trained:
             raise RuntimeError("Model must be trained before making predictions")
+        if not features_list:
+            return []
         
-        # Convert features to vector
-        X = features.to_feature_vector()
-        X_scaled = self.scaler.transform(X)
+        X_scaled = self.scaler.transform(ClientFeatures.to_feature_matrix(features_list))
+        predictions = self.model.predict(X_scaled)
         
-        # Make prediction
-        prediction = self.model.predict(X_scaled)[0]
-        
-        # Calculate confidence interval (simple approach using training RMSE)
+        # Confidence interval and score depend only on the model (training RMSE)
         rmse = self.training_metrics.get('test_rmse', 1.0)
-        ci_lower = prediction - 1.96 * rmse
-        ci_upper = prediction + 1.96 * rmse
-        
-        # Calculate confidence score (inverse of uncertainty)
-        confidence = 1 / (1 + rmse)
-        
-        # Get feature importance
+        confidence = float(1 / (1 + rmse))
         feature_importance = self._get_feature_importance()
+        prediction_date = datetime.utcnow().isoformat()
         
-        return PredictionResult(
-            predicted_value=float(prediction),
-            confidence_interval=(float(ci_lower), float(ci_upper)),
-            confidence=float(confidence),
-            feature_importance=feature_importance,
-            model_type=self.model_type,
-            prediction_date=datetime.utcnow().isoformat()
-        )
-    
-    def predict_batch(self, features_list: List[ClientFeatures]) -> List[PredictionResult]:
-        """Predict outcomes for multiple clients."""
-        return [self.predict_outcome(f) for f in features_list]
+        return [
+            PredictionResult(
+                predicted_value=float(prediction),
+                confidence_interval=(float(prediction - 1.96 * rmse), float(prediction + 1.96 * rmse)),
+                confidence=confidence,
+                feature_importance=dict(feature_importance),
+                model_type=self.model_type,
+                prediction_date=prediction_date
+            )
+            for prediction in predictions
+        ]
     
     def _get_feature_importance(self) -> Dict[str, float]:
         """Get feature importance scores."""
@@ -267,9 +278,18 @@ class OutcomePredictor:
         joblib.dump(model_data, filepath)
     
     @classmethod
-    def load_model(cls, filepath: str) -> 'OutcomePredictor':
-        """Load trained model from disk."""
-        model_data = joblib.load(filepath)
+    def load_model(cls, filepath: str, mmap_mode: Optional[str] = None) -> 'OutcomePredictor':
+        """
+        Load trained model from disk.
+        
+        Args:
+            filepath: Path written by save_model
+            mmap_mode: Passed to joblib.load; 'r' memory-maps stored NumPy
+                arrays read-only. Only plain array attributes stay mapped:
+                forest and boosting estimators copy their tree arrays into
+                private memory when unpickled.
+        """
+        model_data = joblib.load(filepath, mmap_mode=mmap_mode)
         
         predictor = cls(model_type=model_data['model_type'])
         predictor.model = model_data['model']
@@ -287,6 +307,10 @@ class DropoutPredictor:
     Binary classification model.
     """
     
+    # Probability cut points between consecutive risk levels
+    RISK_THRESHOLDS = (0.2, 0.5, 0.7)
+    RISK_LEVELS = ('low', 'moderate', 'high', 'very_high')
+    
     def __init__(self):
         """Initialize dropout predictor."""
         self.model = GradientBoostingClassifier(n_estimators=100, random_state=42)
@@ -343,24 +367,29 @@ class DropoutPredictor:
         Returns:
             Dictionary with dropout probability and risk level
         """
+        return self.predict_batch([features])[0]
+    
+    def predict_batch(self, features_list: List[ClientFeatures]) -> List[Dict]:
+        """
+        Predict dropout risk for multiple clients in one vectorized pass.
+        
+        Returns:
+            One predict_dropout_risk-style dictionary per client, in order
+        """
         if not self.is_trained:
             raise RuntimeError("Model must be trained first")
+        if not features_list:
+            return []
         
-        X = features.to_feature_vector()
-        X_scaled = self.scaler.transform(X)
+        X_scaled = self.scaler.transform(ClientFeatures.to_feature_matrix(features_list))
         
         # Probability of dropout
-        dropout_prob = self.model.predict_proba(X_scaled)[0, 1]
+        dropout_probs = self.model.predict_proba(X_scaled)[:, 1]
         
         # Risk categorization
-        if dropout_prob < 0.2:
-            risk_level = 'low'
-        elif dropout_prob < 0.5:
-            risk_level = 'moderate'
-        elif dropout_prob < 0.7:
-            risk_level = 'high'
-        else:
-            risk_level = 'very_high'
+        risk_levels = np.array(self.RISK_LEVELS)[
+            np.searchsorted(self.RISK_THRESHOLDS, dropout_probs, side='right')
+        ]
         
         # Get feature importance
         feature_importance = {}
@@ -371,13 +400,46 @@ class DropoutPredictor:
                 name: float(imp)
                 for name, imp in zip(self.feature_names, importances)
             }
+        prediction_date = datetime.utcnow().isoformat()
         
-        return {
-            'dropout_probability': float(dropout_prob),
-            'risk_level': risk_level,
-            'feature_importance': feature_importance,
-            'prediction_date': datetime.utcnow().isoformat()
+        return [
+            {
+                'dropout_probability': float(prob),
+                'risk_level': str(level),
+                'feature_importance': dict(feature_importance),
+                'prediction_date': prediction_date
+            }
+            for prob, level in zip(dropout_probs, risk_levels)
+        ]
+    
+    def save_model(self, filepath: str):
+        """Save trained model to disk."""
+        if not self.is_trained:
+            raise RuntimeError("Cannot save untrained model")
+        
+        model_data = {
+            'model': self.model,
+            'scaler': self.scaler,
+            'feature_names': self.feature_names,
+            'training_metrics': self.training_metrics,
+            'trained_at': datetime.utcnow().isoformat()
         }
+        
+        joblib.dump(model_data, filepath)
+    
+    @classmethod
+    def load_model(cls, filepath: str, mmap_mode: Optional[str] = None) -> 'DropoutPredictor':
+        """Load trained model from disk (see OutcomePredictor.load_model)."""
+        model_data = joblib.load(filepath, mmap_mode=mmap_mode)
+        
+        predictor = cls()
+        predictor.model = model_data['model']
+        predictor.scaler = model_data['scaler']
+        predictor.feature_names = model_data['feature_names']
+        predictor.training_metrics = model_data['training_metrics']
+        predictor.is_trained = True
+        
+        return predictor
 
 
 class ResponsePredictor:
@@ -0,0 +1,64 @@
+"""Add anonymous feedback daily rollup table
+
+Revision ID: 004_feedback_daily_rollup
+Revises: 003_add_user_columns
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '004_feedback_daily_rollup'
+down_revision: Union[str, None] = '003_add_user_columns'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('anonymous_feedback_daily_rollup',
+        sa.Column('organization_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('category', sa.String(length=100), nullable=False),
+        sa.Column('severity', sa.String(length=20), nullable=False),
+        sa.Column('status', sa.String(length=50), nullable=False),
+        sa.Column('feedback_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('resolved_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('resolution_days_total', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ),
+        sa.PrimaryKeyConstraint('organization_id', 'day', 'category', 'severity', 'status')
+    )
+    op.create_index('idx_feedback_rollup_org_day', 'anonymous_feedback_daily_rollup', ['organization_id', 'day'], unique=False)
+
+    # Supports the GROUP BY used to rebuild rollups and the pending-feedback scans
+    op.create_index('idx_anonymous_feedback_org_submitted', 'anonymous_feedback', ['organization_id', 'submitted_at'], unique=False)
+
+    # Backfill from existing feedback
+    op.execute("""
+        INSERT INTO anonymous_feedback_daily_rollup
+            (organization_id, day, category, severity, status,
+             feedback_count, resolved_count, resolution_days_total, updated_at)
+        SELECT
+            organization_id,
+            CAST(submitted_at AS DATE),
+            category,
+            severity,
+            COALESCE(status, 'pending_review'),
+            COUNT(*),
+            COUNT(resolution_date),
+            COALESCE(SUM(EXTRACT(DAY FROM (resolution_date - submitted_at)))::int, 0),
+            NOW()
+        FROM anonymous_feedback
+        WHERE submitted_at IS NOT NULL
+        GROUP BY organization_id, CAST(submitted_at AS DATE), category, severity, COALESCE(status, 'pending_review')
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_anonymous_feedback_org_submitted', table_name='anonymous_feedback')
+    op.drop_index('idx_feedback_rollup_org_day', table_name='anonymous_feedback_daily_rollup')
+    op.drop_table('anonymous_feedback_daily_rollup')
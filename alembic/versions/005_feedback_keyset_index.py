@@ -0,0 +1,25 @@
+"""Add keyset pagination index on anonymous feedback
+
+Revision ID: 005_feedback_keyset_index
+Revises: 004_feedback_daily_rollup
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '005_feedback_keyset_index'
+down_revision: Union[str, None] = '004_feedback_daily_rollup'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Cross-organization scans in the batched digest/follow-up tasks page by (submitted_at, id)
+    op.create_index('idx_anonymous_feedback_submitted_id', 'anonymous_feedback', ['submitted_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_anonymous_feedback_submitted_id', table_name='anonymous_feedback')
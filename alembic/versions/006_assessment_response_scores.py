@@ -0,0 +1,37 @@
+"""Add score columns to assessment responses
+
+Revision ID: 006_assessment_response_scores
+Revises: 005_feedback_keyset_index
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '006_assessment_response_scores'
+down_revision: Union[str, None] = '005_feedback_keyset_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('assessment_responses', sa.Column('score_data', sa.JSON(), nullable=True))
+    op.add_column('assessment_responses', sa.Column('scored_at', sa.DateTime(), nullable=True))
+
+    # Keyset scans in the bulk scoring task walk completed responses by id per assessment
+    op.create_index(
+        'idx_assessment_responses_assessment_completed_id',
+        'assessment_responses',
+        ['assessment_id', 'id'],
+        unique=False,
+        postgresql_where=sa.text('completed_at IS NOT NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_assessment_responses_assessment_completed_id', table_name='assessment_responses')
+    op.drop_column('assessment_responses', 'scored_at')
+    op.drop_column('assessment_responses', 'score_data')
@@ -0,0 +1,42 @@
+"""Add communication analysis daily rollup table
+
+Revision ID: 007_communication_daily_rollup
+Revises: 006_assessment_response_scores
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '007_communication_daily_rollup'
+down_revision: Union[str, None] = '006_assessment_response_scores'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('communication_daily_rollup',
+        sa.Column('scope_type', sa.String(length=20), nullable=False),
+        sa.Column('scope_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('message_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('sentiment_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('sentiment_sum', sa.Float(), server_default='0', nullable=False),
+        sa.Column('sentiment_sum_sq', sa.Float(), server_default='0', nullable=False),
+        sa.Column('conflict_sum', sa.Float(), server_default='0', nullable=False),
+        sa.Column('high_conflict_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('emotion_counts', postgresql.JSONB(), server_default=sa.text("'{}'::jsonb"), nullable=False),
+        sa.Column('response_time_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('response_time_sum', sa.Float(), server_default='0', nullable=False),
+        sa.Column('response_time_buckets', postgresql.ARRAY(sa.Integer()), server_default=sa.text("'{}'"), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('scope_type', 'scope_id', 'day')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('communication_daily_rollup')
@@ -0,0 +1,284 @@
+"""Convert email_metadata and communication_analysis to monthly partitions
+
+Revision ID: 008_partition_communication_tables
+Revises: 007_communication_daily_rollup
+Create Date: 2026-10-18 14:00:00.000000
+
+Each table is rebuilt as a declaratively range-partitioned parent with one
+partition per month of existing data, PARTITION_PREMAKE_MONTHS of future
+months and a default partition, then the rows are copied across. The
+partition key is the first column the table has from
+app.core.partitioning.PARTITION_KEY_CANDIDATES, which partition maintenance
+shares. Rows with a NULL key cannot be placed in a month; the upgrade fails
+and names the table rather than inventing timestamps for them. Postgres
+requires the partition key in every primary key and unique constraint, so
+those gain the timestamp column; foreign keys from other tables into these
+tables cannot be kept and are dropped with a warning.
+
+The original primary key, unique constraints and foreign keys in both
+directions are recorded in partition_conversion_constraints and restored on downgrade.
+Inbound foreign keys come back NOT VALID, because rows written while they
+were absent may not satisfy them; run ALTER TABLE ... VALIDATE CONSTRAINT
+once any orphans are cleaned up.
+
+The copy runs inside the migration transaction and locks the table for its
+duration; run it in a maintenance window on large installations.
+Tables that do not exist, or are already partitioned, are skipped.
+"""
+from datetime import date
+from typing import List, Optional, Sequence, Union
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.config import settings
+from app.core.partitioning import PARTITION_KEY_CANDIDATES, default_partition_name, partition_key_column
+
+# revision identifiers, used by Alembic.
+revision: str = '008_partition_communication_tables'
+down_revision: Union[str, None] = '007_communication_daily_rollup'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+# Constraint definitions the conversion has to drop or widen, kept for downgrade
+CONSTRAINTS_TABLE = 'partition_conversion_constraints'
+
+# Tables converted, with their candidate partition key columns
+PARTITIONED_TABLES = PARTITION_KEY_CANDIDATES
+
+
+def _add_months(day: date, months: int) -> date:
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _is_partitioned(bind, table: str) -> bool:
+    return bind.execute(sa.text(
+        "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+        "WHERE c.relname = :table AND pg_table_is_visible(c.oid)"
+    ), {'table': table}).scalar() is not None
+
+
+def _partition_column(inspector, table: str) -> Optional[str]:
+    return partition_key_column(table, (c['name'] for c in inspector.get_columns(table)))
+
+
+def _create_month_partitions(table: str, first: date, last: date) -> None:
+    month = first
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE {table}_p{month.year:04d}_{month.month:02d} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+        )
+        month = _add_months(month, 1)
+
+
+def _record_constraints(bind, table: str) -> None:
+    """Save the table's key constraints and foreign keys, and the foreign keys into it"""
+    if not sa.inspect(bind).has_table(CONSTRAINTS_TABLE):
+        op.create_table(
+            CONSTRAINTS_TABLE,
+            sa.Column('id', sa.Integer, primary_key=True),
+            sa.Column('table_name', sa.String(255), nullable=False),
+            sa.Column('owner_table', sa.String(255), nullable=False),
+            sa.Column('constraint_name', sa.String(255), nullable=False),
+            sa.Column('constraint_type', sa.String(1), nullable=False),
+            sa.Column('definition', sa.Text, nullable=False),
+        )
+    op.execute(sa.text(
+        f"INSERT INTO {CONSTRAINTS_TABLE} (table_name, owner_table, constraint_name, constraint_type, definition) "
+        "SELECT :table, conrelid::regclass::text, conname, contype::text, pg_get_constraintdef(oid) "
+        "FROM pg_constraint "
+        "WHERE (conrelid = CAST(:table AS regclass) AND contype IN ('p', 'u', 'f')) "
+        "OR (confrelid = CAST(:table AS regclass) AND conrelid <> confrelid AND contype = 'f')"
+    ).bindparams(table=table))
+
+
+def _restore_constraints(bind, table: str) -> None:
+    """Put back the constraints _record_constraints saved for the table"""
+    if not sa.inspect(bind).has_table(CONSTRAINTS_TABLE):
+        logger.warning(f"No saved constraints for {table}; keys keep the partition column and inbound foreign keys stay dropped")
+        return
+
+    saved = bind.execute(sa.text(
+        f"SELECT owner_table, constraint_name, constraint_type, definition FROM {CONSTRAINTS_TABLE} "
+        "WHERE table_name = :table ORDER BY constraint_type DESC, id"
+    ), {'table': table}).fetchall()
+    if not saved:
+        return
+
+    # Swap the widened keys copied from the partitioned table for the originals
+    copied = bind.execute(sa.text(
+        "SELECT conname FROM pg_constraint WHERE conrelid = CAST(:table AS regclass) AND contype IN ('p', 'u')"
+    ), {'table': table}).scalars().all()
+    for name in copied:
+        op.execute(f'ALTER TABLE {table} DROP CONSTRAINT "{name}"')
+
+    for owner, name, kind, definition in saved:
+        if kind == 'f' and owner != table:
+            logger.warning(f"Restoring foreign key {owner}.{name} -> {table} as NOT VALID")
+            op.execute(f'ALTER TABLE {owner} ADD CONSTRAINT "{name}" {definition} NOT VALID')
+        else:
+            op.execute(f'ALTER TABLE {owner} ADD CONSTRAINT "{name}" {definition}')
+
+    op.execute(sa.text(f"DELETE FROM {CONSTRAINTS_TABLE} WHERE table_name = :table").bindparams(table=table))
+
+
+def _convert(table: str) -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not inspector.has_table(table):
+        logger.info(f"{table} does not exist; nothing to partition")
+        return
+    if _is_partitioned(bind, table):
+        logger.info(f"{table} is already partitioned")
+        return
+
+    column = _partition_column(inspector, table)
+    if column is None:
+        logger.warning(f"{table} has no timestamp column to partition on; skipped")
+        return
+
+    missing = bind.execute(sa.text(f"SELECT COUNT(*) FROM {table} WHERE {column} IS NULL")).scalar()
+    if missing:
+        raise RuntimeError(
+            f"{table} has {missing} rows with no {column}, which cannot be assigned a monthly "
+            f"partition; set {column} on those rows (or delete them) and rerun the upgrade"
+        )
+
+    legacy = f"{table}_unpartitioned"
+    columns = inspector.get_columns(table)
+    pk = inspector.get_pk_constraint(table)
+    pk_columns: List[str] = pk.get('constrained_columns') or []
+    unique_constraints = inspector.get_unique_constraints(table)
+    indexes = [i for i in inspector.get_indexes(table) if not i.get('duplicates_constraint')]
+    outbound_fks = inspector.get_foreign_keys(table)
+
+    _record_constraints(bind, table)
+
+    # Foreign keys into this table would need the partition key too
+    for other in inspector.get_table_names():
+        if other == table:
+            continue
+        for fk in inspector.get_foreign_keys(other):
+            if fk.get('referred_table') == table and fk.get('name'):
+                logger.warning(f"Dropping foreign key {other}.{fk['name']} -> {table}; partitioned tables cannot be referenced by it")
+                op.drop_constraint(fk['name'], other, type_='foreignkey')
+
+    # Serial (non-identity) sequences must outlive the legacy table
+    serial_sequences = {}
+    for c in columns:
+        if c.get('identity'):
+            continue
+        sequence = bind.execute(sa.text("SELECT pg_get_serial_sequence(:t, :c)"), {'t': table, 'c': c['name']}).scalar()
+        if sequence:
+            serial_sequences[c['name']] = sequence
+
+    op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+
+    # Free the constraint and index names for the new parent table
+    for name in [pk.get('name')] + [u['name'] for u in unique_constraints]:
+        if name:
+            op.execute(f"ALTER TABLE {legacy} RENAME CONSTRAINT {name} TO {name}_legacy")
+    for index in indexes:
+        op.execute(f"DROP INDEX IF EXISTS {index['name']}")
+
+    op.execute(
+        f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS INCLUDING IDENTITY INCLUDING STORAGE INCLUDING COMMENTS) "
+        f"PARTITION BY RANGE ({column})"
+    )
+    for name, sequence in serial_sequences.items():
+        op.execute(f"ALTER SEQUENCE {sequence} OWNED BY {table}.{name}")
+
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET NOT NULL")
+    if pk_columns:
+        key = pk_columns + ([column] if column not in pk_columns else [])
+        op.create_primary_key(pk.get('name') or f"{table}_pkey", table, key)
+
+    for constraint in unique_constraints:
+        key = list(constraint['column_names'])
+        if column not in key:
+            key.append(column)
+        op.create_unique_constraint(constraint['name'], table, key)
+
+    for index in indexes:
+        key = list(index['column_names'])
+        if None in key:
+            logger.warning(f"Expression index {index['name']} on {table} not recreated")
+            continue
+        unique = bool(index.get('unique'))
+        if unique and column not in key:
+            key.append(column)
+        op.create_index(index['name'], table, key, unique=unique)
+    if not any(i['column_names'] and i['column_names'][0] == column for i in indexes):
+        # Recent-window queries filter on the partition key
+        op.create_index(f"idx_{table}_{column}", table, [column])
+
+    for fk in outbound_fks:
+        op.create_foreign_key(
+            fk.get('name'), table, fk['referred_table'],
+            fk['constrained_columns'], fk['referred_columns'],
+            ondelete=(fk.get('options') or {}).get('ondelete')
+        )
+
+    bounds = bind.execute(sa.text(
+        f"SELECT MIN({column})::date, MAX({column})::date FROM {legacy}"
+    )).first()
+    this_month = date.today().replace(day=1)
+    first = bounds[0].replace(day=1) if bounds and bounds[0] else this_month
+    last = max(bounds[1].replace(day=1) if bounds and bounds[1] else this_month, this_month)
+    _create_month_partitions(table, min(first, this_month), _add_months(last, settings.PARTITION_PREMAKE_MONTHS))
+    op.execute(f"CREATE TABLE {default_partition_name(table)} PARTITION OF {table} DEFAULT")
+
+    op.execute(f"INSERT INTO {table} OVERRIDING SYSTEM VALUE SELECT * FROM {legacy}")
+    for c in columns:
+        sequence = bind.execute(sa.text("SELECT pg_get_serial_sequence(:t, :c)"), {'t': table, 'c': c['name']}).scalar()
+        if sequence:
+            op.execute(f"SELECT setval('{sequence}', COALESCE((SELECT MAX({c['name']}) FROM {table}), 0) + 1, false)")
+    op.execute(f"DROP TABLE {legacy}")
+    op.execute(f"ANALYZE {table}")
+
+
+def _revert(table: str) -> None:
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table(table) or not _is_partitioned(bind, table):
+        return
+
+    partitioned = f"{table}_partitioned"
+    columns = [c['name'] for c in sa.inspect(bind).get_columns(table)]
+    op.execute(f"ALTER TABLE {table} RENAME TO {partitioned}")
+    op.execute(f"CREATE TABLE {table} (LIKE {partitioned} INCLUDING DEFAULTS INCLUDING IDENTITY INCLUDING INDEXES)")
+
+    # Serial sequences are owned by the partitioned table and would be dropped with it
+    for name in columns:
+        sequence = bind.execute(sa.text("SELECT pg_get_serial_sequence(:t, :c)"), {'t': partitioned, 'c': name}).scalar()
+        if sequence:
+            op.execute(f"ALTER SEQUENCE {sequence} OWNED BY {table}.{name}")
+
+    op.execute(f"INSERT INTO {table} OVERRIDING SYSTEM VALUE SELECT * FROM {partitioned}")
+    for name in columns:
+        sequence = bind.execute(sa.text("SELECT pg_get_serial_sequence(:t, :c)"), {'t': table, 'c': name}).scalar()
+        if sequence:
+            op.execute(f"SELECT setval('{sequence}', COALESCE((SELECT MAX({name}) FROM {table}), 0) + 1, false)")
+    op.execute(f"DROP TABLE {partitioned} CASCADE")
+    _restore_constraints(bind, table)
+
+
+def upgrade() -> None:
+    for table in PARTITIONED_TABLES:
+        _convert(table)
+
+
+def downgrade() -> None:
+    for table in PARTITIONED_TABLES:
+        _revert(table)
+
+    bind = op.get_bind()
+    if sa.inspect(bind).has_table(CONSTRAINTS_TABLE):
+        remaining = bind.execute(sa.text(f"SELECT COUNT(*) FROM {CONSTRAINTS_TABLE}")).scalar()
+        if not remaining:
+            op.drop_table(CONSTRAINTS_TABLE)
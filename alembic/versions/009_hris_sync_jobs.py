@@ -0,0 +1,61 @@
+"""Add HRIS sync job and run history tables
+
+Revision ID: 009_hris_sync_jobs
+Revises: 008_partition_communication_tables
+Create Date: 2026-10-18 15:00:00.000000
+
+Backing tables for DistributedSyncScheduler
+(app/integrations/hris/distributed_scheduler.py). Times are stored as naive
+UTC.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '009_hris_sync_jobs'
+down_revision: Union[str, None] = '008_partition_communication_tables'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('hris_sync_jobs',
+        sa.Column('job_id', sa.String(length=255), nullable=False),
+        sa.Column('hris_type', sa.String(length=100), nullable=False),
+        sa.Column('cron_expression', sa.String(length=100), nullable=False),
+        sa.Column('sync_types', sa.JSON(), nullable=False),
+        sa.Column('enabled', sa.Boolean(), nullable=False),
+        sa.Column('jitter_seconds', sa.Integer(), nullable=False),
+        sa.Column('next_run_at', sa.DateTime(), nullable=True),
+        sa.Column('last_run_at', sa.DateTime(), nullable=True),
+        sa.Column('last_status', sa.String(length=20), nullable=True),
+        sa.Column('last_duration_seconds', sa.Float(), nullable=True),
+        sa.Column('lease_owner', sa.String(length=255), nullable=True),
+        sa.Column('lease_expires_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('job_id')
+    )
+    op.create_index('ix_hris_sync_jobs_next_run_at', 'hris_sync_jobs', ['next_run_at'])
+
+    op.create_table('hris_sync_job_runs',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('job_id', sa.String(length=255), nullable=False),
+        sa.Column('worker_id', sa.String(length=255), nullable=False),
+        sa.Column('scheduled_for', sa.DateTime(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=False),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('duration_seconds', sa.Float(), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_hris_sync_job_runs_job_started', 'hris_sync_job_runs', ['job_id', 'started_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_hris_sync_job_runs_job_started', table_name='hris_sync_job_runs')
+    op.drop_table('hris_sync_job_runs')
+    op.drop_index('ix_hris_sync_jobs_next_run_at', table_name='hris_sync_jobs')
+    op.drop_table('hris_sync_jobs')
@@ -0,0 +1,39 @@
+"""Add assessment scoring configuration table
+
+Revision ID: 010_assessment_scoring_configs
+Revises: 009_hris_sync_jobs
+Create Date: 2026-10-18 16:00:00.000000
+
+Backs app.db.models.scoring.AssessmentScoringConfig, which the MBTI, Big
+Five and DISC scorers and the bulk scoring task read.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '010_assessment_scoring_configs'
+down_revision: Union[str, None] = '009_hris_sync_jobs'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('assessment_scoring_configs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('assessment_id', sa.Integer(), nullable=False),
+        sa.Column('algorithm', sa.String(length=50), nullable=False),
+        sa.Column('config', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['assessment_id'], ['assessments.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('assessment_id')
+    )
+    op.create_index(op.f('ix_assessment_scoring_configs_id'), 'assessment_scoring_configs', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_assessment_scoring_configs_id'), table_name='assessment_scoring_configs')
+    op.drop_table('assessment_scoring_configs')
@@ -0,0 +1,68 @@
+"""Add psychometric session and progress report tables
+
+Revision ID: 011_psychometric_sessions
+Revises: 010_assessment_scoring_configs
+Create Date: 2026-10-18 17:00:00.000000
+
+Backs app.db.models.psychometric_session, which the session analysis,
+progress report and anomaly tasks in app.tasks.psychometric_tasks read
+and write.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '011_psychometric_sessions'
+down_revision: Union[str, None] = '010_assessment_scoring_configs'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('psychometric_sessions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('client_id', sa.String(length=255), nullable=False),
+        sa.Column('session_date', sa.DateTime(), nullable=False),
+        sa.Column('session_type', sa.String(length=50), nullable=False),
+        sa.Column('sentiment_analysis', sa.JSON(), nullable=False),
+        sa.Column('emotion_analysis', sa.JSON(), nullable=False),
+        sa.Column('psycholinguistic_markers', sa.JSON(), nullable=True),
+        sa.Column('linguistic_features', sa.JSON(), nullable=True),
+        sa.Column('key_insights', sa.JSON(), nullable=True),
+        sa.Column('red_flags', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_psychometric_sessions_id'), 'psychometric_sessions', ['id'], unique=False)
+    op.create_index('idx_psychometric_sessions_client_date', 'psychometric_sessions', ['client_id', 'session_date'], unique=False)
+    op.create_index('idx_psychometric_sessions_session_date', 'psychometric_sessions', ['session_date'], unique=False)
+
+    op.create_table('progress_reports',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('client_id', sa.String(length=255), nullable=False),
+        sa.Column('start_date', sa.DateTime(), nullable=False),
+        sa.Column('end_date', sa.DateTime(), nullable=False),
+        sa.Column('trend_analysis', sa.JSON(), nullable=True),
+        sa.Column('cyclical_patterns', sa.JSON(), nullable=True),
+        sa.Column('emotional_state', sa.JSON(), nullable=True),
+        sa.Column('anomalies', sa.JSON(), nullable=True),
+        sa.Column('progress_level', sa.String(length=50), nullable=True),
+        sa.Column('recommendations', sa.JSON(), nullable=True),
+        sa.Column('session_count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_progress_reports_id'), 'progress_reports', ['id'], unique=False)
+    op.create_index(op.f('ix_progress_reports_client_id'), 'progress_reports', ['client_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_progress_reports_client_id'), table_name='progress_reports')
+    op.drop_index(op.f('ix_progress_reports_id'), table_name='progress_reports')
+    op.drop_table('progress_reports')
+    op.drop_index('idx_psychometric_sessions_session_date', table_name='psychometric_sessions')
+    op.drop_index('idx_psychometric_sessions_client_date', table_name='psychometric_sessions')
+    op.drop_index(op.f('ix_psychometric_sessions_id'), table_name='psychometric_sessions')
+    op.drop_table('psychometric_sessions')
@@ -11,7 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_
 
 # Import database dependencies
-from app.core.database import get_async_db
+from app.core.database import get_async_db, get_analytics_db, get_replica_db, get_replica_sync_db
 
 # Import security dependencies
 from app.core.security import (
@@ -23,11 +23,16 @@ from app.core.security import (
 get_db = get_async_db
 
 # TODO: Implement admin-specific functions when needed
-async def get_current_active_superuser():
-    """Placeholder for superuser authentication"""
-    # For now, just return active user check
-    # In production, this would check admin/superuser role
-    return await get_current_active_user()
+async def get_current_active_superuser(
+    current_user = Depends(get_current_active_user)
+):
+    """Active user with superuser privileges"""
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Superuser privileges required"
+        )
+    return current_user
 
 async def get_current_admin_user():
     """Placeholder for admin user authentication"""
@@ -39,6 +44,9 @@ async def get_current_admin_user():
 __all__ = [
     'get_async_db',
     'get_db',  # Alias for get_async_db
+    'get_analytics_db',
+    'get_replica_db',
+    'get_replica_sync_db',
     'get_current_user',
     'get_current_active_user',
     'get_current_active_superuser',
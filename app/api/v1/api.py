@@ -11,6 +11,7 @@ from app.api.v1.endpoints import (
     admin,
     # templates,  # Temporarily disabled to isolate registration issues
     health,
+    analytics_routes,
     # team_optimization,  # Temporarily disabled due to import issues
     # Temporarily disabled due to missing models
     # teams,  # Needs Team, TeamMember models
@@ -126,6 +127,9 @@ if scoring:
 # Admin endpoints
 api_router.include_router(admin.router, prefix="/admin", tags=["Admin"])
 
+# Predictive analytics served from the model registry
+api_router.include_router(analytics_routes.router, prefix="/analytics", tags=["Analytics"])
+
 # Team optimization endpoints (temporarily disabled due to import issues)
 # api_router.include_router(team_optimization.router, tags=["Team Optimization"])
 
@@ -1,10 +1,11 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_active_superuser
 from app.schemas.user import UserOut as UserSchema
 from app.db.models.user import User as UserModel
+from app.core.query_monitor import db_monitor
 # Temporarily disabled due to syntax issues after async conversion
 # from app.services.user_service import get_users_by_organization, delete_user, restore_user, get_all_users
 
@@ -80,4 +81,30 @@ def restore_user_endpoint(
         )
     return {"message": "User restored successfully"}
 
+
+@router.get("/db/query-stats")
+def get_query_stats(
+    limit: int = Query(20, ge=1, le=500),
+    order_by: str = Query("total_time", pattern="^(total_time|mean_time|p95_time|calls|rows|errors)$"),
+    current_user: UserModel = Depends(get_current_active_superuser)
+) -> Dict[str, Any]:
+    """
+    Top SQL statement fingerprints seen by this worker, with the routes and
+    tasks issuing them. Requires superuser privileges.
+    """
+    return {
+        "summary": db_monitor.get_stats(),
+        "queries": db_monitor.get_top_queries(limit=limit, order_by=order_by)
+    }
+
+
+@router.delete("/db/query-stats", status_code=status.HTTP_204_NO_CONTENT)
+def reset_query_stats(
+    current_user: UserModel = Depends(get_current_active_superuser)
+):
+    """
+    Clear per-fingerprint query statistics. Requires superuser privileges.
+    """
+    db_monitor.reset_fingerprints()
+
 # You would also add endpoints for managing organizations, teams, assessments, etc. here.
\ No newline at end of file
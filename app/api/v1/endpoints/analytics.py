@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import (
-    get_async_db,
+    get_replica_sync_db,
     get_current_active_user,
     get_current_admin_user
 )
@@ -23,7 +23,7 @@ router = APIRouter()
 @router.get("/assessments/{assessment_id}")
 def get_assessment_analytics(
     assessment_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_replica_sync_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Dict[str, Any]:
     """
@@ -58,7 +58,7 @@ def get_assessment_analytics(
 
 @router.get("/users/me")
 def get_my_analytics(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_replica_sync_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Dict[str, Any]:
     """
@@ -71,7 +71,7 @@ def get_my_analytics(
 @router.get("/users/{user_id}")
 def get_user_analytics(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_replica_sync_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Dict[str, Any]:
     """
@@ -94,7 +94,7 @@ def get_user_analytics(
 @router.get("/teams/{team_id}")
 def get_team_analytics(
     team_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_replica_sync_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Dict[str, Any]:
     """
@@ -113,7 +113,7 @@ def get_team_analytics(
 
 @router.get("/system")
 def get_system_analytics(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_replica_sync_db),
     current_admin: User = Depends(get_current_admin_user)
 ) -> Dict[str, Any]:
     """
@@ -7,20 +7,25 @@ Installation:
 """
 
 from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, validator
 from typing import List, Optional, Dict
 from datetime import datetime, date
+import json
 import pandas as pd
 import numpy as np
 
 # Import analytics modules
-# In production, adjust these imports based on your project structure
-# from ai.predictor import OutcomePredictor, DropoutPredictor, ResponsePredictor
+from ai.predictor import ClientFeatures, ResponsePredictor
 # from ai.pattern_recognition import BehavioralPatternDetector, AnomalyDetector
 # from ai.longitudinal_analysis import LongitudinalAnalyzer, TimeSeriesForecaster
+from app.services.model_registry import model_registry
+from app.api.deps import get_current_active_user
 
-# Initialize routers
-router = APIRouter(prefix="/api/v1/analytics", tags=["Analytics"])
+# Initialize routers (mounted at /api/v1/analytics by app/api/v1/api.py).
+# Every endpoint takes clinical inputs, so all of them require a logged-in user.
+router = APIRouter(dependencies=[Depends(get_current_active_user)])
 
 
 # ============================================================================
@@ -30,7 +35,7 @@ router = APIRouter(prefix="/api/v1/analytics", tags=["Analytics"])
 class ClientFeaturesRequest(BaseModel):
     """Request model for client features."""
     age: int = Field(..., ge=18, le=100)
-    gender: str = Field(..., regex="^(male|female|other)$")
+    gender: str = Field(..., pattern="^(male|female|other)$")
     baseline_severity: float = Field(..., ge=0, le=27)
     diagnosis_code: str
     comorbidity_count: int = Field(..., ge=0)
@@ -71,18 +76,35 @@ class PredictDropoutRequest(BaseModel):
     client_id: str
 
 
+class BulkClientRequest(BaseModel):
+    """One client in a bulk scoring request."""
+    client_id: str
+    client_features: ClientFeaturesRequest
+
+
+# Upper bound on one bulk request; scoring a whole population belongs in a
+# task, not a single HTTP body
+BULK_MAX_CLIENTS = 100_000
+
+
+class BulkPredictRequest(BaseModel):
+    """Request for bulk outcome or dropout scoring."""
+    model: str = Field("dropout", pattern="^(outcome|dropout)$")
+    clients: List[BulkClientRequest] = Field(..., min_length=1, max_length=BULK_MAX_CLIENTS)
+
+
 class TrajectoryAnalysisRequest(BaseModel):
     """Request for trajectory analysis."""
     client_id: str
-    time_series: List[TimeSeriesData] = Field(..., min_items=5)
+    time_series: List[TimeSeriesData] = Field(..., min_length=5)
     prediction_periods: int = Field(4, ge=1, le=12)
 
 
 class PatternDetectionRequest(BaseModel):
     """Request for pattern detection."""
     client_id: str
-    time_series: List[TimeSeriesData] = Field(..., min_items=7)
-    pattern_type: str = Field("cyclical", regex="^(cyclical|trend|intervention)$")
+    time_series: List[TimeSeriesData] = Field(..., min_length=7)
+    pattern_type: str = Field("cyclical", pattern="^(cyclical|trend|intervention)$")
 
 
 class AnomalyDetectionRequest(BaseModel):
@@ -94,7 +116,7 @@ class AnomalyDetectionRequest(BaseModel):
 class InterventionAnalysisRequest(BaseModel):
     """Request for intervention effectiveness analysis."""
     client_id: str
-    time_series: List[TimeSeriesData] = Field(..., min_items=10)
+    time_series: List[TimeSeriesData] = Field(..., min_length=10)
     intervention_date: str
     intervention_name: str
     
@@ -111,6 +133,28 @@ class InterventionAnalysisRequest(BaseModel):
 # Predictive Analytics Endpoints
 # ============================================================================
 
+# Trajectory projection is a stateless heuristic; one instance serves all requests
+response_predictor = ResponsePredictor()
+
+# Clients scored per vectorized predict call in the bulk endpoint
+BULK_CHUNK_SIZE = 1000
+
+
+def _to_client_features(request: ClientFeaturesRequest) -> ClientFeatures:
+    return ClientFeatures(**request.dict())
+
+
+def _require_model(name: str):
+    """Loaded model from the registry, or 503 when none has been published"""
+    model = model_registry.get(name)
+    if model is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"No trained {name} model is available"
+        )
+    return model
+
+
 @router.post("/predict/outcome", status_code=status.HTTP_200_OK)
 async def predict_outcome(request: PredictOutcomeRequest):
     """
@@ -135,37 +179,21 @@ async def predict_outcome(request: PredictOutcomeRequest):
     }
     ```
     """
+    model = _require_model('outcome')
     try:
-        # In production, load pre-trained model
-        # predictor = OutcomePredictor.load_model('models/outcome_predictor.joblib')
-        
-        # For demo, return mock prediction
-        # Convert request to features object and predict
+        result = model.predictor.predict_outcome(_to_client_features(request.client_features))
         
-        # Mock response
-        predicted_value = request.client_features.baseline_severity - 6.5
-        
-        response = {
+        return {
             'client_id': request.client_id,
-            'predicted_improvement': max(0, float(predicted_value)),
-            'confidence_interval': (
-                float(predicted_value - 2.5),
-                float(predicted_value + 2.5)
-            ),
-            'confidence': 0.82,
-            'feature_importance': {
-                'therapeutic_alliance_score': 0.25,
-                'homework_completion_rate': 0.20,
-                'baseline_severity': 0.18,
-                'sessions_attended': 0.15,
-                'medication_adherence': 0.12
-            },
-            'model_type': 'random_forest',
-            'prediction_date': datetime.utcnow().isoformat()
+            'predicted_improvement': max(0, result.predicted_value),
+            'confidence_interval': result.confidence_interval,
+            'confidence': result.confidence,
+            'feature_importance': result.feature_importance,
+            'model_type': result.model_type,
+            'model_version': model.version,
+            'prediction_date': result.prediction_date
         }
         
-        return response
-        
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -191,25 +219,11 @@ async def predict_dropout_risk(request: PredictDropoutRequest):
     }
     ```
     """
+    model = _require_model('dropout')
     try:
-        # Calculate dropout risk based on features
-        # Mock calculation
-        risk_score = (
-            (1 - request.client_features.therapeutic_alliance_score / 5) * 0.4 +
-            (1 - request.client_features.homework_completion_rate) * 0.3 +
-            (request.client_features.missed_sessions / 10) * 0.3
-        )
-        
-        risk_score = min(max(risk_score, 0), 1)
-        
-        if risk_score < 0.2:
-            risk_level = 'low'
-        elif risk_score < 0.5:
-            risk_level = 'moderate'
-        elif risk_score < 0.7:
-            risk_level = 'high'
-        else:
-            risk_level = 'very_high'
+        prediction = model.predictor.predict_dropout_risk(_to_client_features(request.client_features))
+        risk_score = prediction['dropout_probability']
+        risk_level = prediction['risk_level']
         
         return {
             'client_id': request.client_id,
@@ -225,7 +239,9 @@ async def predict_dropout_risk(request: PredictDropoutRequest):
                 'Address barriers to homework completion' if request.client_features.homework_completion_rate < 0.5 else None,
                 'Explore reasons for missed sessions' if request.client_features.missed_sessions > 2 else None
             ],
-            'prediction_date': datetime.utcnow().isoformat()
+            'feature_importance': prediction['feature_importance'],
+            'model_version': model.version,
+            'prediction_date': prediction['prediction_date']
         }
         
     except Exception as e:
@@ -235,6 +251,61 @@ async def predict_dropout_risk(request: PredictDropoutRequest):
         )
 
 
+def _bulk_rows(model_name: str, chunk: List[BulkClientRequest], results: List) -> List[Dict]:
+    rows = []
+    for client, result in zip(chunk, results):
+        if model_name == 'outcome':
+            rows.append({
+                'client_id': client.client_id,
+                'predicted_improvement': max(0, result.predicted_value),
+                'confidence_interval': result.confidence_interval,
+                'confidence': result.confidence,
+                'prediction_date': result.prediction_date
+            })
+        else:
+            rows.append({
+                'client_id': client.client_id,
+                'dropout_probability': result['dropout_probability'],
+                'risk_level': result['risk_level'],
+                'prediction_date': result['prediction_date']
+            })
+    return rows
+
+
+@router.post("/predict/bulk", status_code=status.HTTP_200_OK)
+async def predict_bulk(request: BulkPredictRequest):
+    """
+    Score many clients with the outcome or dropout model.
+    
+    Clients are scored in vectorized chunks of BULK_CHUNK_SIZE and streamed
+    back as newline-delimited JSON, one object per client in request order.
+    The whole request is served by the model version current when it
+    started (sent in the X-Model-Version header). Feature importance is a
+    property of the model rather than the client, so rows omit it.
+    
+    A chunk that fails to score yields one {"client_id", "error"} row per
+    client instead of aborting the stream.
+    """
+    model = _require_model(request.model)
+    
+    async def generate():
+        for start in range(0, len(request.clients), BULK_CHUNK_SIZE):
+            chunk = request.clients[start:start + BULK_CHUNK_SIZE]
+            try:
+                features = [_to_client_features(client.client_features) for client in chunk]
+                results = await run_in_threadpool(model.predictor.predict_batch, features)
+                rows = _bulk_rows(request.model, chunk, results)
+            except Exception as e:
+                rows = [{'client_id': client.client_id, 'error': str(e)} for client in chunk]
+            yield ''.join(json.dumps(row) + '\n' for row in rows)
+    
+    return StreamingResponse(
+        generate(),
+        media_type='application/x-ndjson',
+        headers={'X-Model-Version': model.version}
+    )
+
+
 @router.post("/predict/trajectory", status_code=status.HTTP_200_OK)
 async def predict_trajectory(request: ClientFeaturesRequest):
     """
@@ -246,44 +317,16 @@ async def predict_trajectory(request: ClientFeaturesRequest):
     - Engagement score
     """
     try:
-        # Simple heuristic prediction
-        current = request.current_severity
-        baseline = request.baseline_severity
-        
-        # Calculate rate of change
-        if request.weeks_in_treatment > 0:
-            weekly_change = (current - baseline) / request.weeks_in_treatment
-        else:
-            weekly_change = 0
-        
-        # Adjust based on engagement
-        engagement_score = (
-            request.homework_completion_rate * 0.3 +
-            (request.therapeutic_alliance_score / 5) * 0.4 +
-            request.medication_adherence * 0.3
+        prediction = response_predictor.predict_response_trajectory(
+            _to_client_features(request),
+            weeks_ahead=8
         )
         
-        adjusted_change = weekly_change * (0.5 + engagement_score)
-        
-        # Project forward
-        trajectory = []
-        for week in range(1, 9):
-            predicted = current + (adjusted_change * week)
-            predicted = max(0, predicted)
-            uncertainty = 0.5 + (week * 0.1)
-            
-            trajectory.append({
-                'week': week,
-                'predicted_severity': float(predicted),
-                'lower_bound': float(max(0, predicted - uncertainty)),
-                'upper_bound': float(min(27, predicted + uncertainty))
-            })
-        
         return {
-            'current_severity': float(current),
-            'trajectory': trajectory,
-            'expected_change_8_weeks': float(adjusted_change * 8),
-            'engagement_score': float(engagement_score),
+            'current_severity': prediction['current_severity'],
+            'trajectory': prediction['trajectory'],
+            'expected_change_8_weeks': prediction['expected_change'],
+            'engagement_score': prediction['engagement_score'],
             'prediction_date': datetime.utcnow().isoformat()
         }
         
@@ -618,18 +661,11 @@ async def health_check():
             'anomaly_detection': True,
             'longitudinal_analysis': True
         },
+        'models': model_registry.status(),
         'timestamp': datetime.utcnow().isoformat()
     }
 
 
-# Integration with main FastAPI app
-# Add to main.py:
-"""
-from app.api.routes import analytics_routes
-
-app.include_router(analytics_routes.router)
-"""
-
 if __name__ == "__main__":
     import uvicorn
     from fastapi import FastAPI
@@ -640,7 +676,7 @@ if __name__ == "__main__":
         version="1.0.0"
     )
     
-    app.include_router(router)
+    app.include_router(router, prefix="/api/v1/analytics", tags=["Analytics"])
     
     print("Starting Analytics API server...")
     print("API docs: http://localhost:8000/docs")
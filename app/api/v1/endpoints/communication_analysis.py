@@ -10,7 +10,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_db, get_analytics_db, get_replica_db
 from app.db.models.user import User
 from app.services.nlp_analysis_service import nlp_analysis_service
 from app.services.communication_pattern_service import communication_pattern_service
@@ -18,7 +18,6 @@ from app.services.culture_health_service import culture_health_service
 from app.services.coaching_recommendation_service import coaching_recommendation_service
 from app.db.models.communication_analysis import CommunicationAnalysis
 from app.db.models.communication_patterns import CommunicationPatterns
-from app.db.models.culture_metrics import CultureMetrics
 from app.db.models.coaching_recommendations import CoachingRecommendation
 from app.core.logging_config import logger
 
@@ -63,6 +62,7 @@ class CultureHealthResponse(BaseModel):
     health_level: str
     risk_factors: List[str]
     strengths: List[str]
+    communication: Optional[Dict[str, Any]] = None
 
 class CoachingRecommendationResponse(BaseModel):
     id: str
@@ -87,7 +87,7 @@ class InsightsSummaryResponse(BaseModel):
 async def get_sentiment_summary(
     days_back: int = Query(default=30, ge=1, le=365),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_analytics_db)
 ):
     """
     Get sentiment analysis summary for user's communications
@@ -109,7 +109,7 @@ async def get_sentiment_summary(
 async def get_communication_patterns(
     days_back: int = Query(default=30, ge=1, le=365),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_analytics_db)
 ):
     """
     Get detailed communication patterns analysis
@@ -148,7 +148,7 @@ async def get_communication_patterns(
 async def get_behavioral_indicators(
     days_back: int = Query(default=30, ge=1, le=365),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_analytics_db)
 ):
     """
     Get behavioral indicators based on communication analysis
@@ -190,7 +190,7 @@ async def get_team_culture_health(
     team_id: Optional[str] = Query(None, description="Team ID (optional, uses user's team if not provided)"),
     days_back: int = Query(default=30, ge=1, le=365),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_replica_db)
 ):
     """
     Get culture health analysis for team
@@ -207,7 +207,7 @@ async def get_team_culture_health(
                 detail="Team ID required for culture analysis"
             )
 
-        # Generate or get culture metrics
+        # Read from the daily communication rollups (O(days))
         culture_metrics = await culture_health_service.analyze_team_culture(db, target_team_id, days_back)
 
         if not culture_metrics:
@@ -224,7 +224,8 @@ async def get_team_culture_health(
             overall_health_score=culture_metrics.overall_health_score,
             health_level=culture_metrics.health_level.value if hasattr(culture_metrics.health_level, 'value') else str(culture_metrics.health_level),
             risk_factors=culture_metrics.risk_factors_identified,
-            strengths=culture_metrics.strength_indicators
+            strengths=culture_metrics.strength_indicators,
+            communication=culture_metrics.communication
         )
     except HTTPException:
         raise
@@ -239,7 +240,7 @@ async def get_team_culture_health(
 async def get_organization_culture_health(
     days_back: int = Query(default=30, ge=1, le=365),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_replica_db)
 ):
     """
     Get culture health analysis for organization
@@ -251,7 +252,7 @@ async def get_organization_culture_health(
                 detail="User must belong to an organization"
             )
 
-        # Generate or get culture metrics
+        # Read from the daily communication rollups (O(days))
         culture_metrics = await culture_health_service.analyze_organization_culture(db, current_user.organization_id, days_back)
 
         if not culture_metrics:
@@ -268,7 +269,8 @@ async def get_organization_culture_health(
             overall_health_score=culture_metrics.overall_health_score,
             health_level=culture_metrics.health_level.value if hasattr(culture_metrics.health_level, 'value') else str(culture_metrics.health_level),
             risk_factors=culture_metrics.risk_factors_identified,
-            strengths=culture_metrics.strength_indicators
+            strengths=culture_metrics.strength_indicators,
+            communication=culture_metrics.communication
         )
     except HTTPException:
         raise
@@ -283,7 +285,7 @@ async def get_organization_culture_health(
 async def get_coaching_recommendations(
     days_back: int = Query(default=30, ge=1, le=365),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_analytics_db)
 ):
     """
     Get personalized coaching recommendations
@@ -331,7 +333,7 @@ async def get_coaching_recommendations(
 async def get_insights_summary(
     days_back: int = Query(default=30, ge=1, le=365),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_analytics_db)
 ):
     """
     Get comprehensive insights summary combining all analysis types
@@ -416,7 +418,7 @@ async def complete_recommendation(
 async def get_coaching_effectiveness(
     days_back: int = Query(default=90, ge=1, le=365),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_analytics_db)
 ):
     """
     Get analysis of coaching recommendation effectiveness
@@ -461,17 +463,22 @@ async def trigger_analysis(
             recommendations = await coaching_recommendation_service.generate_user_recommendations(db, current_user.id, 30)
             for rec in recommendations:
                 db.add(rec)
-        await db.commit()
+            await db.commit()
             results["recommendations"] = f"Generated {len(recommendations)} recommendations"
 
         if analysis_type in ["culture", "all"] and current_user.organization_id:
-            # Trigger organization culture analysis (admin only)
+            # Culture health is no longer stored as CultureMetrics snapshots:
+            # the daily communication rollups are the history, and the culture
+            # endpoints score any window from them on read. Triggering only
+            # reports the current 30-day scores.
             if current_user.role == "admin":
                 culture_metrics = await culture_health_service.analyze_organization_culture(db, current_user.organization_id, 30)
                 if culture_metrics:
-                    db.add(culture_metrics)
-        await db.commit()
                     results["culture"] = "Culture analysis completed successfully"
+                    results["culture_health"] = {
+                        "overall_health_score": culture_metrics.overall_health_score,
+                        "health_level": culture_metrics.health_level
+                    }
                 else:
                     results["culture"] = "Insufficient data for culture analysis"
             else:
@@ -492,7 +499,7 @@ async def trigger_analysis(
 @router.get("/dashboard/metrics")
 async def get_dashboard_metrics(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_analytics_db)
 ):
     """
     Get key metrics for dashboard display
@@ -32,9 +32,342 @@ class AssessmentScore:
         return asdict(self)
 
 
+@dataclass
+class BatchScoreResult:
+    """
+    Columnar results from scoring many respondents of one assessment.
+    
+    Every array has one entry per respondent, in input order.
+    """
+    assessment_id: str
+    total_score: np.ndarray
+    subscale_scores: Dict[str, np.ndarray]
+    subscale_levels: Dict[str, np.ndarray]
+    severity_band: np.ndarray
+    severity_level: np.ndarray
+    clinical_significance: np.ndarray
+    flags: Dict[str, np.ndarray]
+    
+    def __len__(self) -> int:
+        return len(self.total_score)
+    
+    def row(self, index: int) -> Dict:
+        """Scalar values for a single respondent."""
+        return {
+            'total_score': float(self.total_score[index]),
+            'subscale_scores': {k: float(v[index]) for k, v in self.subscale_scores.items()},
+            'subscale_levels': {k: str(v[index]) for k, v in self.subscale_levels.items()},
+            'severity_band': int(self.severity_band[index]),
+            'severity_level': str(self.severity_level[index]),
+            'clinical_significance': str(self.clinical_significance[index]),
+            'flags': {k: v[index].item() for k, v in self.flags.items()}
+        }
+    
+    def to_dict(self) -> Dict[str, list]:
+        """Flat column name -> list of values."""
+        columns = {
+            'total_score': self.total_score.tolist(),
+            'severity_level': self.severity_level.tolist(),
+            'clinical_significance': self.clinical_significance.tolist()
+        }
+        for name, values in self.subscale_scores.items():
+            columns[f'{name}_score'] = values.tolist()
+        for name, values in self.subscale_levels.items():
+            columns[f'{name}_level'] = values.tolist()
+        for name, values in self.flags.items():
+            columns[name] = values.tolist()
+        return columns
+    
+    def to_dataframe(self):
+        """Results as a pandas DataFrame."""
+        import pandas as pd
+        return pd.DataFrame(self.to_dict())
+
+
+# Scoring rules per instrument. Columns of a responses matrix are items 1..n.
+#   total: 'sum' (all items, or total_items), 'subscales' (sum of subscales)
+#          or 'count_endorsed' (number of items answered 1)
+#   severity_basis: 'total' or 'max_subscale'
+#   severity_cutoffs: lower bounds of bands 1..n; band 0 is below the first
+#   significance: clinical significance per severity band, unless
+#          significance_cutoffs/significance_labels band the total separately
+#   recommendations: per severity band
+INSTRUMENT_SPECS: Dict[str, Dict] = {
+    'phq9': {
+        'n_items': 9,
+        'total': 'sum',
+        'severity_cutoffs': [5, 10, 15, 20],
+        'severity_labels': ["None-Minimal", "Mild", "Moderate", "Moderately Severe", "Severe"],
+        'significance': ["none", "mild", "moderate", "severe", "severe"],
+        'recommendations': [
+            ["Monitor if symptoms worsen"],
+            [
+                "Watchful waiting",
+                "Consider psychotherapy if symptoms persist",
+                "Lifestyle modifications"
+            ],
+            [
+                "Psychotherapy recommended",
+                "Consider medication evaluation",
+                "Regular monitoring (every 2 weeks)"
+            ],
+            [
+                "Active treatment warranted",
+                "Psychotherapy AND/OR medication",
+                "Close monitoring (weekly)",
+                "Consider psychiatric consultation"
+            ],
+            [
+                "Immediate treatment required",
+                "Psychiatric consultation recommended",
+                "Consider intensive outpatient or inpatient care",
+                "Weekly monitoring minimum"
+            ]
+        ]
+    },
+    'gad7': {
+        'n_items': 7,
+        'total': 'sum',
+        'severity_cutoffs': [5, 10, 15],
+        'severity_labels': ["Minimal", "Mild", "Moderate", "Severe"],
+        'significance': ["none", "mild", "moderate", "severe"],
+        'recommendations': [
+            ["No treatment needed", "Monitor if symptoms worsen"],
+            [
+                "Psychoeducation about anxiety",
+                "Self-help resources",
+                "Consider brief counseling"
+            ],
+            [
+                "Probable anxiety disorder - treatment recommended",
+                "Cognitive-behavioral therapy (CBT)",
+                "Consider medication evaluation",
+                "Regular monitoring"
+            ],
+            [
+                "Active treatment required",
+                "CBT and/or medication",
+                "Consider psychiatric consultation",
+                "Weekly monitoring"
+            ]
+        ]
+    },
+    'dass21': {
+        'n_items': 21,
+        'total': 'subscales',
+        'subscales': {
+            'depression': [3, 5, 10, 13, 16, 17, 21],
+            'anxiety': [2, 4, 7, 9, 15, 19, 20],
+            'stress': [1, 6, 8, 11, 12, 14, 18]
+        },
+        # Scores are multiplied by 2 to match DASS-42
+        'subscale_multiplier': 2,
+        'subscale_bands': {
+            'depression': [10, 14, 21, 28],
+            'anxiety': [8, 10, 15, 20],
+            'stress': [15, 19, 26, 34]
+        },
+        'subscale_labels': ["Normal", "Mild", "Moderate", "Severe", "Extremely Severe"],
+        'severity_basis': 'max_subscale',
+        'severity_cutoffs': [10, 20, 28],
+        'severity_labels': ["Normal", "Mild", "Moderate", "Severe"],
+        'significance': ["none", "mild", "moderate", "severe"]
+    },
+    'bdi': {
+        'n_items': 21,
+        'total': 'sum',
+        'severity_cutoffs': [14, 20, 29],
+        'severity_labels': ["Minimal", "Mild", "Moderate", "Severe"],
+        'significance': ["none", "mild", "moderate", "severe"],
+        'recommendations': [
+            ["No treatment indicated", "Monitor symptoms"],
+            [
+                "Psychotherapy may be beneficial",
+                "Self-help interventions",
+                "Reassess in 2-4 weeks"
+            ],
+            [
+                "Psychotherapy recommended",
+                "Consider medication evaluation",
+                "Regular monitoring"
+            ],
+            [
+                "Immediate treatment needed",
+                "Psychotherapy AND medication likely needed",
+                "Risk assessment for self-harm",
+                "Consider intensive treatment"
+            ]
+        ]
+    },
+    'audit': {
+        # Items 1-8 scored 0-4, items 9-10 scored 0, 2, 4
+        'n_items': 10,
+        'total': 'sum',
+        'total_items': list(range(1, 11)),
+        'severity_cutoffs': [8, 16, 20],
+        'severity_labels': ["Low Risk", "Hazardous Drinking", "Harmful Drinking", "Alcohol Dependence"],
+        'significance': ["none", "moderate", "severe", "severe"],
+        'recommendations': [
+            [
+                "No intervention needed",
+                "Provide alcohol education materials"
+            ],
+            [
+                "Brief intervention recommended",
+                "Provide feedback about risks",
+                "Motivational enhancement therapy",
+                "Reassess in 3 months"
+            ],
+            [
+                "Brief intervention + counseling",
+                "Consider outpatient treatment program",
+                "Monitor closely",
+                "Assess for alcohol dependence"
+            ],
+            [
+                "Comprehensive assessment needed",
+                "Refer to addiction specialist",
+                "Consider intensive outpatient or inpatient treatment",
+                "Medical evaluation for withdrawal management",
+                "Support group referral (AA, SMART Recovery)"
+            ]
+        ]
+    },
+    'ace': {
+        'n_items': 10,
+        'total': 'count_endorsed',
+        'severity_cutoffs': [1, 4],
+        'severity_labels': ["No ACEs", "Moderate ACE Exposure", "High ACE Exposure"],
+        'significance': ["none", "mild", "severe"],
+        'recommendations': [
+            ["No specific trauma-informed interventions needed"],
+            [
+                "Acknowledge ACE history in treatment planning",
+                "Consider trauma-informed care approach",
+                "Assess current impact of early experiences"
+            ],
+            [
+                "High priority for trauma-informed care",
+                "Consider trauma-focused therapy (EMDR, TF-CBT)",
+                "Assess for complex trauma/PTSD",
+                "Build safety and stabilization first",
+                "Screen for dissociation"
+            ]
+        ]
+    },
+    'stai': {
+        'n_items': 40,
+        'total': 'subscales',
+        'subscales': {
+            'state_anxiety': list(range(1, 21)),
+            'trait_anxiety': list(range(21, 41))
+        },
+        'subscale_bands': {
+            'state_anxiety': [40, 60],
+            'trait_anxiety': [40, 60]
+        },
+        'subscale_labels': ["Low anxiety", "Moderate anxiety", "High anxiety"],
+        'severity_basis': 'max_subscale',
+        'severity_cutoffs': [40, 60],
+        'severity_labels': ["Low Anxiety", "Moderate Anxiety", "High Anxiety"],
+        'significance': ["none", "moderate", "severe"],
+        'recommendations': [
+            ["No intervention needed"],
+            [
+                "Monitor anxiety symptoms",
+                "Stress management techniques",
+                "Consider brief counseling"
+            ],
+            [
+                "Anxiety treatment recommended",
+                "CBT or other evidence-based therapy",
+                "Consider medication evaluation"
+            ]
+        ]
+    },
+    'pcl5': {
+        'n_items': 20,
+        'total': 'sum',
+        # DSM-5 clusters
+        'subscales': {
+            'intrusion': [1, 2, 3, 4, 5],
+            'avoidance': [6, 7],
+            'negative_alterations': [8, 9, 10, 11, 12, 13, 14],
+            'arousal_reactivity': [15, 16, 17, 18, 19, 20]
+        },
+        'severity_cutoffs': [31, 45],
+        'severity_labels': ["Below Cutoff", "Probable PTSD", "Severe PTSD Symptoms"],
+        'significance_cutoffs': [10, 31, 45],
+        'significance_labels': ["none", "mild", "moderate", "severe"]
+    },
+    'eq': {
+        'n_items': 40,
+        'total': 'sum',
+        'severity_cutoffs': [30, 52],
+        'severity_labels': ["Low Empathy", "Average Empathy", "High Empathy"],
+        'significance': ["none", "none", "none"],
+        'recommendations': [
+            ["May benefit from social skills training"],
+            ["Empathy within normal range"],
+            ["Above average empathy"]
+        ]
+    },
+    'iat': {
+        'n_items': 20,
+        'total': 'sum',
+        'severity_cutoffs': [40, 70],
+        'severity_labels': ["Average Online User", "Frequent Problems", "Significant Problems"],
+        'significance': ["none", "moderate", "severe"],
+        'recommendations': [
+            ["No intervention needed"],
+            [
+                "Consider reducing internet use",
+                "Set boundaries and schedules",
+                "Brief counseling may help"
+            ],
+            [
+                "Internet use causing significant impairment",
+                "Specialized treatment recommended",
+                "CBT for internet addiction"
+            ]
+        ]
+    },
+    'pcq': {
+        'n_items': 24,
+        'total': 'subscales',
+        'subscales': {
+            'hope': list(range(1, 7)),
+            'efficacy': list(range(7, 13)),
+            'resilience': list(range(13, 19)),
+            'optimism': list(range(19, 25))
+        },
+        'severity_cutoffs': [72, 108],
+        'severity_labels': ["Low PsyCap", "Moderate PsyCap", "High PsyCap"],
+        'significance': ["none", "none", "none"],
+        'recommendations': [
+            ["May benefit from resilience-building interventions"],
+            ["Average psychological capital"],
+            ["Strong psychological resources"]
+        ]
+    },
+    'msi': {
+        'n_items': 150,
+        'total': 'sum',
+        'severity_cutoffs': [],
+        'severity_labels': ["Variable"],
+        'significance': ["moderate"],
+        'recommendations': [["Couples therapy may be beneficial"]]
+    }
+}
+
+
 class ScoringEngine:
     """
     Main scoring engine for all clinical assessments.
+    
+    score_batch() scores a whole (respondents x items) matrix at once from
+    INSTRUMENT_SPECS; the per-instrument score_* methods score a single
+    responses dict through it and add the narrative interpretation.
     """
     
     def __init__(self):
@@ -67,7 +400,9 @@ class ScoringEngine:
         
         Args:
             assessment_id: Assessment identifier
-            responses: Dictionary of item_number -> response_value
+            responses: Dictionary of item_number -> response_value; item
+                numbers may be ints or numeric strings such as "3" and must
+                be between 1 and the instrument's item count
             demographics: Optional demographic info for normative comparison
             
         Returns:
@@ -78,6 +413,164 @@ class ScoringEngine:
         
         return self.scoring_methods[assessment_id](responses, demographics)
     
+    # ========================================================================
+    # Batch Scoring
+    # ========================================================================
+    
+    def score_batch(self, assessment_type: str, responses_matrix) -> BatchScoreResult:
+        """
+        Score many respondents of one assessment at once.
+        
+        Args:
+            assessment_type: Assessment identifier (key of INSTRUMENT_SPECS)
+            responses_matrix: (n_respondents x n_items) array where column j
+                holds item j + 1, or a DataFrame whose columns are item
+                numbers. NaN marks an unanswered item and scores as 0.
+            
+        Returns:
+            BatchScoreResult with one entry per respondent
+        
+        Raises:
+            ValueError: Unknown assessment, or item numbers outside 1..n_items
+        """
+        spec = INSTRUMENT_SPECS.get(assessment_type)
+        if spec is None:
+            raise ValueError(f"Batch scoring not implemented for {assessment_type}")
+        
+        raw = self._as_item_matrix(responses_matrix, spec['n_items'])
+        
+        reverse_items = spec.get('reverse_items')
+        if reverse_items:
+            low, high = spec['item_range']
+            cols = np.asarray(reverse_items) - 1
+            raw[:, cols] = (low + high) - raw[:, cols]
+        
+        values = np.nan_to_num(raw, nan=0.0)
+        
+        multiplier = spec.get('subscale_multiplier', 1)
+        subscale_scores = {
+            name: values[:, np.asarray(items) - 1].sum(axis=1) * multiplier
+            for name, items in spec.get('subscales', {}).items()
+        }
+        
+        if spec['total'] == 'subscales':
+            total = np.sum(list(subscale_scores.values()), axis=0)
+        elif spec['total'] == 'count_endorsed':
+            total = (values == 1).sum(axis=1).astype(float)
+        elif 'total_items' in spec:
+            total = values[:, np.asarray(spec['total_items']) - 1].sum(axis=1)
+        else:
+            total = values.sum(axis=1)
+        
+        labels = np.asarray(spec.get('subscale_labels', []), dtype=object)
+        subscale_levels = {
+            name: labels[np.searchsorted(cutoffs, subscale_scores[name], side='right')]
+            for name, cutoffs in spec.get('subscale_bands', {}).items()
+        }
+        
+        if spec.get('severity_basis') == 'max_subscale':
+            basis = np.max(list(subscale_scores.values()), axis=0)
+        else:
+            basis = total
+        
+        band = np.searchsorted(spec['severity_cutoffs'], basis, side='right')
+        severity = np.asarray(spec['severity_labels'], dtype=object)[band]
+        
+        if 'significance_cutoffs' in spec:
+            significance = np.asarray(spec['significance_labels'], dtype=object)[
+                np.searchsorted(spec['significance_cutoffs'], total, side='right')
+            ]
+        else:
+            significance = np.asarray(spec['significance'], dtype=object)[band]
+        
+        return BatchScoreResult(
+            assessment_id=assessment_type,
+            total_score=total,
+            subscale_scores=subscale_scores,
+            subscale_levels=subscale_levels,
+            severity_band=band,
+            severity_level=severity,
+            clinical_significance=significance,
+            flags=self._batch_flags(assessment_type, values, spec)
+        )
+    
+    @staticmethod
+    def _item_columns(items, n_items: int) -> np.ndarray:
+        """
+        Zero-based columns for 1-based item numbers.
+        
+        Raises ValueError for items outside 1..n_items rather than letting
+        item 0 or a negative key wrap around onto the last items.
+        """
+        columns = np.asarray([int(item) for item in items], dtype=int) - 1
+        invalid = (columns < 0) | (columns >= n_items)
+        if invalid.any():
+            bad = sorted({int(item) for item, flag in zip(items, invalid) if flag})
+            raise ValueError(f"Item numbers must be between 1 and {n_items}, got {bad}")
+        return columns
+    
+    @staticmethod
+    def _as_item_matrix(responses_matrix, n_items: int) -> np.ndarray:
+        """Float matrix with n_items columns, column j = item j + 1."""
+        if hasattr(responses_matrix, 'columns'):
+            columns = ScoringEngine._item_columns(list(responses_matrix.columns), n_items)
+            data = responses_matrix.to_numpy(dtype=float, na_value=np.nan)
+            matrix = np.full((len(data), n_items), np.nan)
+            matrix[:, columns] = data
+            return matrix
+        
+        matrix = np.array(responses_matrix, dtype=float, ndmin=2)
+        if matrix.shape[1] > n_items:
+            raise ValueError(f"Expected at most {n_items} item columns, got {matrix.shape[1]}")
+        if matrix.shape[1] < n_items:
+            padding = np.full((matrix.shape[0], n_items - matrix.shape[1]), np.nan)
+            matrix = np.hstack([matrix, padding])
+        return matrix
+    
+    @staticmethod
+    def _batch_flags(assessment_type: str, values: np.ndarray, spec: Dict) -> Dict[str, np.ndarray]:
+        """Instrument-specific item-level alerts and criteria."""
+        if assessment_type == 'phq9':
+            # Item 9 is suicide risk (needs special attention)
+            return {'suicide_risk': values[:, 8]}
+        
+        if assessment_type == 'pcl5':
+            # Provisional PTSD diagnosis (DSM-5 criteria): item rated >= 2
+            # in at least 1 B, 1 C, 2 D and 2 E items
+            endorsed = values >= 2
+            clusters = spec['subscales']
+            counts = {
+                name: endorsed[:, np.asarray(items) - 1].sum(axis=1)
+                for name, items in clusters.items()
+            }
+            meets = (
+                (counts['intrusion'] >= 1) &
+                (counts['avoidance'] >= 1) &
+                (counts['negative_alterations'] >= 2) &
+                (counts['arousal_reactivity'] >= 2)
+            )
+            return {'provisional_ptsd': meets}
+        
+        return {}
+    
+    def _score_single(self, assessment_type: str, responses: Dict) -> Dict:
+        """Score one responses dict through score_batch; keys may be ints or numeric strings."""
+        spec = INSTRUMENT_SPECS[assessment_type]
+        row = np.full((1, spec['n_items']), np.nan)
+        row[0, self._item_columns(list(responses), spec['n_items'])] = list(responses.values())
+        
+        scored = self.score_batch(assessment_type, row).row(0)
+        recommendations = spec.get('recommendations')
+        scored['recommendations'] = (
+            list(recommendations[scored['severity_band']]) if recommendations else []
+        )
+        return scored
+    
+    @staticmethod
+    def _fmt(score: float):
+        """Display whole-number scores without a trailing .0"""
+        return int(score) if float(score).is_integer() else score
+    
     # ========================================================================
     # Screening Tools
     # ========================================================================
@@ -89,51 +582,13 @@ class ScoringEngine:
         Items 1-9: Each scored 0-3
         Total: 0-27
         """
-        # Calculate total score
-        total_score = sum(responses.values())
+        scored = self._score_single('phq9', responses)
+        total_score = self._fmt(scored['total_score'])
+        severity = scored['severity_level']
+        recommendations = scored['recommendations']
         
         # Item 9 is suicide risk (needs special attention)
-        suicide_risk_score = responses.get(9, 0)
-        
-        # Determine severity
-        if total_score < 5:
-            severity = "None-Minimal"
-            clinical_sig = "none"
-            recommendations = ["Monitor if symptoms worsen"]
-        elif total_score < 10:
-            severity = "Mild"
-            clinical_sig = "mild"
-            recommendations = [
-                "Watchful waiting",
-                "Consider psychotherapy if symptoms persist",
-                "Lifestyle modifications"
-            ]
-        elif total_score < 15:
-            severity = "Moderate"
-            clinical_sig = "moderate"
-            recommendations = [
-                "Psychotherapy recommended",
-                "Consider medication evaluation",
-                "Regular monitoring (every 2 weeks)"
-            ]
-        elif total_score < 20:
-            severity = "Moderately Severe"
-            clinical_sig = "severe"
-            recommendations = [
-                "Active treatment warranted",
-                "Psychotherapy AND/OR medication",
-                "Close monitoring (weekly)",
-                "Consider psychiatric consultation"
-            ]
-        else:
-            severity = "Severe"
-            clinical_sig = "severe"
-            recommendations = [
-                "Immediate treatment required",
-                "Psychiatric consultation recommended",
-                "Consider intensive outpatient or inpatient care",
-                "Weekly monitoring minimum"
-            ]
+        suicide_risk_score = self._fmt(scored['flags']['suicide_risk'])
         
         # Add suicide risk recommendations
         if suicide_risk_score > 0:
@@ -151,12 +606,12 @@ class ScoringEngine:
         
         return AssessmentScore(
             assessment_id='phq9',
-            total_score=float(total_score),
+            total_score=scored['total_score'],
             subscale_scores={},
             percentile=None,
             severity_level=severity,
             interpretation=interpretation.strip(),
-            clinical_significance=clinical_sig,
+            clinical_significance=scored['clinical_significance'],
             recommendations=recommendations,
             scored_at=datetime.utcnow().isoformat()
         )
@@ -168,39 +623,9 @@ class ScoringEngine:
         Items 1-7: Each scored 0-3
         Total: 0-21
         """
-        total_score = sum(responses.values())
-        
-        # Determine severity
-        if total_score < 5:
-            severity = "Minimal"
-            clinical_sig = "none"
-            recommendations = ["No treatment needed", "Monitor if symptoms worsen"]
-        elif total_score < 10:
-            severity = "Mild"
-            clinical_sig = "mild"
-            recommendations = [
-                "Psychoeducation about anxiety",
-                "Self-help resources",
-                "Consider brief counseling"
-            ]
-        elif total_score < 15:
-            severity = "Moderate"
-            clinical_sig = "moderate"
-            recommendations = [
-                "Probable anxiety disorder - treatment recommended",
-                "Cognitive-behavioral therapy (CBT)",
-                "Consider medication evaluation",
-                "Regular monitoring"
-            ]
-        else:
-            severity = "Severe"
-            clinical_sig = "severe"
-            recommendations = [
-                "Active treatment required",
-                "CBT and/or medication",
-                "Consider psychiatric consultation",
-                "Weekly monitoring"
-            ]
+        scored = self._score_single('gad7', responses)
+        total_score = self._fmt(scored['total_score'])
+        severity = scored['severity_level']
         
         interpretation = f"""
         GAD-7 Score: {total_score}/21 - {severity} Anxiety
@@ -211,13 +636,13 @@ class ScoringEngine:
         
         return AssessmentScore(
             assessment_id='gad7',
-            total_score=float(total_score),
+            total_score=scored['total_score'],
             subscale_scores={},
             percentile=None,
             severity_level=severity,
             interpretation=interpretation.strip(),
-            clinical_significance=clinical_sig,
-            recommendations=recommendations,
+            clinical_significance=scored['clinical_significance'],
+            recommendations=scored['recommendations'],
             scored_at=datetime.utcnow().isoformat()
         )
     
@@ -228,58 +653,18 @@ class ScoringEngine:
         Three subscales of 7 items each.
         Scores are multiplied by 2 to match DASS-42.
         """
-        # Subscale item assignments
-        depression_items = [3, 5, 10, 13, 16, 17, 21]
-        anxiety_items = [2, 4, 7, 9, 15, 19, 20]
-        stress_items = [1, 6, 8, 11, 12, 14, 18]
-        
-        # Calculate subscale scores
-        depression = sum(responses.get(i, 0) for i in depression_items) * 2
-        anxiety = sum(responses.get(i, 0) for i in anxiety_items) * 2
-        stress = sum(responses.get(i, 0) for i in stress_items) * 2
-        
-        total_score = depression + anxiety + stress
-        
-        # Severity interpretation
-        def interpret_depression(score):
-            if score < 10: return "Normal"
-            elif score < 14: return "Mild"
-            elif score < 21: return "Moderate"
-            elif score < 28: return "Severe"
-            else: return "Extremely Severe"
-        
-        def interpret_anxiety(score):
-            if score < 8: return "Normal"
-            elif score < 10: return "Mild"
-            elif score < 15: return "Moderate"
-            elif score < 20: return "Severe"
-            else: return "Extremely Severe"
-        
-        def interpret_stress(score):
-            if score < 15: return "Normal"
-            elif score < 19: return "Mild"
-            elif score < 26: return "Moderate"
-            elif score < 34: return "Severe"
-            else: return "Extremely Severe"
-        
-        dep_level = interpret_depression(depression)
-        anx_level = interpret_anxiety(anxiety)
-        str_level = interpret_stress(stress)
-        
-        # Overall severity (highest subscale)
-        max_subscale = max(depression, anxiety, stress)
-        if max_subscale >= 28:
-            overall_severity = "Severe"
-            clinical_sig = "severe"
-        elif max_subscale >= 20:
-            overall_severity = "Moderate"
-            clinical_sig = "moderate"
-        elif max_subscale >= 10:
-            overall_severity = "Mild"
-            clinical_sig = "mild"
-        else:
-            overall_severity = "Normal"
-            clinical_sig = "none"
+        scored = self._score_single('dass21', responses)
+        subscales = scored['subscale_scores']
+        levels = scored['subscale_levels']
+        overall_severity = scored['severity_level']
+        
+        depression = self._fmt(subscales['depression'])
+        anxiety = self._fmt(subscales['anxiety'])
+        stress = self._fmt(subscales['stress'])
+        
+        dep_level = levels['depression']
+        anx_level = levels['anxiety']
+        str_level = levels['stress']
         
         recommendations = []
         if dep_level != "Normal":
@@ -303,16 +688,12 @@ class ScoringEngine:
         
         return AssessmentScore(
             assessment_id='dass21',
-            total_score=float(total_score),
-            subscale_scores={
-                'depression': float(depression),
-                'anxiety': float(anxiety),
-                'stress': float(stress)
-            },
+            total_score=scored['total_score'],
+            subscale_scores=subscales,
             percentile=None,
             severity_level=overall_severity,
             interpretation=interpretation.strip(),
-            clinical_significance=clinical_sig,
+            clinical_significance=scored['clinical_significance'],
             recommendations=recommendations,
             scored_at=datetime.utcnow().isoformat()
         )
@@ -324,50 +705,9 @@ class ScoringEngine:
         10 items: Items 1-8 scored 0-4, Items 9-10 scored 0,2,4
         Total: 0-40
         """
-        # Items 1-8: Standard 0-4 scoring
-        standard_items = sum(responses.get(i, 0) for i in range(1, 9))
-        
-        # Items 9-10: Special scoring (0, 2, 4 only)
-        special_items = sum(responses.get(i, 0) for i in [9, 10])
-        
-        total_score = standard_items + special_items
-        
-        # Interpretation
-        if total_score < 8:
-            severity = "Low Risk"
-            clinical_sig = "none"
-            recommendations = [
-                "No intervention needed",
-                "Provide alcohol education materials"
-            ]
-        elif total_score < 16:
-            severity = "Hazardous Drinking"
-            clinical_sig = "moderate"
-            recommendations = [
-                "Brief intervention recommended",
-                "Provide feedback about risks",
-                "Motivational enhancement therapy",
-                "Reassess in 3 months"
-            ]
-        elif total_score < 20:
-            severity = "Harmful Drinking"
-            clinical_sig = "severe"
-            recommendations = [
-                "Brief intervention + counseling",
-                "Consider outpatient treatment program",
-                "Monitor closely",
-                "Assess for alcohol dependence"
-            ]
-        else:
-            severity = "Alcohol Dependence"
-            clinical_sig = "severe"
-            recommendations = [
-                "Comprehensive assessment needed",
-                "Refer to addiction specialist",
-                "Consider intensive outpatient or inpatient treatment",
-                "Medical evaluation for withdrawal management",
-                "Support group referral (AA, SMART Recovery)"
-            ]
+        scored = self._score_single('audit', responses)
+        total_score = self._fmt(scored['total_score'])
+        severity = scored['severity_level']
         
         interpretation = f"""
         AUDIT Score: {total_score}/40 - {severity}
@@ -382,13 +722,13 @@ class ScoringEngine:
         
         return AssessmentScore(
             assessment_id='audit',
-            total_score=float(total_score),
+            total_score=scored['total_score'],
             subscale_scores={},
             percentile=None,
             severity_level=severity,
             interpretation=interpretation.strip(),
-            clinical_significance=clinical_sig,
-            recommendations=recommendations,
+            clinical_significance=scored['clinical_significance'],
+            recommendations=scored['recommendations'],
             scored_at=datetime.utcnow().isoformat()
         )
     
@@ -399,32 +739,10 @@ class ScoringEngine:
         10 yes/no questions
         Score: Number of "yes" responses (0-10)
         """
-        # Count yes responses (assuming yes=1, no=0)
-        total_score = sum(1 for v in responses.values() if v == 1)
-        
-        # Interpretation
-        if total_score == 0:
-            severity = "No ACEs"
-            clinical_sig = "none"
-            recommendations = ["No specific trauma-informed interventions needed"]
-        elif total_score <= 3:
-            severity = "Moderate ACE Exposure"
-            clinical_sig = "mild"
-            recommendations = [
-                "Acknowledge ACE history in treatment planning",
-                "Consider trauma-informed care approach",
-                "Assess current impact of early experiences"
-            ]
-        else:
-            severity = "High ACE Exposure"
-            clinical_sig = "severe"
-            recommendations = [
-                "High priority for trauma-informed care",
-                "Consider trauma-focused therapy (EMDR, TF-CBT)",
-                "Assess for complex trauma/PTSD",
-                "Build safety and stabilization first",
-                "Screen for dissociation"
-            ]
+        # Counts yes responses (assuming yes=1, no=0)
+        scored = self._score_single('ace', responses)
+        total_score = self._fmt(scored['total_score'])
+        severity = scored['severity_level']
         
         interpretation = f"""
         ACE Score: {total_score}/10 - {severity}
@@ -444,13 +762,13 @@ class ScoringEngine:
         
         return AssessmentScore(
             assessment_id='ace',
-            total_score=float(total_score),
+            total_score=scored['total_score'],
             subscale_scores={},
             percentile=None,
             severity_level=severity,
             interpretation=interpretation.strip(),
-            clinical_significance=clinical_sig,
-            recommendations=recommendations,
+            clinical_significance=scored['clinical_significance'],
+            recommendations=scored['recommendations'],
             scored_at=datetime.utcnow().isoformat()
         )
     
@@ -465,49 +783,21 @@ class ScoringEngine:
         21 items, each scored 0-3
         Total: 0-63
         """
-        total_score = sum(responses.values())
-        
-        if total_score < 14:
-            severity = "Minimal"
-            clinical_sig = "none"
-            recommendations = ["No treatment indicated", "Monitor symptoms"]
-        elif total_score < 20:
-            severity = "Mild"
-            clinical_sig = "mild"
-            recommendations = [
-                "Psychotherapy may be beneficial",
-                "Self-help interventions",
-                "Reassess in 2-4 weeks"
-            ]
-        elif total_score < 29:
-            severity = "Moderate"
-            clinical_sig = "moderate"
-            recommendations = [
-                "Psychotherapy recommended",
-                "Consider medication evaluation",
-                "Regular monitoring"
-            ]
-        else:
-            severity = "Severe"
-            clinical_sig = "severe"
-            recommendations = [
-                "Immediate treatment needed",
-                "Psychotherapy AND medication likely needed",
-                "Risk assessment for self-harm",
-                "Consider intensive treatment"
-            ]
+        scored = self._score_single('bdi', responses)
+        total_score = self._fmt(scored['total_score'])
+        severity = scored['severity_level']
         
         interpretation = f"BDI-II Score: {total_score}/63 - {severity} Depression"
         
         return AssessmentScore(
             assessment_id='bdi',
-            total_score=float(total_score),
+            total_score=scored['total_score'],
             subscale_scores={},
             percentile=None,
             severity_level=severity,
             interpretation=interpretation,
-            clinical_significance=clinical_sig,
-            recommendations=recommendations,
+            clinical_significance=scored['clinical_significance'],
+            recommendations=scored['recommendations'],
             scored_at=datetime.utcnow().isoformat()
         )
     
@@ -519,45 +809,15 @@ class ScoringEngine:
         Each scored 1-4
         """
         # Assuming items 1-20 are State, 21-40 are Trait
-        state_items = list(range(1, 21))
-        trait_items = list(range(21, 41))
-        
-        state_score = sum(responses.get(i, 0) for i in state_items)
-        trait_score = sum(responses.get(i, 0) for i in trait_items)
-        
-        total_score = state_score + trait_score
+        scored = self._score_single('stai', responses)
+        subscales = scored['subscale_scores']
+        levels = scored['subscale_levels']
         
-        def interpret_score(score, scale_name):
-            if score < 40:
-                return f"{scale_name}: Low anxiety"
-            elif score < 60:
-                return f"{scale_name}: Moderate anxiety"
-            else:
-                return f"{scale_name}: High anxiety"
+        state_score = self._fmt(subscales['state_anxiety'])
+        trait_score = self._fmt(subscales['trait_anxiety'])
         
-        state_interp = interpret_score(state_score, "State")
-        trait_interp = interpret_score(trait_score, "Trait")
-        
-        if state_score >= 60 or trait_score >= 60:
-            severity = "High Anxiety"
-            clinical_sig = "severe"
-            recommendations = [
-                "Anxiety treatment recommended",
-                "CBT or other evidence-based therapy",
-                "Consider medication evaluation"
-            ]
-        elif state_score >= 40 or trait_score >= 40:
-            severity = "Moderate Anxiety"
-            clinical_sig = "moderate"
-            recommendations = [
-                "Monitor anxiety symptoms",
-                "Stress management techniques",
-                "Consider brief counseling"
-            ]
-        else:
-            severity = "Low Anxiety"
-            clinical_sig = "none"
-            recommendations = ["No intervention needed"]
+        state_interp = f"State: {levels['state_anxiety']}"
+        trait_interp = f"Trait: {levels['trait_anxiety']}"
         
         interpretation = f"""
         STAI Results:
@@ -567,16 +827,13 @@ class ScoringEngine:
         
         return AssessmentScore(
             assessment_id='stai',
-            total_score=float(total_score),
-            subscale_scores={
-                'state_anxiety': float(state_score),
-                'trait_anxiety': float(trait_score)
-            },
+            total_score=scored['total_score'],
+            subscale_scores=subscales,
             percentile=None,
-            severity_level=severity,
+            severity_level=scored['severity_level'],
             interpretation=interpretation.strip(),
-            clinical_significance=clinical_sig,
-            recommendations=recommendations,
+            clinical_significance=scored['clinical_significance'],
+            recommendations=scored['recommendations'],
             scored_at=datetime.utcnow().isoformat()
         )
     
@@ -591,38 +848,12 @@ class ScoringEngine:
         20 items, each scored 0-4
         Total: 0-80
         """
-        # DSM-5 clusters
-        cluster_b = [1, 2, 3, 4, 5]  # Intrusion
-        cluster_c = [6, 7]  # Avoidance
-        cluster_d = [8, 9, 10, 11, 12, 13, 14]  # Negative alterations
-        cluster_e = [15, 16, 17, 18, 19, 20]  # Arousal/reactivity
-        
-        total_score = sum(responses.values())
-        
-        b_score = sum(responses.get(i, 0) for i in cluster_b)
-        c_score = sum(responses.get(i, 0) for i in cluster_c)
-        d_score = sum(responses.get(i, 0) for i in cluster_d)
-        e_score = sum(responses.get(i, 0) for i in cluster_e)
-        
-        # Provisional PTSD diagnosis (DSM-5 criteria)
-        criterion_b = any(responses.get(i, 0) >= 2 for i in cluster_b)
-        criterion_c = any(responses.get(i, 0) >= 2 for i in cluster_c)
-        criterion_d = sum(1 for i in cluster_d if responses.get(i, 0) >= 2) >= 2
-        criterion_e = sum(1 for i in cluster_e if responses.get(i, 0) >= 2) >= 2
-        
-        meets_criteria = all([criterion_b, criterion_c, criterion_d, criterion_e])
-        
-        if total_score < 31:
-            severity = "Below Cutoff"
-            clinical_sig = "none" if total_score < 10 else "mild"
-        elif total_score < 45:
-            severity = "Probable PTSD"
-            clinical_sig = "moderate"
-        else:
-            severity = "Severe PTSD Symptoms"
-            clinical_sig = "severe"
+        scored = self._score_single('pcl5', responses)
+        subscales = scored['subscale_scores']
+        total_score = self._fmt(scored['total_score'])
+        severity = scored['severity_level']
+        meets_criteria = scored['flags']['provisional_ptsd']
         
-        recommendations = []
         if meets_criteria or total_score >= 31:
             recommendations = [
                 "Comprehensive PTSD assessment recommended",
@@ -643,10 +874,10 @@ class ScoringEngine:
         PCL-5 Score: {total_score}/80 - {severity}
         
         DSM-5 Cluster Scores:
-        • Intrusion (B): {b_score}/20
-        • Avoidance (C): {c_score}/8
-        • Negative Alterations (D): {d_score}/28
-        • Arousal/Reactivity (E): {e_score}/24
+        • Intrusion (B): {self._fmt(subscales['intrusion'])}/20
+        • Avoidance (C): {self._fmt(subscales['avoidance'])}/8
+        • Negative Alterations (D): {self._fmt(subscales['negative_alterations'])}/28
+        • Arousal/Reactivity (E): {self._fmt(subscales['arousal_reactivity'])}/24
         
         Provisional PTSD: {"YES" if meets_criteria else "NO"}
         (Score ≥31-33 suggests probable PTSD)
@@ -654,17 +885,12 @@ class ScoringEngine:
         
         return AssessmentScore(
             assessment_id='pcl5',
-            total_score=float(total_score),
-            subscale_scores={
-                'intrusion': float(b_score),
-                'avoidance': float(c_score),
-                'negative_alterations': float(d_score),
-                'arousal_reactivity': float(e_score)
-            },
+            total_score=scored['total_score'],
+            subscale_scores=subscales,
             percentile=None,
             severity_level=severity,
             interpretation=interpretation.strip(),
-            clinical_significance=clinical_sig,
+            clinical_significance=scored['clinical_significance'],
             recommendations=recommendations,
             scored_at=datetime.utcnow().isoformat()
         )
@@ -676,64 +902,37 @@ class ScoringEngine:
     def score_eq(self, responses: Dict, demographics: Dict = None) -> AssessmentScore:
         """Score EQ (Empathy Quotient)."""
         # Simplified scoring
-        total_score = sum(responses.values())
-        
-        if total_score < 30:
-            level = "Low Empathy"
-            recommendations = ["May benefit from social skills training"]
-        elif total_score < 52:
-            level = "Average Empathy"
-            recommendations = ["Empathy within normal range"]
-        else:
-            level = "High Empathy"
-            recommendations = ["Above average empathy"]
+        scored = self._score_single('eq', responses)
+        total_score = self._fmt(scored['total_score'])
+        level = scored['severity_level']
         
         return AssessmentScore(
             assessment_id='eq',
-            total_score=float(total_score),
+            total_score=scored['total_score'],
             subscale_scores={},
             percentile=None,
             severity_level=level,
             interpretation=f"EQ Score: {total_score}/80 - {level}",
             clinical_significance="none",
-            recommendations=recommendations,
+            recommendations=scored['recommendations'],
             scored_at=datetime.utcnow().isoformat()
         )
     
     def score_iat(self, responses: Dict, demographics: Dict = None) -> AssessmentScore:
         """Score IAT (Internet Addiction Test)."""
-        total_score = sum(responses.values())
-        
-        if total_score < 40:
-            severity = "Average Online User"
-            clinical_sig = "none"
-            recommendations = ["No intervention needed"]
-        elif total_score < 70:
-            severity = "Frequent Problems"
-            clinical_sig = "moderate"
-            recommendations = [
-                "Consider reducing internet use",
-                "Set boundaries and schedules",
-                "Brief counseling may help"
-            ]
-        else:
-            severity = "Significant Problems"
-            clinical_sig = "severe"
-            recommendations = [
-                "Internet use causing significant impairment",
-                "Specialized treatment recommended",
-                "CBT for internet addiction"
-            ]
+        scored = self._score_single('iat', responses)
+        total_score = self._fmt(scored['total_score'])
+        severity = scored['severity_level']
         
         return AssessmentScore(
             assessment_id='iat',
-            total_score=float(total_score),
+            total_score=scored['total_score'],
             subscale_scores={},
             percentile=None,
             severity_level=severity,
             interpretation=f"IAT Score: {total_score}/100 - {severity}",
-            clinical_significance=clinical_sig,
-            recommendations=recommendations,
+            clinical_significance=scored['clinical_significance'],
+            recommendations=scored['recommendations'],
             scored_at=datetime.utcnow().isoformat()
         )
     
@@ -768,57 +967,38 @@ class ScoringEngine:
     
     def score_msi(self, responses: Dict, demographics: Dict = None) -> AssessmentScore:
         """MSI (Marital Satisfaction Inventory) placeholder."""
-        total_score = sum(responses.values())
+        scored = self._score_single('msi', responses)
         return AssessmentScore(
             assessment_id='msi',
-            total_score=float(total_score),
+            total_score=scored['total_score'],
             subscale_scores={},
             percentile=None,
-            severity_level="Variable",
+            severity_level=scored['severity_level'],
             interpretation="MSI assesses relationship satisfaction across multiple domains.",
-            clinical_significance="moderate",
-            recommendations=["Couples therapy may be beneficial"],
+            clinical_significance=scored['clinical_significance'],
+            recommendations=scored['recommendations'],
             scored_at=datetime.utcnow().isoformat()
         )
     
     def score_pcq(self, responses: Dict, demographics: Dict = None) -> AssessmentScore:
         """PCQ (Psychological Capital) scoring."""
         # 4 subscales: Hope, Efficacy, Resilience, Optimism (6 items each)
-        hope = sum(responses.get(i, 0) for i in range(1, 7))
-        efficacy = sum(responses.get(i, 0) for i in range(7, 13))
-        resilience = sum(responses.get(i, 0) for i in range(13, 19))
-        optimism = sum(responses.get(i, 0) for i in range(19, 25))
-        
-        total_score = hope + efficacy + resilience + optimism
-        
-        if total_score < 72:
-            level = "Low PsyCap"
-            recommendations = ["May benefit from resilience-building interventions"]
-        elif total_score < 108:
-            level = "Moderate PsyCap"
-            recommendations = ["Average psychological capital"]
-        else:
-            level = "High PsyCap"
-            recommendations = ["Strong psychological resources"]
+        scored = self._score_single('pcq', responses)
+        total_score = self._fmt(scored['total_score'])
+        level = scored['severity_level']
         
         return AssessmentScore(
             assessment_id='pcq',
-            total_score=float(total_score),
-            subscale_scores={
-                'hope': float(hope),
-                'efficacy': float(efficacy),
-                'resilience': float(resilience),
-                'optimism': float(optimism)
-            },
+            total_score=scored['total_score'],
+            subscale_scores=scored['subscale_scores'],
             percentile=None,
             severity_level=level,
             interpretation=f"PCQ Score: {total_score}/144 - {level}",
             clinical_significance="none",
-            recommendations=recommendations,
+            recommendations=scored['recommendations'],
             scored_at=datetime.utcnow().isoformat()
         )
 
-
 # Example usage
 if __name__ == "__main__":
     print("Assessment Scoring Engine Demo")
@@ -16,6 +16,7 @@ import redis.asyncio as redis
 from redis.asyncio import Redis
 from app.core.config import settings
 from app.core.constants import CacheKeys, CacheTTL
+from app.core import metrics_registry
 
 logger = logging.getLogger(__name__)
 
@@ -38,20 +39,25 @@ class CacheMetrics:
         self.stats['hits'] += 1
         self.stats['total_response_time'] += response_time
         self.stats['keys_by_type'][key_type] = self.stats['keys_by_type'].get(key_type, 0) + 1
+        metrics_registry.record_cache_operation('hit', key_type, response_time)
 
     def record_miss(self, key_type: str = 'unknown'):
         self.stats['misses'] += 1
         self.stats['keys_by_type'][key_type] = self.stats['keys_by_type'].get(key_type, 0) + 1
+        metrics_registry.record_cache_operation('miss', key_type)
 
     def record_set(self, key_type: str = 'unknown'):
         self.stats['sets'] += 1
         self.stats['keys_by_type'][key_type] = self.stats['keys_by_type'].get(key_type, 0) + 1
+        metrics_registry.record_cache_operation('set', key_type)
 
     def record_delete(self):
         self.stats['deletes'] += 1
+        metrics_registry.record_cache_operation('delete')
 
     def record_error(self):
         self.stats['errors'] += 1
+        metrics_registry.record_cache_operation('error')
 
     def record_slow_operation(self, operation: str, duration: float):
         self.stats['slow_operations'].append({
@@ -8,6 +8,11 @@ from celery.schedules import crontab
 from kombu import Exchange, Queue
 import logging
 import os
+import time
+
+from app.core import metrics_registry
+from app.core.monitoring import set_query_source, reset_query_source
+from app.core.query_monitor import n_plus_one_detector
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +43,7 @@ celery_app = Celery(
     backend=CELERY_RESULT_BACKEND,
     include=[
         'app.tasks.scoring_scheduler',
+        'app.tasks.psychometric_tasks',
     ]
 )
 
@@ -74,10 +80,18 @@ celery_app.conf.update(
     task_routes={
         'tasks.calculate_assessment_scores': {'queue': 'scoring'},
         'tasks.process_assessment_batch': {'queue': 'scoring'},
+        'tasks.bulk_calculate_assessment_scores': {'queue': 'scoring'},
         'tasks.generate_assessment_report': {'queue': 'reports'},
         'tasks.send_assessment_notification': {'queue': 'notifications'},
         'tasks.cleanup_expired_assessments': {'queue': 'maintenance'},
         'tasks.generate_daily_reports': {'queue': 'reports'},
+        'tasks.generate_organization_reports': {'queue': 'reports'},
+        'tasks.render_report_chunk': {'queue': 'reports'},
+        'tasks.summarize_organization_reports': {'queue': 'reports'},
+        'tasks.generate_month_end_reports': {'queue': 'reports'},
+        'tasks.export_assessment_responses': {'queue': 'reports'},
+        'tasks.maintain_partitions': {'queue': 'maintenance'},
+        'train_anomaly_model': {'queue': 'maintenance'},
     },
     
     # Queue definitions
@@ -133,6 +147,20 @@ celery_app.conf.beat_schedule = {
         'options': {'queue': 'maintenance'}
     },
     
+    # Premake and expire monthly table partitions daily at 3 AM
+    'maintain-partitions': {
+        'task': 'tasks.maintain_partitions',
+        'schedule': crontab(hour=3, minute=0),
+        'options': {'queue': 'maintenance'}
+    },
+    
+    # Refit the population anomaly model nightly at 4 AM
+    'train-anomaly-model': {
+        'task': 'train_anomaly_model',
+        'schedule': crontab(hour=4, minute=0),
+        'options': {'queue': 'maintenance'}
+    },
+    
     # Generate daily reports at 1 AM
     'generate-daily-reports': {
         'task': 'tasks.generate_daily_reports',
@@ -140,6 +168,13 @@ celery_app.conf.beat_schedule = {
         'options': {'queue': 'reports'}
     },
     
+    # Queue per-organization reports on the 1st of each month at 5 AM
+    'generate-month-end-reports': {
+        'task': 'tasks.generate_month_end_reports',
+        'schedule': crontab(day_of_month=1, hour=5, minute=0),
+        'options': {'queue': 'reports'}
+    },
+    
     # Health check every 5 minutes
     'health-check': {
         'task': 'tasks.health_check',
@@ -183,11 +218,20 @@ from celery.signals import (
     worker_shutdown
 )
 
+# Start times, query-source tokens and N+1 scopes of tasks running in this
+# worker process, by task ID
+_task_start_times = {}
+_task_source_tokens = {}
+_task_query_scopes = {}
+
 
 @task_prerun.connect
 def task_prerun_handler(sender=None, task_id=None, task=None, args=None, 
                         kwargs=None, **extra_kwargs):
     """Log when task starts"""
+    _task_start_times[task_id] = time.monotonic()
+    _task_source_tokens[task_id] = set_query_source(f"task {task.name}")
+    _task_query_scopes[task_id] = n_plus_one_detector.begin(f"task {task.name}")
     logger.info(
         f"Task started: {task.name} (ID: {task_id})"
     )
@@ -197,6 +241,24 @@ def task_prerun_handler(sender=None, task_id=None, task=None, args=None,
 def task_postrun_handler(sender=None, task_id=None, task=None, args=None,
                          kwargs=None, retval=None, **extra_kwargs):
     """Log when task completes"""
+    started = _task_start_times.pop(task_id, None)
+    token = _task_source_tokens.pop(task_id, None)
+    if token is not None:
+        try:
+            reset_query_source(token)
+        except ValueError:
+            # Token was created in a different context (e.g. eager mode)
+            pass
+
+    n_plus_one_detector.end(_task_query_scopes.pop(task_id, None))
+
+    if started is not None:
+        metrics_registry.observe_task(
+            task.name,
+            extra_kwargs.get('state') == 'SUCCESS',
+            time.monotonic() - started
+        )
+
     logger.info(
         f"Task completed: {task.name} (ID: {task_id})"
     )
@@ -72,6 +72,25 @@ class Settings(BaseSettings):
     DB_POOL_RECYCLE: int = Field(default=300, env="DB_POOL_RECYCLE")
     DB_POOL_PRE_PING: bool = Field(default=True, env="DB_POOL_PRE_PING")
     DB_ECHO: bool = Field(default=False, env="DB_ECHO")
+
+    # Analytics / reporting pool (see app.core.database); kept small and
+    # separate so long-running reports cannot starve login and CRUD
+    DB_READ_REPLICA_URL: Optional[str] = Field(default=None, env="DB_READ_REPLICA_URL")
+    DB_ANALYTICS_POOL_SIZE: int = Field(default=3, env="DB_ANALYTICS_POOL_SIZE")
+    DB_ANALYTICS_MAX_OVERFLOW: int = Field(default=2, env="DB_ANALYTICS_MAX_OVERFLOW")
+    DB_ANALYTICS_POOL_TIMEOUT: int = Field(default=10, env="DB_ANALYTICS_POOL_TIMEOUT")
+    DB_ANALYTICS_STATEMENT_TIMEOUT_MS: int = Field(default=60000, env="DB_ANALYTICS_STATEMENT_TIMEOUT_MS")
+
+    # Monthly partitions for email_metadata / communication_analysis (see
+    # app.core.partitioning); retention drops whole months, 0 keeps forever
+    PARTITION_PREMAKE_MONTHS: int = Field(default=3, env="PARTITION_PREMAKE_MONTHS")
+    EMAIL_METADATA_RETENTION_MONTHS: int = Field(default=12, env="EMAIL_METADATA_RETENTION_MONTHS")
+    COMMUNICATION_ANALYSIS_RETENTION_MONTHS: int = Field(default=12, env="COMMUNICATION_ANALYSIS_RETENTION_MONTHS")
+
+    # N+1 query detection (see app.core.query_monitor); defaults to on outside production
+    N_PLUS_ONE_DETECTION: Optional[bool] = Field(default=None, env="N_PLUS_ONE_DETECTION")
+    N_PLUS_ONE_THRESHOLD: int = Field(default=5, env="N_PLUS_ONE_THRESHOLD")
+    N_PLUS_ONE_RAISE: bool = Field(default=False, env="N_PLUS_ONE_RAISE")
     
     # =============================================================================
     # REDIS CONFIGURATION
@@ -168,6 +187,11 @@ class Settings(BaseSettings):
         """Alias for backward compatibility"""
         return self.allowed_origins_list
     
+    @property
+    def metrics_allowed_networks_list(self) -> List[str]:
+        """Convert METRICS_ALLOWED_NETWORKS to list"""
+        return [network.strip() for network in self.METRICS_ALLOWED_NETWORKS.split(",") if network.strip()]
+    
     @property
     def allowed_methods_list(self) -> List[str]:
         """Convert ALLOWED_METHODS string to list"""
@@ -239,6 +263,9 @@ class Settings(BaseSettings):
         default=".jpg,.jpeg,.png,.pdf,.doc,.docx",
         env="ALLOWED_UPLOAD_EXTENSIONS"
     )
+    # Rendered reports, content-addressed, and the pool size used to render them
+    REPORT_OUTPUT_DIR: str = Field(default="reports", env="REPORT_OUTPUT_DIR")
+    REPORT_RENDER_WORKERS: int = Field(default=0, env="REPORT_RENDER_WORKERS")  # 0 = one per CPU
     
     @property
     def allowed_upload_extensions_list(self) -> List[str]:
@@ -266,6 +293,12 @@ class Settings(BaseSettings):
     # =============================================================================
     AI_ENABLED: bool = Field(default=False, env="AI_ENABLED")
     AI_MODEL_PATH: str = Field(default="", env="AI_MODEL_PATH")
+    # Versioned predictor artifacts served by app.services.model_registry
+    ANALYTICS_MODEL_DIR: str = Field(default="models", env="ANALYTICS_MODEL_DIR")
+    ANALYTICS_MODEL_RELOAD_SECONDS: int = Field(default=30, env="ANALYTICS_MODEL_RELOAD_SECONDS")
+    # Load models when app.main is imported; with gunicorn --preload that is
+    # once in the master, and workers share the loaded models copy-on-write
+    ANALYTICS_PRELOAD_MODELS: bool = Field(default=False, env="ANALYTICS_PRELOAD_MODELS")
     AI_API_KEY: str = Field(default="", env="AI_API_KEY")
     AI_API_URL: str = Field(default="", env="AI_API_URL")
     AI_MAX_TOKENS: int = Field(default=1000, env="AI_MAX_TOKENS")
@@ -314,6 +347,10 @@ class Settings(BaseSettings):
     # =============================================================================
     SENTRY_DSN: str = Field(default="", env="SENTRY_DSN")
     ENABLE_METRICS: bool = Field(default=True, env="ENABLE_METRICS")
+    METRICS_ALLOWED_NETWORKS: str = Field(
+        default="127.0.0.1/32,::1/128,10.0.0.0/8,172.16.0.0/12,192.168.0.0/16",
+        env="METRICS_ALLOWED_NETWORKS"
+    )
     PROMETHEUS_PORT: int = Field(default=9090, env="PROMETHEUS_PORT")
     
     # =============================================================================
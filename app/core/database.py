@@ -2,11 +2,31 @@
 """
 Single authoritative database configuration for PsychSync AI
 Uses async SQLAlchemy 2.0 with asyncpg driver
+
+Three connection pools, each behind its own FastAPI dependency:
+
+    get_async_db      primary, transactional (login, CRUD, writes)
+    get_analytics_db  primary, small bounded pool with a statement timeout,
+                      for long-running reports that may also persist results
+    get_replica_db    read replica (DB_READ_REPLICA_URL) for read-only
+                      analytics; falls back to the analytics pool when no
+                      replica is configured
+    get_replica_sync_db  the same, as a sync (psycopg2) session for
+                      handlers and services still written against Session
+
+Heavy reporting therefore queues on its own connections instead of the
+primary pool that authentication depends on.
+
+Celery tasks and other code that runs outside an event loop use
+SessionLocal, a sync (psycopg2) session factory on the primary.
 """
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.pool import QueuePool
+from typing import Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 import logging
 
 from app.core.config import settings, get_database_url
@@ -17,10 +37,45 @@ class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models"""
     pass
 
-# Create async database engine
+
+def _async_url(url: str) -> str:
+    """Force the asyncpg driver on a plain postgresql:// URL"""
+    if url.startswith('postgresql://'):
+        return url.replace('postgresql://', 'postgresql+asyncpg://', 1)
+    return url
+
+
+def _sync_url(url: str) -> str:
+    """Force the psycopg2 driver on a plain or asyncpg postgresql URL"""
+    if url.startswith('postgresql+asyncpg://'):
+        return url.replace('postgresql+asyncpg://', 'postgresql+psycopg2://', 1)
+    if url.startswith('postgresql://'):
+        return url.replace('postgresql://', 'postgresql+psycopg2://', 1)
+    return url
+
+
+def _analytics_connect_args(application_name: str) -> dict:
+    """asyncpg server settings applied to every analytics connection"""
+    return {
+        "server_settings": {
+            "application_name": application_name,
+            "statement_timeout": str(settings.DB_ANALYTICS_STATEMENT_TIMEOUT_MS),
+        }
+    }
+
+
+def _sync_analytics_connect_args(application_name: str, read_only: bool = False) -> dict:
+    """psycopg2 equivalent of _analytics_connect_args"""
+    options = f"-c statement_timeout={settings.DB_ANALYTICS_STATEMENT_TIMEOUT_MS}"
+    if read_only:
+        options += " -c default_transaction_read_only=on"
+    return {"application_name": application_name, "options": options}
+
+
+# Create async database engine (primary, transactional)
 async_engine = create_async_engine(
     get_database_url(async_driver=True),
-    poolclass=QueuePool,
+    poolclass=AsyncAdaptedQueuePool,
     pool_size=settings.DB_POOL_SIZE,
     max_overflow=settings.DB_MAX_OVERFLOW,
     pool_pre_ping=settings.DB_POOL_PRE_PING,
@@ -29,6 +84,39 @@ async_engine = create_async_engine(
     future=True
 )
 
+# Bounded pool on the primary for long-running analytics; pool_timeout is
+# short so an overloaded report fails fast instead of queueing indefinitely
+analytics_engine = create_async_engine(
+    get_database_url(async_driver=True),
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_ANALYTICS_POOL_SIZE,
+    max_overflow=settings.DB_ANALYTICS_MAX_OVERFLOW,
+    pool_timeout=settings.DB_ANALYTICS_POOL_TIMEOUT,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    connect_args=_analytics_connect_args("psychsync_analytics"),
+    echo=settings.DB_ECHO,
+    future=True
+)
+
+# Optional read replica; sessions are read-only at the server level too
+replica_engine: Optional[AsyncEngine] = None
+if settings.DB_READ_REPLICA_URL:
+    replica_connect_args = _analytics_connect_args("psychsync_replica")
+    replica_connect_args["server_settings"]["default_transaction_read_only"] = "on"
+    replica_engine = create_async_engine(
+        _async_url(settings.DB_READ_REPLICA_URL),
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.DB_ANALYTICS_POOL_SIZE,
+        max_overflow=settings.DB_ANALYTICS_MAX_OVERFLOW,
+        pool_timeout=settings.DB_ANALYTICS_POOL_TIMEOUT,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        connect_args=replica_connect_args,
+        echo=settings.DB_ECHO,
+        future=True
+    )
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     bind=async_engine,
@@ -38,6 +126,66 @@ AsyncSessionLocal = async_sessionmaker(
     autocommit=False
 )
 
+AnalyticsSessionLocal = async_sessionmaker(
+    bind=analytics_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+    autocommit=False
+)
+
+ReplicaSessionLocal = async_sessionmaker(
+    bind=replica_engine or analytics_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+    autocommit=False
+)
+
+# Sync engine and session factory for Celery workers and scripts
+sync_engine = create_engine(
+    _sync_url(get_database_url(async_driver=False)),
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    echo=settings.DB_ECHO,
+    future=True
+)
+
+SessionLocal = sessionmaker(
+    bind=sync_engine,
+    class_=Session,
+    expire_on_commit=False,
+    autoflush=False,
+    autocommit=False
+)
+
+# Sync counterpart of the replica pool: the replica when configured,
+# otherwise a bounded pool on the primary with the analytics statement timeout
+replica_sync_engine = create_engine(
+    _sync_url(settings.DB_READ_REPLICA_URL or get_database_url(async_driver=False)),
+    pool_size=settings.DB_ANALYTICS_POOL_SIZE,
+    max_overflow=settings.DB_ANALYTICS_MAX_OVERFLOW,
+    pool_timeout=settings.DB_ANALYTICS_POOL_TIMEOUT,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    connect_args=_sync_analytics_connect_args(
+        "psychsync_replica" if settings.DB_READ_REPLICA_URL else "psychsync_analytics",
+        read_only=bool(settings.DB_READ_REPLICA_URL)
+    ),
+    echo=settings.DB_ECHO,
+    future=True
+)
+
+ReplicaSyncSessionLocal = sessionmaker(
+    bind=replica_sync_engine,
+    class_=Session,
+    expire_on_commit=False,
+    autoflush=False,
+    autocommit=False
+)
+
 async def get_async_db() -> AsyncSession:
     """
     Async database dependency for FastAPI
@@ -53,6 +201,58 @@ async def get_async_db() -> AsyncSession:
         finally:
             await session.close()
 
+async def get_analytics_db() -> AsyncSession:
+    """
+    Database dependency for long-running reports on the primary
+
+    Uses the bounded analytics pool; statements are cancelled after
+    DB_ANALYTICS_STATEMENT_TIMEOUT_MS.
+    """
+    async with AnalyticsSessionLocal() as session:
+        try:
+            yield session
+        except Exception as e:
+            logger.error(f"Analytics database session error: {e}")
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+async def get_replica_db() -> AsyncSession:
+    """
+    Read-only database dependency for analytics
+
+    Served by the read replica when DB_READ_REPLICA_URL is set, otherwise by
+    the analytics pool on the primary. Replica data may lag the primary, so
+    don't use this to read back rows written in the same request.
+    """
+    async with ReplicaSessionLocal() as session:
+        try:
+            yield session
+        except Exception as e:
+            logger.error(f"Replica database session error: {e}")
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+def get_replica_sync_db() -> Session:
+    """
+    Sync read-only database dependency for analytics
+
+    Same routing as get_replica_db; FastAPI runs sync handlers using it in
+    its threadpool.
+    """
+    session = ReplicaSyncSessionLocal()
+    try:
+        yield session
+    except Exception as e:
+        logger.error(f"Replica database session error: {e}")
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
 # Legacy compatibility - DEPRECATED
 def get_db():
     """
@@ -60,7 +260,8 @@ def get_db():
     Will be removed in future versions
     """
     raise DeprecationWarning(
-        "get_db() is deprecated. Use get_async_db() instead. "
+        "get_db() is deprecated. Use get_async_db() instead, "
+        "or SessionLocal() outside the event loop. "
         "This function will be removed in the next major version."
     )
 
@@ -92,6 +293,11 @@ async def close_db_connections():
     """Close all database connections"""
     try:
         await async_engine.dispose()
+        await analytics_engine.dispose()
+        if replica_engine is not None:
+            await replica_engine.dispose()
+        sync_engine.dispose()
+        replica_sync_engine.dispose()
         logger.info("Database connections closed successfully")
     except Exception as e:
         logger.error(f"Error closing database connections: {e}")
\ No newline at end of file
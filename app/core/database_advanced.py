@@ -15,6 +15,14 @@ from sqlalchemy import text, event, DDL
 from sqlalchemy.engine import Engine
 from app.core.config import settings
 from app.core.constants import Database
+# Query monitoring lives in app.core.query_monitor so it can be imported
+# without creating an engine; re-exported here for existing callers
+from app.core.query_monitor import (
+    DatabaseMonitor,
+    QueryFingerprintStats,
+    db_monitor,
+    fingerprint_statement,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -89,77 +97,6 @@ AsyncSessionLocal = async_sessionmaker(
     join_transaction_mode="savepoint",
 )
 
-# Database performance monitor
-class DatabaseMonitor:
-    """Advanced database performance monitoring"""
-
-    def __init__(self):
-        self.query_stats: Dict[str, Any] = {
-            'total_queries': 0,
-            'total_time': 0.0,
-            'slow_queries': 0,
-            'error_queries': 0,
-            'query_types': {},
-            'slow_threshold': 1.0  # seconds
-        }
-
-    def record_query(self, query: str, duration: float, error: bool = False):
-        """Record query performance statistics"""
-        self.query_stats['total_queries'] += 1
-        self.query_stats['total_time'] += duration
-
-        if error:
-            self.query_stats['error_queries'] += 1
-        elif duration > self.query_stats['slow_threshold']:
-            self.query_stats['slow_queries'] += 1
-            logger.warning(f"Slow query detected: {duration:.2f}s - {query[:100]}...")
-
-        # Track query types
-        query_type = query.strip().split()[0].upper() if query else 'UNKNOWN'
-        self.query_stats['query_types'][query_type] = \
-            self.query_stats['query_types'].get(query_type, 0) + 1
-
-    def get_stats(self) -> Dict[str, Any]:
-        """Get performance statistics"""
-        total_queries = self.query_stats['total_queries']
-        if total_queries == 0:
-            return self.query_stats
-
-        avg_time = self.query_stats['total_time'] / total_queries
-
-        return {
-            **self.query_stats,
-            'avg_query_time': avg_time,
-            'slow_query_percentage': (self.query_stats['slow_queries'] / total_queries) * 100,
-            'error_query_percentage': (self.query_stats['error_queries'] / total_queries) * 100,
-        }
-
-# Global database monitor instance
-db_monitor = DatabaseMonitor()
-
-# Performance monitoring event listeners
-@event.listens_for(Engine, "before_cursor_execute")
-def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-    """Record query start time"""
-    context._query_start_time = time.time()
-
-@event.listens_for(Engine, "after_cursor_execute")
-def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-    """Record query completion and performance stats"""
-    total = time.time() - context._query_start_time
-    db_monitor.record_query(str(statement), total)
-
-@event.listens_for(Engine, "handle_error")
-def handle_error(exception_context):
-    """Record database errors"""
-    context = exception_context.execution_context
-    if context:
-        db_monitor.record_query(
-            str(context.statement) if context.statement else "UNKNOWN",
-            0.0,
-            error=True
-        )
-
 async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Advanced async database dependency with performance monitoring
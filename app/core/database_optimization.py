@@ -11,6 +11,14 @@ import logging
 import time
 from datetime import datetime, timedelta
 
+from app.core.query_benchmark import (
+    SeedScale,
+    iter_plan_nodes,
+    load_plan,
+    plan_signature,
+    run_plan_benchmarks,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -124,7 +132,7 @@ class DatabaseOptimizer:
             plan_data = explain_result.scalar()
 
             # Extract performance metrics
-            metrics = self._extract_query_metrics(plan_data[0] if plan_data else {})
+            metrics = self._extract_query_metrics(plan_data)
 
             # Generate optimization suggestions
             suggestions = self._generate_optimization_suggestions(metrics, query)
@@ -142,48 +150,28 @@ class DatabaseOptimizer:
 
     def _extract_query_metrics(self, plan_data: Dict) -> Dict[str, Any]:
         """Extract key metrics from execution plan"""
+        plan_data = load_plan(plan_data)
+        root = plan_data.get("Plan", {})
         metrics = {
-            "execution_time": 0,
-            "planning_time": 0,
-            "total_cost": 0,
-            "rows_returned": 0,
+            "execution_time": plan_data.get("Execution Time", 0),
+            "planning_time": plan_data.get("Planning Time", 0),
+            # Costs, rows and buffers on the root node already include its children
+            "total_cost": root.get("Total Cost", 0),
+            "rows_returned": root.get("Actual Rows", 0),
             "index_scans": 0,
             "seq_scans": 0,
-            "buffer_hits": 0,
-            "buffer_reads": 0
+            "buffer_hits": root.get("Shared Hit Blocks", 0),
+            "buffer_reads": root.get("Shared Read Blocks", 0),
+            "plan": plan_signature(plan_data)
         }
 
-        def traverse_plan(node):
-            if isinstance(node, dict):
-                # Extract metrics from this node
-                if "Execution Time" in node:
-                    metrics["execution_time"] += node["Execution Time"]
-                if "Planning Time" in node:
-                    metrics["planning_time"] = max(metrics["planning_time"], node["Planning Time"])
-                if "Total Cost" in node:
-                    metrics["total_cost"] += node["Total Cost"]
-                if "Actual Rows" in node:
-                    metrics["rows_returned"] += node["Actual Rows"]
-
-                # Count scan types
-                if "Node Type" in node:
-                    if "Index Scan" in node["Node Type"]:
-                        metrics["index_scans"] += 1
-                    elif "Seq Scan" in node["Node Type"]:
-                        metrics["seq_scans"] += 1
-
-                # Buffer information
-                if "Shared Hit Blocks" in node:
-                    metrics["buffer_hits"] += node["Shared Hit Blocks"]
-                if "Shared Read Blocks" in node:
-                    metrics["buffer_reads"] += node["Shared Read Blocks"]
-
-                # Recursively traverse child nodes
-                if "Plans" in node:
-                    for child in node["Plans"]:
-                        traverse_plan(child)
-
-        traverse_plan(plan_data)
+        for _, node in iter_plan_nodes(root):
+            node_type = node.get("Node Type", "")
+            if "Index" in node_type and "Scan" in node_type:
+                metrics["index_scans"] += 1
+            elif node_type == "Seq Scan":
+                metrics["seq_scans"] += 1
+
         return metrics
 
     def _generate_optimization_suggestions(self, metrics: Dict, query: str) -> List[str]:
@@ -428,6 +416,29 @@ class DatabaseOptimizer:
             logger.error(f"Failed to check table bloat: {e}")
             return []
 
+    # =============================================================================
+    # PLAN REGRESSION BENCHMARKS
+    # =============================================================================
+
+    async def run_plan_benchmarks(
+        self,
+        scale: float = 1.0,
+        update_baseline: bool = False,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Seed the benchmark schema and diff hot-query plans against the baseline
+
+        See app.core.query_benchmark; runs on this session's engine, so point
+        the optimizer at a disposable database rather than production.
+        """
+        return await run_plan_benchmarks(
+            self.db.bind,
+            scale=SeedScale.from_factor(scale),
+            update_baseline=update_baseline,
+            **kwargs
+        )
+
     # =============================================================================
     # AUTOMATED OPTIMIZATION
     # =============================================================================
@@ -0,0 +1,186 @@
+# app/core/metrics_registry.py
+"""
+Unified Prometheus metrics registry for PsychSync
+
+All in-process monitors (request middleware, DatabaseMonitor, CacheMetrics,
+TaskMonitor, PerformanceProfiler) also report here so a single /metrics
+scrape describes the whole deployment.
+
+Multi-worker deployments (uvicorn --workers, gunicorn, Celery prefork) must
+set PROMETHEUS_MULTIPROC_DIR to an empty, writable directory shared by all
+workers of the host and clear it on startup. Each process then writes its
+samples to mmap'd files in that directory and render_metrics() aggregates
+them, so every worker serves the same numbers.
+
+Requirements:
+    pip install prometheus-client
+"""
+
+import os
+import logging
+import ipaddress
+from typing import Iterable, Optional, Tuple
+
+try:
+    from prometheus_client import (
+        CollectorRegistry,
+        Counter,
+        Histogram,
+        REGISTRY,
+        CONTENT_TYPE_LATEST,
+        generate_latest,
+        multiprocess,
+    )
+    from prometheus_client.openmetrics.exposition import (
+        CONTENT_TYPE_LATEST as OPENMETRICS_CONTENT_TYPE,
+        generate_latest as generate_openmetrics,
+    )
+    HAS_PROMETHEUS = True
+except ImportError:
+    HAS_PROMETHEUS = False
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds, shared by request, query and cache histograms
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Task runtimes are longer-tailed than request latencies
+TASK_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+
+if HAS_PROMETHEUS:
+    HTTP_REQUEST_DURATION = Histogram(
+        'psychsync_http_request_duration_seconds',
+        'HTTP request latency',
+        ['method', 'endpoint', 'status'],
+        buckets=LATENCY_BUCKETS
+    )
+    DB_QUERY_DURATION = Histogram(
+        'psychsync_db_query_duration_seconds',
+        'Database query execution time',
+        ['operation'],
+        buckets=LATENCY_BUCKETS
+    )
+    DB_QUERY_ERRORS = Counter(
+        'psychsync_db_query_errors',
+        'Database queries that raised an error',
+        ['operation']
+    )
+    CACHE_OPERATIONS = Counter(
+        'psychsync_cache_operations',
+        'Cache operations by result; hit ratio = hit / (hit + miss)',
+        ['operation', 'key_type']
+    )
+    CACHE_HIT_DURATION = Histogram(
+        'psychsync_cache_hit_duration_seconds',
+        'Latency of cache reads that hit',
+        ['key_type'],
+        buckets=LATENCY_BUCKETS
+    )
+    TASK_DURATION = Histogram(
+        'psychsync_task_duration_seconds',
+        'Celery task runtime',
+        ['task', 'status'],
+        buckets=TASK_BUCKETS
+    )
+    OPERATION_DURATION = Histogram(
+        'psychsync_operation_duration_seconds',
+        'Runtime of operations wrapped by PerformanceProfiler',
+        ['operation'],
+        buckets=LATENCY_BUCKETS
+    )
+
+
+def observe_request(method: str, endpoint: str, status_code: int, duration: float):
+    """Record an HTTP request; endpoint should be the route template"""
+    if HAS_PROMETHEUS:
+        HTTP_REQUEST_DURATION.labels(method, endpoint, str(status_code)).observe(duration)
+
+
+def observe_db_query(operation: str, duration: float, error: bool = False):
+    """Record a database query by statement type (SELECT, INSERT, ...)"""
+    if not HAS_PROMETHEUS:
+        return
+    if error:
+        DB_QUERY_ERRORS.labels(operation).inc()
+    else:
+        DB_QUERY_DURATION.labels(operation).observe(duration)
+
+
+def record_cache_operation(operation: str, key_type: str = 'unknown', duration: float = None):
+    """Record a cache hit, miss, set, delete or error"""
+    if not HAS_PROMETHEUS:
+        return
+    CACHE_OPERATIONS.labels(operation, key_type).inc()
+    if operation == 'hit' and duration is not None:
+        CACHE_HIT_DURATION.labels(key_type).observe(duration)
+
+
+def observe_task(task_name: str, success: bool, duration: float):
+    """Record a finished Celery task"""
+    if HAS_PROMETHEUS:
+        TASK_DURATION.labels(task_name, 'success' if success else 'failure').observe(duration)
+
+
+def observe_operation(operation_name: str, duration: float):
+    """Record a profiled operation"""
+    if HAS_PROMETHEUS:
+        OPERATION_DURATION.labels(operation_name).observe(duration)
+
+
+def render_metrics(accept_header: str = '') -> Tuple[bytes, str]:
+    """
+    Render all metrics for a scrape
+
+    Aggregates every worker's samples when PROMETHEUS_MULTIPROC_DIR is set,
+    and uses the OpenMetrics format when the scraper asks for it.
+
+    Returns:
+        (body, content_type)
+    """
+    if not HAS_PROMETHEUS:
+        return b'# prometheus-client is not installed\n', 'text/plain; charset=utf-8'
+
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+
+    if 'application/openmetrics-text' in (accept_header or ''):
+        return generate_openmetrics(registry), OPENMETRICS_CONTENT_TYPE
+
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def scrape_allowed(client_host: Optional[str], allowed_networks: Iterable[str], forwarded: bool = False) -> bool:
+    """
+    Whether a /metrics request comes from an internal scraper
+
+    Requests relayed by a reverse proxy (``forwarded``) are refused, since
+    the proxy's own address would otherwise stand in for the real client.
+    """
+    if forwarded or not client_host:
+        return False
+    try:
+        address = ipaddress.ip_address(client_host)
+    except ValueError:
+        return False
+    for network in allowed_networks:
+        try:
+            if address in ipaddress.ip_network(network, strict=False):
+                return True
+        except ValueError:
+            logger.warning(f"Ignoring invalid metrics network: {network}")
+    return False
+
+
+def mark_worker_dead(pid: int):
+    """
+    Drop a dead worker's live samples in multiprocess mode
+
+    Call from the process manager's child-exit hook (e.g. gunicorn child_exit).
+    """
+    if HAS_PROMETHEUS and os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        multiprocess.mark_process_dead(pid)
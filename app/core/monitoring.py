@@ -5,19 +5,24 @@ Includes performance metrics, request tracing, and health monitoring
 """
 
 import time
+import math
 import uuid
 import json
 import logging
 import psutil
 import asyncio
-from typing import Dict, Any, Optional, List, Callable
-from datetime import datetime, timedelta
+from array import array
+from collections import deque
+from typing import Dict, Any, Optional, List, Callable, Union
+from datetime import datetime
 from contextlib import asynccontextmanager
+from contextvars import ContextVar, Token
 from dataclasses import dataclass, asdict
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from app.core.config import settings
 from app.core.constants import Logging
+from app.core import metrics_registry
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +40,7 @@ class RequestMetrics:
     user_agent: Optional[str] = None
     query_params: Optional[Dict[str, Any]] = None
     error_message: Optional[str] = None
+    route: Optional[str] = None
 
 @dataclass
 class SystemMetrics:
@@ -57,25 +63,172 @@ class DatabaseMetrics:
     avg_query_time: float
     timestamp: datetime
 
-class MetricsCollector:
-    """Advanced metrics collection system"""
+# Route or task currently issuing queries; a string or a zero-argument
+# callable resolved lazily (the route template is only known after routing)
+_query_source: ContextVar[Optional[Union[str, Callable[[], str]]]] = ContextVar(
+    'query_source', default=None
+)
+
+def set_query_source(source: Union[str, Callable[[], str]]) -> Token:
+    """Attribute subsequent queries in this context to a route or task"""
+    return _query_source.set(source)
+
+def reset_query_source(token: Token):
+    """Restore the query source active before set_query_source"""
+    _query_source.reset(token)
+
+def get_query_source() -> str:
+    """Route or task the current query is running for"""
+    source = _query_source.get()
+    if callable(source):
+        try:
+            source = source()
+        except Exception:
+            source = None
+    return source or 'unknown'
+
+_UNIX_EPOCH = datetime(1970, 1, 1)
+
+# Label for requests that matched no route (404 scans, probes); collapsing
+# them keeps endpoint keys and metric label cardinality bounded
+UNMATCHED_ROUTE = 'unmatched'
+
+class LatencyHistogram:
+    """
+    Fixed-size latency histogram with logarithmic buckets (HDR-style).
+
+    Each bucket is GROWTH times wider than the previous one, so any
+    percentile is reported within ~2.5% of the true value regardless of how
+    many samples were recorded. Memory is constant and percentile queries
+    walk a fixed number of buckets.
+    """
+
+    MIN_VALUE = 0.0001  # 100us
+    MAX_VALUE = 300.0   # 5 minutes
+    GROWTH = 1.05
+    _LOG_GROWTH = math.log(GROWTH)
+    BUCKET_COUNT = int(math.ceil(math.log(MAX_VALUE / MIN_VALUE) / _LOG_GROWTH)) + 2
+
+    __slots__ = ('counts', 'count', 'total', 'min', 'max')
 
     def __init__(self):
-        self.request_metrics: List[RequestMetrics] = []
-        self.system_metrics: List[SystemMetrics] = []
-        self.database_metrics: List[DatabaseMetrics] = []
+        self.counts = array('Q', bytes(8 * self.BUCKET_COUNT))
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    @classmethod
+    def _bucket(cls, value: float) -> int:
+        if value <= cls.MIN_VALUE:
+            return 0
+        index = int(math.log(value / cls.MIN_VALUE) / cls._LOG_GROWTH) + 1
+        return min(index, cls.BUCKET_COUNT - 1)
+
+    @classmethod
+    def _bucket_value(cls, index: int) -> float:
+        """Representative (geometric midpoint) value of a bucket"""
+        if index == 0:
+            return cls.MIN_VALUE
+        return cls.MIN_VALUE * cls.GROWTH ** (index - 0.5)
+
+    def record(self, value: float):
+        self.counts[self._bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: 'LatencyHistogram'):
+        """Add another histogram's samples into this one"""
+        counts = self.counts
+        for i, c in enumerate(other.counts):
+            if c:
+                counts[i] += c
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percentile: float) -> float:
+        """Value at the given percentile (0-100)"""
+        if not self.count:
+            return 0.0
+
+        rank = max(1, math.ceil(self.count * percentile / 100))
+        seen = 0
+        for index, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank:
+                return min(max(self._bucket_value(index), self.min), self.max)
+        return self.max
+
+
+class _WindowSlot:
+    """Request aggregates for one time slot of the rolling window"""
+
+    __slots__ = ('epoch', 'all', 'endpoints', 'errors', 'status_codes', 'endpoint_errors', 'endpoint_status_codes')
+
+    def __init__(self, epoch: int):
+        self.epoch = epoch
+        self.all = LatencyHistogram()
+        self.endpoints: Dict[str, LatencyHistogram] = {}
+        self.errors = 0
+        self.status_codes: Dict[str, int] = {}
+        self.endpoint_errors: Dict[str, int] = {}
+        self.endpoint_status_codes: Dict[str, Dict[str, int]] = {}
+
+
+class MetricsCollector:
+    """
+    Advanced metrics collection system
+
+    Request metrics are aggregated as they arrive instead of being stored:
+    lifetime per-endpoint totals in endpoint_stats, plus a ring buffer of
+    per-minute slots holding latency histograms for the rolling window used
+    by get_request_stats. Memory is bounded by window size and the number
+    of distinct routes.
+    """
+
+    SLOT_SECONDS = 60
+
+    def __init__(self, window_minutes: int = 60):
+        self.window_minutes = window_minutes
+        self._slots: List[Optional[_WindowSlot]] = [None] * window_minutes
+        self.system_metrics: deque = deque(maxlen=1000)
+        self.database_metrics: deque = deque(maxlen=1000)
         self.error_counts: Dict[str, int] = {}
         self.endpoint_stats: Dict[str, Dict[str, Any]] = {}
-        self.max_metrics_history = 10000  # Keep last 10k metrics
+
+    @classmethod
+    def _epoch_slot(cls, timestamp: datetime) -> int:
+        """Slot number of a naive UTC timestamp"""
+        return int((timestamp - _UNIX_EPOCH).total_seconds()) // cls.SLOT_SECONDS
+
+    def _slot_for(self, epoch: int) -> _WindowSlot:
+        """Return the ring buffer slot for an epoch minute, recycling stale ones"""
+        index = epoch % self.window_minutes
+        slot = self._slots[index]
+        if slot is None or slot.epoch != epoch:
+            slot = _WindowSlot(epoch)
+            self._slots[index] = slot
+        return slot
 
     def record_request(self, metrics: RequestMetrics):
         """Record request metrics"""
-        self.request_metrics.append(metrics)
+        route = metrics.route or UNMATCHED_ROUTE
+        endpoint_key = f"{metrics.method} {route}"
+        status_code = str(metrics.status_code)
+        is_error = metrics.status_code >= 400
+
+        metrics_registry.observe_request(metrics.method, route, metrics.status_code, metrics.duration)
 
-        # Update endpoint statistics
-        endpoint_key = f"{metrics.method} {metrics.path}"
-        if endpoint_key not in self.endpoint_stats:
-            self.endpoint_stats[endpoint_key] = {
+        # Update lifetime endpoint statistics
+        stats = self.endpoint_stats.get(endpoint_key)
+        if stats is None:
+            stats = self.endpoint_stats[endpoint_key] = {
                 'count': 0,
                 'total_duration': 0.0,
                 'min_duration': float('inf'),
@@ -84,61 +237,77 @@ class MetricsCollector:
                 'status_codes': {}
             }
 
-        stats = self.endpoint_stats[endpoint_key]
         stats['count'] += 1
         stats['total_duration'] += metrics.duration
         stats['min_duration'] = min(stats['min_duration'], metrics.duration)
         stats['max_duration'] = max(stats['max_duration'], metrics.duration)
-
-        # Track status codes
-        status_code = str(metrics.status_code)
         stats['status_codes'][status_code] = stats['status_codes'].get(status_code, 0) + 1
 
         # Track errors
-        if metrics.status_code >= 400:
+        if is_error:
             stats['error_count'] += 1
-            error_key = f"{metrics.status_code}_{metrics.path}"
+            error_key = f"{metrics.status_code}_{route}"
             self.error_counts[error_key] = self.error_counts.get(error_key, 0) + 1
 
-        # Cleanup old metrics
-        self._cleanup_old_metrics()
+        # Update the current window slot
+        slot = self._slot_for(self._epoch_slot(metrics.timestamp))
+        slot.all.record(metrics.duration)
+        slot.status_codes[status_code] = slot.status_codes.get(status_code, 0) + 1
+
+        histogram = slot.endpoints.get(endpoint_key)
+        if histogram is None:
+            histogram = slot.endpoints[endpoint_key] = LatencyHistogram()
+            slot.endpoint_status_codes[endpoint_key] = {}
+        histogram.record(metrics.duration)
+        endpoint_codes = slot.endpoint_status_codes[endpoint_key]
+        endpoint_codes[status_code] = endpoint_codes.get(status_code, 0) + 1
+
+        if is_error:
+            slot.errors += 1
+            slot.endpoint_errors[endpoint_key] = slot.endpoint_errors.get(endpoint_key, 0) + 1
 
     def record_system_metrics(self, metrics: SystemMetrics):
         """Record system metrics"""
         self.system_metrics.append(metrics)
-        self._cleanup_old_metrics()
 
     def record_database_metrics(self, metrics: DatabaseMetrics):
         """Record database metrics"""
         self.database_metrics.append(metrics)
-        self._cleanup_old_metrics()
-
-    def _cleanup_old_metrics(self):
-        """Remove old metrics to prevent memory leaks"""
-        if len(self.request_metrics) > self.max_metrics_history:
-            self.request_metrics = self.request_metrics[-self.max_metrics_history:]
-
-        if len(self.system_metrics) > 1000:  # Keep fewer system metrics
-            self.system_metrics = self.system_metrics[-1000:]
-
-        if len(self.database_metrics) > 1000:
-            self.database_metrics = self.database_metrics[-1000:]
 
     def get_request_stats(
         self,
         minutes: int = 60,
         path_filter: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Get request statistics for the last N minutes"""
-        cutoff_time = datetime.utcnow() - timedelta(minutes=minutes)
-
-        filtered_metrics = [
-            m for m in self.request_metrics
-            if m.timestamp >= cutoff_time and
-            (path_filter is None or path_filter in m.path)
-        ]
-
-        if not filtered_metrics:
+        """Get request statistics for the last N minutes (at most window_minutes)"""
+        minutes = max(1, min(minutes, self.window_minutes))
+        current_epoch = self._epoch_slot(datetime.utcnow())
+        oldest_epoch = current_epoch - minutes + 1
+
+        histogram = LatencyHistogram()
+        error_count = 0
+        status_codes: Dict[str, int] = {}
+
+        for slot in self._slots:
+            if slot is None or not oldest_epoch <= slot.epoch <= current_epoch:
+                continue
+
+            if path_filter is None:
+                histogram.merge(slot.all)
+                error_count += slot.errors
+                for code, count in slot.status_codes.items():
+                    status_codes[code] = status_codes.get(code, 0) + count
+                continue
+
+            for endpoint_key, endpoint_histogram in slot.endpoints.items():
+                if path_filter not in endpoint_key:
+                    continue
+                histogram.merge(endpoint_histogram)
+                error_count += slot.endpoint_errors.get(endpoint_key, 0)
+                for code, count in slot.endpoint_status_codes[endpoint_key].items():
+                    status_codes[code] = status_codes.get(code, 0) + count
+
+        if not histogram.count:
             return {
                 'total_requests': 0,
                 'avg_duration': 0.0,
@@ -147,35 +316,19 @@ class MetricsCollector:
                 'status_codes': {}
             }
 
-        total_requests = len(filtered_metrics)
-        total_duration = sum(m.duration for m in filtered_metrics)
-        error_count = sum(1 for m in filtered_metrics if m.status_code >= 400)
-
-        # Calculate status code distribution
-        status_codes = {}
-        for metric in filtered_metrics:
-            code = str(metric.status_code)
-            status_codes[code] = status_codes.get(code, 0) + 1
+        total_requests = histogram.count
 
         return {
             'total_requests': total_requests,
-            'avg_duration': total_duration / total_requests,
+            'avg_duration': histogram.total / total_requests,
             'requests_per_minute': total_requests / minutes,
-            'error_rate': (error_count / total_requests * 100) if total_requests > 0 else 0,
+            'error_rate': error_count / total_requests * 100,
             'status_codes': status_codes,
-            'avg_response_time_95th': self._calculate_percentile(filtered_metrics, 95),
-            'avg_response_time_99th': self._calculate_percentile(filtered_metrics, 99)
+            'avg_response_time_50th': histogram.percentile(50),
+            'avg_response_time_95th': histogram.percentile(95),
+            'avg_response_time_99th': histogram.percentile(99)
         }
 
-    def _calculate_percentile(self, metrics: List[RequestMetrics], percentile: int) -> float:
-        """Calculate response time percentile"""
-        if not metrics:
-            return 0.0
-
-        durations = sorted(m.duration for m in metrics)
-        index = int(len(durations) * percentile / 100)
-        return durations[min(index, len(durations) - 1)]
-
     def get_health_status(self) -> Dict[str, Any]:
         """Get overall system health status"""
         recent_requests = self.get_request_stats(minutes=5)
@@ -236,6 +389,11 @@ class RequestMonitoringMiddleware(BaseHTTPMiddleware):
         request.state.request_id = request_id
         request.state.start_time = start_time
 
+        # Attribute database queries to the route template once routing has run
+        source_token = set_query_source(
+            lambda: f"{method} {getattr(request.scope.get('route'), 'path', UNMATCHED_ROUTE)}"
+        )
+
         # Log request start
         logger.info(
             f"Request started: {method} {path}",
@@ -258,6 +416,9 @@ class RequestMonitoringMiddleware(BaseHTTPMiddleware):
             # Extract user ID if available
             user_id = getattr(request.state, 'user_id', None)
 
+            # Route template keeps endpoint cardinality bounded (/users/{id})
+            route = getattr(request.scope.get('route'), 'path', None)
+
             # Record metrics
             request_metrics = RequestMetrics(
                 request_id=request_id,
@@ -269,7 +430,8 @@ class RequestMonitoringMiddleware(BaseHTTPMiddleware):
                 user_id=user_id,
                 ip_address=ip_address,
                 user_agent=user_agent,
-                query_params=query_params
+                query_params=query_params,
+                route=route
             )
             metrics_collector.record_request(request_metrics)
 
@@ -308,7 +470,8 @@ class RequestMonitoringMiddleware(BaseHTTPMiddleware):
                 ip_address=ip_address,
                 user_agent=user_agent,
                 query_params=query_params,
-                error_message=str(e)
+                error_message=str(e),
+                route=getattr(request.scope.get('route'), 'path', None)
             )
             metrics_collector.record_request(error_metrics)
 
@@ -329,6 +492,9 @@ class RequestMonitoringMiddleware(BaseHTTPMiddleware):
             # Re-raise the exception
             raise
 
+        finally:
+            reset_query_source(source_token)
+
 async def collect_system_metrics():
     """Collect system performance metrics"""
     try:
@@ -530,6 +696,8 @@ class PerformanceProfiler:
 
     def record_profile(self, operation_name: str, duration: float):
         """Record performance profile"""
+        metrics_registry.observe_operation(operation_name, duration)
+
         if operation_name not in self.profiles:
             self.profiles[operation_name] = []
         self.profiles[operation_name].append(duration)
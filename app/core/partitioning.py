@@ -0,0 +1,231 @@
+# app/core/partitioning.py
+"""
+Monthly range-partition maintenance for high-volume time-series tables
+
+email_metadata and communication_analysis are declaratively partitioned by
+month on their timestamp column (alembic revision 008, which picks the column
+from PARTITION_KEY_CANDIDATES). This module keeps
+PARTITION_PREMAKE_MONTHS of future partitions in place and enforces
+retention by detaching and dropping whole months. Dropping a partition
+frees its space at once, with none of the dead tuples, vacuum work or
+index bloat of a bulk DELETE.
+
+Partitions are named {table}_pYYYY_MM; the {table}_default partition only
+catches rows outside every monthly range and should stay empty. Rows that
+landed there before their month's partition existed are moved into it when
+the partition is created.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PARTITION_SUFFIX = re.compile(r"_p(\d{4})_(\d{2})$")
+
+# Partitioned table -> candidate partition key columns; the first one the
+# table has is the key (see partition_key_column)
+PARTITION_KEY_CANDIDATES: Dict[str, Tuple[str, ...]] = {
+    'email_metadata': ('date_received', 'date_sent', 'created_at'),
+    'communication_analysis': ('analysis_timestamp', 'analyzed_at', 'created_at'),
+}
+
+# Partitioned table -> settings field holding its retention in months
+RETENTION_SETTINGS: Dict[str, str] = {
+    'email_metadata': 'EMAIL_METADATA_RETENTION_MONTHS',
+    'communication_analysis': 'COMMUNICATION_ANALYSIS_RETENTION_MONTHS',
+}
+
+
+@dataclass(frozen=True)
+class PartitionedTable:
+    """A table partitioned by month on a timestamp column"""
+    name: str
+    retention_months: int
+
+
+def partitioned_tables() -> Tuple[PartitionedTable, ...]:
+    """Partitioned tables and their retention, from settings"""
+    return tuple(
+        PartitionedTable(table, getattr(settings, RETENTION_SETTINGS[table]))
+        for table in PARTITION_KEY_CANDIDATES
+    )
+
+
+def partition_key_column(table: str, columns: Iterable[str]) -> Optional[str]:
+    """Partition key for a table with the given columns, or None if it has no candidate"""
+    present = set(columns)
+    return next((c for c in PARTITION_KEY_CANDIDATES[table] if c in present), None)
+
+
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+def month_start(day: date) -> date:
+    return date(day.year, day.month, 1)
+
+
+def add_months(day: date, months: int) -> date:
+    """First of the month `months` after day's month (negative goes back)"""
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month.year:04d}_{month.month:02d}"
+
+
+def partition_month(table: str, partition: str) -> Optional[date]:
+    """Month covered by a partition, or None for the default/foreign partitions"""
+    if not partition.startswith(f"{table}_p"):
+        return None
+    match = PARTITION_SUFFIX.search(partition)
+    return date(int(match.group(1)), int(match.group(2)), 1) if match else None
+
+
+async def is_partitioned(conn: AsyncConnection, table: str) -> bool:
+    result = await conn.execute(text("""
+        SELECT 1 FROM pg_partitioned_table pt
+        JOIN pg_class c ON c.oid = pt.partrelid
+        WHERE c.relname = :table AND pg_table_is_visible(c.oid)
+    """), {"table": table})
+    return result.scalar() is not None
+
+
+async def list_partitions(conn: AsyncConnection, table: str) -> List[str]:
+    result = await conn.execute(text("""
+        SELECT child.relname
+        FROM pg_inherits i
+        JOIN pg_class parent ON parent.oid = i.inhparent
+        JOIN pg_class child ON child.oid = i.inhrelid
+        WHERE parent.relname = :table AND pg_table_is_visible(parent.oid)
+        ORDER BY child.relname
+    """), {"table": table})
+    return [row[0] for row in result]
+
+
+async def partition_key(conn: AsyncConnection, table: str) -> str:
+    """Column a partitioned table is partitioned on, from the catalog"""
+    result = await conn.execute(text("""
+        SELECT a.attname
+        FROM pg_partitioned_table pt
+        JOIN pg_attribute a ON a.attrelid = pt.partrelid AND a.attnum = pt.partattrs[0]
+        WHERE pt.partrelid = CAST(:table AS regclass)
+    """), {"table": table})
+    return result.scalar_one()
+
+
+async def _default_has_rows(conn: AsyncConnection, table: str, key: str, start: date, end: date) -> bool:
+    result = await conn.execute(text(
+        f"SELECT 1 FROM {default_partition_name(table)} "
+        f"WHERE {key} >= :start AND {key} < :end LIMIT 1"
+    ), {"start": start, "end": end})
+    return result.scalar() is not None
+
+
+async def ensure_partitions(
+    conn: AsyncConnection,
+    spec: PartitionedTable,
+    months_ahead: Optional[int] = None,
+    today: Optional[date] = None
+) -> List[str]:
+    """
+    Create monthly partitions from the current month through months_ahead
+
+    Returns:
+        Names of partitions created
+    """
+    months_ahead = settings.PARTITION_PREMAKE_MONTHS if months_ahead is None else months_ahead
+    current = month_start(today or datetime.utcnow().date())
+    existing = set(await list_partitions(conn, spec.name))
+    default = default_partition_name(spec.name)
+    key = await partition_key(conn, spec.name) if default in existing else None
+
+    created = []
+    for offset in range(months_ahead + 1):
+        start = add_months(current, offset)
+        end = add_months(start, 1)
+        name = partition_name(spec.name, start)
+        if name in existing:
+            continue
+        bounds = f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        if key and await _default_has_rows(conn, spec.name, key, start, end):
+            # Postgres refuses a partition whose range still has rows in the
+            # default partition. Detach it, move those rows into the new
+            # partition and reattach, as one statement so it is atomic even
+            # on an autocommit connection.
+            in_range = f"{key} >= '{start.isoformat()}' AND {key} < '{end.isoformat()}'"
+            await conn.execute(text(
+                f"DO $$ BEGIN "
+                f"ALTER TABLE {spec.name} DETACH PARTITION {default}; "
+                f"CREATE TABLE {name} PARTITION OF {spec.name} {bounds}; "
+                f"INSERT INTO {name} OVERRIDING SYSTEM VALUE SELECT * FROM {default} WHERE {in_range}; "
+                f"DELETE FROM {default} WHERE {in_range}; "
+                f"ALTER TABLE {spec.name} ATTACH PARTITION {default} DEFAULT; "
+                f"END $$"
+            ))
+            logger.warning(f"Created partition {name} and moved its rows out of {default}")
+        else:
+            await conn.execute(text(f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {spec.name} {bounds}"))
+            logger.info(f"Created partition {name}")
+        created.append(name)
+    return created
+
+
+async def drop_expired_partitions(
+    conn: AsyncConnection,
+    spec: PartitionedTable,
+    today: Optional[date] = None
+) -> List[str]:
+    """
+    Detach and drop partitions whose whole month is older than retention
+
+    Returns:
+        Names of partitions dropped
+    """
+    if spec.retention_months <= 0:
+        return []
+
+    cutoff = add_months(month_start(today or datetime.utcnow().date()), -spec.retention_months)
+    dropped = []
+    for partition in await list_partitions(conn, spec.name):
+        month = partition_month(spec.name, partition)
+        if month is None or add_months(month, 1) > cutoff:
+            continue
+        await conn.execute(text(f"ALTER TABLE {spec.name} DETACH PARTITION {partition}"))
+        await conn.execute(text(f"DROP TABLE {partition}"))
+        dropped.append(partition)
+        logger.info(f"Dropped expired partition {partition}")
+    return dropped
+
+
+async def maintain_partitions(conn: AsyncConnection, today: Optional[date] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Premake future partitions and enforce retention for every partitioned table
+
+    Expects an autocommit connection so each DDL statement holds its lock
+    only briefly. Tables that are missing or not yet converted are skipped.
+    """
+    report = {}
+    for spec in partitioned_tables():
+        if not await is_partitioned(conn, spec.name):
+            logger.warning(f"{spec.name} is not partitioned; skipping partition maintenance")
+            continue
+        try:
+            report[spec.name] = {
+                'created': await ensure_partitions(conn, spec, today=today),
+                'dropped': await drop_expired_partitions(conn, spec, today=today),
+            }
+        except Exception as e:
+            logger.error(f"Partition maintenance failed for {spec.name}: {e}")
+            report[spec.name] = {'error': str(e)}
+    return report
@@ -0,0 +1,735 @@
+# app/core/query_benchmark.py
+"""
+Plan-regression benchmarks for PsychSync's hot queries
+
+Seeds a synthetic dataset of configurable scale into an isolated schema,
+captures EXPLAIN (ANALYZE, BUFFERS) plans and timings for a fixed set of
+canonical queries and diffs them against a stored baseline, so an index
+change, ORM rewrite or Postgres upgrade that flips a plan is caught before
+it reaches production.
+
+The benchmark tables live in their own schema (query_bench) and never touch
+application data. Their columns mirror the ORM models with user/team
+references typed consistently as UUID; their indexes are compiled from the
+models' own Index definitions, so adding or dropping an index on a model
+shows up as a plan change on the next run.
+
+Usage:
+    python scripts/benchmark_queries.py --scale 1.0
+    python scripts/benchmark_queries.py --update-baseline
+"""
+
+import json
+import logging
+import statistics
+import hashlib
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.schema import CreateIndex
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_SCHEMA = "query_bench"
+BASELINE_VERSION = 1
+
+DEFAULT_BASELINE_PATH = Path(__file__).resolve().parents[2] / "scripts" / "query_plan_baseline.json"
+
+
+# =============================================================================
+# PLAN HELPERS
+# =============================================================================
+
+def load_plan(raw: Any) -> Dict[str, Any]:
+    """
+    Normalise an EXPLAIN (FORMAT JSON) result to its top-level object
+
+    asyncpg hands json columns back as text, psycopg2 as parsed lists.
+    """
+    if isinstance(raw, (str, bytes)):
+        raw = json.loads(raw)
+    if isinstance(raw, list):
+        raw = raw[0] if raw else {}
+    return raw or {}
+
+
+def iter_plan_nodes(node: Dict[str, Any], depth: int = 0) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (depth, node) for a plan node and all of its children, depth-first"""
+    if not node:
+        return
+    yield depth, node
+    for child in node.get("Plans", []):
+        yield from iter_plan_nodes(child, depth + 1)
+
+
+def describe_plan_node(node: Dict[str, Any]) -> str:
+    """
+    One-line description of a plan node's shape
+
+    Only structural fields are kept (node type, strategy, join type, relation
+    and index); costs, row counts and timings vary between runs and would make
+    every comparison a "change".
+    """
+    parts = [node.get("Node Type", "?")]
+    if node.get("Strategy") and node.get("Strategy") != "Plain":
+        parts.insert(0, node["Strategy"])
+    if node.get("Join Type") and node.get("Join Type") != "Inner":
+        parts.append(f"({node['Join Type']})")
+    if node.get("Index Name"):
+        parts.append(f"using {node['Index Name']}")
+    if node.get("Relation Name"):
+        parts.append(f"on {node['Relation Name']}")
+    if node.get("Parent Relationship") in ("SubPlan", "InitPlan"):
+        parts.append(f"[{node['Parent Relationship']}]")
+    return " ".join(parts)
+
+
+def plan_signature(plan: Dict[str, Any]) -> List[str]:
+    """Indented plan outline used to detect plan flips"""
+    return [
+        "  " * depth + describe_plan_node(node)
+        for depth, node in iter_plan_nodes(plan.get("Plan", {}))
+    ]
+
+
+# =============================================================================
+# SCHEMA AND SEED DATA
+# =============================================================================
+
+@dataclass
+class SeedScale:
+    """Row counts for the synthetic dataset"""
+    organizations: int = 50
+    users: int = 20000
+    teams: int = 1000
+    members_per_team: int = 12
+    assessments: int = 2000
+    responses: int = 200000
+
+    @classmethod
+    def from_factor(cls, factor: float) -> "SeedScale":
+        """Scale every table linearly from the defaults (1.0 ~ a mid-size tenant mix)"""
+        base = cls()
+        return cls(
+            organizations=max(1, int(base.organizations * factor)),
+            users=max(10, int(base.users * factor)),
+            teams=max(1, int(base.teams * factor)),
+            members_per_team=base.members_per_team,
+            assessments=max(1, int(base.assessments * factor)),
+            responses=max(10, int(base.responses * factor)),
+        )
+
+
+# Columns mirror app/db/models; enums are stored as their SQLAlchemy names
+BENCHMARK_TABLES: Dict[str, str] = {
+    "organizations": """
+        CREATE TABLE organizations (
+            id UUID PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        )
+    """,
+    "users": """
+        CREATE TABLE users (
+            id UUID PRIMARY KEY,
+            email CITEXT NOT NULL,
+            password_hash TEXT NOT NULL,
+            full_name TEXT,
+            is_active BOOLEAN NOT NULL DEFAULT true,
+            is_verified BOOLEAN NOT NULL DEFAULT false,
+            last_login TIMESTAMPTZ,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            deleted_at TIMESTAMPTZ,
+            organization_id UUID REFERENCES organizations(id)
+        )
+    """,
+    "teams": """
+        CREATE TABLE teams (
+            id UUID PRIMARY KEY,
+            name TEXT NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            created_by_id UUID REFERENCES users(id),
+            organization_id UUID NOT NULL REFERENCES organizations(id)
+        )
+    """,
+    "team_members": """
+        CREATE TABLE team_members (
+            id UUID PRIMARY KEY,
+            team_id UUID NOT NULL REFERENCES teams(id),
+            user_id UUID NOT NULL REFERENCES users(id),
+            role VARCHAR(20) NOT NULL,
+            CONSTRAINT uq_team_member_user UNIQUE (team_id, user_id)
+        )
+    """,
+    "assessments": """
+        CREATE TABLE assessments (
+            id INTEGER PRIMARY KEY,
+            title VARCHAR NOT NULL,
+            category VARCHAR(20) NOT NULL,
+            status VARCHAR(20),
+            created_by_id UUID NOT NULL REFERENCES users(id),
+            team_id UUID REFERENCES teams(id),
+            created_at TIMESTAMP DEFAULT NOW()
+        )
+    """,
+    "assessment_responses": """
+        CREATE TABLE assessment_responses (
+            id INTEGER PRIMARY KEY,
+            assessment_id INTEGER NOT NULL REFERENCES assessments(id),
+            respondent_id UUID NOT NULL REFERENCES users(id),
+            status VARCHAR(20),
+            score_data JSON,
+            completed_at TIMESTAMP
+        )
+    """,
+}
+
+
+# Set-based seed steps; {placeholders} are filled from SeedScale. Random
+# values are reproducible because the session calls setseed() first.
+SEED_STEPS: Dict[str, str] = {
+    "organizations": """
+        INSERT INTO organizations (id, name, created_at)
+        SELECT md5('org' || g)::uuid, 'Organization ' || g, NOW() - g * INTERVAL '1 day'
+        FROM generate_series(1, {organizations}) g
+    """,
+    # Quadratic skew: a few large organizations and a long tail of small ones
+    "users": """
+        INSERT INTO users (id, email, password_hash, full_name, is_active, is_verified,
+                           last_login, created_at, deleted_at, organization_id)
+        SELECT md5('user' || g)::uuid,
+               'user' || g || '@bench.psychsync.test',
+               'x',
+               'Benchmark User ' || g,
+               random() > 0.05,
+               random() > 0.2,
+               NOW() - random() * INTERVAL '90 days',
+               NOW() - random() * INTERVAL '730 days',
+               CASE WHEN random() < 0.02 THEN NOW() END,
+               md5('org' || (1 + floor({organizations} * power(random(), 2)))::int)::uuid
+        FROM generate_series(1, {users}) g
+    """,
+    "teams": """
+        INSERT INTO teams (id, name, created_at, created_by_id, organization_id)
+        SELECT md5('team' || g)::uuid,
+               'Team ' || g,
+               NOW() - random() * INTERVAL '365 days',
+               md5('user' || (1 + floor(random() * {users}))::int)::uuid,
+               md5('org' || (1 + floor({organizations} * power(random(), 2)))::int)::uuid
+        FROM generate_series(1, {teams}) g
+    """,
+    "team_members": """
+        INSERT INTO team_members (id, team_id, user_id, role)
+        SELECT md5('member' || t || ':' || m)::uuid,
+               md5('team' || t)::uuid,
+               md5('user' || (1 + floor(random() * {users}))::int)::uuid,
+               CASE WHEN m = 1 THEN 'OWNER' WHEN random() < 0.1 THEN 'ADMIN' ELSE 'MEMBER' END
+        FROM generate_series(1, {teams}) t, generate_series(1, {members_per_team}) m
+        ON CONFLICT (team_id, user_id) DO NOTHING
+    """,
+    "assessments": """
+        INSERT INTO assessments (id, title, category, status, created_by_id, team_id, created_at)
+        SELECT g,
+               'Assessment ' || g,
+               'PERSONALITY',
+               'PUBLISHED',
+               md5('user' || (1 + floor(random() * {users}))::int)::uuid,
+               md5('team' || (1 + floor(random() * {teams}))::int)::uuid,
+               NOW() - random() * INTERVAL '365 days'
+        FROM generate_series(1, {assessments}) g
+    """,
+    "assessment_responses": """
+        INSERT INTO assessment_responses (id, assessment_id, respondent_id, status,
+                                          score_data, completed_at)
+        SELECT g,
+               1 + floor({assessments} * power(random(), 2))::int,
+               md5('user' || (1 + floor(random() * {users}))::int)::uuid,
+               CASE WHEN p < 0.8 THEN 'COMPLETED' ELSE 'IN_PROGRESS' END,
+               CASE WHEN p < 0.8 THEN json_build_object('total_score', floor(random() * 27)) END,
+               CASE WHEN p < 0.8 THEN NOW() - random() * INTERVAL '365 days' END
+        FROM (SELECT g, random() AS p FROM generate_series(1, {responses}) g) s
+    """,
+}
+
+
+def model_index_ddl() -> Dict[str, List[str]]:
+    """
+    CREATE INDEX statements for the benchmark tables, taken from the models
+
+    Executed with search_path set to the benchmark schema so the unqualified
+    table names resolve there.
+    """
+    from app.db.models.user import User
+    from app.db.models.team import Team, TeamMember
+    from app.db.models.assessment import Assessment, AssessmentResponse
+
+    dialect = postgresql.dialect()
+    ddl: Dict[str, List[str]] = {}
+    for model in (User, Team, TeamMember, Assessment, AssessmentResponse):
+        table = model.__table__
+        ddl[table.name] = [
+            str(CreateIndex(index).compile(dialect=dialect))
+            for index in sorted(table.indexes, key=lambda i: i.name or "")
+        ]
+    return ddl
+
+
+# =============================================================================
+# CANONICAL QUERIES
+# =============================================================================
+
+@dataclass
+class BenchmarkQuery:
+    """
+    A hot query to benchmark
+
+    params maps each bind parameter to a SQL expression that picks a
+    representative value from the seeded data (usually the largest tenant,
+    the worst case for the plan).
+    """
+    name: str
+    sql: str
+    params: Dict[str, str] = field(default_factory=dict)
+    tables: Tuple[str, ...] = ()
+    description: str = ""
+
+
+CANONICAL_QUERIES: List[BenchmarkQuery] = [
+    BenchmarkQuery(
+        name="user_lookup_by_email",
+        description="Login and token refresh",
+        sql="""
+            SELECT id, email, password_hash, is_active, is_verified
+            FROM users
+            WHERE email = :email AND deleted_at IS NULL
+        """,
+        params={"email": "SELECT email FROM users ORDER BY id LIMIT 1"},
+        tables=("users",),
+    ),
+    BenchmarkQuery(
+        name="org_members",
+        description="Organization member directory, newest first",
+        sql="""
+            SELECT id, email, full_name, last_login
+            FROM users
+            WHERE organization_id = :org_id AND is_active = true AND deleted_at IS NULL
+            ORDER BY created_at DESC
+            LIMIT 50
+        """,
+        params={"org_id": """
+            SELECT organization_id FROM users
+            GROUP BY organization_id ORDER BY count(*) DESC LIMIT 1
+        """},
+        tables=("users",),
+    ),
+    BenchmarkQuery(
+        name="team_roster",
+        description="Team page member list",
+        sql="""
+            SELECT u.id, u.full_name, u.email, tm.role
+            FROM team_members tm
+            JOIN users u ON u.id = tm.user_id
+            WHERE tm.team_id = :team_id
+            ORDER BY tm.role, u.full_name
+        """,
+        params={"team_id": "SELECT team_id FROM team_members ORDER BY team_id LIMIT 1"},
+        tables=("users", "team_members"),
+    ),
+    BenchmarkQuery(
+        name="assessment_results",
+        description="Completed responses for an assessment results page",
+        sql="""
+            SELECT r.id, r.respondent_id, r.score_data, r.completed_at
+            FROM assessment_responses r
+            WHERE r.assessment_id = :assessment_id AND r.status = 'COMPLETED'
+            ORDER BY r.completed_at DESC
+            LIMIT 100
+        """,
+        params={"assessment_id": """
+            SELECT assessment_id FROM assessment_responses
+            GROUP BY assessment_id ORDER BY count(*) DESC LIMIT 1
+        """},
+        tables=("assessment_responses",),
+    ),
+    BenchmarkQuery(
+        name="team_analytics",
+        description="Per-team member and response rollup for an organization",
+        sql="""
+            SELECT t.id,
+                   t.name,
+                   (SELECT count(*) FROM team_members tm WHERE tm.team_id = t.id) AS member_count,
+                   count(r.id) FILTER (WHERE r.status = 'COMPLETED') AS completed_responses,
+                   avg((r.score_data->>'total_score')::numeric) AS avg_score
+            FROM teams t
+            LEFT JOIN assessments a ON a.team_id = t.id
+            LEFT JOIN assessment_responses r ON r.assessment_id = a.id
+            WHERE t.organization_id = :org_id
+            GROUP BY t.id, t.name
+            ORDER BY completed_responses DESC
+        """,
+        params={"org_id": """
+            SELECT organization_id FROM teams
+            GROUP BY organization_id ORDER BY count(*) DESC LIMIT 1
+        """},
+        tables=("teams", "team_members", "assessments", "assessment_responses"),
+    ),
+]
+
+
+# =============================================================================
+# RESULTS AND BASELINE DIFF
+# =============================================================================
+
+@dataclass
+class QueryBenchmarkResult:
+    """Median timings and plan shape for one benchmark query"""
+    name: str
+    execution_ms: float = 0.0
+    planning_ms: float = 0.0
+    execution_ms_runs: List[float] = field(default_factory=list)
+    rows: int = 0
+    shared_hit_blocks: int = 0
+    shared_read_blocks: int = 0
+    plan_signature: List[str] = field(default_factory=list)
+    plan_hash: str = ""
+    skipped: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class PlanRegression:
+    """A difference from the baseline worth failing a build over"""
+    query: str
+    kind: str  # plan_changed, slower, missing_baseline, skipped
+    detail: str
+    baseline: Any = None
+    current: Any = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def compare_to_baseline(
+    results: List[QueryBenchmarkResult],
+    baseline: Dict[str, Any],
+    time_tolerance: float = 0.5,
+    min_delta_ms: float = 1.0
+) -> List[PlanRegression]:
+    """
+    Diff benchmark results against a stored baseline
+
+    A query regresses when its plan shape differs from the baseline, or when
+    its median execution time grew by more than time_tolerance (0.5 = 50%)
+    and by at least min_delta_ms, so sub-millisecond jitter on fast index
+    lookups doesn't fail the run.
+    """
+    regressions = []
+    stored = baseline.get("queries", {})
+
+    for result in results:
+        if result.skipped:
+            regressions.append(PlanRegression(
+                query=result.name, kind="skipped", detail=result.skipped
+            ))
+            continue
+
+        expected = stored.get(result.name)
+        if expected is None:
+            regressions.append(PlanRegression(
+                query=result.name,
+                kind="missing_baseline",
+                detail="No baseline recorded; run with --update-baseline"
+            ))
+            continue
+
+        if expected.get("plan_hash") != result.plan_hash:
+            regressions.append(PlanRegression(
+                query=result.name,
+                kind="plan_changed",
+                detail="Plan shape differs from baseline",
+                baseline=expected.get("plan_signature"),
+                current=result.plan_signature
+            ))
+
+        baseline_ms = expected.get("execution_ms", 0.0)
+        delta_ms = result.execution_ms - baseline_ms
+        if baseline_ms > 0 and delta_ms >= min_delta_ms and delta_ms / baseline_ms > time_tolerance:
+            regressions.append(PlanRegression(
+                query=result.name,
+                kind="slower",
+                detail=f"Median execution {baseline_ms:.2f}ms -> {result.execution_ms:.2f}ms "
+                       f"(+{delta_ms / baseline_ms:.0%})",
+                baseline=baseline_ms,
+                current=result.execution_ms
+            ))
+
+    return regressions
+
+
+def load_baseline(path: Path = DEFAULT_BASELINE_PATH) -> Optional[Dict[str, Any]]:
+    """Read a stored baseline, or None if there isn't one yet"""
+    path = Path(path)
+    if not path.exists():
+        return None
+    with path.open() as f:
+        return json.load(f)
+
+
+def save_baseline(
+    results: List[QueryBenchmarkResult],
+    scale: SeedScale,
+    server_version: str,
+    path: Path = DEFAULT_BASELINE_PATH
+):
+    """Write results as the new baseline; skipped queries are left out"""
+    baseline = {
+        "version": BASELINE_VERSION,
+        "generated_at": datetime.utcnow().isoformat(),
+        "server_version": server_version,
+        "scale": asdict(scale),
+        "queries": {
+            r.name: {
+                "description": next((q.description for q in CANONICAL_QUERIES if q.name == r.name), ""),
+                "execution_ms": r.execution_ms,
+                "planning_ms": r.planning_ms,
+                "rows": r.rows,
+                "shared_hit_blocks": r.shared_hit_blocks,
+                "shared_read_blocks": r.shared_read_blocks,
+                "plan_hash": r.plan_hash,
+                "plan_signature": r.plan_signature,
+            }
+            for r in results if not r.skipped
+        },
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+class QueryPlanBenchmark:
+    """
+    Seeds the benchmark schema and measures the canonical queries
+
+    Seeding is all set-based (INSERT ... SELECT generate_series), so a
+    200k-response dataset builds in seconds. A failed seed step is logged
+    and every query that reads the affected table is reported as skipped
+    rather than aborting the run.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        scale: Optional[SeedScale] = None,
+        seed: float = 0.42,
+        warmup_runs: int = 2,
+        runs: int = 5,
+        queries: Optional[List[BenchmarkQuery]] = None
+    ):
+        self.engine = engine
+        self.scale = scale or SeedScale()
+        self.seed = seed
+        self.warmup_runs = warmup_runs
+        self.runs = runs
+        self.queries = queries or CANONICAL_QUERIES
+        self.failed_tables: Dict[str, str] = {}
+        self.server_version = ""
+
+    async def _prepare_connection(self, conn: AsyncConnection):
+        # Same planner settings as the application engine, and no parallel
+        # workers so timings don't depend on how busy the host is
+        await conn.execute(text(f"SET search_path TO {BENCHMARK_SCHEMA}, public"))
+        await conn.execute(text("SET jit = off"))
+        await conn.execute(text("SET max_parallel_workers_per_gather = 0"))
+
+    async def seed_dataset(self):
+        """Drop and rebuild the benchmark schema with fresh synthetic data"""
+        self.failed_tables = {}
+        counts = {k: int(v) for k, v in asdict(self.scale).items()}
+        index_ddl = model_index_ddl()
+
+        async with self.engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            self.server_version = (await conn.execute(text("SHOW server_version"))).scalar() or ""
+
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {BENCHMARK_SCHEMA} CASCADE"))
+            await conn.execute(text(f"CREATE SCHEMA {BENCHMARK_SCHEMA}"))
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS citext"))
+            await self._prepare_connection(conn)
+            await conn.execute(text("SELECT setseed(:seed)"), {"seed": self.seed})
+
+            for table, create_sql in BENCHMARK_TABLES.items():
+                if await self._run_step(conn, table, create_sql):
+                    await self._run_step(conn, table, SEED_STEPS[table].format(**counts))
+
+            # Indexes after the bulk load: faster, and statistics are fresh
+            for table, statements in index_ddl.items():
+                if table in self.failed_tables:
+                    continue
+                for statement in statements:
+                    await self._run_step(conn, table, statement, fatal=False)
+
+            for table in BENCHMARK_TABLES:
+                if table not in self.failed_tables:
+                    await conn.execute(text(f"VACUUM ANALYZE {table}"))
+
+        logger.info(
+            f"Seeded {BENCHMARK_SCHEMA} at {asdict(self.scale)}"
+            + (f"; failed: {sorted(self.failed_tables)}" if self.failed_tables else "")
+        )
+
+    async def _run_step(self, conn: AsyncConnection, table: str, sql: str, fatal: bool = True) -> bool:
+        if table in self.failed_tables:
+            return False
+        try:
+            await conn.execute(text(sql))
+            return True
+        except Exception as e:
+            if fatal:
+                self.failed_tables[table] = str(e).splitlines()[0]
+                logger.warning(f"Benchmark seed step for {table} failed: {e}")
+            else:
+                logger.warning(f"Benchmark index on {table} skipped: {e}")
+            return False
+
+    async def run(self) -> List[QueryBenchmarkResult]:
+        """Benchmark every query against the seeded schema"""
+        results = []
+        async with self.engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            if not self.server_version:
+                self.server_version = (await conn.execute(text("SHOW server_version"))).scalar() or ""
+            await self._prepare_connection(conn)
+
+            for query in self.queries:
+                missing = [t for t in query.tables if t in self.failed_tables]
+                if missing:
+                    results.append(QueryBenchmarkResult(
+                        name=query.name,
+                        skipped=f"Seed failed for {', '.join(missing)}"
+                    ))
+                    continue
+                try:
+                    results.append(await self._benchmark_query(conn, query))
+                except Exception as e:
+                    logger.error(f"Benchmark {query.name} failed: {e}")
+                    results.append(QueryBenchmarkResult(
+                        name=query.name, skipped=str(e).splitlines()[0]
+                    ))
+        return results
+
+    async def _resolve_params(self, conn: AsyncConnection, query: BenchmarkQuery) -> Dict[str, str]:
+        params = {}
+        for name, picker in query.params.items():
+            value = (await conn.execute(text(picker))).scalar()
+            if value is None:
+                raise ValueError(f"No seeded value for :{name}")
+            params[name] = str(value)
+        return params
+
+    async def _benchmark_query(self, conn: AsyncConnection, query: BenchmarkQuery) -> QueryBenchmarkResult:
+        # Inline the parameters: EXPLAIN is not a preparable statement, and
+        # literal values give the custom plan the application would get
+        params = await self._resolve_params(conn, query)
+        sql = str(
+            text(query.sql).bindparams(**params).compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+        )
+        explain = text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")
+
+        for _ in range(self.warmup_runs):
+            await conn.execute(explain)
+
+        plans = []
+        for _ in range(self.runs):
+            plans.append(load_plan((await conn.execute(explain)).scalar()))
+
+        execution = [p.get("Execution Time", 0.0) for p in plans]
+        planning = [p.get("Planning Time", 0.0) for p in plans]
+        last_plan = plans[-1]
+        root = last_plan.get("Plan", {})
+        signature = plan_signature(last_plan)
+
+        return QueryBenchmarkResult(
+            name=query.name,
+            execution_ms=round(statistics.median(execution), 3),
+            planning_ms=round(statistics.median(planning), 3),
+            execution_ms_runs=[round(t, 3) for t in execution],
+            rows=int(root.get("Actual Rows", 0)),
+            shared_hit_blocks=int(root.get("Shared Hit Blocks", 0)),
+            shared_read_blocks=int(root.get("Shared Read Blocks", 0)),
+            plan_signature=signature,
+            plan_hash=hashlib.sha1("\n".join(signature).encode()).hexdigest()[:16],
+        )
+
+    async def drop_dataset(self):
+        """Remove the benchmark schema"""
+        async with self.engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {BENCHMARK_SCHEMA} CASCADE"))
+
+
+async def run_plan_benchmarks(
+    engine: AsyncEngine,
+    scale: Optional[SeedScale] = None,
+    baseline_path: Path = DEFAULT_BASELINE_PATH,
+    update_baseline: bool = False,
+    seed_data: bool = True,
+    time_tolerance: float = 0.5,
+    runs: int = 5
+) -> Dict[str, Any]:
+    """
+    Seed, benchmark and diff in one call
+
+    Writes the baseline when update_baseline is set or none exists yet.
+
+    Returns:
+        Dict with results, regressions and whether the baseline was written
+    """
+    benchmark = QueryPlanBenchmark(engine, scale=scale, runs=runs)
+    if seed_data:
+        await benchmark.seed_dataset()
+    results = await benchmark.run()
+
+    baseline = load_baseline(baseline_path)
+    baseline_written = False
+    regressions: List[PlanRegression] = []
+
+    if update_baseline or baseline is None:
+        save_baseline(results, benchmark.scale, benchmark.server_version, baseline_path)
+        baseline_written = True
+        regressions = [
+            PlanRegression(query=r.name, kind="skipped", detail=r.skipped)
+            for r in results if r.skipped
+        ]
+    else:
+        if baseline.get("scale") != asdict(benchmark.scale):
+            logger.warning(
+                f"Baseline was recorded at scale {baseline.get('scale')}, "
+                f"running at {asdict(benchmark.scale)}; timings are not comparable"
+            )
+        regressions = compare_to_baseline(results, baseline, time_tolerance=time_tolerance)
+
+    return {
+        "server_version": benchmark.server_version,
+        "scale": asdict(benchmark.scale),
+        "results": [r.to_dict() for r in results],
+        "regressions": [r.to_dict() for r in regressions],
+        "baseline_path": str(baseline_path),
+        "baseline_written": baseline_written,
+    }
@@ -0,0 +1,420 @@
+# app/core/query_monitor.py
+"""
+SQL query monitoring for PsychSync
+Statement fingerprinting, per-fingerprint latency statistics and the
+engine-wide cursor execution hooks that feed them
+"""
+
+import re
+import time
+import logging
+import threading
+import traceback
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Iterator, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core import metrics_registry
+from app.core.config import settings
+from app.core.monitoring import LatencyHistogram, get_query_source
+
+logger = logging.getLogger(__name__)
+
+# Statement fingerprinting
+_SQL_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_SQL_STRING = re.compile(r"'(?:[^']|'')*'")
+_SQL_NUMBER = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_SQL_PARAM = re.compile(r"%\([^)]+\)s|%s|\$\d+|(?<![:\w]):\w+|\?")
+_SQL_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.I)
+_SQL_VALUES_LIST = re.compile(r"\bVALUES\s*(\([^()]*\))(?:\s*,\s*\([^()]*\))+", re.I)
+_SQL_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint_statement(statement: str) -> str:
+    """
+    Normalize a SQL statement so that executions differing only in literal
+    values share one fingerprint: comments dropped, literals and bind
+    parameters replaced with ?, IN (...) lists and multi-row VALUES collapsed,
+    whitespace squeezed.
+
+    >>> fingerprint_statement("SELECT * FROM users WHERE id IN (1, 2, 3) AND name = 'x'")
+    'SELECT * FROM users WHERE id IN (...) AND name = ?'
+    """
+    fingerprint = _SQL_COMMENT.sub(" ", statement)
+    fingerprint = _SQL_STRING.sub("?", fingerprint)
+    fingerprint = _SQL_PARAM.sub("?", fingerprint)
+    fingerprint = _SQL_NUMBER.sub("?", fingerprint)
+    fingerprint = _SQL_IN_LIST.sub("IN (...)", fingerprint)
+    fingerprint = _SQL_VALUES_LIST.sub(r"VALUES \1, ...", fingerprint)
+    return _SQL_WHITESPACE.sub(" ", fingerprint).strip()
+
+
+class QueryFingerprintStats:
+    """Aggregated execution statistics for one statement fingerprint"""
+
+    MAX_SOURCES = 20
+
+    __slots__ = ('fingerprint', 'calls', 'errors', 'total_time', 'rows', 'latency', 'sources', 'sample')
+
+    def __init__(self, fingerprint: str, sample: str):
+        self.fingerprint = fingerprint
+        self.sample = sample
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.rows = 0
+        self.latency = LatencyHistogram()
+        self.sources: Dict[str, int] = {}
+
+    def record(self, duration: float, rows: int, source: str):
+        self.calls += 1
+        self.total_time += duration
+        self.rows += max(rows, 0)
+        self.latency.record(duration)
+
+        if source in self.sources or len(self.sources) < self.MAX_SOURCES:
+            self.sources[source] = self.sources.get(source, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        calls = self.calls or 1
+        return {
+            'fingerprint': self.fingerprint,
+            'sample': self.sample,
+            'calls': self.calls,
+            'errors': self.errors,
+            'total_time': self.total_time,
+            'mean_time': self.total_time / calls,
+            'max_time': self.latency.max if self.calls else 0.0,
+            'p95_time': self.latency.percentile(95),
+            'rows': self.rows,
+            'rows_per_call': self.rows / calls,
+            'sources': dict(sorted(self.sources.items(), key=lambda item: item[1], reverse=True))
+        }
+
+
+# Database performance monitor
+class DatabaseMonitor:
+    """Advanced database performance monitoring"""
+
+    # Upper bound on distinct fingerprints kept in memory
+    max_fingerprints = 2000
+
+    def __init__(self):
+        self.query_stats: Dict[str, Any] = {
+            'total_queries': 0,
+            'total_time': 0.0,
+            'slow_queries': 0,
+            'error_queries': 0,
+            'query_types': {},
+            'slow_threshold': 1.0  # seconds
+        }
+        self.fingerprints: Dict[str, QueryFingerprintStats] = {}
+        self._lock = threading.Lock()
+
+    def record_query(self, query: str, duration: float, error: bool = False, rows: int = 0):
+        """Record query performance statistics"""
+        self.query_stats['total_queries'] += 1
+        self.query_stats['total_time'] += duration
+
+        fingerprint = fingerprint_statement(query) if query else 'UNKNOWN'
+        source = get_query_source()
+
+        if error:
+            self.query_stats['error_queries'] += 1
+        elif duration > self.query_stats['slow_threshold']:
+            self.query_stats['slow_queries'] += 1
+            logger.warning(
+                f"Slow query detected: {duration:.2f}s from {source} - {fingerprint[:500]}"
+            )
+
+        # Track query types
+        query_type = query.strip().split()[0].upper() if query else 'UNKNOWN'
+        self.query_stats['query_types'][query_type] = \
+            self.query_stats['query_types'].get(query_type, 0) + 1
+
+        self._record_fingerprint(fingerprint, query, duration, error, rows, source)
+
+        metrics_registry.observe_db_query(query_type, duration, error=error)
+
+    def _record_fingerprint(
+        self,
+        fingerprint: str,
+        query: str,
+        duration: float,
+        error: bool,
+        rows: int,
+        source: str
+    ):
+        with self._lock:
+            stats = self.fingerprints.get(fingerprint)
+            if stats is None:
+                if len(self.fingerprints) >= self.max_fingerprints:
+                    # Evict the fingerprint contributing least total time
+                    coldest = min(self.fingerprints.values(), key=lambda item: item.total_time)
+                    del self.fingerprints[coldest.fingerprint]
+                stats = self.fingerprints[fingerprint] = QueryFingerprintStats(
+                    fingerprint, (query or '')[:1000]
+                )
+
+            if error:
+                stats.errors += 1
+            else:
+                stats.record(duration, rows, source)
+
+    def get_top_queries(self, limit: int = 20, order_by: str = 'total_time') -> List[Dict[str, Any]]:
+        """
+        Top statement fingerprints
+
+        Args:
+            limit: Number of fingerprints to return
+            order_by: total_time, mean_time, p95_time, calls, rows or errors
+        """
+        with self._lock:
+            rows = [stats.to_dict() for stats in self.fingerprints.values()]
+
+        if rows and order_by not in rows[0]:
+            raise ValueError(f"Unknown order_by: {order_by}")
+
+        rows.sort(key=lambda row: row[order_by], reverse=True)
+        return rows[:limit]
+
+    def reset_fingerprints(self):
+        """Clear per-fingerprint statistics"""
+        with self._lock:
+            self.fingerprints.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get performance statistics"""
+        total_queries = self.query_stats['total_queries']
+        if total_queries == 0:
+            return self.query_stats
+
+        avg_time = self.query_stats['total_time'] / total_queries
+
+        return {
+            **self.query_stats,
+            'avg_query_time': avg_time,
+            'slow_query_percentage': (self.query_stats['slow_queries'] / total_queries) * 100,
+            'error_query_percentage': (self.query_stats['error_queries'] / total_queries) * 100,
+            'distinct_fingerprints': len(self.fingerprints),
+        }
+
+# Global database monitor instance
+db_monitor = DatabaseMonitor()
+
+
+# N+1 query detection
+class NPlusOneError(AssertionError):
+    """Raised at the end of a query scope that repeated a statement too often"""
+
+
+@dataclass
+class NPlusOneViolation:
+    """A statement fingerprint executed repeatedly within one request or task"""
+    scope: str
+    fingerprint: str
+    count: int
+    stack: List[str] = field(default_factory=list)
+
+    def format(self) -> str:
+        return (
+            f"{self.count}x in {self.scope}: {self.fingerprint[:300]}\n"
+            + "".join(self.stack)
+        )
+
+
+class QueryScope:
+    """Fingerprint counts for the queries issued by one request or task"""
+
+    __slots__ = ('name', 'counts', 'stacks')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.counts: Dict[str, int] = {}
+        self.stacks: Dict[str, List[str]] = {}
+
+
+_query_scope: ContextVar[Optional[QueryScope]] = ContextVar('query_scope', default=None)
+
+
+class NPlusOneDetector:
+    """
+    Flags statement fingerprints repeated within a single request or task
+
+    Each request/task runs inside query_scope(); the cursor hook counts
+    fingerprints for the active scope and captures the application stack
+    when a fingerprint first reaches the threshold. On scope exit the
+    repeated fingerprints are logged, or raised as NPlusOneError when
+    raise_on_violation is set (as in tests).
+
+    Enabled by default outside production; see the N_PLUS_ONE_* settings.
+    """
+
+    # Frames from these paths are dropped from captured stacks
+    IGNORED_PATHS = ('site-packages', 'sqlalchemy', 'asyncio', 'starlette')
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        threshold: int = 5,
+        raise_on_violation: bool = False
+    ):
+        if enabled is None:
+            enabled = settings.ENVIRONMENT.lower() not in ('production', 'prod')
+        self.enabled = enabled
+        self.threshold = threshold
+        self.raise_on_violation = raise_on_violation
+        self.violations: List[NPlusOneViolation] = []
+        self.max_violations = 200
+
+    def record(self, fingerprint: str):
+        """Count a statement for the active scope (called from the cursor hook)"""
+        scope = _query_scope.get()
+        if scope is None:
+            return
+
+        count = scope.counts.get(fingerprint, 0) + 1
+        scope.counts[fingerprint] = count
+
+        if count == self.threshold:
+            scope.stacks[fingerprint] = self._capture_stack()
+
+    def _capture_stack(self) -> List[str]:
+        frames = traceback.extract_stack()[:-2]
+
+        # Async sessions run cursor hooks in a SQLAlchemy greenlet; the
+        # application frames are on the parent greenlet's stack
+        try:
+            import greenlet
+            parent = greenlet.getcurrent().parent
+            if parent is not None and parent.gr_frame is not None:
+                frames = traceback.extract_stack(parent.gr_frame) + frames
+        except ImportError:
+            pass
+
+        frames = [
+            frame for frame in frames
+            if frame.filename != __file__
+            and not any(part in frame.filename for part in self.IGNORED_PATHS)
+        ]
+        return traceback.format_list(frames[-8:])
+
+    def begin(self, name: str) -> Optional[Tuple[QueryScope, Token]]:
+        """
+        Start a scope for code that cannot use the scope() context manager
+        (e.g. Celery prerun/postrun signals). Returns a handle for end().
+        Nested scopes fold into the outer one.
+        """
+        if not self.enabled or _query_scope.get() is not None:
+            return None
+
+        scope = QueryScope(name)
+        return scope, _query_scope.set(scope)
+
+    def end(self, handle: Optional[Tuple[QueryScope, Token]]) -> List[NPlusOneViolation]:
+        """Close a scope started with begin() and report violations"""
+        if handle is None:
+            return []
+
+        scope, token = handle
+        try:
+            _query_scope.reset(token)
+        except ValueError:
+            # Token created in another context; just detach the scope
+            _query_scope.set(None)
+        return self.check(scope)
+
+    @contextmanager
+    def scope(self, name: str) -> Iterator[Optional[QueryScope]]:
+        """Group the queries issued inside the block under one scope"""
+        handle = self.begin(name)
+        try:
+            yield handle[0] if handle else _query_scope.get()
+        except BaseException:
+            # Don't mask the original error with an N+1 report
+            if handle:
+                _query_scope.reset(handle[1])
+            raise
+        self.end(handle)
+
+    def check(self, scope: QueryScope) -> List[NPlusOneViolation]:
+        """Report fingerprints in a finished scope that reached the threshold"""
+        violations = [
+            NPlusOneViolation(scope.name, fingerprint, count, scope.stacks.get(fingerprint, []))
+            for fingerprint, count in scope.counts.items()
+            if count >= self.threshold
+        ]
+        if not violations:
+            return violations
+
+        self.violations.extend(violations)
+        del self.violations[:-self.max_violations]
+
+        report = "\n".join(violation.format() for violation in violations)
+        if self.raise_on_violation:
+            raise NPlusOneError(f"N+1 queries detected:\n{report}")
+
+        logger.warning(f"N+1 queries detected:\n{report}")
+        return violations
+
+
+n_plus_one_detector = NPlusOneDetector(
+    enabled=settings.N_PLUS_ONE_DETECTION,
+    threshold=settings.N_PLUS_ONE_THRESHOLD,
+    raise_on_violation=settings.N_PLUS_ONE_RAISE
+)
+
+
+def query_scope(name: str):
+    """Shortcut for n_plus_one_detector.scope(name)"""
+    return n_plus_one_detector.scope(name)
+
+
+class NPlusOneMiddleware:
+    """ASGI middleware running each HTTP request in its own query scope"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or not n_plus_one_detector.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        with n_plus_one_detector.scope(f"{scope['method']} {scope['path']}") as query_scope_:
+            await self.app(scope, receive, send)
+
+            # Report against the route template once routing has run
+            route = getattr(scope.get('route'), 'path', None)
+            if query_scope_ is not None and route:
+                query_scope_.name = f"{scope['method']} {route}"
+
+# Performance monitoring event listeners
+@event.listens_for(Engine, "before_cursor_execute")
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """Record query start time"""
+    context._query_start_time = time.time()
+
+    if n_plus_one_detector.enabled:
+        n_plus_one_detector.record(fingerprint_statement(statement))
+
+@event.listens_for(Engine, "after_cursor_execute")
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """Record query completion and performance stats"""
+    total = time.time() - context._query_start_time
+    db_monitor.record_query(str(statement), total, rows=getattr(cursor, 'rowcount', 0) or 0)
+
+@event.listens_for(Engine, "handle_error")
+def handle_error(exception_context):
+    """Record database errors"""
+    context = exception_context.execution_context
+    if context:
+        db_monitor.record_query(
+            str(context.statement) if context.statement else "UNKNOWN",
+            0.0,
+            error=True
+        )
@@ -18,6 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.core.database import get_async_db
 from app.core.constants import AIProcessing, Email
+from app.core import metrics_registry
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +50,6 @@ celery_app.conf.update(
     worker_prefetch_multiplier=4,
     worker_max_tasks_per_child=1000,
     worker_disable_rate_limits=False,
-    worker_send_task_events=True,
 
     # Task execution
     task_always_eager=False,  # Don't run tasks synchronously
@@ -61,7 +61,6 @@ celery_app.conf.update(
     task_soft_time_limit=300,  # 5 minutes
     task_time_limit=600,       # 10 minutes
     task_acks_late=True,
-    worker_send_task_events=True,
 
     # Result backend
     result_expires=3600,       # 1 hour
@@ -554,6 +553,8 @@ class TaskMonitor:
         if not success:
             self.error_counts[task_name] = self.error_counts.get(task_name, 0) + 1
 
+        metrics_registry.observe_task(task_name, success, duration)
+
         # Log slow tasks
         if duration > 10:  # Tasks taking more than 10 seconds
             logger.warning(f"Slow task detected: {task_name} took {duration:.2f}s")
@@ -0,0 +1,60 @@
+# app/db/models/anonymous_feedback.py
+from sqlalchemy import Column, String, Text, Integer, Date, DateTime, JSON, ForeignKey, Index, PrimaryKeyConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import text
+from app.core.database import Base
+
+
+class AnonymousFeedback(Base):
+    __tablename__ = "anonymous_feedback"
+
+    # Matches alembic revision 002_anonymous_feedback_tables
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
+    tracking_id = Column(String(255), nullable=False, unique=True, index=True)
+    feedback_type = Column(String(100), nullable=False)
+    category = Column(String(100), nullable=False)
+    severity = Column(String(20), nullable=False)
+    description = Column(Text, nullable=False)
+    target_type = Column(String(50), nullable=True)
+    target_id_hash = Column(String(255), nullable=True)
+    evidence_urls = Column(JSON, nullable=True)
+    submitter_fingerprint = Column(String(255), nullable=False)
+    status = Column(String(50), nullable=True)
+    submitted_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=True)
+    resolution_date = Column(DateTime, nullable=True)
+    assigned_reviewer_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    reviewer_notes = Column(Text, nullable=True)
+    public_resolution_notes = Column(Text, nullable=True)
+    urgency_score = Column(String(10), nullable=True)
+    auto_assigned = Column(String(10), nullable=True)
+    investigation_priority = Column(String(20), nullable=True)
+    incident_date = Column(DateTime, nullable=True)
+    actions_taken_summary = Column(Text, nullable=True)
+    internal_notes = Column(Text, nullable=True)
+
+
+class AnonymousFeedbackDailyRollup(Base):
+    """
+    Per-day feedback counts for an organization, keyed by submission day,
+    category, severity and current status. Maintained incrementally by
+    AnonymousFeedbackService on submit and status update so dashboards read
+    O(days) rows instead of the full feedback history.
+    """
+    __tablename__ = "anonymous_feedback_daily_rollup"
+
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
+    day = Column(Date, nullable=False)
+    category = Column(String(100), nullable=False)
+    severity = Column(String(20), nullable=False)
+    status = Column(String(50), nullable=False)
+    feedback_count = Column(Integer, nullable=False, server_default=text('0'))
+    resolved_count = Column(Integer, nullable=False, server_default=text('0'))
+    resolution_days_total = Column(Integer, nullable=False, server_default=text('0'))
+    updated_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        PrimaryKeyConstraint('organization_id', 'day', 'category', 'severity', 'status'),
+        Index('idx_feedback_rollup_org_day', 'organization_id', 'day'),
+    )
@@ -98,6 +98,8 @@ class AssessmentResponse(Base):
     respondent_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     status = Column(SQLEnum(ResponseStatus), default=ResponseStatus.IN_PROGRESS)
     responses = Column(JSON, nullable=True)
+    score_data = Column(JSON, nullable=True)
+    scored_at = Column(DateTime, nullable=True)
     started_at = Column(DateTime, server_default=func.now())
     completed_at = Column(DateTime, nullable=True)
     
@@ -0,0 +1,36 @@
+# app/db/models/communication_rollup.py
+from sqlalchemy import Column, String, Integer, Float, Date, DateTime, PrimaryKeyConstraint
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
+from sqlalchemy.sql import text
+from app.core.database import Base
+
+
+class CommunicationDailyRollup(Base):
+    """
+    Per-day communication analysis aggregates for a user, team or organization.
+
+    Every column is an additive accumulator (counts, sums, sums of squares,
+    histogram buckets), so CommunicationRollupService can fold new analyses
+    in with a single upsert and culture-health reads merge O(days) rows
+    instead of scanning every analysed email.
+    """
+    __tablename__ = "communication_daily_rollup"
+
+    scope_type = Column(String(20), nullable=False)  # 'user', 'team', 'organization'
+    scope_id = Column(UUID(as_uuid=True), nullable=False)
+    day = Column(Date, nullable=False)
+    message_count = Column(Integer, nullable=False, server_default=text('0'))
+    sentiment_count = Column(Integer, nullable=False, server_default=text('0'))
+    sentiment_sum = Column(Float, nullable=False, server_default=text('0'))
+    sentiment_sum_sq = Column(Float, nullable=False, server_default=text('0'))
+    conflict_sum = Column(Float, nullable=False, server_default=text('0'))
+    high_conflict_count = Column(Integer, nullable=False, server_default=text('0'))
+    emotion_counts = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    response_time_count = Column(Integer, nullable=False, server_default=text('0'))
+    response_time_sum = Column(Float, nullable=False, server_default=text('0'))
+    response_time_buckets = Column(ARRAY(Integer), nullable=False, server_default=text("'{}'"))
+    updated_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        PrimaryKeyConstraint('scope_type', 'scope_id', 'day'),
+    )
@@ -19,7 +19,9 @@ class Organization(Base):
     updated_at = Column(TIMESTAMP(timezone=True), server_default=text('NOW()'), nullable=False)
     
     # Relationships
-    users = relationship("User", back_populates="organization", foreign_keys="[User.organization_id]")
+    # Read-only: users.organization_id has no FK constraint and User has no
+    # organization attribute to back-populate
+    users = relationship("User", primaryjoin="Organization.id == foreign(User.organization_id)", viewonly=True)
     # teams = relationship("Team", back_populates="organization", foreign_keys="[Team.organization_id]")
 
     # Email Analysis Relationships - Temporarily disabled
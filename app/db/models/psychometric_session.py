@@ -0,0 +1,49 @@
+# app/db/models/psychometric_session.py
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class PsychometricSession(Base):
+    """
+    NLP analysis of one therapy session, written by analyze_session_async
+
+    Progress reports and anomaly detection read a client's sessions back
+    by session_date.
+    """
+    __tablename__ = "psychometric_sessions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    client_id = Column(String(255), nullable=False)
+    session_date = Column(DateTime, nullable=False)
+    session_type = Column(String(50), nullable=False, default="therapy")
+    sentiment_analysis = Column(JSON, nullable=False, default=dict)
+    emotion_analysis = Column(JSON, nullable=False, default=dict)
+    psycholinguistic_markers = Column(JSON, nullable=True)
+    linguistic_features = Column(JSON, nullable=True)
+    key_insights = Column(JSON, nullable=True)
+    red_flags = Column(JSON, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+
+    __table_args__ = (
+        Index("idx_psychometric_sessions_client_date", "client_id", "session_date"),
+        Index("idx_psychometric_sessions_session_date", "session_date"),
+    )
+
+
+class ProgressReport(Base):
+    """Client progress over a date range, written by generate_progress_report_async"""
+    __tablename__ = "progress_reports"
+
+    id = Column(Integer, primary_key=True, index=True)
+    client_id = Column(String(255), nullable=False, index=True)
+    start_date = Column(DateTime, nullable=False)
+    end_date = Column(DateTime, nullable=False)
+    trend_analysis = Column(JSON, nullable=True)
+    cyclical_patterns = Column(JSON, nullable=True)
+    emotional_state = Column(JSON, nullable=True)
+    anomalies = Column(JSON, nullable=True)
+    progress_level = Column(String(50), nullable=True)
+    recommendations = Column(JSON, nullable=True)
+    session_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, server_default=func.now())
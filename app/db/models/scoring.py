@@ -0,0 +1,30 @@
+# app/db/models/scoring.py
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
+from sqlalchemy.sql import func
+from app.core.database import Base
+import enum
+
+
+class ScoringAlgorithm(str, enum.Enum):
+    MBTI = "mbti"
+    BIG_FIVE = "big_five"
+    DISC = "disc"
+    GENERIC = "generic"
+
+
+class AssessmentScoringConfig(Base):
+    """
+    Scoring algorithm and its item mapping for one assessment
+
+    ``config`` holds the algorithm's mapping, e.g. ``factors`` and
+    ``reverse_scored`` for Big Five or ``dimensions`` for MBTI and DISC,
+    each keyed by question ID.
+    """
+    __tablename__ = "assessment_scoring_configs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    assessment_id = Column(Integer, ForeignKey("assessments.id", ondelete="CASCADE"), nullable=False, unique=True)
+    algorithm = Column(String(50), nullable=False, default=ScoringAlgorithm.GENERIC.value)
+    config = Column(JSON, nullable=False, default=dict)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -85,16 +85,15 @@ class TeamMember(Base):
         Index('idx_team_members_lookup', 'team_id', 'user_id', 'role'),
     )
     
-    # Relationships
+    # Relationships - one-way while Team.members and User.team_memberships
+    # are disabled (a dangling back_populates stops every mapper configuring)
     team = relationship(
         "Team", 
-        back_populates="members",
         foreign_keys=[team_id]
     )
     
     user = relationship(
         "User", 
-        back_populates="team_memberships",
         foreign_keys=[user_id]
     )
     
@@ -9,9 +9,11 @@ Requirements:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, asdict, fields
 from datetime import datetime, date
+from functools import lru_cache
+from operator import attrgetter
 import pandas as pd
 import requests
 from requests.auth import HTTPBasicAuth
@@ -23,7 +25,7 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Employee:
     """Standardized employee data structure."""
     employee_id: str
@@ -46,7 +48,7 @@ class Employee:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class AttendanceRecord:
     """Standardized attendance record."""
     record_id: str
@@ -68,7 +70,7 @@ class AttendanceRecord:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class LeaveRecord:
     """Standardized leave record."""
     leave_id: str
@@ -89,7 +91,7 @@ class LeaveRecord:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceReview:
     """Standardized performance review."""
     review_id: str
@@ -107,6 +109,36 @@ class PerformanceReview:
         return data
 
 
+EXPORT_FORMATS = ('csv', 'parquet', 'arrow')
+
+
+@lru_cache(maxsize=None)
+def _record_fields(record_type: type) -> Tuple[str, ...]:
+    """Field names of a record dataclass, cached per type."""
+    return tuple(f.name for f in fields(record_type))
+
+
+def records_to_columns(data: List[Any]) -> Dict[str, List]:
+    """
+    Build per-field column lists straight from record objects.
+    Avoids creating an intermediate dict per record; dates are kept as
+    native objects so DataFrame/Arrow builders can infer typed columns.
+    
+    Args:
+        data: List of records of one type (Employee, AttendanceRecord, etc.)
+        
+    Returns:
+        Dictionary mapping field name to column values
+    """
+    if not data:
+        return {}
+    
+    return {
+        name: list(map(attrgetter(name), data))
+        for name in _record_fields(type(data[0]))
+    }
+
+
 class HRISConnector(ABC):
     """
     Abstract base class for HRIS connectors.
@@ -273,7 +305,13 @@ class HRISConnector(ABC):
             logger.warning("No data to export")
             return ""
         
-        df = pd.DataFrame([item.to_dict() for item in data])
+        # Dates are written with isoformat(), as to_dict() does, so
+        # microseconds and UTC offsets are kept
+        columns = {
+            name: [value.isoformat() if isinstance(value, date) else value for value in values]
+            for name, values in records_to_columns(data).items()
+        }
+        df = pd.DataFrame(columns)
         
         # Generate full path
         filepath = os.path.join(output_dir, filename)
@@ -284,6 +322,124 @@ class HRISConnector(ABC):
         
         return filepath
     
+    def export_to_arrow_table(self, data: List[Any]):
+        """
+        Convert data to a pyarrow Table without going through pandas.
+        
+        Args:
+            data: List of data objects
+            
+        Returns:
+            pyarrow.Table
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow is required for Parquet/Arrow export: pip install pyarrow")
+        
+        return pa.table(records_to_columns(data))
+    
+    def export_to_parquet(
+        self,
+        data: List[Any],
+        filename: str,
+        output_dir: str = "./exports",
+        row_group_size: int = 1_000_000
+    ) -> str:
+        """
+        Export data to a Parquet file.
+        
+        Args:
+            data: List of data objects
+            filename: Output filename
+            output_dir: Output directory
+            row_group_size: Rows per Parquet row group
+            
+        Returns:
+            Path to exported file
+        """
+        import os
+        import pyarrow.parquet as pq
+        
+        if not data:
+            logger.warning("No data to export")
+            return ""
+        
+        os.makedirs(output_dir, exist_ok=True)
+        filepath = os.path.join(output_dir, filename)
+        
+        pq.write_table(
+            self.export_to_arrow_table(data),
+            filepath,
+            row_group_size=row_group_size,
+            compression='snappy'
+        )
+        logger.info(f"Exported {len(data)} records to {filepath}")
+        
+        return filepath
+    
+    def export_to_arrow(
+        self,
+        data: List[Any],
+        filename: str,
+        output_dir: str = "./exports"
+    ) -> str:
+        """
+        Export data to an Arrow IPC (Feather v2) file.
+        
+        Args:
+            data: List of data objects
+            filename: Output filename
+            output_dir: Output directory
+            
+        Returns:
+            Path to exported file
+        """
+        import os
+        import pyarrow.feather as feather
+        
+        if not data:
+            logger.warning("No data to export")
+            return ""
+        
+        os.makedirs(output_dir, exist_ok=True)
+        filepath = os.path.join(output_dir, filename)
+        
+        feather.write_feather(self.export_to_arrow_table(data), filepath, compression='lz4')
+        logger.info(f"Exported {len(data)} records to {filepath}")
+        
+        return filepath
+    
+    def export_to_file(
+        self,
+        data: List[Any],
+        filename: str,
+        output_dir: str = "./exports",
+        format: str = "csv"
+    ) -> str:
+        """
+        Export data in the given format.
+        
+        Args:
+            data: List of data objects
+            filename: Output filename
+            output_dir: Output directory
+            format: One of 'csv', 'parquet', 'arrow'
+            
+        Returns:
+            Path to exported file
+        """
+        exporters = {
+            'csv': self.export_to_csv,
+            'parquet': self.export_to_parquet,
+            'arrow': self.export_to_arrow,
+        }
+        
+        if format not in exporters:
+            raise ValueError(f"Unsupported export format: {format}")
+        
+        return exporters[format](data, filename, output_dir)
+    
     def export_to_dataframe(self, data: List[Any]) -> pd.DataFrame:
         """
         Convert data to pandas DataFrame.
@@ -297,7 +453,7 @@ class HRISConnector(ABC):
         if not data:
             return pd.DataFrame()
         
-        return pd.DataFrame([item.to_dict() for item in data])
+        return pd.DataFrame(records_to_columns(data))
     
     def _make_request(
         self,
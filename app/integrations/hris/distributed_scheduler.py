@@ -0,0 +1,657 @@
+"""
+Distributed Sync Scheduler for PsychSync
+Database-backed replacement for the in-process SyncScheduler loop.
+
+Jobs are stored centrally with cron expressions. Each replica polls for due
+jobs and claims them with a lease before running, so a job runs on exactly
+one replica per occurrence. Start times are spread with a stable per-job
+jitter and every run is recorded with its duration.
+
+Cron expressions are evaluated in the scheduler's timezone (the server's
+local time unless one is configured, matching the in-process scheduler);
+all stored times are naive UTC. The tables are created by Alembic revision
+009_hris_sync_jobs.
+
+File: app/integrations/hris/distributed_scheduler.py
+"""
+
+import hashlib
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional, Callable, Set
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import (
+    create_engine, MetaData, Table, Column, String, Integer, Float, Boolean,
+    DateTime, Text, JSON, Index, select, update, insert, delete, and_, or_
+)
+
+from .webhook_scheduler import SyncJob
+
+logger = logging.getLogger(__name__)
+
+
+metadata = MetaData()
+
+sync_jobs_table = Table(
+    'hris_sync_jobs', metadata,
+    Column('job_id', String(255), primary_key=True),
+    Column('hris_type', String(100), nullable=False),
+    Column('cron_expression', String(100), nullable=False),
+    Column('sync_types', JSON, nullable=False),
+    Column('enabled', Boolean, nullable=False, default=True),
+    Column('jitter_seconds', Integer, nullable=False, default=0),
+    Column('next_run_at', DateTime, nullable=True),
+    Column('last_run_at', DateTime, nullable=True),
+    Column('last_status', String(20), nullable=True),
+    Column('last_duration_seconds', Float, nullable=True),
+    Column('lease_owner', String(255), nullable=True),
+    Column('lease_expires_at', DateTime, nullable=True),
+    Column('updated_at', DateTime, nullable=True),
+    Index('ix_hris_sync_jobs_next_run_at', 'next_run_at'),
+)
+
+sync_job_runs_table = Table(
+    'hris_sync_job_runs', metadata,
+    Column('id', Integer, primary_key=True, autoincrement=True),
+    Column('job_id', String(255), nullable=False),
+    Column('worker_id', String(255), nullable=False),
+    Column('scheduled_for', DateTime, nullable=True),
+    Column('started_at', DateTime, nullable=False),
+    Column('finished_at', DateTime, nullable=True),
+    Column('duration_seconds', Float, nullable=True),
+    Column('status', String(20), nullable=False),
+    Column('error', Text, nullable=True),
+    Index('ix_hris_sync_job_runs_job_started', 'job_id', 'started_at'),
+)
+
+
+class CronExpression:
+    """
+    Minimal five-field cron expression (minute hour day month weekday).
+    Supports ``*``, lists, ranges and steps. Weekday 0 and 7 are Sunday.
+    """
+
+    FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+    def __init__(self, expression: str):
+        """
+        Parse a cron expression.
+
+        Args:
+            expression: Cron expression, e.g. "0 2 * * *"
+        """
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: {expression!r}")
+
+        self.expression = expression
+        fields = [self._parse_field(part, low, high) for part, (low, high) in zip(parts, self.FIELD_RANGES)]
+        self.minutes, self.hours, self.days, self.months, weekdays = fields
+        self.weekdays = {0 if d == 7 else d for d in weekdays}
+        self.day_restricted = parts[2] != '*'
+        self.weekday_restricted = parts[4] != '*'
+
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int) -> Set[int]:
+        """Parse one cron field into the set of matching values."""
+        values = set()
+
+        for item in field.split(','):
+            step = 1
+            if '/' in item:
+                item, step_str = item.split('/', 1)
+                step = int(step_str)
+                if step < 1:
+                    raise ValueError(f"Invalid cron step: {field!r}")
+
+            if item == '*':
+                start, end = low, high
+            elif '-' in item:
+                start_str, end_str = item.split('-', 1)
+                start, end = int(start_str), int(end_str)
+            else:
+                start = int(item)
+                end = high if step > 1 else start
+
+            if start < low or end > high or start > end:
+                raise ValueError(f"Cron field out of range: {field!r}")
+
+            values.update(range(start, end + 1, step))
+
+        return values
+
+    def _day_matches(self, dt: datetime) -> bool:
+        """Apply cron day-of-month / day-of-week semantics."""
+        day_ok = dt.day in self.days
+        weekday_ok = (dt.weekday() + 1) % 7 in self.weekdays
+
+        if self.day_restricted and self.weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, after: datetime) -> datetime:
+        """
+        Get the first matching time strictly after ``after``.
+
+        Args:
+            after: Reference time
+
+        Returns:
+            Next matching datetime (second and microsecond zeroed)
+        """
+        dt = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = dt + timedelta(days=366 * 5)
+
+        while dt < limit:
+            if dt.month not in self.months:
+                year, month = (dt.year + 1, 1) if dt.month == 12 else (dt.year, dt.month + 1)
+                dt = dt.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+
+            if not self._day_matches(dt):
+                dt = (dt + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+
+            if dt.hour not in self.hours:
+                dt = (dt + timedelta(hours=1)).replace(minute=0)
+                continue
+
+            if dt.minute not in self.minutes:
+                dt += timedelta(minutes=1)
+                continue
+
+            return dt
+
+        raise ValueError(f"Cron expression never matches: {self.expression!r}")
+
+
+def _interval_cron(minutes: int) -> str:
+    """
+    Cron expression for a fixed interval in minutes.
+    Cron steps restart at every hour (and day), so only intervals that
+    divide an hour or a day evenly can be expressed.
+    """
+    if minutes < 1:
+        raise ValueError(f"Invalid schedule interval: {minutes} minutes")
+    if minutes < 60 and 60 % minutes == 0:
+        return "* * * * *" if minutes == 1 else f"*/{minutes} * * * *"
+    hours, remainder = divmod(minutes, 60)
+    if remainder == 0 and 24 % hours == 0:
+        return "0 * * * *" if hours == 1 else f"0 */{hours} * * *"
+    raise ValueError(
+        f"An interval of {minutes} minutes cannot be expressed in cron; "
+        f"use an interval that divides an hour or a day, or a cron expression"
+    )
+
+
+def to_cron_expression(schedule_expression: str) -> str:
+    """
+    Convert a SyncScheduler English schedule string to a cron expression.
+    Strings that are already cron expressions are returned unchanged.
+    Intervals that do not divide an hour or a day raise ValueError.
+
+    Args:
+        schedule_expression: e.g. "every day at 02:00", "every 15 minutes"
+
+    Returns:
+        Cron expression
+    """
+    parts = schedule_expression.lower().split()
+
+    if len(parts) == 5 and parts[0] != 'every':
+        CronExpression(schedule_expression)
+        return schedule_expression
+
+    if "every" in parts:
+        if "day" in parts:
+            if "at" in parts:
+                time_idx = parts.index("at") + 1
+                if time_idx < len(parts):
+                    hour, minute = parts[time_idx].split(':')[:2]
+                    return f"{int(minute)} {int(hour)} * * *"
+            return "0 0 * * *"
+
+        count = next((int(part) for part in parts if part.isdigit()), 1)
+
+        if "hour" in parts or "hours" in parts:
+            return _interval_cron(count * 60)
+
+        if "minute" in parts or "minutes" in parts:
+            return _interval_cron(count)
+
+    raise ValueError(f"Unsupported schedule expression: {schedule_expression!r}")
+
+
+# Consecutive cron occurrences sampled to find a job's shortest interval
+JITTER_INTERVAL_SAMPLES = 8
+
+
+def stable_jitter(job_id: str, max_jitter_seconds: int) -> int:
+    """
+    Deterministic per-job offset in ``[0, max_jitter_seconds]``.
+    The same job always lands on the same offset, so tenants sharing a cron
+    expression are spread across the window instead of starting together.
+    """
+    if max_jitter_seconds <= 0:
+        return 0
+    digest = hashlib.sha256(job_id.encode()).hexdigest()
+    return int(digest[:12], 16) % (max_jitter_seconds + 1)
+
+
+class DistributedSyncScheduler:
+    """
+    Database-backed scheduled synchronization manager.
+    Drop-in replacement for SyncScheduler that is safe to run on every
+    replica: jobs live in the database and each occurrence is claimed by a
+    single replica through a lease.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        worker_id: Optional[str] = None,
+        poll_interval: int = 30,
+        lease_seconds: int = 300,
+        max_jitter_seconds: int = 900,
+        history_retention_days: int = 30,
+        schedule_timezone: Optional[str] = None
+    ):
+        """
+        Initialize distributed scheduler.
+
+        Args:
+            database_url: SQLAlchemy URL of the shared database
+            worker_id: Identifier of this replica (defaults to host:pid:random)
+            poll_interval: Seconds between polls for due jobs
+            lease_seconds: Lease length; renewed while a job is running
+            max_jitter_seconds: Upper bound of the per-job start offset;
+                also capped at half of each job's cron interval
+            history_retention_days: Run history older than this is pruned
+            schedule_timezone: IANA timezone cron expressions are evaluated
+                in (defaults to the server's local time)
+        """
+        self.engine = create_engine(database_url, pool_pre_ping=True)
+        self.timezone = ZoneInfo(schedule_timezone) if schedule_timezone else None
+
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_jitter_seconds = max_jitter_seconds
+        self.history_retention_days = history_retention_days
+
+        self.running = False
+        self.thread = None
+        self._stop_event = threading.Event()
+        self.sync_callbacks: Dict[str, Callable] = {}
+
+    def _next_run(self, cron_expression: str, jitter_seconds: int, after: datetime) -> datetime:
+        """
+        Next cron occurrence after ``after`` plus the job's jitter.
+        ``after`` and the result are naive UTC; the cron expression is
+        matched against wall-clock time in the scheduler's timezone.
+        """
+        local_after = after.replace(tzinfo=timezone.utc).astimezone(self.timezone)
+        local_next = CronExpression(cron_expression).next_after(local_after.replace(tzinfo=None))
+        if self.timezone is not None:
+            local_next = local_next.replace(tzinfo=self.timezone)
+        next_run = local_next.astimezone(timezone.utc).replace(tzinfo=None)
+        return next_run + timedelta(seconds=jitter_seconds)
+
+    def _job_jitter(self, job_id: str, cron_expression: str) -> int:
+        """
+        Stable jitter for a job, capped at half its shortest cron interval so
+        a jittered run always starts well before the job's next occurrence.
+        """
+        cron = CronExpression(cron_expression)
+        occurrence = cron.next_after(datetime.utcnow())
+        shortest = None
+        for _ in range(JITTER_INTERVAL_SAMPLES):
+            following = cron.next_after(occurrence)
+            gap = int((following - occurrence).total_seconds())
+            shortest = gap if shortest is None else min(shortest, gap)
+            occurrence = following
+        return stable_jitter(job_id, min(self.max_jitter_seconds, shortest // 2))
+
+    def add_job(
+        self,
+        job_id: str,
+        hris_type: str,
+        schedule_expression: str,
+        sync_types: List[str],
+        callback: Callable
+    ):
+        """
+        Add or update a scheduled sync job.
+        Every replica should register the same jobs; the row is upserted and
+        the callback is kept locally.
+
+        Args:
+            job_id: Unique job identifier
+            hris_type: HRIS system type
+            schedule_expression: Cron expression or English schedule string
+            sync_types: Types of data to sync
+            callback: Function to call for sync
+        """
+        cron_expression = to_cron_expression(schedule_expression)
+        jitter_seconds = self._job_jitter(job_id, cron_expression)
+        now = datetime.utcnow()
+
+        with self.engine.begin() as conn:
+            existing = conn.execute(
+                select(sync_jobs_table.c.cron_expression, sync_jobs_table.c.jitter_seconds)
+                .where(sync_jobs_table.c.job_id == job_id)
+            ).first()
+
+            values = {
+                'hris_type': hris_type,
+                'cron_expression': cron_expression,
+                'sync_types': sync_types,
+                'jitter_seconds': jitter_seconds,
+                'updated_at': now,
+            }
+
+            if existing is None:
+                conn.execute(insert(sync_jobs_table).values(
+                    job_id=job_id,
+                    enabled=True,
+                    next_run_at=self._next_run(cron_expression, jitter_seconds, now),
+                    **values
+                ))
+            else:
+                if tuple(existing) != (cron_expression, jitter_seconds):
+                    values['next_run_at'] = self._next_run(cron_expression, jitter_seconds, now)
+                conn.execute(
+                    update(sync_jobs_table)
+                    .where(sync_jobs_table.c.job_id == job_id)
+                    .values(**values)
+                )
+
+        self.sync_callbacks[job_id] = callback
+
+        logger.info(f"Added sync job: {job_id} - {cron_expression} (+{jitter_seconds}s jitter)")
+
+    def remove_job(self, job_id: str):
+        """Remove a scheduled job."""
+        with self.engine.begin() as conn:
+            conn.execute(delete(sync_jobs_table).where(sync_jobs_table.c.job_id == job_id))
+        self.sync_callbacks.pop(job_id, None)
+        logger.info(f"Removed sync job: {job_id}")
+
+    def _set_enabled(self, job_id: str, enabled: bool):
+        with self.engine.begin() as conn:
+            conn.execute(
+                update(sync_jobs_table)
+                .where(sync_jobs_table.c.job_id == job_id)
+                .values(enabled=enabled, updated_at=datetime.utcnow())
+            )
+
+    def enable_job(self, job_id: str):
+        """Enable a job."""
+        self._set_enabled(job_id, True)
+        logger.info(f"Enabled sync job: {job_id}")
+
+    def disable_job(self, job_id: str):
+        """Disable a job."""
+        self._set_enabled(job_id, False)
+        logger.info(f"Disabled sync job: {job_id}")
+
+    def _claim(self, job_id: str, cron_expression: str, jitter_seconds: int,
+               scheduled_for: datetime, now: datetime) -> bool:
+        """
+        Atomically claim a due job.
+        The conditional UPDATE only matches while the job is due and no live
+        lease exists, so exactly one replica wins; the winner also advances
+        ``next_run_at`` so the occurrence is not picked up again.
+
+        The next run is the occurrence after this cron slot (``scheduled_for``
+        minus the jitter), not after ``now``: ``now`` already includes the
+        jitter and poll delay, and counting from it would skip occurrences
+        inside that window. Occurrences missed entirely while no replica was
+        polling are coalesced into one run rather than replayed.
+        """
+        jobs = sync_jobs_table.c
+        after = max(scheduled_for, now) - timedelta(seconds=jitter_seconds)
+
+        with self.engine.begin() as conn:
+            result = conn.execute(
+                update(sync_jobs_table)
+                .where(and_(
+                    jobs.job_id == job_id,
+                    jobs.enabled.is_(True),
+                    jobs.next_run_at == scheduled_for,
+                    or_(jobs.lease_expires_at.is_(None), jobs.lease_expires_at < now)
+                ))
+                .values(
+                    lease_owner=self.worker_id,
+                    lease_expires_at=now + timedelta(seconds=self.lease_seconds),
+                    next_run_at=self._next_run(cron_expression, jitter_seconds, after),
+                    last_run_at=now,
+                    updated_at=now
+                )
+            )
+
+        return result.rowcount == 1
+
+    def _renew_lease(self, job_id: str, done: threading.Event):
+        """Extend the lease periodically until the job finishes."""
+        while not done.wait(self.lease_seconds / 3):
+            try:
+                with self.engine.begin() as conn:
+                    conn.execute(
+                        update(sync_jobs_table)
+                        .where(and_(
+                            sync_jobs_table.c.job_id == job_id,
+                            sync_jobs_table.c.lease_owner == self.worker_id
+                        ))
+                        .values(lease_expires_at=datetime.utcnow() + timedelta(seconds=self.lease_seconds))
+                    )
+            except Exception as e:
+                logger.error(f"Lease renewal failed for {job_id}: {e}")
+
+    def _run_job(self, row, scheduled_for: datetime):
+        """Run a claimed job, record its history and release the lease."""
+        job = SyncJob(
+            job_id=row.job_id,
+            hris_type=row.hris_type,
+            schedule_expression=row.cron_expression,
+            sync_types=list(row.sync_types or []),
+            enabled=row.enabled,
+            last_run=datetime.utcnow()
+        )
+
+        logger.info(f"Running sync job: {job.job_id} on {self.worker_id}")
+
+        done = threading.Event()
+        renewer = threading.Thread(target=self._renew_lease, args=(job.job_id, done), daemon=True)
+        renewer.start()
+
+        started_at = datetime.utcnow()
+        start = time.perf_counter()
+        status, error = "success", None
+
+        try:
+            self.sync_callbacks[job.job_id](job)
+            logger.info(f"Sync job completed: {job.job_id}")
+        except Exception as e:
+            status, error = "failed", str(e)
+            logger.error(f"Sync job failed: {job.job_id} - {e}")
+        finally:
+            done.set()
+            renewer.join(timeout=5)
+
+        duration = time.perf_counter() - start
+        finished_at = datetime.utcnow()
+
+        with self.engine.begin() as conn:
+            conn.execute(insert(sync_job_runs_table).values(
+                job_id=job.job_id,
+                worker_id=self.worker_id,
+                scheduled_for=scheduled_for,
+                started_at=started_at,
+                finished_at=finished_at,
+                duration_seconds=duration,
+                status=status,
+                error=error
+            ))
+            conn.execute(
+                update(sync_jobs_table)
+                .where(and_(
+                    sync_jobs_table.c.job_id == job.job_id,
+                    sync_jobs_table.c.lease_owner == self.worker_id
+                ))
+                .values(
+                    last_status=status,
+                    last_duration_seconds=duration,
+                    lease_owner=None,
+                    lease_expires_at=None,
+                    updated_at=finished_at
+                )
+            )
+
+    def run_pending(self) -> int:
+        """
+        Claim and run every due job that has a local callback.
+
+        Returns:
+            Number of jobs run by this replica
+        """
+        if not self.sync_callbacks:
+            return 0
+
+        now = datetime.utcnow()
+        jobs = sync_jobs_table.c
+
+        with self.engine.connect() as conn:
+            due = conn.execute(
+                select(sync_jobs_table)
+                .where(and_(
+                    jobs.enabled.is_(True),
+                    jobs.next_run_at <= now,
+                    jobs.job_id.in_(list(self.sync_callbacks))
+                ))
+                .order_by(jobs.next_run_at)
+            ).fetchall()
+
+        ran = 0
+        for row in due:
+            if self._claim(row.job_id, row.cron_expression, row.jitter_seconds, row.next_run_at, now):
+                self._run_job(row, row.next_run_at)
+                ran += 1
+
+        return ran
+
+    def prune_history(self) -> int:
+        """Delete run history older than the retention window."""
+        cutoff = datetime.utcnow() - timedelta(days=self.history_retention_days)
+        with self.engine.begin() as conn:
+            result = conn.execute(
+                delete(sync_job_runs_table).where(sync_job_runs_table.c.started_at < cutoff)
+            )
+        return result.rowcount
+
+    def start(self):
+        """Start polling for due jobs."""
+        if self.running:
+            logger.warning("Scheduler already running")
+            return
+
+        self.running = True
+        self._stop_event.clear()
+
+        def run_scheduler():
+            logger.info(f"Distributed sync scheduler started ({self.worker_id})")
+            last_prune = 0.0
+            while not self._stop_event.is_set():
+                try:
+                    self.run_pending()
+                    if time.monotonic() - last_prune > 3600:
+                        self.prune_history()
+                        last_prune = time.monotonic()
+                except Exception as e:
+                    logger.error(f"Scheduler poll failed: {e}")
+                self._stop_event.wait(self.poll_interval)
+
+        self.thread = threading.Thread(target=run_scheduler, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stop the scheduler."""
+        self.running = False
+        self._stop_event.set()
+        if self.thread:
+            self.thread.join(timeout=5)
+        logger.info("Distributed sync scheduler stopped")
+
+    def _row_to_job(self, row) -> SyncJob:
+        return SyncJob(
+            job_id=row.job_id,
+            hris_type=row.hris_type,
+            schedule_expression=row.cron_expression,
+            sync_types=list(row.sync_types or []),
+            enabled=row.enabled,
+            last_run=row.last_run_at,
+            next_run=row.next_run_at,
+            last_status=row.last_status
+        )
+
+    def get_jobs(self) -> List[SyncJob]:
+        """Get all scheduled jobs."""
+        with self.engine.connect() as conn:
+            rows = conn.execute(select(sync_jobs_table).order_by(sync_jobs_table.c.job_id)).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def get_job_status(self, job_id: str) -> Optional[Dict]:
+        """Get job status including lease and last run duration."""
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                select(sync_jobs_table).where(sync_jobs_table.c.job_id == job_id)
+            ).first()
+
+        if not row:
+            return None
+
+        status = self._row_to_job(row).to_dict()
+        status['cron_expression'] = row.cron_expression
+        status['jitter_seconds'] = row.jitter_seconds
+        status['last_duration_seconds'] = row.last_duration_seconds
+        status['lease_owner'] = row.lease_owner
+        return status
+
+    def get_run_history(self, job_id: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        """
+        Get recent runs, newest first.
+
+        Args:
+            job_id: Restrict to one job
+            limit: Maximum number of runs to return
+
+        Returns:
+            List of run records
+        """
+        runs = sync_job_runs_table.c
+        query = select(sync_job_runs_table).order_by(runs.started_at.desc()).limit(limit)
+        if job_id:
+            query = query.where(runs.job_id == job_id)
+
+        with self.engine.connect() as conn:
+            rows = conn.execute(query).fetchall()
+
+        return [
+            {
+                'job_id': row.job_id,
+                'worker_id': row.worker_id,
+                'scheduled_for': row.scheduled_for.isoformat() if row.scheduled_for else None,
+                'started_at': row.started_at.isoformat(),
+                'finished_at': row.finished_at.isoformat() if row.finished_at else None,
+                'duration_seconds': row.duration_seconds,
+                'status': row.status,
+                'error': row.error,
+            }
+            for row in rows
+        ]
@@ -14,7 +14,7 @@ from typing import Dict, Optional, Type
 from datetime import date, timedelta
 import logging
 
-from .base_connector import HRISConnector, CSVConnector
+from .base_connector import HRISConnector, CSVConnector, EXPORT_FORMATS
 from .orangehrm_connector import OrangeHRMConnector
 from .sentrifugo_connector import SentrifugoConnector
 from .icehrm_connector import IceHRMConnector
@@ -221,19 +221,24 @@ class HRISIntegrationManager:
         self,
         connector: HRISConnector,
         output_dir: str = "./exports",
-        days_back: int = 30
+        days_back: int = 30,
+        format: str = "csv"
     ) -> Dict[str, str]:
         """
-        Export all HRIS data to CSV files.
+        Export all HRIS data to files.
         
         Args:
             connector: HRIS connector instance
             output_dir: Directory for exports
             days_back: Number of days for attendance/leaves
+            format: Output format - 'csv', 'parquet' or 'arrow'
             
         Returns:
             Dictionary mapping data type to file path
         """
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {format}")
+        
         end_date = date.today()
         start_date = end_date - timedelta(days=days_back)
         
@@ -243,30 +248,33 @@ class HRISIntegrationManager:
             # Export employees
             employees = connector.get_employees()
             if employees:
-                path = connector.export_to_csv(
+                path = connector.export_to_file(
                     employees,
-                    f'employees_{date.today()}.csv',
-                    output_dir
+                    f'employees_{date.today()}.{format}',
+                    output_dir,
+                    format=format
                 )
                 exports['employees'] = path
             
             # Export attendance
             attendance = connector.get_attendance(start_date, end_date)
             if attendance:
-                path = connector.export_to_csv(
+                path = connector.export_to_file(
                     attendance,
-                    f'attendance_{start_date}_to_{end_date}.csv',
-                    output_dir
+                    f'attendance_{start_date}_to_{end_date}.{format}',
+                    output_dir,
+                    format=format
                 )
                 exports['attendance'] = path
             
             # Export leaves
             leaves = connector.get_leave_records(start_date, end_date)
             if leaves:
-                path = connector.export_to_csv(
+                path = connector.export_to_file(
                     leaves,
-                    f'leaves_{start_date}_to_{end_date}.csv',
-                    output_dir
+                    f'leaves_{start_date}_to_{end_date}.{format}',
+                    output_dir,
+                    format=format
                 )
                 exports['leaves'] = path
             
@@ -276,10 +284,11 @@ class HRISIntegrationManager:
                 end_date=end_date
             )
             if reviews:
-                path = connector.export_to_csv(
+                path = connector.export_to_file(
                     reviews,
-                    f'reviews_{start_date}_to_{end_date}.csv',
-                    output_dir
+                    f'reviews_{start_date}_to_{end_date}.{format}',
+                    output_dir,
+                    format=format
                 )
                 exports['reviews'] = path
             
@@ -14,6 +14,7 @@ from dataclasses import dataclass, field
 from .integration_manager import HRISIntegrationManager
 from .export_manager import ExportManager
 from .webhook_scheduler import WebhookReceiver, WebhookSender, SyncScheduler, WebhookEvent
+from .distributed_scheduler import DistributedSyncScheduler
 from .extended_models import EmployeeExtended, AttendanceRecordExtended, LeaveRecordExtended
 
 logger = logging.getLogger(__name__)
@@ -41,6 +42,9 @@ class IntegrationConfig:
     # Scheduling Settings
     enable_scheduling: bool = True
     sync_schedule: str = "every day at 02:00"
+    scheduler_backend: str = "local"  # local, database
+    scheduler_max_jitter_seconds: int = 900
+    scheduler_timezone: Optional[str] = None  # IANA name; None uses server local time
     sync_types: List[str] = field(default_factory=lambda: ['employees', 'attendance', 'leaves'])
     
     # Database Settings
@@ -154,7 +158,16 @@ class PsychSyncIntegration:
     
     def _setup_scheduler(self):
         """Setup sync scheduler."""
-        self.scheduler = SyncScheduler()
+        if self.config.scheduler_backend == 'database':
+            if not self.config.database_url:
+                raise ValueError("scheduler_backend='database' requires database_url")
+            self.scheduler = DistributedSyncScheduler(
+                database_url=self.config.database_url,
+                max_jitter_seconds=self.config.scheduler_max_jitter_seconds,
+                schedule_timezone=self.config.scheduler_timezone
+            )
+        else:
+            self.scheduler = SyncScheduler()
         
         # Add main sync job
         self.scheduler.add_job(
@@ -200,7 +213,7 @@ class PsychSyncIntegration:
             if employee:
                 # Send notification to outbound webhooks
                 if self.webhook_sender:
-                    self.webhook_sender.send_webhook(
+                    self.webhook_sender.enqueue_webhook(
                         event_type='employee.created',
                         data=employee.to_dict(),
                         source='psychsync'
@@ -219,7 +232,7 @@ class PsychSyncIntegration:
         
         # Send notification
         if self.webhook_sender:
-            self.webhook_sender.send_webhook(
+            self.webhook_sender.enqueue_webhook(
                 event_type='leave.requested',
                 data=event.data,
                 source='psychsync'
@@ -5,19 +5,24 @@ Real-time event processing and automated synchronization.
 File: app/integrations/hris/webhook_scheduler.py
 """
 
+import asyncio
 import hashlib
 import hmac
 import json
 import logging
-from typing import Dict, List, Optional, Callable, Any
-from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+import random
+import uuid
+from collections import deque
+from concurrent.futures import Future
+from typing import Deque, Dict, List, Optional, Callable, Any, Tuple
+from datetime import datetime
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 import threading
 import time
 import schedule
 from flask import Flask, request, jsonify
-import requests
+import httpx
 
 logger = logging.getLogger(__name__)
 
@@ -220,23 +225,452 @@ class WebhookReceiver:
         return events
 
 
+@dataclass
+class WebhookEndpoint:
+    """Outbound webhook endpoint configuration."""
+    url: str
+    max_concurrency: int = 4
+    supports_batch: bool = False
+    max_batch_size: int = 100
+
+
+@dataclass
+class DeadLetter:
+    """Payload that could not be delivered after all retries."""
+    url: str
+    payload: str
+    event_ids: List[str]
+    attempts: int
+    last_error: str
+    is_batch: bool = False
+    failed_at: datetime = field(default_factory=datetime.now)
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        result = asdict(self)
+        result['failed_at'] = self.failed_at.isoformat()
+        return result
+
+
+class WebhookDeliveryEngine:
+    """
+    Concurrent outbound webhook delivery.
+    Uses a pooled async HTTP client, bounds in-flight requests per endpoint,
+    retries transient failures with exponential backoff and keeps payloads
+    that exhaust their retries in a dead-letter store.
+    
+    The dead-letter store is in memory and bounded: once it holds
+    ``max_dead_letters`` payloads the oldest is dropped (and counted in
+    ``dropped_dead_letters``) so a long outage cannot grow it without limit.
+    """
+    
+    RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+    
+    def __init__(
+        self,
+        endpoints: List[WebhookEndpoint],
+        secret_key: str,
+        max_retries: int = 5,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        timeout: float = 10.0,
+        max_connections: int = 100,
+        max_dead_letters: int = 1000,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Initialize delivery engine.
+        
+        Args:
+            endpoints: Endpoints to deliver to
+            secret_key: Secret key for signing payloads
+            max_retries: Retries per payload after the first attempt
+            backoff_base: Initial backoff delay in seconds
+            backoff_max: Upper bound for a single backoff delay
+            timeout: Per-request timeout in seconds
+            max_connections: Connection pool size shared by all endpoints
+            max_dead_letters: Most failed payloads kept for redelivery
+            transport: Optional httpx transport (e.g. a MockTransport in tests)
+        """
+        self.endpoints = {endpoint.url: endpoint for endpoint in endpoints}
+        self.secret_key = secret_key
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.transport = transport
+        self.dead_letters: Deque[DeadLetter] = deque(maxlen=max_dead_letters)
+        self.dropped_dead_letters = 0
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                ),
+                transport=self.transport
+            )
+            self._semaphores = {
+                url: asyncio.Semaphore(endpoint.max_concurrency)
+                for url, endpoint in self.endpoints.items()
+            }
+        return self._client
+    
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._semaphores = {}
+    
+    async def __aenter__(self) -> "WebhookDeliveryEngine":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    def _generate_signature(self, payload: bytes) -> str:
+        """Generate HMAC signature for payload."""
+        return hmac.new(
+            self.secret_key.encode(),
+            payload,
+            hashlib.sha256
+        ).hexdigest()
+    
+    def _build_payloads(
+        self,
+        endpoint: WebhookEndpoint,
+        events: List[WebhookEvent]
+    ) -> List[Tuple[str, List[str], bool]]:
+        """
+        Build request bodies for an endpoint.
+        
+        Endpoints that accept batches receive events coalesced into chunks
+        of at most ``max_batch_size``; others receive one body per event.
+        
+        Returns:
+            List of (body, event_ids, is_batch) tuples
+        """
+        event_dicts = [event.to_dict() for event in events]
+        
+        if not endpoint.supports_batch:
+            return [
+                (json.dumps(event_dict), [event_dict['event_id']], False)
+                for event_dict in event_dicts
+            ]
+        
+        payloads = []
+        size = max(1, endpoint.max_batch_size)
+        for i in range(0, len(event_dicts), size):
+            chunk = event_dicts[i:i + size]
+            body = json.dumps({'batch': True, 'count': len(chunk), 'events': chunk})
+            payloads.append((body, [e['event_id'] for e in chunk], True))
+        return payloads
+    
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Exponential backoff with full jitter, honouring Retry-After."""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, delay)
+    
+    async def _post_with_retry(
+        self,
+        endpoint: WebhookEndpoint,
+        body: str,
+        event_ids: List[str],
+        is_batch: bool
+    ) -> bool:
+        """
+        Post one body to an endpoint, retrying transient failures.
+        
+        Returns:
+            True if delivered, False if moved to the dead-letter store
+        """
+        client = self._get_client()
+        semaphore = self._semaphores[endpoint.url]
+        
+        data = body.encode()
+        headers = {
+            'Content-Type': 'application/json',
+            'X-Webhook-Signature': self._generate_signature(data)
+        }
+        if is_batch:
+            headers['X-Webhook-Batch'] = 'true'
+        
+        last_error = ""
+        attempts = 0
+        
+        for attempt in range(self.max_retries + 1):
+            attempts = attempt + 1
+            retry_after = None
+            headers['X-Webhook-Attempt'] = str(attempts)
+            
+            try:
+                async with semaphore:
+                    response = await client.post(endpoint.url, content=data, headers=headers)
+                
+                if 200 <= response.status_code < 300:
+                    return True
+                
+                last_error = f"HTTP {response.status_code}"
+                if response.status_code not in self.RETRYABLE_STATUS_CODES:
+                    break
+                retry_after = response.headers.get('Retry-After')
+            
+            except httpx.HTTPError as e:
+                last_error = f"{type(e).__name__}: {e}"
+            
+            if attempt < self.max_retries:
+                await asyncio.sleep(self._backoff_delay(attempt, retry_after))
+        
+        logger.error(
+            f"Webhook delivery to {endpoint.url} failed after {attempts} attempts: {last_error}"
+        )
+        self._add_dead_letter(DeadLetter(
+            url=endpoint.url,
+            payload=body,
+            event_ids=event_ids,
+            attempts=attempts,
+            last_error=last_error,
+            is_batch=is_batch
+        ))
+        return False
+    
+    def _add_dead_letter(self, letter: DeadLetter):
+        """Store a failed payload, evicting the oldest when the store is full."""
+        if len(self.dead_letters) == self.dead_letters.maxlen:
+            evicted = self.dead_letters[0]
+            self.dropped_dead_letters += 1
+            logger.warning(
+                f"Dead-letter store full ({self.dead_letters.maxlen}); dropping payload "
+                f"for {evicted.url} with events {evicted.event_ids}"
+            )
+        self.dead_letters.append(letter)
+    
+    async def deliver(self, events: List[WebhookEvent]) -> Dict[str, Dict[str, int]]:
+        """
+        Deliver events to all endpoints concurrently.
+        
+        Args:
+            events: Events to deliver
+            
+        Returns:
+            Dictionary mapping URLs to delivered/failed event counts
+        """
+        jobs = []
+        for endpoint in self.endpoints.values():
+            for body, event_ids, is_batch in self._build_payloads(endpoint, events):
+                jobs.append((endpoint.url, event_ids, self._post_with_retry(
+                    endpoint, body, event_ids, is_batch
+                )))
+        
+        outcomes = await asyncio.gather(*(job[2] for job in jobs))
+        
+        results = {url: {'delivered': 0, 'failed': 0} for url in self.endpoints}
+        for (url, event_ids, _), delivered in zip(jobs, outcomes):
+            results[url]['delivered' if delivered else 'failed'] += len(event_ids)
+        
+        return results
+    
+    async def redeliver_dead_letters(self) -> Dict[str, int]:
+        """
+        Retry every payload in the dead-letter store.
+        Payloads that fail again are put back in the store.
+        
+        Returns:
+            Counts of redelivered and still-failing payloads
+        """
+        pending = [letter for letter in self.dead_letters if letter.url in self.endpoints]
+        self.dead_letters = deque(
+            (letter for letter in self.dead_letters if letter.url not in self.endpoints),
+            maxlen=self.dead_letters.maxlen
+        )
+        
+        outcomes = await asyncio.gather(*(
+            self._post_with_retry(
+                self.endpoints[letter.url],
+                letter.payload,
+                letter.event_ids,
+                letter.is_batch
+            )
+            for letter in pending
+        ))
+        
+        delivered = sum(1 for ok in outcomes if ok)
+        return {'redelivered': delivered, 'failed': len(outcomes) - delivered}
+    
+    def get_dead_letters(self, url: Optional[str] = None) -> List[DeadLetter]:
+        """Get dead-lettered payloads, optionally for a single endpoint."""
+        # Snapshot first: the delivery loop may append from another thread
+        letters = list(self.dead_letters)
+        if url:
+            return [letter for letter in letters if letter.url == url]
+        return letters
+
+
 class WebhookSender:
     """
     Send webhooks to external systems.
     Notify other services of HRIS changes.
+    
+    Delivery runs on a background event loop owned by the sender, so the
+    pooled HTTP client stays open across calls and callers never need (or
+    conflict with) an event loop of their own. Request handlers should use
+    ``enqueue_webhook``, which returns immediately; ``send_webhook`` blocks
+    until every retry has finished.
     """
     
-    def __init__(self, webhook_urls: List[str], secret_key: str):
+    def __init__(
+        self,
+        webhook_urls: List[str],
+        secret_key: str,
+        endpoints: Optional[List[WebhookEndpoint]] = None,
+        max_retries: int = 5,
+        max_dead_letters: int = 1000,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
         """
         Initialize webhook sender.
         
         Args:
             webhook_urls: List of webhook URLs to send to
             secret_key: Secret key for signing webhooks
+            endpoints: Optional per-endpoint settings (concurrency, batching);
+                URLs without an entry use the defaults
+            max_retries: Retries per payload before dead-lettering
+            max_dead_letters: Most failed payloads kept for redelivery
+            transport: Optional httpx transport for the delivery client
         """
         self.webhook_urls = webhook_urls
         self.secret_key = secret_key
-        self.session = requests.Session()
+        
+        configured = {endpoint.url: endpoint for endpoint in endpoints or []}
+        self.engine = WebhookDeliveryEngine(
+            endpoints=[configured.get(url) or WebhookEndpoint(url=url) for url in webhook_urls],
+            secret_key=secret_key,
+            max_retries=max_retries,
+            max_dead_letters=max_dead_letters,
+            transport=transport
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+    
+    def _create_event(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        source: str
+    ) -> WebhookEvent:
+        """Create an outbound event."""
+        return WebhookEvent(
+            event_id=str(uuid.uuid4()),
+            event_type=event_type,
+            timestamp=datetime.now(),
+            source=source,
+            data=data
+        )
+    
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the delivery event loop, starting its thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="webhook-delivery",
+                    daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
+    
+    def _submit(
+        self,
+        events: List[Tuple[str, Dict[str, Any]]],
+        source: str
+    ) -> Future:
+        """Schedule delivery on the delivery loop."""
+        outbound = [self._create_event(event_type, data, source) for event_type, data in events]
+        return asyncio.run_coroutine_threadsafe(self.engine.deliver(outbound), self._get_loop())
+    
+    async def asend_webhooks(
+        self,
+        events: List[Tuple[str, Dict[str, Any]]],
+        source: str = "psychsync"
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Send many events to all configured URLs from async code.
+        
+        Args:
+            events: List of (event_type, data) tuples
+            source: Source system name
+            
+        Returns:
+            Dictionary mapping URLs to delivered/failed event counts
+        """
+        return await asyncio.wrap_future(self._submit(events, source))
+    
+    def send_webhooks(
+        self,
+        events: List[Tuple[str, Dict[str, Any]]],
+        source: str = "psychsync"
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Send many events to all configured URLs, blocking until done.
+        
+        Args:
+            events: List of (event_type, data) tuples
+            source: Source system name
+            
+        Returns:
+            Dictionary mapping URLs to delivered/failed event counts
+        """
+        return self._submit(events, source).result()
+    
+    def enqueue_webhook(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        source: str = "psychsync"
+    ) -> Future:
+        """
+        Queue a webhook for delivery to all configured URLs and return at once.
+        Failures are logged and end up in the dead-letter store.
+        
+        Args:
+            event_type: Type of event
+            data: Event data
+            source: Source system name
+            
+        Returns:
+            Future resolving to the delivered/failed counts per URL
+        """
+        future = self._submit([(event_type, data)], source)
+        future.add_done_callback(self._log_delivery)
+        return future
+    
+    @staticmethod
+    def _log_delivery(future: Future):
+        """Log the outcome of a queued delivery."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Webhook delivery error: {error}")
+            return
+        for url, counts in future.result().items():
+            if counts['failed']:
+                logger.warning(f"Webhook failed for {url}")
     
     def send_webhook(
         self,
@@ -245,7 +679,7 @@ class WebhookSender:
         source: str = "psychsync"
     ) -> Dict[str, bool]:
         """
-        Send webhook to all configured URLs.
+        Send webhook to all configured URLs, blocking through all retries.
         
         Args:
             event_type: Type of event
@@ -255,53 +689,35 @@ class WebhookSender:
         Returns:
             Dictionary mapping URLs to success status
         """
-        event = WebhookEvent(
-            event_id=str(datetime.now().timestamp()),
-            event_type=event_type,
-            timestamp=datetime.now(),
-            source=source,
-            data=data
-        )
-        
-        payload = json.dumps(event.to_dict())
-        signature = self._generate_signature(payload.encode())
-        
-        headers = {
-            'Content-Type': 'application/json',
-            'X-Webhook-Signature': signature
-        }
-        
-        results = {}
-        
-        for url in self.webhook_urls:
-            try:
-                response = self.session.post(
-                    url,
-                    data=payload,
-                    headers=headers,
-                    timeout=10
-                )
-                
-                results[url] = response.status_code == 200
-                
-                if response.status_code == 200:
-                    logger.info(f"Webhook sent successfully to {url}")
-                else:
-                    logger.warning(f"Webhook failed for {url}: {response.status_code}")
-            
-            except Exception as e:
-                logger.error(f"Failed to send webhook to {url}: {e}")
-                results[url] = False
-        
-        return results
+        results = self.send_webhooks([(event_type, data)], source)
+        
+        for url, counts in results.items():
+            if counts['delivered']:
+                logger.info(f"Webhook sent successfully to {url}")
+            else:
+                logger.warning(f"Webhook failed for {url}")
+        
+        return {url: counts['failed'] == 0 for url, counts in results.items()}
+    
+    def close(self):
+        """Close the pooled client and stop the delivery loop."""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.engine.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+    
+    def get_dead_letters(self) -> List[DeadLetter]:
+        """Get payloads that exhausted their retries."""
+        return self.engine.get_dead_letters()
     
     def _generate_signature(self, payload: bytes) -> str:
         """Generate HMAC signature for payload."""
-        return hmac.new(
-            self.secret_key.encode(),
-            payload,
-            hashlib.sha256
-        ).hexdigest()
+        return self.engine._generate_signature(payload)
 
 
 @dataclass
@@ -14,7 +14,7 @@ from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from sqlalchemy.exc import SQLAlchemyError
@@ -37,6 +37,10 @@ from app.core.handlers import (
     general_exception_handler
 )
 from app.core.security_middleware import SecurityMiddleware
+from app.core.monitoring import RequestMonitoringMiddleware
+from app.core.metrics_registry import render_metrics, scrape_allowed
+# Importing query_monitor registers the engine-wide query timing hooks
+from app.core.query_monitor import NPlusOneMiddleware
 
 # Import the consolidated router from our clean API file
 from app.api.v1.api import api_router
@@ -61,6 +65,16 @@ limiter = Limiter(
     default_limits=[f"{settings.RATE_LIMIT_PER_MINUTE}/minute"]
 )
 
+# --- Prediction Model Preload ---
+# Under gunicorn --preload this runs once in the master before workers fork,
+# so they share the loaded models copy-on-write instead of each loading a copy
+if settings.ANALYTICS_PRELOAD_MODELS and not os.getenv("TESTING"):
+    try:
+        from app.services.model_registry import model_registry
+        logger.info(f"Prediction models preloaded: {model_registry.load_all()}")
+    except Exception as e:
+        logger.warning(f"Prediction model preload failed: {e}")
+
 # --- Application Lifespan Management ---
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -72,6 +86,11 @@ async def lifespan(app: FastAPI):
             logger.info("Redis initialized successfully.")
         except Exception as e:
             logger.warning(f"Redis initialization failed: {e}")
+        try:
+            from app.services.model_registry import model_registry
+            logger.info(f"Prediction models loaded: {model_registry.load_all()}")
+        except Exception as e:
+            logger.warning(f"Prediction model loading failed: {e}")
     yield
     logger.info("Shutting down PsychSync AI app...")
 
@@ -122,6 +141,12 @@ app.add_middleware(
     enable_ip_whitelist=False  # Set to True to enable IP whitelist
 )
 
+# Request latency/status metrics for /metrics and the monitoring collector
+app.add_middleware(RequestMonitoringMiddleware)
+
+# Flags repeated identical queries per request (disabled in production)
+app.add_middleware(NPlusOneMiddleware)
+
 # --- API Routers ---
 # Include the main API router (this already has /api/v1 prefix from routes.py)
 app.include_router(api_router)
@@ -166,6 +191,24 @@ async def health_check_main() -> Dict[str, Any]:
         },
     }
 
+@app.get("/metrics", include_in_schema=False)
+def metrics(request: Request) -> Response:
+    """
+    Prometheus/OpenMetrics scrape endpoint, aggregated across workers
+
+    Only served when ENABLE_METRICS is on, to direct (non-proxied) clients in
+    METRICS_ALLOWED_NETWORKS; everyone else gets a 404.
+    """
+    allowed = scrape_allowed(
+        request.client.host if request.client else None,
+        settings.metrics_allowed_networks_list,
+        forwarded="x-forwarded-for" in request.headers or "forwarded" in request.headers,
+    )
+    if not settings.ENABLE_METRICS or not allowed:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    body, content_type = render_metrics(request.headers.get("accept", ""))
+    return Response(content=body, media_type=content_type)
+
 # --- Uvicorn Runner ---
 if __name__ == "__main__":
     uvicorn.run(
@@ -8,6 +8,7 @@ PDF reports, Excel exports, and custom report builder.
 
 Requirements:
     pip install reportlab pandas openpyxl matplotlib
+    pip install pyarrow  # for Parquet exports
 """
 
 from reportlab.lib import colors
@@ -23,65 +24,116 @@ from reportlab.pdfgen import canvas
 
 import pandas as pd
 import numpy as np
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple
+from uuid import UUID
+import csv
 import io
 import base64
+import json
 
 
 # ============================================================================
 # PDF Report Generator
 # ============================================================================
 
-class PDFReportGenerator:
-    """
-    Generate professional PDF reports for clinical and research purposes.
+@lru_cache(maxsize=1)
+def report_styles():
     """
+    Stylesheet shared by every report built in this process.
     
-    def __init__(self, title: str = "PsychSync Report"):
-        """
-        Initialize PDF report generator.
-        
-        Args:
-            title: Report title
-        """
-        self.title = title
-        self.styles = getSampleStyleSheet()
-        self._add_custom_styles()
-    
-    def _add_custom_styles(self):
-        """Add custom paragraph styles."""
-        self.styles.add(ParagraphStyle(
+    Building the sample stylesheet and custom styles is done once; styles
+    are only read while rendering, so documents can share them.
+    """
+    styles = getSampleStyleSheet()
+    custom_styles = [
+        ParagraphStyle(
             name='CustomTitle',
-            parent=self.styles['Heading1'],
+            parent=styles['Heading1'],
             fontSize=24,
             textColor=colors.HexColor('#1a56db'),
             spaceAfter=30,
             alignment=TA_CENTER
-        ))
-        
-        self.styles.add(ParagraphStyle(
+        ),
+        ParagraphStyle(
             name='SectionHeader',
-            parent=self.styles['Heading2'],
+            parent=styles['Heading2'],
             fontSize=16,
             textColor=colors.HexColor('#1e40af'),
             spaceAfter=12,
             spaceBefore=12
-        ))
-        
-        self.styles.add(ParagraphStyle(
+        ),
+        ParagraphStyle(
             name='BodyText',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=11,
             spaceAfter=6
-        ))
+        ),
+    ]
+    for style in custom_styles:
+        # The sample sheet already defines BodyText; replace it rather than add
+        if style.name in styles:
+            styles.byName[style.name] = style
+        else:
+            styles.add(style)
+    return styles
+
+
+def render_score_chart(
+    assessment_scores: pd.DataFrame,
+    date_column: str = 'date',
+    score_column: str = 'score'
+) -> Optional[bytes]:
+    """
+    Render an assessment score trend as PNG bytes.
+    
+    Returns None when there is nothing to plot. Draws on its own Figure
+    rather than through pyplot's global figure manager, so reports can be
+    rendered from several threads at once.
+    """
+    if assessment_scores.empty or score_column not in assessment_scores.columns:
+        return None
+    
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    
+    x = assessment_scores[date_column] if date_column in assessment_scores.columns else range(len(assessment_scores))
+    fig = Figure(figsize=(6, 2.5), dpi=100)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.plot(list(x), assessment_scores[score_column].tolist(), marker='o', color='#1e40af')
+    ax.set_ylabel('Score')
+    ax.grid(alpha=0.3)
+    fig.autofmt_xdate()
+    fig.tight_layout()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png')
+    return buffer.getvalue()
+
+class PDFReportGenerator:
+    """
+    Generate professional PDF reports for clinical and research purposes.
+    """
+    
+    def __init__(self, title: str = "PsychSync Report"):
+        """
+        Initialize PDF report generator.
+        
+        Args:
+            title: Report title
+        """
+        self.title = title
+        self.styles = report_styles()
     
     def generate_client_progress_report(
         self,
         client_info: Dict,
         assessment_scores: pd.DataFrame,
         session_summary: Dict,
-        output_file: str
+        output_file,
+        score_chart: Optional[bytes] = None
     ):
         """
         Generate comprehensive client progress report.
@@ -90,7 +142,8 @@ class PDFReportGenerator:
             client_info: Client demographic information
             assessment_scores: DataFrame with assessment scores over time
             session_summary: Summary of sessions
-            output_file: Output PDF file path
+            output_file: Output PDF file path or binary file object
+            score_chart: PNG of the score trend (see render_score_chart)
         """
         doc = SimpleDocTemplate(
             output_file,
@@ -189,6 +242,10 @@ class PDFReportGenerator:
             ]))
             
             elements.append(score_table)
+            
+            if score_chart:
+                elements.append(Spacer(1, 12))
+                elements.append(RLImage(io.BytesIO(score_chart), width=6*inch, height=2.5*inch))
         else:
             elements.append(Paragraph("No assessment data available.", self.styles['BodyText']))
         
@@ -260,7 +317,7 @@ class PDFReportGenerator:
         Args:
             summary_stats: Aggregate statistics
             clients_data: DataFrame with client outcomes
-            output_file: Output PDF file path
+            output_file: Output PDF file path or binary file object
         """
         doc = SimpleDocTemplate(output_file, pagesize=letter)
         elements = []
@@ -418,7 +475,7 @@ class CSVExporter:
         """Export DataFrame with metadata header."""
         with open(output_file, 'w') as f:
             # Write metadata as comments
-            f.write(f"# PsychSync Data Export\n")
+            f.write("# PsychSync Data Export\n")
             f.write(f"# Export Date: {datetime.now().isoformat()}\n")
             for key, value in metadata.items():
                 f.write(f"# {key}: {value}\n")
@@ -428,6 +485,277 @@ class CSVExporter:
         df.to_csv(output_file, mode='a', index=False)
 
 
+# ============================================================================
+# Streaming Export
+# ============================================================================
+
+# Rows held in memory at once by the streaming exporters
+STREAM_CHUNK_SIZE = 10000
+
+# Data rows per Excel worksheet, leaving one for the header
+EXCEL_MAX_ROWS = 1048575
+
+
+def iter_query_rows(session, statement, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Stream rows of a SQLAlchemy select through a server-side cursor.
+    
+    Only chunk_size rows are fetched from the database at a time; each row
+    is a mapping of column name to value.
+    """
+    result = session.execute(statement.execution_options(yield_per=chunk_size))
+    yield from result.mappings()
+
+
+def _rows_with_columns(rows: Iterable, columns: Optional[List[str]]) -> Tuple[List[str], Iterator[List[Any]]]:
+    """Column names and an iterator of value lists for mapping or sequence rows"""
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return list(columns or []), iter(())
+    if columns is None:
+        if hasattr(first, 'keys'):
+            columns = list(first.keys())
+        elif hasattr(first, '_fields'):
+            columns = list(first._fields)
+        else:
+            raise ValueError("columns are required for rows without field names")
+    
+    def values(row):
+        if hasattr(row, 'keys'):
+            return [row.get(column) for column in columns]
+        return list(row)
+    
+    return list(columns), (values(row) for row in chain([first], rows))
+
+
+def _chunks(iterator: Iterator, size: int) -> Iterator[List]:
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _plain_value(value: Any) -> Any:
+    """Value in a form Excel and Parquet writers accept"""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def arrow_schema(statement):
+    """
+    Parquet schema for the columns of a SQLAlchemy select.
+    
+    Types come from each column's Python type: numbers, booleans and
+    temporal values keep their type, everything else (text, enums, UUIDs,
+    JSON) is written as strings.
+    """
+    import pyarrow as pa
+    from decimal import Decimal
+    
+    arrow_types = [
+        (bool, pa.bool_()),
+        (int, pa.int64()),
+        (float, pa.float64()),
+        (Decimal, pa.float64()),
+        (datetime, pa.timestamp('us')),
+        (date, pa.date32()),
+        (time, pa.time64('us')),
+        (timedelta, pa.duration('us')),
+        (bytes, pa.binary()),
+    ]
+    fields = []
+    for column in statement.selected_columns:
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            python_type = str
+        arrow_type = next(
+            (t for py, t in arrow_types if isinstance(python_type, type) and issubclass(python_type, py)),
+            pa.string()
+        )
+        fields.append((column.name, arrow_type))
+    return pa.schema(fields)
+
+
+def _arrow_column(name: str, values: List[Any], field_type):
+    """
+    Arrow array of values in the given type.
+    
+    Values are inferred first and then cast safely, so a value the type
+    cannot hold (e.g. 5.5 in an integer column) raises ValueError rather
+    than being truncated.
+    """
+    import pyarrow as pa
+    
+    if pa.types.is_string(field_type):
+        return pa.array([None if v is None else str(v) for v in values], type=field_type)
+    try:
+        return pa.array(values).cast(field_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+        raise ValueError(f"Column {name!r} has values that do not fit Parquet type {field_type}: {e}") from e
+
+
+class StreamingExporter:
+    """
+    Constant-memory exports from row iterators.
+    
+    Rows may be mappings (e.g. from iter_query_rows), named tuples, or plain
+    sequences with explicit columns. Rows are consumed lazily and at most one
+    chunk is held in memory, however many rows are exported.
+    """
+    
+    @staticmethod
+    def export_csv(
+        rows: Iterable,
+        output_file: str,
+        columns: Optional[List[str]] = None,
+        metadata: Optional[Dict] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> int:
+        """
+        Stream rows to CSV.
+        
+        Args:
+            rows: Row iterator
+            output_file: Output CSV file path
+            columns: Column names (default: keys of the first row)
+            metadata: Optional metadata written as comment lines first
+            chunk_size: Rows written per batch
+            
+        Returns:
+            Number of rows written
+        """
+        columns, values = _rows_with_columns(rows, columns)
+        written = 0
+        with open(output_file, 'w', newline='') as f:
+            if metadata is not None:
+                f.write("# PsychSync Data Export\n")
+                f.write(f"# Export Date: {datetime.now().isoformat()}\n")
+                for key, value in metadata.items():
+                    f.write(f"# {key}: {value}\n")
+                f.write("\n")
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            for chunk in _chunks(values, chunk_size):
+                writer.writerows(
+                    [json.dumps(v, default=str) if isinstance(v, (dict, list)) else v for v in row]
+                    for row in chunk
+                )
+                written += len(chunk)
+        return written
+    
+    @staticmethod
+    def export_excel(
+        sheets: Dict[str, Iterable],
+        output_file: str,
+        columns: Optional[Dict[str, List[str]]] = None
+    ) -> Dict[str, int]:
+        """
+        Stream rows to Excel with openpyxl's write-only workbook.
+        
+        A sheet with more rows than Excel allows continues on sheets named
+        "<name> (2)", "<name> (3)" and so on.
+        
+        Args:
+            sheets: Dictionary of sheet_name -> row iterator
+            output_file: Output Excel file path
+            columns: Optional sheet_name -> column names
+            
+        Returns:
+            Rows written per sheet
+        """
+        from openpyxl import Workbook
+        
+        workbook = Workbook(write_only=True)
+        counts = {}
+        for sheet_name, rows in sheets.items():
+            sheet_columns, values = _rows_with_columns(rows, (columns or {}).get(sheet_name))
+            part = 1
+            worksheet = workbook.create_sheet(title=sheet_name[:31])
+            worksheet.append(sheet_columns)
+            written = 0
+            for row in values:
+                if written and written % EXCEL_MAX_ROWS == 0:
+                    part += 1
+                    suffix = f" ({part})"
+                    worksheet = workbook.create_sheet(title=sheet_name[:31 - len(suffix)] + suffix)
+                    worksheet.append(sheet_columns)
+                worksheet.append([_plain_value(v) for v in row])
+                written += 1
+            counts[sheet_name] = written
+        workbook.save(output_file)
+        return counts
+    
+    @staticmethod
+    def export_parquet(
+        rows: Iterable,
+        output_file: str,
+        columns: Optional[List[str]] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        schema=None
+    ) -> int:
+        """
+        Stream rows to Parquet, one row group per chunk.
+        
+        Without an explicit schema it is inferred from the first chunk, with
+        columns that are entirely null there typed as strings. Later chunks
+        must fit that schema: a value that would be truncated or cannot be
+        converted raises ValueError. Pass a schema (e.g. arrow_schema of the
+        query) when early rows may not be representative. Nested values are
+        written as JSON strings.
+        
+        Args:
+            rows: Row iterator
+            output_file: Output Parquet file path
+            columns: Column names (default: keys of the first row)
+            chunk_size: Rows per row group
+            schema: pyarrow schema to write (default: inferred)
+            
+        Returns:
+            Number of rows written
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        if columns is None and schema is not None:
+            columns = schema.names
+        columns, values = _rows_with_columns(rows, columns)
+        writer = None
+        written = 0
+        try:
+            for chunk in _chunks(values, chunk_size):
+                arrays = [[_plain_value(v) for v in column] for column in zip(*chunk)]
+                if schema is None:
+                    inferred = [pa.array(a) for a in arrays]
+                    schema = pa.schema([
+                        (name, pa.string() if pa.types.is_null(array.type) else array.type)
+                        for name, array in zip(columns, inferred)
+                    ])
+                if writer is None:
+                    writer = pq.ParquetWriter(output_file, schema)
+                table = pa.Table.from_arrays(
+                    [_arrow_column(field.name, a, field.type) for a, field in zip(arrays, schema)],
+                    schema=schema
+                )
+                writer.write_table(table)
+                written += len(chunk)
+            if writer is None:
+                if schema is None:
+                    schema = pa.schema([(name, pa.string()) for name in columns])
+                pq.write_table(schema.empty_table(), output_file)
+        finally:
+            if writer is not None:
+                writer.close()
+        return written
+
+
 # ============================================================================
 # Report Builder
 # ============================================================================
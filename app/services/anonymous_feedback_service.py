@@ -7,17 +7,16 @@ Enables employees to report concerns without fear of retaliation
 import secrets
 import hashlib
 from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
 from dataclasses import dataclass
 import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, func, select, delete, insert, cast, Date
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from collections import Counter, defaultdict
-from typing import Dict, List, Any, Optional
 
-from app.db.models.anonymous_feedback import AnonymousFeedback
-from app.core.logging_config import logger
+from app.db.models.anonymous_feedback import AnonymousFeedback, AnonymousFeedbackDailyRollup
 
 @dataclass
 class FeedbackSubmission:
@@ -75,7 +74,7 @@ class AnonymousFeedbackService:
 
     async def submit_anonymous_feedback(
         self,
-        db: Session,
+        db: AsyncSession,
         organization_id: str,
         feedback_data: FeedbackSubmission
     ) -> Dict[str, Any]:
@@ -115,7 +114,16 @@ class AnonymousFeedbackService:
             )
 
             db.add(feedback)
-        await db.commit()
+            await self._apply_rollup_delta(
+                db,
+                organization_id=organization_id,
+                submitted_at=feedback.submitted_at,
+                category=feedback.category,
+                severity=feedback.severity,
+                status=feedback.status,
+                feedback_delta=1
+            )
+            await db.commit()
             await db.refresh(feedback)
 
             # Log anonymously (no identifying information)
@@ -158,7 +166,7 @@ class AnonymousFeedbackService:
 
     async def check_feedback_status(
         self,
-        db: Session,
+        db: AsyncSession,
         tracking_id: str
     ) -> Dict[str, Any]:
         """
@@ -167,8 +175,10 @@ class AnonymousFeedbackService:
         """
 
         try:
-            feedback = result = await db.execute(query)
-        return result.scalars().all()
+            result = await db.execute(
+                select(AnonymousFeedback).where(AnonymousFeedback.tracking_id == tracking_id)
+            )
+            feedback = result.scalar_one_or_none()
 
             if not feedback:
                 return {
@@ -206,7 +216,7 @@ class AnonymousFeedbackService:
 
     async def get_feedback_for_review(
         self,
-        db: Session,
+        db: AsyncSession,
         organization_id: str,
         reviewer_id: str,
         status_filter: Optional[str] = 'pending_review',
@@ -294,7 +304,7 @@ class AnonymousFeedbackService:
 
     async def update_feedback_status(
         self,
-        db: Session,
+        db: AsyncSession,
         feedback_id: str,
         reviewer_id: str,
         new_status: str,
@@ -307,8 +317,10 @@ class AnonymousFeedbackService:
 
         try:
             # Verify permissions
-            feedback = result = await db.execute(query)
-        return result.scalars().all()
+            result = await db.execute(
+                select(AnonymousFeedback).where(AnonymousFeedback.id == feedback_id)
+            )
+            feedback = result.scalar_one_or_none()
 
             if not feedback:
                 return {
@@ -322,6 +334,9 @@ class AnonymousFeedbackService:
                     'error': 'Insufficient permissions'
                 }
 
+            previous_status = feedback.status
+            previous_resolution_days = self._resolution_days(feedback)
+
             # Update feedback
             feedback.status = new_status
             feedback.updated_at = datetime.utcnow()
@@ -337,6 +352,28 @@ class AnonymousFeedbackService:
             if new_status in ['resolved', 'closed']:
                 feedback.resolution_date = datetime.utcnow()
 
+            # Move the feedback between rollup buckets
+            await self._apply_rollup_delta(
+                db,
+                organization_id=feedback.organization_id,
+                submitted_at=feedback.submitted_at,
+                category=feedback.category,
+                severity=feedback.severity,
+                status=previous_status,
+                feedback_delta=-1,
+                resolution_days=previous_resolution_days
+            )
+            await self._apply_rollup_delta(
+                db,
+                organization_id=feedback.organization_id,
+                submitted_at=feedback.submitted_at,
+                category=feedback.category,
+                severity=feedback.severity,
+                status=new_status,
+                feedback_delta=1,
+                resolution_days=self._resolution_days(feedback)
+            )
+
             await db.commit()
 
             # Log status change
@@ -362,7 +399,7 @@ class AnonymousFeedbackService:
 
     async def get_anonymous_feedback_statistics(
         self,
-        db: Session,
+        db: AsyncSession,
         organization_id: str,
         days_back: int = 90
     ) -> Dict[str, Any]:
@@ -374,14 +411,30 @@ class AnonymousFeedbackService:
         try:
             cutoff_date = datetime.utcnow() - timedelta(days=days_back)
 
-            feedbacks = db.query(AnonymousFeedback).filter(
-                and_(
-                    AnonymousFeedback.organization_id == organization_id,
-                    AnonymousFeedback.submitted_at >= cutoff_date
-                )
-            ).all()
+            rollups = await self._fetch_daily_rollups(db, organization_id, cutoff_date.date())
 
-            if not feedbacks:
+            # Fold the per-day buckets into breakdowns (O(days x categories))
+            category_stats = Counter()
+            severity_stats = Counter()
+            status_stats = Counter()
+            daily_submissions = defaultdict(int)
+            weekly_trends = defaultdict(Counter)
+            resolved_count = 0
+            resolution_days_total = 0
+
+            for row in rollups:
+                count = row.feedback_count
+                category_stats[row.category] += count
+                severity_stats[row.severity] += count
+                status_stats[row.status] += count
+                daily_submissions[row.day.isoformat()] += count
+                weekly_trends[row.day.strftime("%Y-W%U")][row.category] += count
+                resolved_count += row.resolved_count
+                resolution_days_total += row.resolution_days_total
+
+            total_submissions = sum(category_stats.values())
+
+            if not total_submissions:
                 return {
                     'total_submissions': 0,
                     'analysis_period_days': days_back,
@@ -397,45 +450,38 @@ class AnonymousFeedbackService:
                     }
                 }
 
-            # Analyze patterns and trends
-            category_stats = Counter([f.category for f in feedbacks])
-            severity_stats = Counter([f.severity for f in feedbacks])
-            status_stats = Counter([f.status for f in feedbacks])
-
-            # Calculate submission trends
-            daily_submissions = defaultdict(int)
-            for feedback in feedbacks:
-                date_key = feedback.submitted_at.date().isoformat()
-                daily_submissions[date_key] += 1
-
             # Generate insights
-            psychological_safety_level = self._assess_psychological_safety_level(feedbacks)
+            psychological_safety_level = self._assess_psychological_safety_level(severity_stats)
             primary_concerns = self._identify_primary_concerns(category_stats, severity_stats)
-            trending_issues = self._identify_trending_issues(feedbacks)
+            trending_issues = self._identify_trending_issues(weekly_trends)
 
             # Generate organizational recommendations
             recommendations = self._generate_organizational_recommendations(
-                feedbacks, category_stats, severity_stats
+                total_submissions, category_stats, severity_stats
             )
 
             return {
-                'total_submissions': len(feedbacks),
+                'total_submissions': total_submissions,
                 'analysis_period_days': days_back,
                 'category_breakdown': dict(category_stats),
                 'severity_breakdown': dict(severity_stats),
                 'status_breakdown': dict(status_stats),
                 'submission_trends': dict(daily_submissions),
-                'average_resolution_time': self._calculate_avg_resolution_time(feedbacks),
+                'average_resolution_time': self._calculate_avg_resolution_time(
+                    resolved_count, resolution_days_total
+                ),
                 'insights': {
                     'psychological_safety_level': psychological_safety_level,
                     'primary_concerns': primary_concerns,
                     'trending_issues': trending_issues,
                     'recommendations': recommendations
                 },
-                'benchmark_comparison': self._generate_benchmark_comparison(feedbacks),
+                'benchmark_comparison': self._generate_benchmark_comparison(
+                    total_submissions, severity_stats.get('critical', 0)
+                ),
                 'data_quality': {
-                    'sample_size': len(feedbacks),
-                    'confidence_level': 'high' if len(feedbacks) >= 20 else 'medium',
+                    'sample_size': total_submissions,
+                    'confidence_level': 'high' if total_submissions >= 20 else 'medium',
                     'period_completeness': 'complete'
                 }
             }
@@ -447,6 +493,133 @@ class AnonymousFeedbackService:
                 'error': str(e)
             }
 
+    async def _fetch_daily_rollups(
+        self,
+        db: AsyncSession,
+        organization_id: str,
+        since: date
+    ) -> List[Any]:
+        """Fetch non-empty daily rollup buckets for an organization since a day"""
+        rollup = AnonymousFeedbackDailyRollup
+        result = await db.execute(
+            select(
+                rollup.day,
+                rollup.category,
+                rollup.severity,
+                rollup.status,
+                rollup.feedback_count,
+                rollup.resolved_count,
+                rollup.resolution_days_total
+            ).where(
+                and_(
+                    rollup.organization_id == organization_id,
+                    rollup.day >= since,
+                    rollup.feedback_count > 0
+                )
+            ).order_by(rollup.day)
+        )
+        return result.all()
+
+    async def _apply_rollup_delta(
+        self,
+        db: AsyncSession,
+        organization_id: str,
+        submitted_at: datetime,
+        category: str,
+        severity: str,
+        status: Optional[str],
+        feedback_delta: int,
+        resolution_days: Optional[int] = None
+    ) -> None:
+        """
+        Add (or with a negative delta, remove) one feedback item to its daily
+        rollup bucket in the caller's transaction
+        """
+        resolved = resolution_days is not None
+        now = datetime.utcnow()
+
+        stmt = pg_insert(AnonymousFeedbackDailyRollup).values(
+            organization_id=organization_id,
+            day=submitted_at.date(),
+            category=category,
+            severity=severity,
+            status=status or 'pending_review',
+            feedback_count=feedback_delta,
+            resolved_count=feedback_delta if resolved else 0,
+            resolution_days_total=feedback_delta * resolution_days if resolved else 0,
+            updated_at=now
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['organization_id', 'day', 'category', 'severity', 'status'],
+            set_={
+                'feedback_count': AnonymousFeedbackDailyRollup.feedback_count + stmt.excluded.feedback_count,
+                'resolved_count': AnonymousFeedbackDailyRollup.resolved_count + stmt.excluded.resolved_count,
+                'resolution_days_total': (
+                    AnonymousFeedbackDailyRollup.resolution_days_total + stmt.excluded.resolution_days_total
+                ),
+                'updated_at': now
+            }
+        )
+        await db.execute(stmt)
+
+    async def rebuild_daily_rollups(self, db: AsyncSession, organization_id: str) -> int:
+        """
+        Recompute an organization's daily rollups from the raw feedback table
+        with a single GROUP BY. Used for backfills and drift repair.
+        """
+        day = cast(AnonymousFeedback.submitted_at, Date)
+        status = func.coalesce(AnonymousFeedback.status, 'pending_review')
+
+        grouped = select(
+            AnonymousFeedback.organization_id,
+            day,
+            AnonymousFeedback.category,
+            AnonymousFeedback.severity,
+            status,
+            func.count(),
+            func.count(AnonymousFeedback.resolution_date),
+            func.coalesce(
+                func.sum(func.extract('day', AnonymousFeedback.resolution_date - AnonymousFeedback.submitted_at)),
+                0
+            ),
+            func.now()
+        ).where(
+            and_(
+                AnonymousFeedback.organization_id == organization_id,
+                AnonymousFeedback.submitted_at.isnot(None)
+            )
+        ).group_by(
+            AnonymousFeedback.organization_id,
+            day,
+            AnonymousFeedback.category,
+            AnonymousFeedback.severity,
+            status
+        )
+
+        await db.execute(
+            delete(AnonymousFeedbackDailyRollup).where(
+                AnonymousFeedbackDailyRollup.organization_id == organization_id
+            )
+        )
+        result = await db.execute(
+            insert(AnonymousFeedbackDailyRollup).from_select(
+                [
+                    'organization_id', 'day', 'category', 'severity', 'status',
+                    'feedback_count', 'resolved_count', 'resolution_days_total', 'updated_at'
+                ],
+                grouped
+            )
+        )
+        await db.commit()
+
+        return result.rowcount
+
+    def _resolution_days(self, feedback: AnonymousFeedback) -> Optional[int]:
+        """Whole days from submission to resolution, or None if unresolved"""
+        if not feedback.resolution_date:
+            return None
+        return (feedback.resolution_date - feedback.submitted_at).days
+
     def _generate_anonymous_fingerprint(self) -> str:
         """Generate anonymous fingerprint for duplicate detection (not identification)"""
         # Use timestamp and randomness to create unique fingerprint
@@ -474,7 +647,7 @@ class AnonymousFeedbackService:
 
         return description.strip()
 
-    async def _handle_feedback_submission(self, db: Session, feedback: AnonymousFeedback) -> None:
+    async def _handle_feedback_submission(self, db: AsyncSession, feedback: AnonymousFeedback) -> None:
         """Handle appropriate workflows for feedback submission"""
         try:
             # Trigger alerts for critical issues
@@ -515,7 +688,7 @@ class AnonymousFeedbackService:
 
         return resources
 
-    async def _verify_reviewer_permissions(self, db: Session, reviewer_id: str, organization_id: str) -> bool:
+    async def _verify_reviewer_permissions(self, db: AsyncSession, reviewer_id: str, organization_id: str) -> bool:
         """Verify reviewer has appropriate permissions"""
         # Implementation would check user roles and permissions
         # This is a placeholder for actual permission checking logic
@@ -538,15 +711,15 @@ class AnonymousFeedbackService:
 
         return min(base_score + age_factor, 1.0)
 
-    def _assess_psychological_safety_level(self, feedbacks: List[AnonymousFeedback]) -> str:
+    def _assess_psychological_safety_level(self, severity_stats: Counter) -> str:
         """Assess overall psychological safety level based on feedback patterns"""
-        if not feedbacks:
+        total_count = sum(severity_stats.values())
+        if not total_count:
             return 'insufficient_data'
 
         # Count critical and high severity issues
-        critical_count = len([f for f in feedbacks if f.severity == 'critical'])
-        high_count = len([f for f in feedbacks if f.severity == 'high'])
-        total_count = len(feedbacks)
+        critical_count = severity_stats.get('critical', 0)
+        high_count = severity_stats.get('high', 0)
 
         concern_ratio = (critical_count + high_count) / total_count
 
@@ -661,7 +834,7 @@ class AnonymousFeedbackService:
 
         return actions
 
-    async def _auto_assign_reviewer(self, db: Session, feedback: AnonymousFeedback) -> None:
+    async def _auto_assign_reviewer(self, db: AsyncSession, feedback: AnonymousFeedback) -> None:
         """Auto-assign feedback to appropriate reviewer based on category"""
         # This would integrate with user roles and specialties
         # For now, placeholder logic
@@ -676,7 +849,7 @@ class AnonymousFeedbackService:
         # Implementation would find appropriate reviewer based on type
         feedback.assigned_reviewer_id = None  # Would be set to actual reviewer ID
 
-    async def _update_psychological_safety_metrics(self, db: Session, feedback: AnonymousFeedback) -> None:
+    async def _update_psychological_safety_metrics(self, db: AsyncSession, feedback: AnonymousFeedback) -> None:
         """Update organizational psychological safety metrics based on feedback"""
         # This would integrate with culture health service
         # Implementation would update metrics and trigger alerts if patterns emerge
@@ -713,15 +886,8 @@ class AnonymousFeedbackService:
 
         return concerns
 
-    def _identify_trending_issues(self, feedbacks: List[AnonymousFeedback]) -> List[Dict[str, Any]]:
-        """Identify trending issues from recent feedback"""
-        # Group feedback by week to identify trends
-        weekly_trends = defaultdict(lambda: defaultdict(int))
-
-        for feedback in feedbacks:
-            week_key = feedback.submitted_at.strftime("%Y-W%U")
-            weekly_trends[week_key][feedback.category] += 1
-
+    def _identify_trending_issues(self, weekly_trends: Dict[str, Counter]) -> List[Dict[str, Any]]:
+        """Identify trending issues from weekly per-category submission counts"""
         # Identify increasing trends
         trending = []
         weeks = sorted(weekly_trends.keys())
@@ -746,7 +912,7 @@ class AnonymousFeedbackService:
 
     def _generate_organizational_recommendations(
         self,
-        feedbacks: List[AnonymousFeedback],
+        total_count: int,
         category_stats: Counter,
         severity_stats: Counter
     ) -> List[str]:
@@ -754,7 +920,7 @@ class AnonymousFeedbackService:
         recommendations = []
 
         # Analyze critical issues
-        critical_count = len([f for f in feedbacks if f.severity == 'critical'])
+        critical_count = severity_stats.get('critical', 0)
         if critical_count > 0:
             recommendations.append(f"Address {critical_count} critical issues immediately")
 
@@ -764,7 +930,7 @@ class AnonymousFeedbackService:
             recommendations.append(f"Focus on {top_category[0]} - {top_category[1]} reports received")
 
         # Check for patterns
-        if len(feedbacks) > 10:  # Sufficient data for pattern analysis
+        if total_count > 10:  # Sufficient data for pattern analysis
             recommendations.append("Consider anonymous climate survey to gather broader feedback")
             recommendations.append("Review team dynamics in high-reporting areas")
 
@@ -777,24 +943,15 @@ class AnonymousFeedbackService:
 
         return recommendations
 
-    def _calculate_avg_resolution_time(self, feedbacks: List[AnonymousFeedback]) -> Optional[float]:
+    def _calculate_avg_resolution_time(self, resolved_count: int, resolution_days_total: int) -> Optional[float]:
         """Calculate average resolution time in days"""
-        resolved_feedbacks = [f for f in feedbacks if f.resolution_date]
-
-        if not resolved_feedbacks:
+        if not resolved_count:
             return None
 
-        total_days = sum([
-            (f.resolution_date - f.submitted_at).days
-            for f in resolved_feedbacks
-        ])
-
-        return round(total_days / len(resolved_feedbacks), 1)
+        return round(resolution_days_total / resolved_count, 1)
 
-    def _generate_benchmark_comparison(self, feedbacks: List[AnonymousFeedback]) -> Dict[str, Any]:
+    def _generate_benchmark_comparison(self, total_count: int, critical_count: int) -> Dict[str, Any]:
         """Generate benchmark comparisons for feedback patterns"""
-        total_count = len(feedbacks)
-        critical_count = len([f for f in feedbacks if f.severity == 'critical'])
 
         # Industry benchmarks (these would be based on actual industry data)
         industry_benchmarks = {
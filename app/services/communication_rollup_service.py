@@ -0,0 +1,330 @@
+# app/services/communication_rollup_service.py
+"""
+Communication Rollup Service
+Maintains per-day user, team and organization aggregates of communication
+analysis so culture-health reads are O(days) rather than O(emails)
+"""
+
+import math
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, select, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.communication_rollup import CommunicationDailyRollup
+from app.db.models.team import TeamMember
+from app.db.models.user import User
+from app.core.logging_config import logger
+
+SCOPE_USER = 'user'
+SCOPE_TEAM = 'team'
+SCOPE_ORGANIZATION = 'organization'
+
+HIGH_CONFLICT_THRESHOLD = 0.7
+
+# Upper edges (minutes) of the response-time histogram buckets; the last
+# bucket is open-ended. Fixed so buckets from different days add directly.
+RESPONSE_TIME_EDGES_MINUTES = (
+    1, 2, 5, 10, 15, 30, 45, 60, 90, 120, 180, 240, 360, 480,
+    720, 1080, 1440, 2160, 2880, 4320, 7200, 10080
+)
+RESPONSE_TIME_BUCKETS = len(RESPONSE_TIME_EDGES_MINUTES) + 1
+
+
+@dataclass
+class CommunicationAccumulator:
+    """Additive aggregate of communication analyses (one rollup row's worth)"""
+    message_count: int = 0
+    sentiment_count: int = 0
+    sentiment_sum: float = 0.0
+    sentiment_sum_sq: float = 0.0
+    conflict_sum: float = 0.0
+    high_conflict_count: int = 0
+    emotion_counts: Counter = field(default_factory=Counter)
+    response_time_count: int = 0
+    response_time_sum: float = 0.0
+    response_time_buckets: List[int] = field(default_factory=lambda: [0] * RESPONSE_TIME_BUCKETS)
+
+    def add(
+        self,
+        sentiment: Optional[float],
+        conflict_probability: Optional[float],
+        dominant_emotion: Optional[str],
+        response_time_minutes: Optional[float] = None
+    ):
+        """Fold one analysed message in"""
+        self.message_count += 1
+        if sentiment is not None:
+            sentiment = float(sentiment)
+            self.sentiment_count += 1
+            self.sentiment_sum += sentiment
+            self.sentiment_sum_sq += sentiment * sentiment
+        if conflict_probability is not None:
+            conflict_probability = float(conflict_probability)
+            self.conflict_sum += conflict_probability
+            if conflict_probability > HIGH_CONFLICT_THRESHOLD:
+                self.high_conflict_count += 1
+        if dominant_emotion:
+            self.emotion_counts[dominant_emotion] += 1
+        if response_time_minutes is not None and response_time_minutes >= 0:
+            self.response_time_count += 1
+            self.response_time_sum += float(response_time_minutes)
+            self.response_time_buckets[bisect_left(RESPONSE_TIME_EDGES_MINUTES, response_time_minutes)] += 1
+
+    def merge(self, other: "CommunicationAccumulator"):
+        """Fold another accumulator in"""
+        self.message_count += other.message_count
+        self.sentiment_count += other.sentiment_count
+        self.sentiment_sum += other.sentiment_sum
+        self.sentiment_sum_sq += other.sentiment_sum_sq
+        self.conflict_sum += other.conflict_sum
+        self.high_conflict_count += other.high_conflict_count
+        self.emotion_counts.update(other.emotion_counts)
+        self.response_time_count += other.response_time_count
+        self.response_time_sum += other.response_time_sum
+        for i, count in enumerate(other.response_time_buckets[:RESPONSE_TIME_BUCKETS]):
+            self.response_time_buckets[i] += count or 0
+
+    @classmethod
+    def from_row(cls, row: Any) -> "CommunicationAccumulator":
+        """Build from a CommunicationDailyRollup row"""
+        buckets = list(row.response_time_buckets or [])
+        buckets += [0] * (RESPONSE_TIME_BUCKETS - len(buckets))
+        return cls(
+            message_count=row.message_count,
+            sentiment_count=row.sentiment_count,
+            sentiment_sum=row.sentiment_sum,
+            sentiment_sum_sq=row.sentiment_sum_sq,
+            conflict_sum=row.conflict_sum,
+            high_conflict_count=row.high_conflict_count,
+            emotion_counts=Counter({k: int(v) for k, v in (row.emotion_counts or {}).items()}),
+            response_time_count=row.response_time_count,
+            response_time_sum=row.response_time_sum,
+            response_time_buckets=buckets,
+        )
+
+    def response_time_percentile(self, percentile: float) -> Optional[float]:
+        """Approximate percentile (minutes), interpolated within its bucket"""
+        if not self.response_time_count:
+            return None
+        target = percentile / 100 * self.response_time_count
+        seen = 0
+        for i, count in enumerate(self.response_time_buckets):
+            if count and seen + count >= target:
+                lower = RESPONSE_TIME_EDGES_MINUTES[i - 1] if i > 0 else 0
+                if i >= len(RESPONSE_TIME_EDGES_MINUTES):
+                    return float(lower)
+                upper = RESPONSE_TIME_EDGES_MINUTES[i]
+                return lower + (upper - lower) * (target - seen) / count
+            seen += count
+        return float(RESPONSE_TIME_EDGES_MINUTES[-1])
+
+    def summary(self) -> Dict[str, Any]:
+        """Means, variance, distributions and percentiles for the API"""
+        mean = self.sentiment_sum / self.sentiment_count if self.sentiment_count else None
+        variance = None
+        if self.sentiment_count:
+            variance = max(0.0, self.sentiment_sum_sq / self.sentiment_count - mean * mean)
+
+        emotion_total = sum(self.emotion_counts.values())
+        return {
+            'message_count': self.message_count,
+            'sentiment_mean': mean,
+            'sentiment_variance': variance,
+            'sentiment_std': math.sqrt(variance) if variance is not None else None,
+            'emotion_distribution': {
+                emotion: count / emotion_total
+                for emotion, count in self.emotion_counts.most_common()
+            } if emotion_total else {},
+            'conflict_probability_mean': self.conflict_sum / self.message_count if self.message_count else None,
+            'high_conflict_rate': self.high_conflict_count / self.message_count if self.message_count else None,
+            'response_time_minutes': {
+                'mean': self.response_time_sum / self.response_time_count if self.response_time_count else None,
+                'p50': self.response_time_percentile(50),
+                'p90': self.response_time_percentile(90),
+                'p95': self.response_time_percentile(95),
+            },
+        }
+
+
+class CommunicationRollupService:
+    """Incremental maintenance and reads of communication daily rollups"""
+
+    def __init__(self):
+        self.logger = logger
+
+    async def record_analyses(
+        self,
+        db: AsyncSession,
+        analyses: Iterable[Any],
+        email_metadata: Optional[Iterable[Any]] = None
+    ) -> int:
+        """
+        Fold newly created CommunicationAnalysis records into the user, team
+        and organization rollups, in the caller's transaction
+
+        email_metadata supplies response times and the received date (matched
+        on message_id); otherwise the analysis timestamp decides the day.
+        Call once per analysis, alongside persisting it, or counts double.
+
+        Returns:
+            Number of rollup rows upserted
+        """
+        emails = {e.message_id: e for e in (email_metadata or [])}
+        by_user_day: Dict[Tuple[Any, date], CommunicationAccumulator] = defaultdict(CommunicationAccumulator)
+
+        for analysis in analyses:
+            email = emails.get(analysis.email_id)
+            timestamp = (
+                getattr(email, 'date_received', None)
+                or getattr(analysis, 'analysis_timestamp', None)
+                or datetime.utcnow()
+            )
+            by_user_day[(analysis.user_id, timestamp.date())].add(
+                analysis.sentiment_score,
+                analysis.conflict_probability,
+                analysis.dominant_emotion,
+                getattr(email, 'response_time_minutes', None)
+            )
+
+        if not by_user_day:
+            return 0
+
+        teams_by_user, org_by_user = await self._resolve_scopes(db, {user_id for user_id, _ in by_user_day})
+
+        # Fan each user-day out to the user's teams and organization
+        deltas: Dict[Tuple[str, Any, date], CommunicationAccumulator] = defaultdict(CommunicationAccumulator)
+        for (user_id, day), acc in by_user_day.items():
+            scopes = [(SCOPE_USER, user_id)]
+            scopes += [(SCOPE_TEAM, team_id) for team_id in teams_by_user.get(user_id, ())]
+            if org_by_user.get(user_id):
+                scopes.append((SCOPE_ORGANIZATION, org_by_user[user_id]))
+            for scope_type, scope_id in scopes:
+                deltas[(scope_type, scope_id, day)].merge(acc)
+
+        for (scope_type, scope_id, day), acc in deltas.items():
+            await self._apply_rollup_delta(db, scope_type, scope_id, day, acc)
+
+        return len(deltas)
+
+    async def get_summary(
+        self,
+        db: AsyncSession,
+        scope_type: str,
+        scope_id: Any,
+        days_back: int = 30
+    ) -> Dict[str, Any]:
+        """Aggregate a scope's rollups over the last days_back days"""
+        since = (datetime.utcnow() - timedelta(days=days_back)).date()
+        rollup = CommunicationDailyRollup
+        result = await db.execute(
+            select(rollup).where(
+                and_(
+                    rollup.scope_type == scope_type,
+                    rollup.scope_id == scope_id,
+                    rollup.day >= since
+                )
+            ).order_by(rollup.day)
+        )
+
+        total = CommunicationAccumulator()
+        for row in result.scalars():
+            total.merge(CommunicationAccumulator.from_row(row))
+
+        summary = total.summary()
+        summary['analysis_period_days'] = days_back
+        return summary
+
+    async def _resolve_scopes(
+        self,
+        db: AsyncSession,
+        user_ids: set
+    ) -> Tuple[Dict[Any, List[Any]], Dict[Any, Any]]:
+        """Team memberships and organization for a batch of users (two queries)"""
+        teams_by_user: Dict[Any, List[Any]] = defaultdict(list)
+        result = await db.execute(
+            select(TeamMember.user_id, TeamMember.team_id).where(TeamMember.user_id.in_(user_ids))
+        )
+        for user_id, team_id in result.all():
+            teams_by_user[user_id].append(team_id)
+
+        result = await db.execute(
+            select(User.id, User.organization_id).where(User.id.in_(user_ids))
+        )
+        org_by_user = {user_id: org_id for user_id, org_id in result.all()}
+
+        return teams_by_user, org_by_user
+
+    async def _apply_rollup_delta(
+        self,
+        db: AsyncSession,
+        scope_type: str,
+        scope_id: Any,
+        day: date,
+        acc: CommunicationAccumulator
+    ) -> None:
+        """Add an accumulator to its daily rollup row in the caller's transaction"""
+        rollup = CommunicationDailyRollup
+        now = datetime.utcnow()
+
+        stmt = pg_insert(rollup).values(
+            scope_type=scope_type,
+            scope_id=scope_id,
+            day=day,
+            message_count=acc.message_count,
+            sentiment_count=acc.sentiment_count,
+            sentiment_sum=acc.sentiment_sum,
+            sentiment_sum_sq=acc.sentiment_sum_sq,
+            conflict_sum=acc.conflict_sum,
+            high_conflict_count=acc.high_conflict_count,
+            emotion_counts=dict(acc.emotion_counts),
+            response_time_count=acc.response_time_count,
+            response_time_sum=acc.response_time_sum,
+            response_time_buckets=acc.response_time_buckets,
+            updated_at=now
+        )
+        table = rollup.__tablename__
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['scope_type', 'scope_id', 'day'],
+            set_={
+                'message_count': rollup.message_count + stmt.excluded.message_count,
+                'sentiment_count': rollup.sentiment_count + stmt.excluded.sentiment_count,
+                'sentiment_sum': rollup.sentiment_sum + stmt.excluded.sentiment_sum,
+                'sentiment_sum_sq': rollup.sentiment_sum_sq + stmt.excluded.sentiment_sum_sq,
+                'conflict_sum': rollup.conflict_sum + stmt.excluded.conflict_sum,
+                'high_conflict_count': rollup.high_conflict_count + stmt.excluded.high_conflict_count,
+                # Key-wise sum of the two emotion count objects
+                'emotion_counts': literal_column(f"""(
+                    SELECT COALESCE(jsonb_object_agg(key, total), '{{}}'::jsonb)
+                    FROM (
+                        SELECT key, SUM(value::int) AS total
+                        FROM (
+                            SELECT * FROM jsonb_each_text({table}.emotion_counts)
+                            UNION ALL
+                            SELECT * FROM jsonb_each_text(excluded.emotion_counts)
+                        ) AS counts
+                        GROUP BY key
+                    ) AS merged
+                )"""),
+                'response_time_count': rollup.response_time_count + stmt.excluded.response_time_count,
+                'response_time_sum': rollup.response_time_sum + stmt.excluded.response_time_sum,
+                # Element-wise sum of the two histograms
+                'response_time_buckets': literal_column(f"""ARRAY(
+                    SELECT COALESCE(a, 0) + COALESCE(b, 0)
+                    FROM unnest({table}.response_time_buckets, excluded.response_time_buckets)
+                         WITH ORDINALITY AS t(a, b, i)
+                    ORDER BY i
+                )"""),
+                'updated_at': now
+            }
+        )
+        await db.execute(stmt)
+
+
+# Singleton instance
+communication_rollup_service = CommunicationRollupService()
@@ -2,12 +2,132 @@
 """
 Culture Health Monitoring Service
 Aggregates communication analysis to measure organizational culture health
+
+Reads the precomputed daily rollups maintained by CommunicationRollupService,
+so a team or organization assessment costs O(days) regardless of email volume.
+Snapshots are not persisted (the former CultureMetrics rows): the rollups are
+kept per day, so the scores for any past window can be recomputed from them.
 """
 
-import asyncio
-from typing import Dict, List, Optional, Tuple, Any
-from datetime import datetime, timedelta
-import numpy as np
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
\ No newline at end of file
+
+from app.services.communication_rollup_service import (
+    SCOPE_ORGANIZATION,
+    SCOPE_TEAM,
+    communication_rollup_service,
+)
+from app.core.logging_config import logger
+
+# Fewer analysed messages than this is too thin a sample to score
+MIN_MESSAGES_FOR_ANALYSIS = 20
+
+HEALTH_LEVELS = (
+    (0.75, 'excellent'),
+    (0.60, 'good'),
+    (0.45, 'fair'),
+    (0.0, 'poor'),
+)
+
+
+@dataclass
+class CultureHealthSnapshot:
+    """Culture health scores (0-1) derived from communication rollups"""
+    psychological_safety_score: float
+    collaboration_score: float
+    innovation_score: float
+    trust_level: float
+    overall_health_score: float
+    health_level: str
+    risk_factors_identified: List[str] = field(default_factory=list)
+    strength_indicators: List[str] = field(default_factory=list)
+    communication: Dict[str, Any] = field(default_factory=dict)
+
+
+class CultureHealthService:
+    """Team and organization culture health from communication rollups"""
+
+    def __init__(self):
+        self.logger = logger
+
+    async def analyze_team_culture(
+        self,
+        db: AsyncSession,
+        team_id: str,
+        days_back: int = 30
+    ) -> Optional[CultureHealthSnapshot]:
+        """Culture health for a team, or None when there is too little data"""
+        summary = await communication_rollup_service.get_summary(db, SCOPE_TEAM, team_id, days_back)
+        return self._score(summary)
+
+    async def analyze_organization_culture(
+        self,
+        db: AsyncSession,
+        organization_id: str,
+        days_back: int = 30
+    ) -> Optional[CultureHealthSnapshot]:
+        """Culture health for an organization, or None when there is too little data"""
+        summary = await communication_rollup_service.get_summary(db, SCOPE_ORGANIZATION, organization_id, days_back)
+        return self._score(summary)
+
+    def _score(self, summary: Dict[str, Any]) -> Optional[CultureHealthSnapshot]:
+        """Map aggregate communication statistics onto the culture dimensions"""
+        if summary['message_count'] < MIN_MESSAGES_FOR_ANALYSIS:
+            return None
+
+        sentiment_mean = summary['sentiment_mean'] or 0.0
+        sentiment_std = summary['sentiment_std'] or 0.0
+        conflict = summary['conflict_probability_mean'] or 0.0
+        high_conflict_rate = summary['high_conflict_rate'] or 0.0
+        emotions = summary['emotion_distribution']
+        median_response = summary['response_time_minutes']['p50']
+        p90_response = summary['response_time_minutes']['p90']
+
+        positivity = (sentiment_mean + 1) / 2
+        stability = 1 - min(1.0, sentiment_std)
+        # Replies within the working day count as fully responsive
+        responsiveness = 1 - min(1.0, median_response / 1440) if median_response is not None else 0.5
+        upbeat_share = emotions.get('joy', 0) + emotions.get('surprise', 0)
+        distress_share = emotions.get('anger', 0) + emotions.get('fear', 0)
+
+        psychological_safety = 0.6 * positivity + 0.4 * (1 - high_conflict_rate)
+        collaboration = 0.5 * responsiveness + 0.5 * (1 - conflict)
+        innovation = 0.5 * positivity + 0.5 * min(1.0, 2 * upbeat_share)
+        trust = 0.5 * stability + 0.5 * (1 - conflict)
+        overall = (psychological_safety + collaboration + innovation + trust) / 4
+
+        risk_factors = []
+        strengths = []
+        if high_conflict_rate > 0.15:
+            risk_factors.append('Frequent high-conflict communication')
+        elif high_conflict_rate < 0.05:
+            strengths.append('Low conflict in day-to-day communication')
+        if sentiment_mean < -0.1:
+            risk_factors.append('Predominantly negative sentiment')
+        elif sentiment_mean > 0.2:
+            strengths.append('Positive communication tone')
+        if distress_share > 0.3:
+            risk_factors.append('Elevated anger or anxiety in messages')
+        if p90_response is not None and p90_response > 2880:
+            risk_factors.append('Slow responses (10% take over two days)')
+        elif median_response is not None and median_response <= 120:
+            strengths.append('Responsive collaboration')
+
+        health_level = next(label for threshold, label in HEALTH_LEVELS if overall >= threshold)
+
+        return CultureHealthSnapshot(
+            psychological_safety_score=round(psychological_safety, 3),
+            collaboration_score=round(collaboration, 3),
+            innovation_score=round(innovation, 3),
+            trust_level=round(trust, 3),
+            overall_health_score=round(overall, 3),
+            health_level=health_level,
+            risk_factors_identified=risk_factors,
+            strength_indicators=strengths,
+            communication=summary
+        )
+
+
+# Singleton instance
+culture_health_service = CultureHealthService()
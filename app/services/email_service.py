@@ -1,8 +1,12 @@
+import asyncio
+import logging
 from typing import List, Optional
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
 from pydantic import EmailStr
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 # Email configuration with correct field names for fastapi-mail
 conf = ConnectionConfig(
     MAIL_USERNAME=settings.SMTP_USER or "dummy@example.com",  # Required, use dummy if None
@@ -49,6 +53,42 @@ class EmailService:
         except Exception as e:
             print(f"❌ Failed to send email to {email_to}: {e}")
     
+    @staticmethod
+    async def send_bulk_email(messages: List[dict], max_concurrency: int = 10) -> List[bool]:
+        """
+        Send many emails concurrently over the shared FastMail connection.
+
+        Each message is a dict with ``email_to``, ``subject``, ``body`` and an
+        optional ``html``. Returns one delivered flag per message, in order.
+        """
+        if not messages:
+            return []
+
+        if not settings.SMTP_HOST or not settings.SMTP_USER:
+            logger.warning(f"Email not configured. Would send {len(messages)} emails")
+            return [False] * len(messages)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send_one(message: dict) -> bool:
+            schema = MessageSchema(
+                subject=message['subject'],
+                recipients=[message['email_to']],
+                body=message.get('html') or message['body'],
+                subtype=MessageType.html if message.get('html') else MessageType.plain
+            )
+            async with semaphore:
+                try:
+                    await fm.send_message(schema)
+                    return True
+                except Exception as e:
+                    logger.error(f"Failed to send email to {message['email_to']}: {e}")
+                    return False
+
+        results = await asyncio.gather(*(send_one(message) for message in messages))
+        logger.info(f"Bulk email sent: {sum(results)}/{len(messages)}")
+        return list(results)
+
     @staticmethod
     async def send_verification_email(email: str, token: str, name: str):
         """Send email verification link"""
@@ -195,4 +235,7 @@ class EmailService:
         </html>
         """
         
-        await EmailService.send_email(email, subject, invite_link, html)
\ No newline at end of file
+        await EmailService.send_email(email, subject, invite_link, html)
+
+
+email_service = EmailService()
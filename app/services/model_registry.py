@@ -0,0 +1,266 @@
+# app/services/model_registry.py
+"""
+Versioned, process-wide registry of trained prediction models
+
+Artifacts live under ANALYTICS_MODEL_DIR as {name}/{version}.joblib, written
+uncompressed by publish() (or the predictors' save_model). The active version
+of each model is named by {name}/CURRENT, falling back to the highest version
+present. Models are loaded once per process and reused for every request.
+
+Artifacts are loaded with mmap_mode='r', but that only keeps plain ndarray
+attributes (linear coefficients, scaler statistics) mapped from the page
+cache. Tree ensembles (random forests, gradient boosting, isolation forests)
+copy their node arrays into private memory while unpickling, so mmap does
+not share them. To share those between workers, load the models before the
+server forks: with ANALYTICS_PRELOAD_MODELS set and gunicorn --preload,
+app.main loads them in the master and workers inherit the pages
+copy-on-write.
+
+Publishing a new version and rewriting CURRENT hot-swaps the model: the next
+lookup after ANALYTICS_MODEL_RELOAD_SECONDS notices the change and loads the
+new artifact on a background thread while the old one keeps serving.
+"""
+
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from ai.pattern_recognition import PopulationAnomalyModel
+from ai.predictor import DropoutPredictor, OutcomePredictor
+from app.core.config import settings
+from app.core.logging_config import logger
+
+CURRENT_POINTER = "CURRENT"
+ARTIFACT_SUFFIX = ".joblib"
+
+# Registered model name -> loader taking (path, mmap_mode)
+MODEL_LOADERS: Dict[str, Callable[..., Any]] = {
+    'outcome': OutcomePredictor.load_model,
+    'dropout': DropoutPredictor.load_model,
+}
+
+# Model families with one model per scope, named {family}/{scope}; these are
+# loaded on first use rather than at startup
+MODEL_FAMILY_LOADERS: Dict[str, Callable[..., Any]] = {
+    'anomaly': PopulationAnomalyModel.load_model,
+}
+
+
+def _loader(name: str) -> Callable[..., Any]:
+    family, _, scope = name.partition('/')
+    loader = MODEL_FAMILY_LOADERS.get(family) if scope else MODEL_LOADERS.get(name)
+    if loader is None:
+        raise ValueError(f"Unknown model: {name}")
+    return loader
+
+
+def anomaly_model_name(scope: str, feature_keys: List[str]) -> str:
+    """Registry name of the population anomaly model for a scope and feature set"""
+    return f"anomaly/{scope}-{'-'.join(sorted(feature_keys))}"
+
+
+def _version_key(version: str):
+    """Natural sort key so v10 ranks above v9"""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", version)]
+
+
+@dataclass
+class LoadedModel:
+    """A loaded predictor and the artifact it came from"""
+    name: str
+    version: str
+    path: str
+    predictor: Any
+    loaded_at: datetime
+    load_seconds: float
+
+
+class ModelRegistry:
+    """Loads each registered model once and swaps in new versions without a restart"""
+
+    def __init__(
+        self,
+        model_dir: Optional[str] = None,
+        reload_seconds: Optional[float] = None,
+        mmap_mode: Optional[str] = 'r'
+    ):
+        self.model_dir = Path(model_dir or settings.ANALYTICS_MODEL_DIR)
+        self.reload_seconds = settings.ANALYTICS_MODEL_RELOAD_SECONDS if reload_seconds is None else reload_seconds
+        self.mmap_mode = mmap_mode
+        self._models: Dict[str, LoadedModel] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._loading: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Artifact layout
+    # ------------------------------------------------------------------
+
+    def versions(self, name: str) -> List[str]:
+        """Published versions of a model, oldest first"""
+        directory = self.model_dir / name
+        if not directory.is_dir():
+            return []
+        return sorted(
+            (p.name[:-len(ARTIFACT_SUFFIX)] for p in directory.iterdir() if p.name.endswith(ARTIFACT_SUFFIX)),
+            key=_version_key
+        )
+
+    def active_version(self, name: str) -> Optional[str]:
+        """Version named by CURRENT, else the highest published version"""
+        pointer = self.model_dir / name / CURRENT_POINTER
+        try:
+            version = pointer.read_text().strip()
+            if version:
+                return version
+        except OSError:
+            pass
+        versions = self.versions(name)
+        return versions[-1] if versions else None
+
+    def artifact_path(self, name: str, version: str) -> Path:
+        return self.model_dir / name / f"{version}{ARTIFACT_SUFFIX}"
+
+    def publish(self, name: str, predictor: Any, version: str, activate: bool = True) -> Path:
+        """
+        Save a trained predictor as a new version and optionally make it current
+
+        The artifact is written uncompressed, which memory-mapping requires,
+        and CURRENT is replaced atomically so readers never see a partial file.
+        """
+        _loader(name)
+
+        path = self.artifact_path(name, version)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        predictor.save_model(str(tmp_path))
+        os.replace(tmp_path, path)
+
+        if activate:
+            pointer = self.model_dir / name / CURRENT_POINTER
+            tmp_pointer = pointer.with_name(f".{CURRENT_POINTER}.tmp")
+            tmp_pointer.write_text(version)
+            os.replace(tmp_pointer, pointer)
+            # Let the next lookup pick the new version up immediately
+            self._checked_at.pop(name, None)
+
+        logger.info(f"Published model {name} version {version} to {path}")
+        return path
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _load(self, name: str, version: str) -> Optional[LoadedModel]:
+        path = self.artifact_path(name, version)
+        started = time.perf_counter()
+        try:
+            predictor = _loader(name)(str(path), mmap_mode=self.mmap_mode)
+        except Exception as e:
+            logger.error(f"Failed to load model {name} version {version} from {path}: {e}")
+            return None
+
+        loaded = LoadedModel(
+            name=name,
+            version=version,
+            path=str(path),
+            predictor=predictor,
+            loaded_at=datetime.utcnow(),
+            load_seconds=time.perf_counter() - started
+        )
+        with self._lock:
+            self._models[name] = loaded
+        logger.info(f"Loaded model {name} version {version} in {loaded.load_seconds:.2f}s")
+        return loaded
+
+    def _load_in_background(self, name: str, version: str) -> None:
+        with self._lock:
+            if self._loading.get(name) == version:
+                return
+            self._loading[name] = version
+
+        def run():
+            try:
+                self._load(name, version)
+            finally:
+                with self._lock:
+                    self._loading.pop(name, None)
+
+        threading.Thread(target=run, name=f"model-load-{name}", daemon=True).start()
+
+    def load_all(self) -> Dict[str, Optional[str]]:
+        """
+        Load the active version of every registered model, blocking
+
+        Called at application startup so no request pays the load cost.
+        Models without a published artifact are skipped, and models already
+        loaded at their active version (e.g. preloaded before fork) are kept.
+
+        Returns:
+            Model name -> loaded version (None when unavailable)
+        """
+        loaded = {}
+        for name in MODEL_LOADERS:
+            version = self.active_version(name)
+            self._checked_at[name] = time.monotonic()
+            if version is None:
+                logger.warning(f"No published artifact for model {name} under {self.model_dir}")
+                loaded[name] = None
+                continue
+            current = self._models.get(name)
+            if current is not None and current.version == version:
+                loaded[name] = version
+                continue
+            model = self._load(name, version)
+            loaded[name] = model.version if model else None
+        return loaded
+
+    def get(self, name: str) -> Optional[LoadedModel]:
+        """
+        Current model for a name, or None if none has been published
+
+        Never blocks on I/O beyond a pointer check every reload interval: a
+        newly activated version loads on a background thread and replaces the
+        served model once ready. The very first lookup of an unloaded model
+        loads it inline.
+        """
+        _loader(name)
+
+        current = self._models.get(name)
+        now = time.monotonic()
+        if current is not None and now - self._checked_at.get(name, 0.0) < self.reload_seconds:
+            return current
+
+        self._checked_at[name] = now
+        version = self.active_version(name)
+        if version is None or (current is not None and current.version == version):
+            return current
+        if current is None:
+            return self._load(name, version)
+
+        logger.info(f"Model {name} changed from version {current.version} to {version}; reloading")
+        self._load_in_background(name, version)
+        return current
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Loaded version and load time of each registered or loaded model"""
+        report = {}
+        for name in list(MODEL_LOADERS) + sorted(set(self._models) - set(MODEL_LOADERS)):
+            model = self._models.get(name)
+            report[name] = {
+                'loaded': model is not None,
+                'version': model.version if model else None,
+                'active_version': self.active_version(name),
+                'loaded_at': model.loaded_at.isoformat() if model else None,
+                'load_seconds': round(model.load_seconds, 3) if model else None,
+            }
+        return report
+
+
+# Singleton instance
+model_registry = ModelRegistry()
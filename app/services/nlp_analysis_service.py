@@ -13,6 +13,7 @@ import hashlib
 import logging
 from dataclasses import dataclass
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 try:
     from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
     import torch
@@ -33,6 +34,7 @@ from app.db.models.email_metadata import EmailMetadata
 from app.db.models.communication_analysis import CommunicationAnalysis
 from app.db.models.communication_patterns import CommunicationPatterns
 from app.db.models.user import User
+from app.services.communication_rollup_service import communication_rollup_service
 from app.core.config import settings
 from app.core.logging_config import logger
 
@@ -404,7 +406,12 @@ class NLPAnalysisService:
         )
 
     async def analyze_email_batch(self, db: Session, email_metadata_list: List[EmailMetadata]) -> List[CommunicationAnalysis]:
-        """Analyze a batch of emails and create communication analysis records"""
+        """
+        Analyze a batch of emails and create communication analysis records
+
+        Also folds the results into the daily communication rollups; the
+        caller adds the returned records and commits.
+        """
         analyses = []
 
         for email_meta in email_metadata_list:
@@ -442,6 +449,11 @@ class NLPAnalysisService:
                 self.logger.error(f"Error analyzing email {email_meta.message_id}: {e}")
                 continue
 
+        # Keep the culture-health rollups current in the same transaction the
+        # caller persists these analyses in
+        if analyses:
+            await communication_rollup_service.record_analyses(db, analyses, email_metadata_list)
+
         return analyses
 
     def _calculate_conflict_probability(self, email: EmailMetadata, sentiment: SentimentResult, features: Dict[str, Any]) -> float:
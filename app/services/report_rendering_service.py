@@ -0,0 +1,250 @@
+# app/services/report_rendering_service.py
+"""
+Parallel report rendering with shared caches
+
+Rendering is CPU-bound Python (ReportLab layout, matplotlib charts), so
+threads cannot spread it across cores. Large batches are split into chunks
+and rendered as Celery subtasks (tasks.render_report_chunk, fanned out by
+generate_organization_reports as a chord), so every prefork worker on the
+reports queue renders a chunk in its own process. A process pool inside the
+task is not an option: prefork workers are daemonic and may not start child
+processes. render_bulk renders one chunk in the calling process; its thread
+pool only serves in-process callers and overlaps file I/O. Each thread keeps
+its own PDFReportGenerator, and the ReportLab stylesheet is built once per
+process (report_styles). Score charts are cached on disk under a hash of the
+plotted data, so unchanged clients skip matplotlib entirely.
+
+Rendered reports go to a content-addressed store under REPORT_OUTPUT_DIR.
+A report's key hashes its kind, template version, report date and inputs,
+so re-running a batch over unchanged data finds the existing files and
+renders nothing.
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from app.core.config import settings
+from app.core.logging_config import logger
+from app.reports.generate_report import PDFReportGenerator, render_score_chart
+
+# Bump when a report layout changes so existing renders are not reused
+REPORT_TEMPLATE_VERSION = "1"
+
+REPORT_KINDS = ('client_progress', 'outcome_summary')
+
+
+def _digest(value: Any) -> str:
+    canonical = json.dumps(value, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@dataclass
+class ReportJob:
+    """
+    One report to render
+
+    payload holds JSON-serializable inputs:
+        client_progress: client_info, assessment_scores (records), session_summary
+        outcome_summary: summary_stats, clients_data (records)
+    """
+    kind: str
+    payload: Dict[str, Any]
+    label: Optional[str] = None
+
+    def content_key(self, report_date: date) -> str:
+        return _digest({
+            'kind': self.kind,
+            'version': REPORT_TEMPLATE_VERSION,
+            'date': report_date.isoformat(),
+            'payload': self.payload,
+        })
+
+
+@dataclass
+class RenderedReport:
+    """Outcome of rendering one job"""
+    label: Optional[str]
+    key: str
+    path: Optional[str]
+    cached: bool
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+class ContentAddressedStore:
+    """Files stored as {root}/{namespace}/{key[:2]}/{key}{suffix}, written atomically"""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def path(self, namespace: str, key: str, suffix: str) -> Path:
+        return self.root / namespace / key[:2] / f"{key}{suffix}"
+
+    def read(self, namespace: str, key: str, suffix: str) -> Optional[bytes]:
+        try:
+            return self.path(namespace, key, suffix).read_bytes()
+        except OSError:
+            return None
+
+    def write(self, namespace: str, key: str, suffix: str, data: bytes) -> Path:
+        path = self.path(namespace, key, suffix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        return path
+
+
+class ReportRenderer:
+    """Renders jobs in the current process, reusing one generator and the caches"""
+
+    def __init__(self, output_dir: str):
+        self.store = ContentAddressedStore(output_dir)
+        self.generator = PDFReportGenerator(title="Client Progress Report")
+
+    def score_chart(self, assessment_scores: pd.DataFrame) -> Optional[bytes]:
+        """Score trend PNG, rendered once per distinct series"""
+        if assessment_scores.empty or 'score' not in assessment_scores.columns:
+            return None
+        columns = [c for c in ('date', 'score') if c in assessment_scores.columns]
+        key = _digest(assessment_scores[columns].to_dict(orient='list'))
+        chart = self.store.read('charts', key, '.png')
+        if chart is None:
+            chart = render_score_chart(assessment_scores)
+            if chart:
+                self.store.write('charts', key, '.png', chart)
+        return chart
+
+    def render(self, job: ReportJob, report_date: Optional[date] = None) -> RenderedReport:
+        key = job.content_key(report_date or date.today())
+        path = self.store.path('reports', key, '.pdf')
+        if path.exists():
+            return RenderedReport(label=job.label, key=key, path=str(path), cached=True)
+
+        started = time.perf_counter()
+        try:
+            buffer = io.BytesIO()
+            payload = job.payload
+            if job.kind == 'client_progress':
+                scores = pd.DataFrame(payload.get('assessment_scores') or [])
+                self.generator.generate_client_progress_report(
+                    payload.get('client_info') or {},
+                    scores,
+                    payload.get('session_summary') or {},
+                    buffer,
+                    score_chart=self.score_chart(scores)
+                )
+            elif job.kind == 'outcome_summary':
+                self.generator.generate_outcome_summary_report(
+                    payload.get('summary_stats') or {},
+                    pd.DataFrame(payload.get('clients_data') or []),
+                    buffer
+                )
+            else:
+                raise ValueError(f"Unknown report kind: {job.kind}")
+            path = self.store.write('reports', key, '.pdf', buffer.getvalue())
+        except Exception as e:
+            logger.error(f"Failed to render {job.kind} report {job.label or key}: {e}")
+            return RenderedReport(label=job.label, key=key, path=None, cached=False,
+                                  seconds=time.perf_counter() - started, error=str(e))
+
+        return RenderedReport(label=job.label, key=key, path=str(path), cached=False,
+                              seconds=time.perf_counter() - started)
+
+
+class ReportRenderingService:
+    """Renders single reports and batches across a thread pool"""
+
+    def __init__(self, output_dir: Optional[str] = None, max_workers: Optional[int] = None):
+        self.output_dir = output_dir or settings.REPORT_OUTPUT_DIR
+        self.max_workers = max_workers or settings.REPORT_RENDER_WORKERS or os.cpu_count() or 1
+        self._local = threading.local()
+
+    @property
+    def renderer(self) -> ReportRenderer:
+        """The calling thread's renderer; generators are not shared between threads"""
+        renderer = getattr(self._local, 'renderer', None)
+        if renderer is None:
+            renderer = self._local.renderer = ReportRenderer(self.output_dir)
+        return renderer
+
+    def render(self, job: ReportJob) -> RenderedReport:
+        """Render one report in the calling thread"""
+        return self.renderer.render(job)
+
+    def render_bulk(
+        self,
+        jobs: List[ReportJob],
+        progress: Optional[Callable[[int, int], None]] = None,
+        max_workers: Optional[int] = None
+    ) -> List[RenderedReport]:
+        """
+        Render many reports in this process, optionally across a thread pool
+
+        Reports already in the store are returned without touching the pool.
+        A failed report is returned with its error rather than failing the
+        batch.
+
+        Args:
+            jobs: Reports to render
+            progress: Called as progress(done, total) after each report
+            max_workers: Pool size (defaults to REPORT_RENDER_WORKERS)
+
+        Returns:
+            One RenderedReport per job, in job order
+        """
+        report_date = date.today()
+        total = len(jobs)
+        results: List[Optional[RenderedReport]] = [None] * total
+        done = 0
+
+        def advance():
+            nonlocal done
+            done += 1
+            if progress:
+                progress(done, total)
+
+        pending = []
+        for i, job in enumerate(jobs):
+            key = job.content_key(report_date)
+            path = self.renderer.store.path('reports', key, '.pdf')
+            if path.exists():
+                results[i] = RenderedReport(label=job.label, key=key, path=str(path), cached=True)
+                advance()
+            else:
+                pending.append(i)
+
+        workers = min(max_workers or self.max_workers, len(pending))
+        if workers <= 1:
+            for i in pending:
+                results[i] = self.renderer.render(jobs[i], report_date)
+                advance()
+        elif pending:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='report-render') as pool:
+                futures = {pool.submit(self._render_pending, jobs[i], report_date): i for i in pending}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    advance()
+
+        rendered = sum(1 for r in results if not r.cached and not r.error)
+        failed = sum(1 for r in results if r.error)
+        logger.info(f"Rendered {rendered} reports ({total - rendered - failed} cached, {failed} failed) with {max(workers, 1)} workers")
+        return results
+
+    def _render_pending(self, job: ReportJob, report_date: date) -> RenderedReport:
+        return self.renderer.render(job, report_date)
+
+
+# Singleton instance
+report_rendering_service = ReportRenderingService()
@@ -0,0 +1,244 @@
+# app/services/scoring/vectorized_scorer.py
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.scoring.mbti_scorer import MBTIScorer
+from app.services.scoring.big_five_scorer import BigFiveScorer
+from app.services.scoring.disc_scorer import DISCScorer
+
+
+class VectorizedScorer:
+    """
+    Chunk-at-a-time scoring of AssessmentResponse answer dicts
+
+    Answers for a whole chunk are packed into an (n_responses x n_items)
+    float matrix once, with NaN for missing or unusable answers, and factor
+    scores are computed with NumPy reductions over that matrix. Results match
+    the per-response scorers in this package.
+
+    Only the numeric part is vectorized: type letters, styles and the
+    interpretation text are still built per response by the scorers' own
+    helpers, since they are string formatting over four or five scores.
+    """
+
+    GENERIC_BAND_EDGES = np.array([20, 40, 60, 80])
+    GENERIC_INTERPRETATIONS = [
+        "Low score range - Significant opportunity for growth",
+        "Below average range - Consider areas for development",
+        "Average range - Typical performance level",
+        "Above average range - Good performance in most areas",
+        "High score range - Strong performance across assessment areas",
+    ]
+
+    @staticmethod
+    def _answer_matrix(
+        answers: List[Dict[str, Any]],
+        keys: List[str],
+        true_value: float,
+        false_value: float,
+        parse_strings: bool
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pack answer dicts into a value matrix and a boolean-answer mask
+
+        Returns:
+            (values, is_bool) arrays of shape (len(answers), len(keys))
+        """
+        column = {key: j for j, key in enumerate(keys)}
+        values = np.full((len(answers), len(keys)), np.nan)
+        is_bool = np.zeros((len(answers), len(keys)), dtype=bool)
+
+        for i, row in enumerate(answers):
+            for key, value in (row or {}).items():
+                j = column.get(key)
+                if j is None or value is None:
+                    continue
+
+                if isinstance(value, bool):
+                    values[i, j] = true_value if value else false_value
+                    is_bool[i, j] = True
+                elif isinstance(value, (int, float)):
+                    values[i, j] = value
+                elif parse_strings and isinstance(value, str):
+                    try:
+                        values[i, j] = float(value)
+                    except ValueError:
+                        continue
+
+        return values, is_bool
+
+    @staticmethod
+    def score_generic(answers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Vectorized equivalent of ScoringService._generic_scoring"""
+        keys = sorted({key for row in answers for key in (row or {})})
+        values, is_bool = VectorizedScorer._answer_matrix(
+            answers, keys, true_value=1.0, false_value=0.0, parse_strings=False
+        )
+
+        answered = ~np.isnan(values)
+        totals = np.nansum(values, axis=1)
+        max_scores = np.where(answered, np.where(is_bool, 1.0, 5.0), 0.0).sum(axis=1)
+        percentages = np.divide(
+            totals * 100, max_scores, out=np.zeros_like(totals), where=max_scores > 0
+        )
+
+        # Same bands as ScoringService._get_generic_interpretation
+        bands = np.searchsorted(VectorizedScorer.GENERIC_BAND_EDGES, percentages, side="right")
+
+        return [
+            {
+                "algorithm": "generic",
+                "total_score": round(float(total), 2),
+                "max_possible_score": round(float(max_score), 2),
+                "percentage_score": round(float(percentage), 2),
+                "interpretation": VectorizedScorer.GENERIC_INTERPRETATIONS[band]
+            }
+            for total, max_score, percentage, band in zip(totals, max_scores, percentages, bands)
+        ]
+
+    @staticmethod
+    def _dimension_scores(
+        answers: List[Dict[str, Any]],
+        dimensions: Dict[str, List[Any]],
+        reverse_scored: Dict[str, List[Any]],
+        default: float
+    ) -> Dict[str, List[float]]:
+        """
+        0-100 dimension scores from the mean 1-5 answer of each dimension
+
+        Booleans count as 5/1, numeric strings are parsed, reverse-keyed
+        items score as 6 - x and a dimension with no usable answers gets
+        ``default``, as in the per-response scorers.
+
+        Returns:
+            Dimension -> scores in answer order, rounded to 2 places
+        """
+        keys = sorted({str(q_id) for question_ids in dimensions.values() for q_id in question_ids})
+        column = {key: j for j, key in enumerate(keys)}
+        values, _ = VectorizedScorer._answer_matrix(
+            answers, keys, true_value=5.0, false_value=1.0, parse_strings=True
+        )
+
+        scores = {}
+        for dimension, question_ids in dimensions.items():
+            if not question_ids:
+                scores[dimension] = [default] * len(answers)
+                continue
+
+            idx = np.array([column[str(q_id)] for q_id in question_ids])
+            reverse = np.array([q_id in reverse_scored.get(dimension, []) for q_id in question_ids])
+
+            sub = values[:, idx]
+            sub = np.where(reverse, 6 - sub, sub)
+            counts = (~np.isnan(sub)).sum(axis=1)
+            sums = np.nansum(sub, axis=1)
+            means = np.divide(sums, counts, out=np.ones_like(sums), where=counts > 0)
+            normalized = np.where(counts > 0, (means - 1) / 4 * 100, default)
+
+            # Python round() so halves land exactly where the scorers' do
+            scores[dimension] = [round(float(score), 2) for score in normalized]
+
+        return scores
+
+    @staticmethod
+    def score_big_five(answers: List[Dict[str, Any]], config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Vectorized equivalent of BigFiveScorer.calculate_scores"""
+        factor_arrays = VectorizedScorer._dimension_scores(
+            answers, config.get("factors", {}), config.get("reverse_scored", {}), default=50.0
+        )
+
+        results = []
+        for i in range(len(answers)):
+            factor_scores = {factor: scores[i] for factor, scores in factor_arrays.items()}
+            results.append({
+                "algorithm": "big_five",
+                "factor_scores": factor_scores,
+                "percentile_scores": {
+                    factor: BigFiveScorer._score_to_percentile(score)
+                    for factor, score in factor_scores.items()
+                },
+                "profile": BigFiveScorer._determine_profile(factor_scores),
+                "interpretation": BigFiveScorer._get_interpretation(factor_scores),
+                "subscale_scores": factor_scores
+            })
+
+        return results
+
+    @staticmethod
+    def score_mbti(answers: List[Dict[str, Any]], config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Vectorized equivalent of MBTIScorer.calculate_scores"""
+        dimension_arrays = VectorizedScorer._dimension_scores(
+            answers, config.get("dimensions", {}), config.get("reverse_scored", {}), default=50.0
+        )
+
+        results = []
+        for i in range(len(answers)):
+            dimension_scores = {dimension: scores[i] for dimension, scores in dimension_arrays.items()}
+            mbti_type = MBTIScorer._determine_type(dimension_scores)
+            results.append({
+                "algorithm": "mbti",
+                "dimension_scores": dimension_scores,
+                "mbti_type": mbti_type,
+                "type_description": MBTIScorer.TYPE_DESCRIPTIONS.get(mbti_type, ""),
+                "interpretation": MBTIScorer._get_interpretation(mbti_type, dimension_scores),
+                "subscale_scores": dimension_scores
+            })
+
+        return results
+
+    @staticmethod
+    def score_disc(answers: List[Dict[str, Any]], config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Vectorized equivalent of DISCScorer.calculate_scores (no reverse keying)"""
+        dimension_arrays = VectorizedScorer._dimension_scores(
+            answers, config.get("dimensions", {}), {}, default=25.0
+        )
+
+        results = []
+        for i in range(len(answers)):
+            dimension_scores = {dimension: scores[i] for dimension, scores in dimension_arrays.items()}
+            primary_style, secondary_style = DISCScorer._determine_styles(dimension_scores)
+            results.append({
+                "algorithm": "disc",
+                "dimension_scores": dimension_scores,
+                "primary_style": primary_style,
+                "secondary_style": secondary_style,
+                "style_combination": f"{primary_style}{secondary_style}" if secondary_style else primary_style,
+                "interpretation": DISCScorer._get_interpretation(dimension_scores, primary_style, secondary_style),
+                "behavioral_insights": DISCScorer._get_behavioral_insights(primary_style, secondary_style),
+                "subscale_scores": dimension_scores
+            })
+
+        return results
+
+    @staticmethod
+    def score_chunk(
+        answers: List[Dict[str, Any]],
+        algorithm: str = "generic",
+        config: Optional[Any] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Score a chunk of answer dicts with the configured algorithm
+
+        Args:
+            answers: AssessmentResponse.responses values, one per response
+            algorithm: Scoring algorithm name
+            config: AssessmentScoringConfig (required for non-generic algorithms)
+
+        Returns:
+            Score dicts in the same order as ``answers``
+        """
+        if not answers:
+            return []
+
+        if algorithm == "generic" or config is None:
+            return VectorizedScorer.score_generic(answers)
+
+        if algorithm == "big_five":
+            return VectorizedScorer.score_big_five(answers, config.config)
+        if algorithm == "mbti":
+            return VectorizedScorer.score_mbti(answers, config.config)
+        if algorithm == "disc":
+            return VectorizedScorer.score_disc(answers, config.config)
+
+        raise ValueError(f"Unknown scoring algorithm: {algorithm}")
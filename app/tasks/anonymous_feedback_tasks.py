@@ -1,10 +1,14 @@
 from celery import Celery
+from sqlalchemy import and_, or_, tuple_
 from sqlalchemy.orm import Session
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+from collections import Counter, defaultdict
+import asyncio
 import logging
 from datetime import datetime, timedelta
 
-from app.core.database import get_db
+from app.core.cache import redis_client
+from app.core.database import get_db, AsyncSessionLocal, SessionLocal
 from app.services.email_service import email_service
 from app.core.config import settings
 
@@ -329,7 +333,7 @@ def follow_up_on_pending_feedback() -> Dict[str, Any]:
                 ).all()
 
                 # Prepare escalation email
-                email_subject = f"⚠️ ESCALATION: Overdue Anonymous Feedback Review"
+                email_subject = "⚠️ ESCALATION: Overdue Anonymous Feedback Review"
 
                 email_content = f"""
                 ESCALATION NOTICE
@@ -403,6 +407,367 @@ def follow_up_on_pending_feedback() -> Dict[str, Any]:
         db.close()
 
 
+# =================================================================
+# BATCHED JOB MODE
+# =================================================================
+# The per-org tasks above issue several queries and one email per contact
+# per organization. The batched tasks below pull matching feedback across all
+# organizations with one keyset-paginated query, load recipients in bulk,
+# group items by reviewer and hand everything to a single bulk send.
+
+FEEDBACK_OVERDUE_TIMEFRAMES = {
+    'critical': timedelta(hours=24),
+    'high': timedelta(days=3),
+    'medium': timedelta(days=7),
+    'low': timedelta(days=14)
+}
+
+NOTIFICATION_RUN_TTL = 7 * 24 * 3600
+
+
+def _iter_feedback_pages(db: Session, criteria, page_size: int) -> Iterator[List[Tuple]]:
+    """
+    Yield pages of lightweight feedback rows matching ``criteria``, ordered by
+    (submitted_at, id) and paginated by keyset rather than OFFSET
+    """
+    from app.db.models.anonymous_feedback import AnonymousFeedback
+
+    last_key = None
+
+    while True:
+        query = db.query(
+            AnonymousFeedback.id,
+            AnonymousFeedback.organization_id,
+            AnonymousFeedback.assigned_reviewer_id,
+            AnonymousFeedback.category,
+            AnonymousFeedback.severity,
+            AnonymousFeedback.status,
+            AnonymousFeedback.submitted_at
+        ).filter(criteria)
+
+        if last_key is not None:
+            query = query.filter(
+                tuple_(AnonymousFeedback.submitted_at, AnonymousFeedback.id) > last_key
+            )
+
+        page = query.order_by(
+            AnonymousFeedback.submitted_at,
+            AnonymousFeedback.id
+        ).limit(page_size).all()
+
+        if not page:
+            return
+
+        yield page
+
+        if len(page) < page_size:
+            return
+
+        last_key = (page[-1].submitted_at, page[-1].id)
+
+
+def _group_feedback_by_reviewer(db: Session, pages: Iterator[List[Tuple]]) -> Dict[str, List[Tuple]]:
+    """
+    Group feedback rows by recipient email. Items with an assigned reviewer go
+    to that reviewer; unassigned items go to the organization's active
+    contacts. Recipients are loaded with one query per page for any
+    organizations or reviewers not seen yet.
+    """
+    from app.db.models.user import User
+
+    org_contacts: Dict[str, List[str]] = {}
+    reviewer_emails: Dict[str, Optional[str]] = {}
+    grouped: Dict[str, List[Tuple]] = defaultdict(list)
+
+    for page in pages:
+        new_orgs = {row.organization_id for row in page} - org_contacts.keys()
+        new_reviewers = {
+            row.assigned_reviewer_id for row in page if row.assigned_reviewer_id
+        } - reviewer_emails.keys()
+
+        if new_orgs or new_reviewers:
+            users = db.query(User.id, User.email, User.organization_id).filter(
+                User.is_active == True,
+                or_(
+                    User.organization_id.in_(new_orgs),
+                    User.id.in_(new_reviewers)
+                )
+            ).all()
+
+            for org_id in new_orgs:
+                org_contacts[org_id] = []
+            for reviewer_id in new_reviewers:
+                reviewer_emails[reviewer_id] = None
+
+            for user in users:
+                if user.organization_id in new_orgs:
+                    org_contacts[user.organization_id].append(user.email)
+                if user.id in new_reviewers:
+                    reviewer_emails[user.id] = user.email
+
+        for row in page:
+            reviewer_email = reviewer_emails.get(row.assigned_reviewer_id) if row.assigned_reviewer_id else None
+            recipients = [reviewer_email] if reviewer_email else org_contacts[row.organization_id]
+            for email in recipients:
+                grouped[email].append(row)
+
+    return grouped
+
+
+def _claim_notification(run_id: str, kind: str, email: str) -> bool:
+    """
+    Record that ``email`` is notified in this run. Returns False if it already
+    was, so re-running a run ID never sends the same notification twice.
+    """
+    if not redis_client:
+        logger.warning("Redis unavailable - batched feedback notifications are not deduplicated")
+        return True
+
+    key = f"feedback_notifications:{kind}:{run_id}:{email}"
+    return bool(redis_client.set(key, 1, nx=True, ex=NOTIFICATION_RUN_TTL))
+
+
+def _release_notification(run_id: str, kind: str, email: str) -> None:
+    """Release a claim so a failed send can be retried by the same run ID"""
+    if redis_client:
+        redis_client.delete(f"feedback_notifications:{kind}:{run_id}:{email}")
+
+
+def _send_claimed(run_id: str, kind: str, messages: List[Dict[str, str]]) -> int:
+    """
+    Bulk send claimed messages and release the claim of every message that
+    was not delivered, so re-running the run ID retries only those
+    """
+    if not messages:
+        return 0
+
+    delivered = [False] * len(messages)
+    try:
+        delivered = asyncio.run(email_service.send_bulk_email(messages))
+    finally:
+        for message, ok in zip(messages, delivered):
+            if not ok:
+                _release_notification(run_id, kind, message['email_to'])
+
+    return sum(delivered)
+
+
+def _claim_and_send(run_id: str, kind: str, messages: List[Dict[str, str]]) -> Tuple[int, int]:
+    """
+    Claim each recipient for this run and bulk send to the newly claimed ones.
+    Messages must be fully built first: a claim is only ever held for a
+    message that is about to be sent, and every claim taken here is released
+    again if claiming fails part way through or the message is not delivered.
+
+    Returns:
+        (sent, skipped_already_sent)
+    """
+    claimed = []
+    skipped = 0
+    try:
+        for message in messages:
+            if _claim_notification(run_id, kind, message['email_to']):
+                claimed.append(message)
+            else:
+                skipped += 1
+    except Exception:
+        for message in claimed:
+            _release_notification(run_id, kind, message['email_to'])
+        raise
+
+    return _send_claimed(run_id, kind, claimed), skipped
+
+
+def _digest_body(items: List[Tuple]) -> str:
+    """Daily digest text for one recipient"""
+    severity_counts = Counter(item.severity for item in items)
+    category_counts = Counter(item.category for item in items)
+    pending_critical = [item for item in items if item.severity in ['critical', 'high']]
+
+    body = f"""
+        Daily Anonymous Feedback Summary
+
+        Total New Submissions: {len(items)}
+
+        Severity Breakdown:
+        """
+    for severity, count in severity_counts.items():
+        body += f"- {severity.title()}: {count}\n"
+
+    body += "\nCategory Breakdown:\n"
+    for category, count in category_counts.items():
+        body += f"- {category.replace('_', ' ').title()}: {count}\n"
+
+    if pending_critical:
+        body += f"\n⚠️  High Priority Items Requiring Immediate Review ({len(pending_critical)}):\n"
+        for item in pending_critical:
+            body += f"- {item.category.title()} ({item.severity.upper()}) - Submitted {item.submitted_at.isoformat()}\n"
+
+    body += f"""
+
+        Review Dashboard: {settings.FRONTEND_URL}/hr/anonymous-feedback
+
+        Note: All feedback is completely anonymous. Focus on addressing issues, not identifying sources.
+        """
+    return body
+
+
+def _escalation_body(items: List[Tuple], current_time: datetime) -> str:
+    """Overdue-feedback escalation text for one recipient"""
+    body = f"""
+        ESCALATION NOTICE
+
+        The following anonymous feedback items are overdue for review:
+
+        Total Overdue Items: {len(items)}
+
+        """
+    for item in items:
+        days_overdue = (current_time - item.submitted_at).days
+        body += f"""
+            - {item.category.title()} ({item.severity.upper()})
+              Severity: {item.severity}
+              Submitted: {item.submitted_at.strftime('%Y-%m-%d')}
+              Days Overdue: {days_overdue}
+              Status: {item.status}
+            """
+
+    body += f"""
+
+        Immediate Action Required:
+        1. Review all overdue items immediately
+        2. Update status and add investigation notes
+        3. Escalate to senior leadership if needed
+
+        Review Dashboard: {settings.FRONTEND_URL}/hr/anonymous-feedback
+
+        This is an automated escalation due to missed review deadlines.
+        """
+    return body
+
+
+@celery_app.task(name="send_daily_feedback_digest_batched")
+def send_daily_feedback_digest_batched(run_id: Optional[str] = None, page_size: int = 1000) -> Dict[str, Any]:
+    """
+    Send yesterday's feedback digest for every organization in one pass
+
+    Each recipient receives a single digest covering all items routed to them.
+    Re-running with the same ``run_id`` skips recipients already notified.
+    """
+    db = None
+    try:
+        db = SessionLocal()
+
+        from app.db.models.anonymous_feedback import AnonymousFeedback
+
+        yesterday = datetime.utcnow() - timedelta(days=1)
+        start_of_day = yesterday.replace(hour=0, minute=0, second=0, microsecond=0)
+        end_of_day = yesterday.replace(hour=23, minute=59, second=59, microsecond=999999)
+        run_id = run_id or f"digest-{start_of_day.date().isoformat()}"
+
+        criteria = and_(
+            AnonymousFeedback.submitted_at >= start_of_day,
+            AnonymousFeedback.submitted_at <= end_of_day
+        )
+        grouped = _group_feedback_by_reviewer(db, _iter_feedback_pages(db, criteria, page_size))
+
+        # Build every message before claiming any recipient
+        messages = [
+            {
+                "email_to": email,
+                "subject": "Daily Anonymous Feedback Digest",
+                "body": _digest_body(items)
+            }
+            for email, items in grouped.items()
+        ]
+        sent_count, skipped = _claim_and_send(run_id, "digest", messages)
+
+        logger.info(
+            f"Batched feedback digest {run_id}: {sent_count} sent, "
+            f"{skipped} already notified, {len(grouped)} recipients"
+        )
+
+        return {
+            "success": True,
+            "run_id": run_id,
+            "recipients": len(grouped),
+            "digests_sent": sent_count,
+            "skipped_already_sent": skipped
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to send batched feedback digest: {e}")
+        return {"success": False, "error": str(e)}
+    finally:
+        if db is not None:
+            db.close()
+
+
+@celery_app.task(name="follow_up_on_pending_feedback_batched")
+def follow_up_on_pending_feedback_batched(run_id: Optional[str] = None, page_size: int = 1000) -> Dict[str, Any]:
+    """
+    Escalate overdue feedback for every organization in one pass
+
+    Overdue items for all severities are read with one keyset-paginated query,
+    grouped by reviewer and sent as one escalation per recipient.
+    Re-running with the same ``run_id`` skips recipients already notified.
+    """
+    db = None
+    try:
+        db = SessionLocal()
+
+        from app.db.models.anonymous_feedback import AnonymousFeedback
+
+        current_time = datetime.utcnow()
+        run_id = run_id or f"follow-up-{current_time.date().isoformat()}"
+
+        criteria = and_(
+            AnonymousFeedback.status.in_(['pending_review', 'investigating']),
+            or_(*[
+                and_(
+                    AnonymousFeedback.severity == severity,
+                    AnonymousFeedback.submitted_at <= current_time - timeframe
+                )
+                for severity, timeframe in FEEDBACK_OVERDUE_TIMEFRAMES.items()
+            ])
+        )
+        grouped = _group_feedback_by_reviewer(db, _iter_feedback_pages(db, criteria, page_size))
+
+        overdue_ids = {item.id for items in grouped.values() for item in items}
+
+        # Build every message before claiming any recipient
+        messages = [
+            {
+                "email_to": email,
+                "subject": "⚠️ ESCALATION: Overdue Anonymous Feedback Review",
+                "body": _escalation_body(items, current_time)
+            }
+            for email, items in grouped.items()
+        ]
+        sent_count, skipped = _claim_and_send(run_id, "follow-up", messages)
+
+        logger.info(
+            f"Batched feedback follow-up {run_id}: {len(overdue_ids)} overdue items, "
+            f"{sent_count} escalations sent, {skipped} already notified"
+        )
+
+        return {
+            "success": True,
+            "run_id": run_id,
+            "overdue_items": len(overdue_ids),
+            "recipients": len(grouped),
+            "escalations_sent": sent_count,
+            "skipped_already_sent": skipped
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to process batched feedback follow-up: {e}")
+        return {"success": False, "error": str(e)}
+    finally:
+        if db is not None:
+            db.close()
+
+
 @celery_app.task(name="generate_monthly_anonymous_feedback_report")
 def generate_monthly_anonymous_feedback_report(organization_id: str) -> Dict[str, Any]:
     """
@@ -416,11 +781,15 @@ def generate_monthly_anonymous_feedback_report(organization_id: str) -> Dict[str
         from app.services.anonymous_feedback_service import anonymous_feedback_service
 
         # Get monthly statistics
-        stats = await anonymous_feedback_service.get_anonymous_feedback_statistics(
-            db=db,
-            organization_id=organization_id,
-            days_back=30
-        )
+        async def load_statistics():
+            async with AsyncSessionLocal() as session:
+                return await anonymous_feedback_service.get_anonymous_feedback_statistics(
+                    db=session,
+                    organization_id=organization_id,
+                    days_back=30
+                )
+
+        stats = asyncio.run(load_statistics())
 
         # Get organization details
         from app.db.models.organization import Organization
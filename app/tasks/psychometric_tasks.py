@@ -4,15 +4,30 @@
 # ============================================================================
 
 from celery import shared_task
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import logging
-from app.services.psychometric_service import PsychometricService
-from app.db.session import get_db
+from ai.pattern_recognition import AnomalyDetector, ChangePointState, PopulationAnomalyModel
+from app.core.cache import cache_get, cache_set
+from app.services.model_registry import anomaly_model_name, model_registry
+from app.core.database import SessionLocal
 from app.db.models.psychometric_session import PsychometricSession, ProgressReport
 
 logger = logging.getLogger(__name__)
 
+
+def _psychometric_service():
+    """
+    Build a PsychometricService
+
+    Imported here rather than at module level: the service pulls in the NLP
+    stack (textblob, spacy, transformers), which only the session analysis
+    and progress report tasks need. A worker without it must still register and run the rest.
+    """
+    from app.services.psychometric_service import PsychometricService
+    return PsychometricService()
+
+
 @shared_task(name="analyze_session_async")
 def analyze_session_async(
     session_text: str,
@@ -22,7 +37,7 @@ def analyze_session_async(
 ):
     """Async task to analyze therapy session"""
     try:
-        service = PsychometricService()
+        service = _psychometric_service()
         
         result = service.analyze_client_session(
             session_text,
@@ -32,7 +47,7 @@ def analyze_session_async(
         )
         
         # Store results in database
-        with get_db() as db:
+        with SessionLocal() as db:
             session = PsychometricSession(
                 client_id=client_id,
                 session_date=datetime.fromisoformat(session_date),
@@ -62,10 +77,10 @@ def generate_progress_report_async(
 ):
     """Async task to generate progress report"""
     try:
-        service = PsychometricService()
+        service = _psychometric_service()
         
         # Fetch session analyses from database
-        with get_db() as db:
+        with SessionLocal() as db:
             sessions = db.query(PsychometricSession).filter(
                 PsychometricSession.client_id == client_id,
                 PsychometricSession.session_date >= datetime.fromisoformat(start_date),
@@ -92,7 +107,7 @@ def generate_progress_report_async(
         )
         
         # Store report
-        with get_db() as db:
+        with SessionLocal() as db:
             progress_report = ProgressReport(
                 client_id=client_id,
                 start_date=datetime.fromisoformat(start_date),
@@ -115,48 +130,123 @@ def generate_progress_report_async(
         logger.error(f"Progress report task failed: {e}")
         raise
 
+# Per-client change-detector state lives in the cache between runs
+CHANGE_STATE_KEY = "anomaly:change_state:{client_id}"
+CHANGE_STATE_TTL = 90 * 24 * 3600
+ANOMALY_FEATURES = ["sentiment"]
+
+
+def _session_data_points(sessions) -> List[Dict]:
+    return [
+        {
+            "timestamp": s.session_date.isoformat(),
+            "sentiment": s.sentiment_analysis.get("overall_score", 0),
+            "dominant_emotion": s.emotion_analysis.get("dominant_emotion", "neutral")
+        }
+        for s in sessions
+    ]
+
+
+@shared_task(name="train_anomaly_model")
+def train_anomaly_model(
+    scope: str = "all",
+    client_ids: Optional[List[str]] = None,
+    feature_keys: Optional[List[str]] = None,
+    days: int = 90
+):
+    """
+    Fit a population anomaly model for a scope (an organization's clients,
+    or everyone) and publish it to the model registry. Runs on a schedule;
+    detect_anomalies_batch then scores new sessions against the published
+    model instead of refitting per client.
+    """
+    feature_keys = feature_keys or ANOMALY_FEATURES
+    try:
+        with SessionLocal() as db:
+            query = db.query(PsychometricSession).filter(
+                PsychometricSession.session_date >= datetime.utcnow() - timedelta(days=days)
+            )
+            if client_ids:
+                query = query.filter(PsychometricSession.client_id.in_(client_ids))
+            data_points = _session_data_points(query.all())
+        
+        if len(data_points) < 10:
+            logger.warning(f"Not enough sessions to train anomaly model for {scope}: {len(data_points)}")
+            return {"status": "skipped", "scope": scope, "data_points": len(data_points)}
+        
+        model = PopulationAnomalyModel(feature_keys).fit(data_points)
+        name = anomaly_model_name(scope, feature_keys)
+        version = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+        model_registry.publish(name, model, version)
+        
+        logger.info(f"Trained anomaly model {name} version {version} on {len(data_points)} sessions")
+        return {"status": "success", "model": name, "version": version, "data_points": len(data_points)}
+        
+    except Exception as e:
+        logger.error(f"Anomaly model training failed for {scope}: {e}")
+        raise
+
+
 @shared_task(name="detect_anomalies_batch")
-def detect_anomalies_batch(client_ids: List[str]):
-    """Batch anomaly detection for multiple clients"""
+def detect_anomalies_batch(client_ids: List[str], scope: str = "all"):
+    """
+    Batch anomaly detection for multiple clients
+    
+    Only sessions recorded since a client's previous run are fetched. They
+    are scored against the scope's population model, when one has been
+    published, and folded into the client's streaming change-detector state;
+    without a population model the client's last 30 days are refit as before.
+    """
     try:
-        service = PsychometricService()
+        detector = AnomalyDetector()
+        loaded = model_registry.get(anomaly_model_name(scope, ANOMALY_FEATURES))
+        population_model = loaded.predictor if loaded else None
         results = {}
         
         for client_id in client_ids:
-            # Fetch recent sessions
-            with get_db() as db:
+            state_key = CHANGE_STATE_KEY.format(client_id=client_id)
+            state = ChangePointState.from_dict(cache_get(state_key))
+            since = (
+                datetime.fromisoformat(state.last_timestamp)
+                if population_model is not None and state.last_timestamp
+                else datetime.utcnow() - timedelta(days=30)
+            )
+            
+            # Fetch sessions not yet seen
+            with SessionLocal() as db:
                 sessions = db.query(PsychometricSession).filter(
                     PsychometricSession.client_id == client_id,
-                    PsychometricSession.session_date >= datetime.utcnow() - timedelta(days=30)
-                ).all()
+                    PsychometricSession.session_date > since
+                ).order_by(PsychometricSession.session_date).all()
             
-            if len(sessions) < 10:
+            if not sessions or (population_model is None and len(sessions) < 10):
                 continue
             
             # Prepare data points
-            data_points = [
-                {
-                    "timestamp": s.session_date.isoformat(),
-                    "sentiment": s.sentiment_analysis.get("overall_score", 0),
-                    "dominant_emotion": s.emotion_analysis.get("dominant_emotion", "neutral")
-                }
-                for s in sessions
-            ]
+            data_points = _session_data_points(sessions)
             
             # Detect anomalies
-            anomalies = service.anomaly_detector.detect_anomalies(
+            anomalies = detector.detect_anomalies(
                 data_points,
-                ["sentiment"]
+                ANOMALY_FEATURES,
+                population_model=population_model
+            )
+            
+            # Sudden changes, continuing from the stored detector state
+            new_sessions = [s for s in sessions if not state.last_timestamp or s.session_date.isoformat() > state.last_timestamp]
+            changes = detector.detect_sudden_changes(
+                [p["sentiment"] for p in _session_data_points(new_sessions)],
+                [s.session_date for s in new_sessions],
+                state=state
             )
+            cache_set(state_key, changes.pop("state").to_dict(), expire=CHANGE_STATE_TTL)
             
-            if anomalies.get("anomalies_detected", 0) > 0:
-                results[client_id] = anomalies
-                logger.warning(f"Anomalies detected for client {client_id}: {anomalies['anomalies_detected']}")
+            if anomalies.get("anomalies_detected", 0) > 0 or changes.get("changes_detected", 0) > 0:
+                results[client_id] = {**anomalies, "sudden_changes": changes}
+                logger.warning(f"Anomalies detected for client {client_id}: {anomalies.get('anomalies_detected', 0)}")
         
         return results
         
     except Exception as e:
         logger.error(f"Batch anomaly detection failed: {e}")
         raise
-
-
@@ -3,10 +3,13 @@ File Path: app/tasks/scoring_scheduler.py
 Celery tasks for scheduled background processing
 Handles assessment scoring, report generation, and notifications
 """
-from celery import Task
+from celery import Task, chord
+from sqlalchemy import Integer, Text, JSON, cast, column, update, values
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+import asyncio
+import json
 import logging
 
 from app.core.celery_worker import celery_app
@@ -18,14 +21,19 @@ from app.db.models.assessment import (
 )
 from app.db.models.user import User
 from app.core.config import settings
-# AssessmentService import - will be implemented when service exists
+# AssessmentService import - will be implemented when service exists.
+# The module does not compile yet; that must not keep these tasks from
+# registering with the worker.
 try:
     from app.services.assessment_service import AssessmentService
-except ImportError:
+except (ImportError, SyntaxError):
     AssessmentService = None
 
 logger = logging.getLogger(__name__)
 
+BULK_SCORING_CHUNK_SIZE = 2000
+REPORT_RENDER_CHUNK_SIZE = 25
+
 
 class DatabaseTask(Task):
     """Base task with database session management"""
@@ -150,6 +158,194 @@ def calculate_assessment_scores(
             }
 
 
+def _get_scoring_config(db: Session, assessment_id: int):
+    """Load the scoring configuration for an assessment, if any"""
+    from app.db.models.scoring import AssessmentScoringConfig
+    
+    return db.query(AssessmentScoringConfig).filter(
+        AssessmentScoringConfig.assessment_id == assessment_id
+    ).first()
+
+
+def _write_scores(db: Session, scored: List[tuple], scored_at: datetime) -> None:
+    """
+    Write a chunk of scores with a single UPDATE ... FROM (VALUES ...)
+    
+    Args:
+        db: Database session
+        scored: List of (response_id, score_data) tuples
+        scored_at: Timestamp stored on every row
+    """
+    scored_rows = values(
+        column('id', Integer),
+        column('score_data', Text),
+        name='scored_rows'
+    ).data([
+        (response_id, json.dumps(score_data, default=str))
+        for response_id, score_data in scored
+    ])
+    
+    db.execute(
+        update(AssessmentResponse)
+        .where(AssessmentResponse.id == scored_rows.c.id)
+        .values(
+            score_data=cast(scored_rows.c.score_data, JSON),
+            scored_at=scored_at
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def bulk_score_assessment(
+    db: Session,
+    assessment_id: int,
+    response_ids: Optional[List[int]] = None,
+    chunk_size: int = BULK_SCORING_CHUNK_SIZE
+) -> Dict[str, Any]:
+    """
+    Score every completed response of an assessment in chunks
+    
+    Responses are streamed by keyset pagination on id, selecting only the id
+    and the answer JSON. Each chunk is scored with VectorizedScorer, written
+    back with one bulk UPDATE and committed on its own, so memory stays
+    bounded and progress survives a failure part-way through.
+    
+    Args:
+        db: Database session
+        assessment_id: Assessment ID
+        response_ids: Optional list of specific response IDs to score
+        chunk_size: Responses per chunk
+    
+    Returns:
+        Dict with scoring results
+    """
+    from app.services.scoring.vectorized_scorer import VectorizedScorer
+    
+    config = _get_scoring_config(db, assessment_id)
+    algorithm = config.algorithm if config else "generic"
+    
+    scored_count = 0
+    total_count = 0
+    chunks = 0
+    errors = []
+    last_id = 0
+    
+    while True:
+        query = db.query(
+            AssessmentResponse.id,
+            AssessmentResponse.responses
+        ).filter(
+            AssessmentResponse.assessment_id == assessment_id,
+            AssessmentResponse.completed_at.isnot(None),
+            AssessmentResponse.id > last_id
+        )
+        
+        if response_ids:
+            query = query.filter(AssessmentResponse.id.in_(response_ids))
+        
+        rows = query.order_by(AssessmentResponse.id).limit(chunk_size).all()
+        
+        if not rows:
+            break
+        
+        last_id = rows[-1].id
+        total_count += len(rows)
+        chunks += 1
+        
+        try:
+            scores = VectorizedScorer.score_chunk(
+                [row.responses for row in rows],
+                algorithm=algorithm,
+                config=config
+            )
+            _write_scores(db, list(zip((row.id for row in rows), scores)), datetime.utcnow())
+            db.commit()
+            scored_count += len(rows)
+        
+        except Exception as e:
+            db.rollback()
+            logger.error(
+                f"Error scoring chunk ending at response {last_id} "
+                f"for assessment {assessment_id}: {str(e)}"
+            )
+            errors.append({
+                'first_response_id': rows[0].id,
+                'last_response_id': last_id,
+                'error': str(e)
+            })
+        
+        if len(rows) < chunk_size:
+            break
+    
+    logger.info(
+        f"Bulk scored assessment {assessment_id}: "
+        f"{scored_count}/{total_count} responses in {chunks} chunks"
+    )
+    
+    return {
+        'status': 'success' if not errors else 'partial',
+        'assessment_id': assessment_id,
+        'algorithm': algorithm,
+        'responses_scored': scored_count,
+        'total_responses': total_count,
+        'chunks': chunks,
+        'errors': errors
+    }
+
+
+@celery_app.task(
+    base=DatabaseTask,
+    bind=True,
+    name="tasks.bulk_calculate_assessment_scores",
+    max_retries=3,
+    default_retry_delay=60
+)
+def bulk_calculate_assessment_scores(
+    self,
+    assessment_ids: List[int],
+    chunk_size: int = BULK_SCORING_CHUNK_SIZE
+) -> Dict[str, Any]:
+    """
+    Set-based rescoring of one or more assessments
+    
+    Use this instead of calculate_assessment_scores for large cohorts,
+    e.g. rescoring after a norms update.
+    
+    Args:
+        assessment_ids: Assessment IDs to rescore
+        chunk_size: Responses per chunk
+    
+    Returns:
+        Per-assessment scoring results
+    """
+    try:
+        logger.info(f"Starting bulk scoring for {len(assessment_ids)} assessments")
+        
+        results = [
+            bulk_score_assessment(self.db, assessment_id, chunk_size=chunk_size)
+            for assessment_id in assessment_ids
+        ]
+        
+        return {
+            'status': 'success',
+            'assessments': results,
+            'responses_scored': sum(r['responses_scored'] for r in results),
+            'total_responses': sum(r['total_responses'] for r in results)
+        }
+        
+    except Exception as e:
+        logger.error(f"Error in bulk_calculate_assessment_scores: {str(e)}")
+        
+        try:
+            raise self.retry(exc=e)
+        except Exception:
+            return {
+                'status': 'error',
+                'message': str(e),
+                'assessment_ids': assessment_ids
+            }
+
+
 @celery_app.task(
     base=DatabaseTask,
     bind=True,
@@ -158,13 +354,16 @@ def calculate_assessment_scores(
 )
 def process_assessment_batch(
     self,
-    assessment_ids: List[int]
+    assessment_ids: List[int],
+    bulk: bool = False
 ) -> Dict[str, Any]:
     """
     Process multiple assessments in batch
     
     Args:
         assessment_ids: List of assessment IDs to process
+        bulk: Score all assessments in one set-based task instead of
+            starting one calculate_assessment_scores task per assessment
     
     Returns:
         Batch processing results
@@ -172,6 +371,17 @@ def process_assessment_batch(
     try:
         logger.info(f"Processing batch of {len(assessment_ids)} assessments")
         
+        if bulk:
+            result = bulk_calculate_assessment_scores.delay(assessment_ids)
+            return {
+                'status': 'success',
+                'batch_size': len(assessment_ids),
+                'tasks_started': [{
+                    'assessment_ids': assessment_ids,
+                    'task_id': result.id
+                }]
+            }
+        
         results = []
         for assessment_id in assessment_ids:
             result = calculate_assessment_scores.delay(assessment_id)
@@ -443,6 +653,370 @@ def generate_daily_reports(self) -> Dict[str, Any]:
         }
 
 
+@celery_app.task(
+    base=DatabaseTask,
+    bind=True,
+    name="tasks.generate_organization_reports"
+)
+def generate_organization_reports(
+    self,
+    organization_id: str,
+    days_back: int = 31,
+    chunk_size: int = REPORT_RENDER_CHUNK_SIZE
+) -> Dict[str, Any]:
+    """
+    Render progress reports for every active member of an organization,
+    plus an outcome summary
+    
+    The reports are split into chunks rendered by render_report_chunk
+    subtasks, so the prefork workers on the reports queue render them in
+    parallel; this task is replaced by the chord, and its result is the
+    summary built by summarize_organization_reports. Reports whose inputs
+    are unchanged since an earlier run are reused from the report store.
+    
+    Args:
+        organization_id: Organization ID
+        days_back: Window of completed assessments to report on
+        chunk_size: Reports per render subtask
+    
+    Returns:
+        Counts of rendered, cached and failed reports
+    """
+    from dataclasses import asdict
+    from app.services.report_rendering_service import ReportJob
+    
+    try:
+        db = self.db
+        since = datetime.utcnow() - timedelta(days=days_back)
+        
+        members = db.query(User.id, User.full_name).filter(
+            User.organization_id == organization_id,
+            User.is_active.is_(True)
+        ).all()
+        rows = db.query(
+            AssessmentResponse.respondent_id,
+            AssessmentResponse.completed_at,
+            AssessmentResponse.score_data,
+            Assessment.title
+        ).join(
+            Assessment, Assessment.id == AssessmentResponse.assessment_id
+        ).join(
+            User, User.id == AssessmentResponse.respondent_id
+        ).filter(
+            User.organization_id == organization_id,
+            User.is_active.is_(True),
+            AssessmentResponse.completed_at >= since
+        ).order_by(
+            AssessmentResponse.respondent_id,
+            AssessmentResponse.completed_at
+        ).all()
+        
+        scores_by_client: Dict[Any, List[Dict[str, Any]]] = {}
+        for respondent_id, completed_at, score_data, title in rows:
+            scores_by_client.setdefault(respondent_id, []).append({
+                'date': completed_at.date().isoformat(),
+                'assessment': title,
+                'score': (score_data or {}).get('total_score')
+            })
+        
+        jobs = []
+        outcomes = []
+        for member_id, full_name in members:
+            scores = scores_by_client.get(member_id, [])
+            jobs.append(ReportJob(
+                kind='client_progress',
+                label=str(member_id),
+                payload={
+                    'client_info': {'client_id': str(member_id), 'name': full_name},
+                    'assessment_scores': scores,
+                    'session_summary': {}
+                }
+            ))
+            member_scores = [s['score'] for s in scores if s['score'] is not None]
+            if member_scores:
+                baseline, current = member_scores[0], member_scores[-1]
+                improvement = (baseline - current) / baseline * 100 if baseline > 0 else 0.0
+                outcomes.append({
+                    'client_id': str(member_id),
+                    'assessments': len(member_scores),
+                    'baseline': baseline,
+                    'current': current,
+                    'improvement_pct': round(improvement, 1)
+                })
+        
+        jobs.append(ReportJob(
+            kind='outcome_summary',
+            label=f"organization:{organization_id}",
+            payload={
+                'summary_stats': {
+                    'total_clients': len(members),
+                    'active_clients': len(outcomes),
+                    'avg_improvement': (
+                        sum(o['improvement_pct'] for o in outcomes) / len(outcomes) if outcomes else 0.0
+                    )
+                },
+                'clients_data': outcomes
+            }
+        ))
+        
+        payloads = [asdict(job) for job in jobs]
+        header = [
+            render_report_chunk.s(payloads[start:start + chunk_size], organization_id)
+            for start in range(0, len(payloads), chunk_size)
+        ]
+        logger.info(
+            f"Rendering {len(jobs)} reports for organization {organization_id} in {len(header)} chunks"
+        )
+        
+    except Exception as e:
+        logger.error(f"Error generating reports for organization {organization_id}: {str(e)}")
+        return {
+            'status': 'error',
+            'message': str(e)
+        }
+    
+    return self.replace(chord(header, summarize_organization_reports.s(organization_id)))
+
+
+@celery_app.task(
+    bind=True,
+    name="tasks.render_report_chunk"
+)
+def render_report_chunk(
+    self,
+    jobs: List[Dict[str, Any]],
+    organization_id: str
+) -> List[Dict[str, Any]]:
+    """
+    Render one chunk of an organization's reports in this worker process
+    
+    Progress is published as state PROGRESS with done/total for the chunk.
+    
+    Args:
+        jobs: ReportJob fields, one dict per report
+        organization_id: Organization ID, for progress and logs
+    
+    Returns:
+        RenderedReport fields, one dict per job, in job order
+    """
+    from dataclasses import asdict
+    from app.services.report_rendering_service import ReportJob, report_rendering_service
+    
+    step = max(1, len(jobs) // 10)
+    
+    def progress(done: int, total: int) -> None:
+        if done == total or done % step == 0:
+            self.update_state(state='PROGRESS', meta={
+                'organization_id': organization_id,
+                'done': done,
+                'total': total
+            })
+    
+    # Parallelism comes from the worker processes; threads here would only
+    # contend for the GIL
+    results = report_rendering_service.render_bulk(
+        [ReportJob(**job) for job in jobs], progress=progress, max_workers=1
+    )
+    return [asdict(result) for result in results]
+
+
+@celery_app.task(name="tasks.summarize_organization_reports")
+def summarize_organization_reports(
+    chunks: List[List[Dict[str, Any]]],
+    organization_id: str
+) -> Dict[str, Any]:
+    """
+    Combine the render_report_chunk results of an organization's reports
+    
+    Args:
+        chunks: Chunk results, in chunk order
+        organization_id: Organization ID
+    
+    Returns:
+        Counts of rendered, cached and failed reports
+    """
+    results = [result for chunk in chunks for result in chunk]
+    failed = [r['label'] for r in results if r['error']]
+    cached = sum(1 for r in results if r['cached'])
+    
+    logger.info(
+        f"Organization {organization_id} reports: {len(results) - cached - len(failed)} rendered, "
+        f"{cached} cached, {len(failed)} failed"
+    )
+    
+    return {
+        'status': 'success',
+        'organization_id': organization_id,
+        'total': len(results),
+        'rendered': len(results) - cached - len(failed),
+        'cached': cached,
+        'failed': failed,
+        'summary_report': results[-1]['path']
+    }
+
+
+@celery_app.task(
+    base=DatabaseTask,
+    bind=True,
+    name="tasks.generate_month_end_reports"
+)
+def generate_month_end_reports(self) -> Dict[str, Any]:
+    """
+    Queue report generation for every organization
+    Runs monthly via Celery Beat
+    
+    Returns:
+        Number of organizations queued
+    """
+    from app.db.models.organization import Organization
+    
+    try:
+        organization_ids = [str(org_id) for (org_id,) in self.db.query(Organization.id).all()]
+        for organization_id in organization_ids:
+            generate_organization_reports.delay(organization_id)
+        
+        logger.info(f"Queued month-end reports for {len(organization_ids)} organizations")
+        
+        return {
+            'status': 'success',
+            'organizations_queued': len(organization_ids)
+        }
+        
+    except Exception as e:
+        logger.error(f"Error in generate_month_end_reports: {str(e)}")
+        return {
+            'status': 'error',
+            'message': str(e)
+        }
+
+
+@celery_app.task(
+    base=DatabaseTask,
+    bind=True,
+    name="tasks.export_assessment_responses"
+)
+def export_assessment_responses(
+    self,
+    assessment_id: Optional[int] = None,
+    export_format: str = 'csv'
+) -> Dict[str, Any]:
+    """
+    Export assessment responses for research in constant memory
+    
+    Rows stream from a server-side cursor straight into the file, so the
+    export size is bounded by disk rather than worker memory.
+    
+    Args:
+        assessment_id: Limit to one assessment (default: all)
+        export_format: csv, xlsx or parquet
+    
+    Returns:
+        Export file path and row count
+    """
+    import os
+    from sqlalchemy import select
+    
+    from app.reports.generate_report import StreamingExporter, arrow_schema, iter_query_rows
+    
+    exporters = {
+        'csv': StreamingExporter.export_csv,
+        'parquet': lambda rows, path: StreamingExporter.export_parquet(rows, path, schema=arrow_schema(statement)),
+        'xlsx': lambda rows, path: StreamingExporter.export_excel({'Responses': rows}, path)['Responses'],
+    }
+    if export_format not in exporters:
+        return {
+            'status': 'error',
+            'message': f'Unsupported export format: {export_format}'
+        }
+    
+    try:
+        statement = select(
+            AssessmentResponse.id,
+            AssessmentResponse.assessment_id,
+            AssessmentResponse.respondent_id,
+            AssessmentResponse.status,
+            AssessmentResponse.started_at,
+            AssessmentResponse.completed_at,
+            AssessmentResponse.scored_at,
+            AssessmentResponse.responses,
+            AssessmentResponse.score_data
+        ).order_by(AssessmentResponse.id)
+        if assessment_id is not None:
+            statement = statement.where(AssessmentResponse.assessment_id == assessment_id)
+        
+        export_dir = os.path.join(settings.REPORT_OUTPUT_DIR, 'exports')
+        os.makedirs(export_dir, exist_ok=True)
+        output_file = os.path.join(
+            export_dir,
+            f"assessment_responses_{assessment_id or 'all'}_{datetime.utcnow():%Y%m%d%H%M%S}.{export_format}"
+        )
+        
+        rows = (
+            {**row, 'status': row['status'].value if row['status'] is not None else None}
+            for row in iter_query_rows(self.db, statement)
+        )
+        row_count = exporters[export_format](rows, output_file)
+        
+        logger.info(f"Exported {row_count} assessment responses to {output_file}")
+        
+        return {
+            'status': 'success',
+            'file': output_file,
+            'format': export_format,
+            'rows': row_count
+        }
+        
+    except Exception as e:
+        logger.error(f"Error exporting assessment responses: {str(e)}")
+        return {
+            'status': 'error',
+            'message': str(e)
+        }
+
+
+@celery_app.task(
+    bind=True,
+    name="tasks.maintain_partitions"
+)
+def maintain_partitions(self) -> Dict[str, Any]:
+    """
+    Premake monthly partitions and drop those past retention
+    Runs daily via Celery Beat
+
+    Returns:
+        Partitions created and dropped per table
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+
+    from app.core.config import get_database_url
+    from app.core.partitioning import maintain_partitions as run_maintenance
+
+    async def _run() -> Dict[str, Any]:
+        engine = create_async_engine(get_database_url(async_driver=True), poolclass=NullPool)
+        try:
+            async with engine.connect() as conn:
+                conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+                return await run_maintenance(conn)
+        finally:
+            await engine.dispose()
+
+    try:
+        tables = asyncio.run(_run())
+        logger.info(f"Partition maintenance complete: {tables}")
+        return {
+            'status': 'success',
+            'tables': tables
+        }
+
+    except Exception as e:
+        logger.error(f"Error in maintain_partitions: {str(e)}")
+        return {
+            'status': 'error',
+            'message': str(e)
+        }
+
+
 # =================================================================
 # UTILITY TASKS
 # =================================================================
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Query plan regression benchmarks for PsychSync
+Seeds a synthetic dataset into the query_bench schema, captures EXPLAIN
+(ANALYZE, BUFFERS) for the hot queries and diffs them against the stored
+baseline. Exits non-zero when a plan flips or a query gets slower.
+
+Run against a disposable database (defaults to TEST_DATABASE_URL):
+    python scripts/benchmark_queries.py
+    python scripts/benchmark_queries.py --scale 5 --update-baseline
+"""
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.core.config import settings
+from app.core.query_benchmark import DEFAULT_BASELINE_PATH, SeedScale, run_plan_benchmarks
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="PsychSync query plan regression benchmarks")
+    parser.add_argument("--database-url", default=settings.TEST_DATABASE_URL,
+                        help="Async database URL (default: TEST_DATABASE_URL)")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Dataset scale factor (1.0 = 20k users, 200k responses)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH,
+                        help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Record the current plans and timings as the new baseline")
+    parser.add_argument("--skip-seed", action="store_true",
+                        help="Reuse the already seeded query_bench schema")
+    parser.add_argument("--runs", type=int, default=5,
+                        help="Measured EXPLAIN ANALYZE runs per query")
+    parser.add_argument("--time-tolerance", type=float, default=0.5,
+                        help="Allowed median slowdown before failing (0.5 = 50%%)")
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON")
+    return parser.parse_args()
+
+
+async def main() -> int:
+    """Run the benchmarks and report regressions"""
+    args = parse_args()
+    engine = create_async_engine(args.database_url, echo=False)
+
+    try:
+        report = await run_plan_benchmarks(
+            engine,
+            scale=SeedScale.from_factor(args.scale),
+            baseline_path=args.baseline,
+            update_baseline=args.update_baseline,
+            seed_data=not args.skip_seed,
+            time_tolerance=args.time_tolerance,
+            runs=args.runs
+        )
+    finally:
+        await engine.dispose()
+
+    if args.json:
+        print(json.dumps(report, indent=2, default=str))
+    else:
+        print("\n" + "="*60)
+        print(f"QUERY PLAN BENCHMARKS (PostgreSQL {report['server_version']})")
+        print("="*60)
+        for result in report["results"]:
+            if result["skipped"]:
+                print(f"⚠️  {result['name']}: skipped ({result['skipped']})")
+                continue
+            print(f"{result['name']}: {result['execution_ms']:.2f}ms exec, "
+                  f"{result['planning_ms']:.2f}ms plan, {result['rows']} rows, "
+                  f"{result['shared_hit_blocks'] + result['shared_read_blocks']} buffers")
+            for line in result["plan_signature"]:
+                print(f"    {line}")
+        print("="*60)
+
+        for regression in report["regressions"]:
+            print(f"❌ {regression['query']} [{regression['kind']}]: {regression['detail']}")
+            if regression["kind"] == "plan_changed":
+                print("    baseline:")
+                for line in regression["baseline"] or []:
+                    print(f"      {line}")
+
+        if report["baseline_written"]:
+            print(f"✅ Baseline written to {report['baseline_path']}")
+        elif not report["regressions"]:
+            print("✅ No plan regressions")
+
+    failing = [r for r in report["regressions"] if r["kind"] in ("plan_changed", "slower", "skipped")]
+    return 1 if failing and not report["baseline_written"] else 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(asyncio.run(main()))
+    except KeyboardInterrupt:
+        logger.info("Benchmark cancelled by user")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"Benchmark failed: {e}")
+        sys.exit(1)
@@ -1,4 +1,5 @@
 # app/tests/conftest.py
+import os
 import pytest
 from typing import Generator, Dict
 from fastapi.testclient import TestClient
@@ -7,6 +8,10 @@ from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 from faker import Faker
 
+# Repeated identical queries within a request/task fail the test
+os.environ.setdefault("N_PLUS_ONE_DETECTION", "true")
+os.environ.setdefault("N_PLUS_ONE_RAISE", "true")
+
 from app.main import app
 from app.core.database import Base
 from app.api.deps import get_async_db as get_db
@@ -39,6 +44,14 @@ def db() -> Generator[Session, None, None]:
         db.close()
         Base.metadata.drop_all(bind=engine)
 
+@pytest.fixture
+def no_n_plus_one():
+    """Fail the test if the code under it repeats an identical query too often"""
+    from app.core.query_monitor import n_plus_one_detector
+
+    with n_plus_one_detector.scope("test") as scope:
+        yield scope
+
 @pytest.fixture(scope="function")
 def client(db: Session) -> Generator[TestClient, None, None]:
     """Create test client"""
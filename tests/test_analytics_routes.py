@@ -0,0 +1,170 @@
+"""
+Tests for the registry-backed predictive analytics endpoints
+"""
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("sklearn")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from ai.predictor import DropoutPredictor, OutcomePredictor, generate_synthetic_training_data
+from app.api.deps import get_current_active_user
+from app.api.v1.endpoints import analytics_routes
+from app.services.model_registry import ModelRegistry
+
+CLIENT_FEATURES = {
+    "age": 35,
+    "gender": "female",
+    "baseline_severity": 18.0,
+    "diagnosis_code": "F32.1",
+    "comorbidity_count": 1,
+    "sessions_attended": 8,
+    "homework_completion_rate": 0.4,
+    "therapeutic_alliance_score": 3.0,
+    "medication_adherence": 0.9,
+    "current_severity": 12.0,
+    "weeks_in_treatment": 10,
+    "missed_sessions": 3,
+    "between_session_contacts": 1,
+    "crisis_contacts": 0,
+}
+
+
+@pytest.fixture(scope="module")
+def registry(tmp_path_factory):
+    X, y = generate_synthetic_training_data(n_samples=200)
+    outcome = OutcomePredictor(model_type='linear')
+    outcome.train(X, y)
+    dropout = DropoutPredictor()
+    dropout.train(X, (y < np.median(y)).astype(int))
+
+    registry = ModelRegistry(model_dir=str(tmp_path_factory.mktemp("models")), reload_seconds=3600)
+    registry.publish('outcome', outcome, 'v1')
+    registry.publish('dropout', dropout, 'v2')
+    return registry
+
+
+@pytest.fixture
+def client(registry):
+    app = FastAPI()
+    app.include_router(analytics_routes.router, prefix="/api/v1/analytics")
+    app.dependency_overrides[get_current_active_user] = lambda: SimpleNamespace(id="u1", is_active=True)
+    with patch.object(analytics_routes, "model_registry", registry):
+        yield TestClient(app)
+
+
+@pytest.mark.parametrize("path", [
+    "/api/v1/analytics/predict/outcome",
+    "/api/v1/analytics/predict/dropout",
+    "/api/v1/analytics/predict/bulk",
+    "/api/v1/analytics/predict/trajectory",
+    "/api/v1/analytics/anomaly/detect",
+])
+def test_anonymous_requests_are_rejected(registry, path):
+    from app.api.v1.api import api_router
+
+    app = FastAPI()
+    app.include_router(api_router)
+    with patch.object(analytics_routes, "model_registry", registry):
+        response = TestClient(app).post(path, json={"client_features": CLIENT_FEATURES, "client_id": "c1"})
+
+    assert response.status_code == 401
+
+
+def test_router_is_mounted_under_api_v1():
+    from app.api.v1.api import api_router
+
+    paths = {route.path for route in api_router.routes}
+    assert {"/api/v1/analytics/predict/outcome", "/api/v1/analytics/predict/bulk"} <= paths
+
+
+def test_predict_outcome_uses_registry_model(client):
+    response = client.post("/api/v1/analytics/predict/outcome",
+                           json={"client_features": CLIENT_FEATURES, "client_id": "c1"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["client_id"], body["model_version"]) == ("c1", "v1")
+    assert body["predicted_improvement"] >= 0
+
+
+def test_predict_dropout_reports_risk_and_version(client):
+    response = client.post("/api/v1/analytics/predict/dropout",
+                           json={"client_features": CLIENT_FEATURES, "client_id": "c1"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["model_version"] == "v2"
+    assert 0 <= body["dropout_probability"] <= 1
+    assert body["contributing_factors"]["high_missed_sessions"] is True
+
+
+def test_predict_returns_503_without_published_model(client, tmp_path):
+    with patch.object(analytics_routes, "model_registry", ModelRegistry(model_dir=str(tmp_path))):
+        response = client.post("/api/v1/analytics/predict/outcome", json={"client_features": CLIENT_FEATURES})
+
+    assert response.status_code == 503
+
+
+def test_invalid_features_are_rejected(client):
+    features = {**CLIENT_FEATURES, "gender": "unknown"}
+
+    response = client.post("/api/v1/analytics/predict/outcome", json={"client_features": features})
+
+    assert response.status_code == 422
+
+
+def test_bulk_predict_streams_one_ndjson_line_per_client(client):
+    clients = [
+        {"client_id": f"c{i}", "client_features": {**CLIENT_FEATURES, "missed_sessions": i}}
+        for i in range(5)
+    ]
+
+    with patch.object(analytics_routes, "BULK_CHUNK_SIZE", 2), \
+            client.stream("POST", "/api/v1/analytics/predict/bulk",
+                          json={"model": "dropout", "clients": clients}) as response:
+        lines = list(response.iter_lines())
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["x-model-version"] == "v2"
+    rows = [json.loads(line) for line in lines if line]
+    assert [row["client_id"] for row in rows] == ["c0", "c1", "c2", "c3", "c4"]
+    assert all(0 <= row["dropout_probability"] <= 1 and "risk_level" in row for row in rows)
+
+
+def test_bulk_predict_outcome_rows(client):
+    clients = [{"client_id": "a", "client_features": CLIENT_FEATURES}]
+
+    response = client.post("/api/v1/analytics/predict/bulk", json={"model": "outcome", "clients": clients})
+
+    row = json.loads(response.text)
+    assert response.headers["x-model-version"] == "v1"
+    assert row["client_id"] == "a" and row["predicted_improvement"] >= 0
+
+
+def test_bulk_predict_validates_model_and_clients(client):
+    clients = [{"client_id": "a", "client_features": CLIENT_FEATURES}]
+
+    unknown = client.post("/api/v1/analytics/predict/bulk", json={"model": "churn", "clients": clients})
+    empty = client.post("/api/v1/analytics/predict/bulk", json={"model": "dropout", "clients": []})
+
+    assert (unknown.status_code, empty.status_code) == (422, 422)
+
+
+def test_bulk_predict_caps_clients_per_request():
+    from pydantic import ValidationError
+
+    client = {"client_id": "a", "client_features": CLIENT_FEATURES}
+    schema = analytics_routes.BulkPredictRequest.model_json_schema()
+    assert schema["properties"]["clients"]["maxItems"] == analytics_routes.BULK_MAX_CLIENTS
+
+    with pytest.raises(ValidationError, match="at most"):
+        analytics_routes.BulkPredictRequest(clients=[client] * (analytics_routes.BULK_MAX_CLIENTS + 1))
@@ -0,0 +1,101 @@
+"""
+Tests for anonymous feedback daily rollup maintenance
+"""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.anonymous_feedback_service import AnonymousFeedbackService, FeedbackSubmission
+
+
+def _rollup_deltas(db):
+    """Bucket and counter values of every rollup upsert sent to the session"""
+    deltas = []
+    for call in db.execute.await_args_list:
+        statement = call.args[0]
+        if getattr(statement, 'table', None) is None or statement.table.name != 'anonymous_feedback_daily_rollup':
+            continue
+        params = statement.compile(dialect=postgresql.dialect()).params
+        deltas.append((
+            params['status'],
+            params['feedback_count'],
+            params['resolved_count'],
+            params['resolution_days_total'],
+        ))
+    return deltas
+
+
+def _session(feedback=None):
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=feedback)))
+    db.commit = AsyncMock()
+    db.refresh = AsyncMock()
+    db.rollback = AsyncMock()
+    return db
+
+
+def _feedback(status, resolution_date=None):
+    return SimpleNamespace(
+        id='f1',
+        organization_id='org1',
+        category='workplace_culture',
+        severity='high',
+        status=status,
+        submitted_at=datetime(2026, 3, 1, 9),
+        resolution_date=resolution_date,
+        updated_at=None,
+    )
+
+
+async def test_submission_adds_one_to_pending_bucket():
+    service = AnonymousFeedbackService()
+    db = _session()
+
+    result = await service.submit_anonymous_feedback(db, 'org1', FeedbackSubmission(
+        feedback_type='concern',
+        category='workplace_culture',
+        description='Meetings regularly run over',
+        severity='medium',
+    ))
+
+    assert result['success']
+    assert _rollup_deltas(db) == [('pending_review', 1, 0, 0)]
+
+
+async def test_status_change_moves_feedback_between_buckets():
+    service = AnonymousFeedbackService()
+    db = _session(_feedback('pending_review'))
+
+    result = await service.update_feedback_status(db, 'f1', 'reviewer-1', 'under_investigation')
+
+    assert result['success']
+    assert _rollup_deltas(db) == [
+        ('pending_review', -1, 0, 0),
+        ('under_investigation', 1, 0, 0),
+    ]
+
+
+async def test_resolution_days_move_with_feedback_between_buckets():
+    service = AnonymousFeedbackService()
+    feedback = _feedback('under_investigation')
+    db = _session(feedback)
+
+    await service.update_feedback_status(db, 'f1', 'reviewer-1', 'resolved')
+    days = (feedback.resolution_date - feedback.submitted_at).days
+
+    assert _rollup_deltas(db) == [
+        ('under_investigation', -1, 0, 0),
+        ('resolved', 1, 1, days),
+    ]
+
+    feedback.resolution_date = feedback.submitted_at + timedelta(days=4)
+    reopened = _session(feedback)
+    await service.update_feedback_status(reopened, 'f1', 'reviewer-1', 'under_investigation')
+
+    assert _rollup_deltas(reopened) == [
+        ('resolved', -1, -1, -4),
+        ('under_investigation', 1, 1, 4),
+    ]
@@ -0,0 +1,126 @@
+"""
+Tests for batched anonymous feedback notifications
+"""
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytest.importorskip("celery")
+
+from app.tasks import anonymous_feedback_tasks as tasks
+
+
+class FakeRedis:
+    """Just enough of redis-py for notification claims"""
+
+    def __init__(self):
+        self.store = {}
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    def delete(self, key):
+        return int(self.store.pop(key, None) is not None)
+
+
+@pytest.fixture
+def redis():
+    fake = FakeRedis()
+    with patch.object(tasks, "redis_client", fake):
+        yield fake
+
+
+def _item(severity, category="workplace_culture"):
+    return SimpleNamespace(
+        id=f"{severity}-{category}",
+        organization_id="org1",
+        assigned_reviewer_id=None,
+        category=category,
+        severity=severity,
+        status="pending_review",
+        submitted_at=datetime(2026, 3, 1, 9),
+    )
+
+
+def _run_digest(run_id, grouped, send_results):
+    send = AsyncMock(side_effect=send_results)
+    with patch.object(tasks, "SessionLocal", MagicMock()), \
+            patch.object(tasks, "_group_feedback_by_reviewer", return_value=grouped), \
+            patch.object(tasks, "_iter_feedback_pages"), \
+            patch.object(tasks.email_service, "send_bulk_email", send):
+        result = tasks.send_daily_feedback_digest_batched(run_id=run_id)
+    return result, send
+
+
+def test_claims_are_exclusive_per_run_until_released(redis):
+    assert tasks._claim_notification("run-1", "digest", "hr@example.com")
+    assert not tasks._claim_notification("run-1", "digest", "hr@example.com")
+    assert tasks._claim_notification("run-2", "digest", "hr@example.com")
+    assert tasks._claim_notification("run-1", "follow-up", "hr@example.com")
+
+    tasks._release_notification("run-1", "digest", "hr@example.com")
+
+    assert tasks._claim_notification("run-1", "digest", "hr@example.com")
+
+
+def test_rerun_skips_delivered_and_retries_failed_recipients(redis):
+    grouped = {
+        "a@example.com": [_item("critical")],
+        "b@example.com": [_item("low"), _item("medium")],
+    }
+
+    first, _ = _run_digest("run-1", grouped, [[True, False]])
+    second, send = _run_digest("run-1", grouped, [[True]])
+    third, _ = _run_digest("run-1", grouped, [[]])
+
+    assert (first["digests_sent"], first["skipped_already_sent"]) == (1, 0)
+    assert [m["email_to"] for m in send.await_args.args[0]] == ["b@example.com"]
+    assert (second["digests_sent"], second["skipped_already_sent"]) == (1, 1)
+    assert (third["digests_sent"], third["skipped_already_sent"]) == (0, 2)
+
+
+def test_failed_bulk_send_releases_every_claim(redis):
+    grouped = {"a@example.com": [_item("high")], "b@example.com": [_item("low")]}
+
+    result, _ = _run_digest("run-1", grouped, ConnectionError("SMTP down"))
+
+    assert result == {"success": False, "error": "SMTP down"}
+    assert redis.store == {}
+
+
+def test_failed_message_build_leaves_no_claims(redis):
+    broken = _item("high")
+    broken.category = None  # .title() raises while building the body
+    grouped = {"a@example.com": [_item("low")], "b@example.com": [broken]}
+
+    result, send = _run_digest("run-1", grouped, [[True, True]])
+
+    assert result["success"] is False
+    send.assert_not_awaited()
+    assert redis.store == {}
+
+    retry, send = _run_digest("run-1", {"a@example.com": [_item("low")]}, [[True]])
+    assert (retry["digests_sent"], retry["skipped_already_sent"]) == (1, 0)
+
+
+def test_claim_failure_part_way_releases_earlier_claims(redis):
+    claim = redis.set
+
+    def flaky_set(key, *args, **kwargs):
+        if key.endswith(":b@example.com"):
+            raise ConnectionError("Redis went away")
+        return claim(key, *args, **kwargs)
+
+    redis.set = flaky_set
+    grouped = {"a@example.com": [_item("low")], "b@example.com": [_item("high")]}
+
+    result, send = _run_digest("run-1", grouped, [[True, True]])
+
+    assert result == {"success": False, "error": "Redis went away"}
+    send.assert_not_awaited()
+    assert redis.store == {}
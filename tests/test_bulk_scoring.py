@@ -0,0 +1,133 @@
+"""
+Parity tests for bulk assessment scoring against the per-response scorers
+"""
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+pytest.importorskip("celery")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.core.database import Base
+from app.db.models.assessment import AssessmentResponse
+from app.db.models.scoring import AssessmentScoringConfig
+from app.db.models.user import User  # noqa: F401 - resolves AssessmentResponse relationships
+from app.services.scoring.big_five_scorer import BigFiveScorer
+from app.services.scoring.disc_scorer import DISCScorer
+from app.services.scoring.mbti_scorer import MBTIScorer
+from app.services.scoring.vectorized_scorer import VectorizedScorer
+from app.tasks import scoring_scheduler
+
+CONFIGS = {
+    "big_five": {
+        "factors": {
+            "openness": [1, 2, 3],
+            "conscientiousness": [4, 5],
+            "extraversion": [6, 7],
+            "agreeableness": [8],
+            "neuroticism": [],
+        },
+        "reverse_scored": {"openness": [2], "conscientiousness": [5], "extraversion": [6, 7]},
+    },
+    "mbti": {
+        "dimensions": {"E-I": [1, 2], "S-N": [3, 4], "T-F": [5, 6], "J-P": [7, 8]},
+        "reverse_scored": {"E-I": [2], "T-F": [5]},
+    },
+    "disc": {
+        "dimensions": {"D": [1, 2], "I": [3, 4], "S": [5, 6], "C": [7, 8]},
+    },
+}
+
+ROW_SCORERS = {"big_five": BigFiveScorer, "mbti": MBTIScorer, "disc": DISCScorer}
+
+
+def _answers(n, seed):
+    """Answer dicts mixing ints, floats, bools, numeric and junk strings and gaps"""
+    rng = np.random.default_rng(seed)
+    answers = []
+    for _ in range(n):
+        row = {}
+        for q_id in range(1, 9):
+            kind = rng.integers(0, 8)
+            if kind < 4:
+                row[str(q_id)] = int(rng.integers(1, 6))
+            elif kind == 4:
+                row[str(q_id)] = bool(rng.integers(0, 2))
+            elif kind == 5:
+                row[str(q_id)] = str(rng.integers(1, 6))
+            elif kind == 6:
+                row[str(q_id)] = None if rng.random() < 0.5 else "n/a"
+        answers.append(row)
+    # Every item missing, every item at the scale ends
+    answers += [{}, {str(q): 1 for q in range(1, 9)}, {str(q): 5 for q in range(1, 9)}]
+    return answers
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[AssessmentResponse.__table__, AssessmentScoringConfig.__table__])
+    with Session(engine) as session:
+        yield session
+
+
+def _bulk_score(db, answers, chunk_size, **kwargs):
+    """Run bulk_score_assessment and capture the scores it writes"""
+    db.add_all([
+        AssessmentResponse(id=i + 1, assessment_id=1, respondent_id=1, responses=row,
+                           completed_at=datetime(2026, 3, 1))
+        for i, row in enumerate(answers)
+    ])
+    db.add(AssessmentResponse(id=len(answers) + 1, assessment_id=1, respondent_id=1, responses={"1": 5}))
+    db.commit()
+
+    written = {}
+    with patch.object(scoring_scheduler, "_write_scores",
+                      side_effect=lambda _db, scored, _at: written.update(scored)):
+        result = scoring_scheduler.bulk_score_assessment(db, 1, chunk_size=chunk_size, **kwargs)
+    return result, written
+
+
+@pytest.mark.parametrize("algorithm", ["big_five", "mbti", "disc"])
+def test_bulk_scores_match_per_response_scorers(db, algorithm):
+    config = AssessmentScoringConfig(assessment_id=1, algorithm=algorithm, config=CONFIGS[algorithm])
+    db.add(config)
+    answers = _answers(40, seed=len(algorithm))
+
+    result, written = _bulk_score(db, answers, chunk_size=16)
+
+    assert (result["status"], result["algorithm"]) == ("success", algorithm)
+    assert (result["responses_scored"], result["chunks"]) == (len(answers), 3)
+    for response_id, row in enumerate(answers, start=1):
+        expected = ROW_SCORERS[algorithm].calculate_scores(SimpleNamespace(responses=row), config)
+        assert written[response_id] == expected, f"response {response_id}: {row}"
+
+
+@pytest.mark.parametrize("algorithm", ["big_five", "mbti", "disc"])
+def test_chunk_scoring_never_falls_back_to_per_response_scorers(algorithm):
+    config = SimpleNamespace(config=CONFIGS[algorithm])
+
+    with patch.object(ROW_SCORERS[algorithm], "calculate_scores", side_effect=AssertionError("row scorer")):
+        scores = VectorizedScorer.score_chunk(_answers(5, seed=0), algorithm, config)
+
+    assert len(scores) == 8 and all(score["algorithm"] == algorithm for score in scores)
+
+    with pytest.raises(ValueError):
+        VectorizedScorer.score_chunk([{}], "enneagram", config)
+
+
+def test_generic_scoring_without_config(db):
+    answers = [{"1": 5, "2": True, "3": 2.5, "4": "text"}, {"1": False}, {}]
+
+    result, written = _bulk_score(db, answers, chunk_size=2, response_ids=[1, 2, 3])
+
+    assert (result["algorithm"], result["responses_scored"], result["chunks"]) == ("generic", 3, 2)
+    assert written[1]["total_score"] == 8.5 and written[1]["max_possible_score"] == 11
+    assert written[1]["percentage_score"] == pytest.approx(77.27)
+    assert written[1]["interpretation"].startswith("Above average")
+    assert written[2]["percentage_score"] == 0 and written[3]["max_possible_score"] == 0
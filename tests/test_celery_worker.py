@@ -0,0 +1,23 @@
+"""
+Tests that the Celery worker can load every task module it includes
+"""
+import importlib
+
+import pytest
+
+pytest.importorskip("celery")
+
+from app.core.celery_worker import celery_app
+
+
+@pytest.mark.parametrize("module", celery_app.conf.include)
+def test_included_task_module_imports(module):
+    importlib.import_module(module)
+
+
+def test_worker_loads_all_task_modules():
+    celery_app.loader.import_default_modules()
+
+    for name in ("tasks.calculate_assessment_scores", "tasks.maintain_partitions",
+                 "tasks.generate_organization_reports", "train_anomaly_model"):
+        assert name in celery_app.tasks
@@ -0,0 +1,89 @@
+"""
+Tests for the culture health endpoints served from communication rollups
+"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# The endpoint module needs the email-analysis models (EmailMetadata,
+# CommunicationAnalysis, ...), which this tree does not ship yet
+communication_analysis = pytest.importorskip("app.api.v1.endpoints.communication_analysis")
+
+from app.api import deps
+from app.services import culture_health_service as culture_module
+
+HEALTHY_SUMMARY = {
+    'message_count': 40,
+    'sentiment_mean': 0.4,
+    'sentiment_variance': 0.04,
+    'sentiment_std': 0.2,
+    'emotion_distribution': {'joy': 0.6, 'neutral': 0.4},
+    'conflict_probability_mean': 0.1,
+    'high_conflict_rate': 0.02,
+    'response_time_minutes': {'mean': 50.0, 'p50': 40.0, 'p90': 200.0, 'p95': 300.0},
+    'analysis_period_days': 30,
+}
+
+
+@pytest.fixture
+def get_summary(monkeypatch):
+    mock = AsyncMock(return_value=HEALTHY_SUMMARY)
+    monkeypatch.setattr(culture_module.communication_rollup_service, "get_summary", mock)
+    return mock
+
+
+@pytest.fixture
+def client_for():
+    app = FastAPI()
+    app.include_router(communication_analysis.router, prefix="/api/v1/communication")
+    db = SimpleNamespace(add=None, commit=AsyncMock())
+    app.dependency_overrides[deps.get_replica_db] = lambda: db
+    app.dependency_overrides[deps.get_db] = lambda: db
+
+    def client_for(**overrides):
+        user = SimpleNamespace(**{
+            'id': "u1", 'team_id': "team-a", 'organization_id': "org-1", 'role': "member", **overrides
+        })
+        app.dependency_overrides[deps.get_current_user] = lambda: user
+        return TestClient(app)
+
+    return client_for
+
+
+def test_team_culture_reads_rollups_for_the_window(client_for, get_summary):
+    response = client_for().get("/api/v1/communication/culture/team", params={"days_back": 14})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body['health_level'] == 'excellent'
+    assert body['communication']['message_count'] == 40
+    assert 'Responsive collaboration' in body['strengths']
+    assert get_summary.await_args.args[1:] == ('team', 'team-a', 14)
+
+
+def test_organization_culture_404_when_too_little_data(client_for, get_summary):
+    get_summary.return_value = {**HEALTHY_SUMMARY, 'message_count': 3}
+
+    response = client_for().get("/api/v1/communication/culture/organization")
+
+    assert response.status_code == 404
+    assert get_summary.await_args.args[1:] == ('organization', 'org-1', 30)
+
+
+def test_trigger_culture_reports_scores_without_persisting(client_for, get_summary):
+    response = client_for(role="admin").post(
+        "/api/v1/communication/analysis/trigger", params={"analysis_type": "culture"}
+    )
+
+    assert response.status_code == 200
+    results = response.json()['results']
+    assert results['culture'] == "Culture analysis completed successfully"
+    assert results['culture_health']['health_level'] == 'excellent'
+
+    response = client_for().post(
+        "/api/v1/communication/analysis/trigger", params={"analysis_type": "culture"}
+    )
+    assert response.json()['results']['culture'] == "Admin privileges required for culture analysis"
@@ -0,0 +1,219 @@
+"""
+Tests for communication rollup accumulators
+"""
+import asyncio
+import statistics
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.communication_rollup_service import (
+    RESPONSE_TIME_BUCKETS,
+    SCOPE_ORGANIZATION,
+    SCOPE_TEAM,
+    SCOPE_USER,
+    CommunicationAccumulator,
+    communication_rollup_service,
+)
+from app.services.culture_health_service import culture_health_service
+
+
+def test_merged_days_match_single_pass_statistics():
+    sentiments = [0.8, -0.4, 0.1, 0.5, -0.9, 0.3]
+    conflicts = [0.1, 0.9, 0.2, 0.3, 0.8, 0.0]
+
+    monday, tuesday = CommunicationAccumulator(), CommunicationAccumulator()
+    for i, (sentiment, conflict) in enumerate(zip(sentiments, conflicts)):
+        (monday if i < 3 else tuesday).add(sentiment, conflict, 'joy' if sentiment > 0 else 'anger', 30 * (i + 1))
+
+    total = CommunicationAccumulator()
+    total.merge(monday)
+    total.merge(tuesday)
+    summary = total.summary()
+
+    assert summary['message_count'] == 6
+    assert summary['sentiment_mean'] == pytest.approx(statistics.mean(sentiments))
+    assert summary['sentiment_variance'] == pytest.approx(statistics.pvariance(sentiments))
+    assert summary['high_conflict_rate'] == pytest.approx(2 / 6)
+    assert summary['emotion_distribution'] == {'joy': pytest.approx(4 / 6), 'anger': pytest.approx(2 / 6)}
+
+
+def test_response_time_percentiles_stay_within_bucket():
+    acc = CommunicationAccumulator()
+    for minutes in [3] * 50 + [100] * 40 + [3000] * 10:
+        acc.add(None, None, None, minutes)
+
+    percentiles = acc.summary()['response_time_minutes']
+
+    assert 2 <= percentiles['p50'] <= 5
+    assert 90 <= percentiles['p90'] <= 120
+    assert 2880 <= percentiles['p95'] <= 4320
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return list(self.rows)
+
+    def scalars(self):
+        return iter(self.rows)
+
+
+class FakeSession:
+    """Answers the membership and rollup selects; records rollup upserts"""
+
+    def __init__(self, team_members=(), organizations=None, rollup_rows=()):
+        self.team_members = list(team_members)
+        self.organizations = organizations or {}
+        self.rollup_rows = list(rollup_rows)
+        self.selects = []
+        self.upserts = []
+
+    async def execute(self, stmt):
+        if stmt.is_insert:
+            compiled = stmt.compile(dialect=postgresql.dialect())
+            self.upserts.append((str(compiled), compiled.params))
+            return FakeResult([])
+
+        self.selects.append(stmt)
+        table = stmt.selected_columns[0].table.name
+        if table == "team_members":
+            return FakeResult(self.team_members)
+        if table == "users":
+            return FakeResult(list(self.organizations.items()))
+        return FakeResult(self.rollup_rows)
+
+
+def _analysis(user_id, email_id, sentiment, conflict, emotion):
+    return SimpleNamespace(
+        user_id=user_id,
+        email_id=email_id,
+        sentiment_score=sentiment,
+        conflict_probability=conflict,
+        dominant_emotion=emotion,
+        analysis_timestamp=datetime(2026, 3, 9, 12),
+    )
+
+
+def test_record_analyses_fans_out_to_user_team_and_organization():
+    db = FakeSession(
+        team_members=[("alice", "team-a"), ("alice", "team-b"), ("bob", "team-a")],
+        organizations={"alice": "org-1", "bob": "org-1"},
+    )
+    analyses = [
+        _analysis("alice", "m1", 0.5, 0.1, "joy"),
+        _analysis("alice", "m2", -0.5, 0.9, "anger"),
+        _analysis("bob", "m3", 0.2, 0.2, "joy"),
+    ]
+    emails = [
+        SimpleNamespace(message_id="m1", date_received=datetime(2026, 3, 2, 9), response_time_minutes=30),
+        SimpleNamespace(message_id="m2", date_received=datetime(2026, 3, 2, 17), response_time_minutes=None),
+    ]
+
+    upserted = asyncio.run(communication_rollup_service.record_analyses(db, analyses, emails))
+
+    # Membership is resolved once per batch, not per analysis
+    assert len(db.selects) == 2
+
+    rows = {
+        (params["scope_type"], params["scope_id"], params["day"]): params
+        for _, params in db.upserts
+    }
+    assert upserted == len(rows) == 7
+    alice_day = date(2026, 3, 2)
+    bob_day = date(2026, 3, 9)  # no email metadata, so the analysis timestamp decides
+    assert set(rows) == {
+        (SCOPE_USER, "alice", alice_day),
+        (SCOPE_TEAM, "team-a", alice_day),
+        (SCOPE_TEAM, "team-b", alice_day),
+        (SCOPE_ORGANIZATION, "org-1", alice_day),
+        (SCOPE_USER, "bob", bob_day),
+        (SCOPE_TEAM, "team-a", bob_day),
+        (SCOPE_ORGANIZATION, "org-1", bob_day),
+    }
+
+    alice = rows[(SCOPE_TEAM, "team-b", alice_day)]
+    assert alice["message_count"] == 2
+    assert alice["sentiment_sum"] == pytest.approx(0.0)
+    assert alice["sentiment_sum_sq"] == pytest.approx(0.5)
+    assert alice["high_conflict_count"] == 1
+    assert alice["emotion_counts"] == {"joy": 1, "anger": 1}
+    assert alice["response_time_count"] == 1
+    assert sum(alice["response_time_buckets"]) == 1
+    assert len(alice["response_time_buckets"]) == RESPONSE_TIME_BUCKETS
+
+    sql = db.upserts[0][0]
+    assert "ON CONFLICT (scope_type, scope_id, day) DO UPDATE" in sql
+    assert "communication_daily_rollup.message_count + excluded.message_count" in sql
+
+
+def test_record_analyses_without_analyses_touches_nothing():
+    db = FakeSession()
+
+    assert asyncio.run(communication_rollup_service.record_analyses(db, [])) == 0
+    assert db.selects == [] and db.upserts == []
+
+
+def _rollup_row(day, sentiments, conflicts, emotion, response_minutes):
+    acc = CommunicationAccumulator()
+    for sentiment, conflict in zip(sentiments, conflicts):
+        acc.add(sentiment, conflict, emotion, response_minutes)
+    return SimpleNamespace(
+        day=day,
+        message_count=acc.message_count,
+        sentiment_count=acc.sentiment_count,
+        sentiment_sum=acc.sentiment_sum,
+        sentiment_sum_sq=acc.sentiment_sum_sq,
+        conflict_sum=acc.conflict_sum,
+        high_conflict_count=acc.high_conflict_count,
+        emotion_counts=dict(acc.emotion_counts),
+        response_time_count=acc.response_time_count,
+        response_time_sum=acc.response_time_sum,
+        # Rows written before a bucket was added come back shorter
+        response_time_buckets=acc.response_time_buckets[:-1],
+    )
+
+
+def test_get_summary_merges_rollup_rows_for_the_window():
+    today = datetime.utcnow().date()
+    rows = [
+        _rollup_row(today - timedelta(days=2), [0.6] * 15, [0.1] * 15, "joy", 20),
+        _rollup_row(today - timedelta(days=1), [-0.2] * 15, [0.8] * 15, "anger", 200),
+    ]
+    db = FakeSession(rollup_rows=rows)
+
+    summary = asyncio.run(communication_rollup_service.get_summary(db, SCOPE_TEAM, "team-a", days_back=7))
+
+    sql = str(db.selects[0].compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    assert "communication_daily_rollup.scope_type = 'team'" in sql
+    assert "communication_daily_rollup.day >= '%s'" % (datetime.utcnow() - timedelta(days=7)).date() in sql
+
+    assert summary["message_count"] == 30
+    assert summary["analysis_period_days"] == 7
+    assert summary["sentiment_mean"] == pytest.approx(0.2)
+    assert summary["sentiment_std"] == pytest.approx(0.4)
+    assert summary["high_conflict_rate"] == pytest.approx(0.5)
+    assert summary["emotion_distribution"] == {"joy": pytest.approx(0.5), "anger": pytest.approx(0.5)}
+    assert 15 <= summary["response_time_minutes"]["p50"] <= 30
+
+
+def test_culture_health_scores_rollups_and_needs_enough_messages():
+    today = datetime.utcnow().date()
+    calm = [_rollup_row(today, [0.6] * 25, [0.05] * 25, "joy", 20)]
+    thin = [_rollup_row(today, [0.6] * 5, [0.05] * 5, "joy", 20)]
+
+    snapshot = asyncio.run(culture_health_service.analyze_team_culture(FakeSession(rollup_rows=calm), "team-a"))
+    assert snapshot.health_level == "excellent"
+    assert 0.75 <= snapshot.overall_health_score <= 1
+    assert "Positive communication tone" in snapshot.strength_indicators
+    assert "Responsive collaboration" in snapshot.strength_indicators
+    assert snapshot.risk_factors_identified == []
+    assert snapshot.communication["message_count"] == 25
+
+    assert asyncio.run(
+        culture_health_service.analyze_organization_culture(FakeSession(rollup_rows=thin), "org-1")
+    ) is None
@@ -0,0 +1,89 @@
+"""
+Tests for the analytics and read-replica session dependencies
+"""
+import ast
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core import database
+
+ANALYTICS_ENDPOINTS = Path(__file__).resolve().parents[1] / "app/api/v1/endpoints/analytics.py"
+
+
+@pytest.fixture
+def sqlite_sessions():
+    engine = create_engine("sqlite://")
+    factory = sessionmaker(bind=engine, class_=Session)
+    with patch.object(database, "ReplicaSyncSessionLocal", factory):
+        yield
+    engine.dispose()
+
+
+def test_replica_sync_db_yields_and_closes_a_sync_session(sqlite_sessions):
+    dependency = database.get_replica_sync_db()
+    session = next(dependency)
+
+    assert isinstance(session, Session)
+    assert session.execute(text("SELECT 1")).scalar() == 1
+
+    with patch.object(session, "close", wraps=session.close) as close:
+        with pytest.raises(StopIteration):
+            next(dependency)
+    close.assert_called_once()
+
+
+def test_replica_sync_db_rolls_back_on_error(sqlite_sessions):
+    dependency = database.get_replica_sync_db()
+    session = next(dependency)
+
+    with patch.object(session, "rollback") as rollback, pytest.raises(ValueError):
+        dependency.throw(ValueError("query failed"))
+    rollback.assert_called_once()
+
+
+@pytest.mark.skipif(bool(database.settings.DB_READ_REPLICA_URL), reason="read replica configured")
+def test_replica_sync_engine_falls_back_to_bounded_primary_pool():
+    engine = database.replica_sync_engine
+
+    assert engine.url.drivername == "postgresql+psycopg2"
+    assert engine.url.database == database.sync_engine.url.database
+    assert engine.pool.size() == database.settings.DB_ANALYTICS_POOL_SIZE
+
+
+def test_sync_connect_args_apply_timeout_and_read_only():
+    timeout = f"statement_timeout={database.settings.DB_ANALYTICS_STATEMENT_TIMEOUT_MS}"
+
+    primary = database._sync_analytics_connect_args("psychsync_analytics")
+    replica = database._sync_analytics_connect_args("psychsync_replica", read_only=True)
+
+    assert primary == {"application_name": "psychsync_analytics", "options": f"-c {timeout}"}
+    assert replica["options"] == f"-c {timeout} -c default_transaction_read_only=on"
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("postgresql://u@db/app", "postgresql+psycopg2://u@db/app"),
+    ("postgresql+asyncpg://u@replica/app", "postgresql+psycopg2://u@replica/app"),
+    ("sqlite://", "sqlite://"),
+])
+def test_sync_url_forces_psycopg2(url, expected):
+    assert database._sync_url(url) == expected
+
+
+def test_analytics_handlers_are_sync_and_use_sync_replica_sessions():
+    # The endpoint module's service imports are not importable in every
+    # environment, so inspect its source instead of the router
+    tree = ast.parse(ANALYTICS_ENDPOINTS.read_text())
+    handlers = [
+        node for node in tree.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.decorator_list
+    ]
+
+    assert handlers
+    for handler in handlers:
+        assert isinstance(handler, ast.FunctionDef), handler.name
+        dependencies = {ast.unparse(default) for default in handler.args.defaults}
+        assert "Depends(get_replica_sync_db)" in dependencies, handler.name
@@ -0,0 +1,172 @@
+"""
+Tests for the distributed HRIS sync scheduler
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("flask")
+pytest.importorskip("schedule")
+
+from sqlalchemy import update
+
+from app.integrations.hris.distributed_scheduler import (
+    CronExpression,
+    DistributedSyncScheduler,
+    metadata,
+    sync_jobs_table,
+    to_cron_expression,
+)
+
+
+def test_cron_next_after_steps_lists_and_ranges():
+    every_15 = CronExpression("*/15 * * * *")
+    weekdays_9_to_5 = CronExpression("0 9-17 * * 1-5")
+    first_or_sunday = CronExpression("30 2 1 * 0")
+
+    assert every_15.next_after(datetime(2026, 3, 1, 10, 7, 42)) == datetime(2026, 3, 1, 10, 15)
+    assert every_15.next_after(datetime(2026, 3, 1, 10, 45)) == datetime(2026, 3, 1, 11, 0)
+    # Friday 17:00 -> Monday 09:00
+    assert weekdays_9_to_5.next_after(datetime(2026, 3, 6, 17, 0)) == datetime(2026, 3, 9, 9, 0)
+    # Day and weekday both restricted: either matches
+    assert first_or_sunday.next_after(datetime(2026, 3, 2)) == datetime(2026, 3, 8, 2, 30)
+    assert first_or_sunday.next_after(datetime(2026, 3, 29, 3)) == datetime(2026, 4, 1, 2, 30)
+
+    with pytest.raises(ValueError):
+        CronExpression("0 24 * * *")
+    with pytest.raises(ValueError):
+        CronExpression("0 2 * *")
+
+
+def test_schedule_strings_convert_to_cron():
+    assert to_cron_expression("every day at 02:30") == "30 2 * * *"
+    assert to_cron_expression("every hour") == "0 * * * *"
+    assert to_cron_expression("every 15 minutes") == "*/15 * * * *"
+    assert to_cron_expression("every 120 minutes") == "0 */2 * * *"
+    assert to_cron_expression("every 6 hours") == "0 */6 * * *"
+    assert to_cron_expression("5 4 * * 1") == "5 4 * * 1"
+
+    for expression in ("every 90 minutes", "every 7 minutes", "every 5 hours"):
+        with pytest.raises(ValueError):
+            to_cron_expression(expression)
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'scheduler.db'}"
+    scheduler = DistributedSyncScheduler(url)
+    metadata.create_all(scheduler.engine)
+    return url
+
+
+def _scheduler(database_url, worker_id, **kwargs):
+    return DistributedSyncScheduler(database_url, worker_id=worker_id, max_jitter_seconds=0, **kwargs)
+
+
+def _make_due(scheduler, job_id):
+    with scheduler.engine.begin() as conn:
+        conn.execute(
+            update(sync_jobs_table)
+            .where(sync_jobs_table.c.job_id == job_id)
+            .values(next_run_at=datetime.utcnow() - timedelta(minutes=1))
+        )
+
+
+def test_cron_is_evaluated_in_scheduler_timezone(database_url):
+    scheduler = _scheduler(database_url, "a", schedule_timezone="America/New_York")
+
+    # 02:00 in New York is 07:00 UTC in winter and 06:00 UTC in summer
+    assert scheduler._next_run("0 2 * * *", 0, datetime(2026, 1, 10, 12)) == datetime(2026, 1, 11, 7)
+    assert scheduler._next_run("0 2 * * *", 0, datetime(2026, 7, 10, 12)) == datetime(2026, 7, 11, 6)
+    assert scheduler._next_run("0 2 * * *", 30, datetime(2026, 7, 10, 12)) == datetime(2026, 7, 11, 6, 0, 30)
+
+
+def test_due_job_runs_on_exactly_one_replica(database_url):
+    runs = []
+    replicas = [_scheduler(database_url, f"worker-{i}") for i in range(3)]
+    for replica in replicas:
+        replica.add_job("bamboo_sync", "bamboo", "every day at 02:00", ["employees"],
+                        lambda job, worker=replica.worker_id: runs.append(worker))
+
+    assert sum(replica.run_pending() for replica in replicas) == 0
+
+    _make_due(replicas[0], "bamboo_sync")
+    assert sum(replica.run_pending() for replica in replicas) == 1
+    assert sum(replica.run_pending() for replica in replicas) == 0
+
+    status = replicas[0].get_job_status("bamboo_sync")
+    history = replicas[0].get_run_history("bamboo_sync")
+
+    assert runs == ["worker-0"]
+    assert status["lease_owner"] is None and status["last_status"] == "success"
+    assert datetime.fromisoformat(status["next_run"]) > datetime.utcnow()
+    assert [(run["worker_id"], run["status"]) for run in history] == [("worker-0", "success")]
+
+
+def test_frequent_job_keeps_every_occurrence_despite_large_jitter(database_url):
+    scheduler = DistributedSyncScheduler(
+        database_url, worker_id="worker-0", max_jitter_seconds=900, schedule_timezone="UTC"
+    )
+    scheduler.add_job("roster_sync", "bamboo", "* * * * *", ["employees"], lambda job: None)
+    scheduler.add_job("quarter_hour_sync", "bamboo", "*/15 * * * *", ["employees"], lambda job: None)
+
+    # Jitter is capped at half the cron interval
+    jitter = scheduler.get_job_status("roster_sync")["jitter_seconds"]
+    assert 0 < jitter <= 30
+    assert scheduler.get_job_status("quarter_hour_sync")["jitter_seconds"] <= 450
+
+    # A run claimed late in its slot schedules the very next minute, not one after `now`
+    slot = datetime(2026, 3, 1, 10, 0)
+    scheduled_for = slot + timedelta(seconds=jitter)
+    with scheduler.engine.begin() as conn:
+        conn.execute(update(sync_jobs_table).values(next_run_at=scheduled_for))
+    assert scheduler._claim("roster_sync", "* * * * *", jitter, scheduled_for,
+                            scheduled_for + timedelta(seconds=25))
+    next_run = datetime.fromisoformat(scheduler.get_job_status("roster_sync")["next_run"])
+    assert next_run == slot + timedelta(minutes=1, seconds=jitter)
+
+    # Occurrences missed during an outage are coalesced into the next one
+    with scheduler.engine.begin() as conn:
+        conn.execute(update(sync_jobs_table).values(lease_expires_at=None))
+    assert scheduler._claim("roster_sync", "* * * * *", jitter, next_run,
+                            next_run + timedelta(hours=2, seconds=10))
+    next_run = datetime.fromisoformat(scheduler.get_job_status("roster_sync")["next_run"])
+    assert next_run == slot + timedelta(hours=2, minutes=2, seconds=jitter)
+
+
+def test_live_lease_blocks_claim_until_it_expires(database_url):
+    runs = []
+    scheduler = _scheduler(database_url, "worker-0")
+    scheduler.add_job("bamboo_sync", "bamboo", "0 2 * * *", ["employees"], runs.append)
+    _make_due(scheduler, "bamboo_sync")
+
+    with scheduler.engine.begin() as conn:
+        conn.execute(
+            update(sync_jobs_table)
+            .values(lease_owner="crashed", lease_expires_at=datetime.utcnow() + timedelta(minutes=5))
+        )
+    assert scheduler.run_pending() == 0
+
+    with scheduler.engine.begin() as conn:
+        conn.execute(update(sync_jobs_table).values(lease_expires_at=datetime.utcnow() - timedelta(seconds=1)))
+    assert scheduler.run_pending() == 1
+    assert len(runs) == 1
+
+
+def test_failed_job_is_recorded_and_disabled_job_skipped(database_url):
+    scheduler = _scheduler(database_url, "worker-0")
+
+    def fail(job):
+        raise RuntimeError("HRIS unavailable")
+
+    scheduler.add_job("bamboo_sync", "bamboo", "0 2 * * *", ["employees"], fail)
+    scheduler.disable_job("bamboo_sync")
+    _make_due(scheduler, "bamboo_sync")
+    assert scheduler.run_pending() == 0
+
+    scheduler.enable_job("bamboo_sync")
+    assert scheduler.run_pending() == 1
+
+    run = scheduler.get_run_history("bamboo_sync")[0]
+    assert (run["status"], run["error"]) == ("failed", "HRIS unavailable")
@@ -0,0 +1,123 @@
+"""
+Tests for experiment and gamification stores
+"""
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from ai.experimental_features import (
+    ABTestingFramework,
+    GamificationEngine,
+    RedisExperimentStore,
+    RedisGamificationStore,
+    RunningStats,
+)
+
+
+def _redis_client():
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    return fakeredis.FakeRedis()
+
+
+@pytest.fixture(params=["memory", "redis"])
+def stores(request):
+    if request.param == "memory":
+        return None, None
+    client = _redis_client()
+    return RedisExperimentStore(client), RedisGamificationStore(client)
+
+
+def test_assignments_are_sticky_and_counted_once(stores):
+    framework = ABTestingFramework(store=stores[0])
+    framework.create_test("onboarding", "Onboarding", "", ["control", "new_flow"], [0.5, 0.5], 30)
+
+    first = {f"user_{i}": framework.assign_variant(f"user_{i}", "onboarding") for i in range(200)}
+    again = {user: framework.assign_variant(user, "onboarding", force_variant="control") for user in first}
+    stats = framework.get_test_statistics("onboarding")
+
+    assert again == first
+    assert framework.get_variant("user_0", "onboarding") == first["user_0"]
+    assert framework.get_variant("stranger", "onboarding") is None
+    assert stats["total_participants"] == 200
+    assert stats["variant_counts"]["control"] == sum(v == "control" for v in first.values())
+
+    framework.end_test("onboarding")
+    assert framework.get_test_statistics("onboarding")["is_active"] is False
+
+
+def test_running_stats_merge_matches_batch_moments():
+    values = np.random.default_rng(0).normal(3, 2, 500)
+    left, right = RunningStats(), RunningStats()
+    for i, value in enumerate(values):
+        (left if i < 200 else right).add(value)
+
+    merged = left.merge(right)
+
+    assert merged.count == 500
+    assert merged.mean == pytest.approx(values.mean())
+    assert merged.variance == pytest.approx(values.var(ddof=1))
+
+
+def test_experiment_results_track_lift_and_sequential_significance(stores):
+    framework = ABTestingFramework(store=stores[0])
+    framework.create_test("checkout", "Checkout", "", ["control", "treatment"], [0.5, 0.5], 30)
+    rng = np.random.default_rng(3)
+    rates = {"control": 0.10, "treatment": 0.20}
+
+    sequential = []
+    for i in range(3000):
+        user = f"user_{i}"
+        if rng.random() < rates[framework.assign_variant(user, "checkout")]:
+            framework.record_metric(user, "checkout")
+        if (i + 1) % 500 == 0:
+            sequential.append(framework.get_experiment_results("checkout")["comparisons"]["treatment"]["sequential_p_value"])
+
+    results = framework.get_experiment_results("checkout")
+    control, treatment = results["variants"]["control"], results["variants"]["treatment"]
+    comparison = results["comparisons"]["treatment"]
+
+    assert control["mean"] == pytest.approx(control["observations"] / control["participants"])
+    assert comparison["lift"] == pytest.approx(treatment["mean"] - control["mean"])
+    assert comparison["confidence_sequence"][0] < comparison["confidence_interval"][0] < comparison["lift"]
+    assert sequential == sorted(sequential, reverse=True)
+    assert comparison["significant"]
+
+    with pytest.raises(ValueError):
+        framework.record_metric("stranger", "checkout")
+
+
+def test_points_achievements_and_leaderboard(stores):
+    engine = GamificationEngine(store=stores[1])
+    for i, points in enumerate([30, 250, 120]):
+        engine.award_points(f"user_{i}", points, "activity")
+
+    unlocked = engine.unlock_achievement("user_0", "first_session")
+    repeated = engine.unlock_achievement("user_0", "first_session")
+    leaderboard = engine.get_leaderboard(limit=2)
+
+    assert unlocked["total_points"] == 40 and unlocked["success"]
+    assert repeated == {'success': False, 'message': 'Achievement already unlocked'}
+    assert [(e["user_id"], e["total_points"], e["level"]) for e in leaderboard] == [("user_1", 250, 3), ("user_2", 120, 2)]
+    assert engine.get_user_progress("user_0").achievements_earned == ["first_session"]
+
+
+def test_streak_unlocks_week_achievement(stores):
+    engine = GamificationEngine(store=stores[1])
+    today = [datetime(2026, 1, 1, 9)]
+
+    class Clock(datetime):
+        @classmethod
+        def utcnow(cls):
+            return today[0]
+
+    with patch("ai.experimental_features.datetime", Clock):
+        engine.get_user_progress("user_0")
+        for _ in range(7):
+            today[0] += timedelta(days=1)
+            result = engine.update_streak("user_0")
+
+    assert result["streak_days"] == 7
+    assert "week_streak" in engine.get_user_progress("user_0").achievements_earned
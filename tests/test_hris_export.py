@@ -0,0 +1,78 @@
+"""
+Tests for HRIS record export
+"""
+import csv
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("requests")
+
+from app.integrations.hris.base_connector import (
+    AttendanceRecord,
+    CSVConnector,
+    Employee,
+    records_to_columns,
+)
+
+
+def _attendance():
+    return [
+        AttendanceRecord(
+            record_id="A1",
+            employee_id="E1",
+            date=date(2026, 3, 2),
+            clock_in=datetime(2026, 3, 2, 8, 59, 30, 125000, tzinfo=timezone(timedelta(hours=2))),
+            hours_worked=8.5
+        ),
+        AttendanceRecord(record_id="A2", employee_id="E2", date=date(2026, 3, 2), status="absent"),
+    ]
+
+
+def test_records_to_columns_keeps_field_order_and_native_values():
+    employees = [
+        Employee("E1", "Ada", "Lovelace", "ada@example.com", hire_date=date(2020, 1, 6)),
+        Employee("E2", "Alan", "Turing", "alan@example.com"),
+    ]
+
+    columns = records_to_columns(employees)
+
+    assert list(columns) == list(employees[0].to_dict())
+    assert columns["employee_id"] == ["E1", "E2"]
+    assert columns["hire_date"] == [date(2020, 1, 6), None]
+    assert records_to_columns([]) == {}
+
+
+def test_csv_export_matches_to_dict_isoformat(tmp_path):
+    records = _attendance()
+
+    path = CSVConnector({}).export_to_csv(records, "attendance.csv", str(tmp_path))
+
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+
+    assert rows[0]["clock_in"] == records[0].to_dict()["clock_in"] == "2026-03-02T08:59:30.125000+02:00"
+    assert rows[0]["date"] == "2026-03-02"
+    assert rows[1]["clock_in"] == ""
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_columnar_export_round_trips_typed_columns(tmp_path, format):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    records = _attendance()
+    path = CSVConnector({}).export_to_file(records, f"attendance.{format}", str(tmp_path), format=format)
+    table = pq.read_table(path) if format == "parquet" else feather.read_table(path)
+
+    assert table.num_rows == 2
+    assert table.schema.field("date").type == pa.date32()
+    assert pa.types.is_timestamp(table.schema.field("clock_in").type)
+    assert table.column("clock_in")[0].as_py() == records[0].clock_in
+    assert table.column("hours_worked").to_pylist() == [8.5, None]
+
+
+def test_unknown_export_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        CSVConnector({}).export_to_file(_attendance(), "attendance.xml", str(tmp_path), format="xml")
@@ -0,0 +1,108 @@
+"""
+Tests for cohort trajectory fitting in ai.longitudinal_analysis
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("scipy")
+
+from ai.longitudinal_analysis import LongitudinalAnalyzer
+
+
+@pytest.fixture
+def cohort():
+    rng = np.random.default_rng(7)
+    frames = []
+    for client in range(30):
+        n = int(rng.integers(6, 30))
+        t = np.arange(n)
+        frames.append(pd.DataFrame({
+            'client_id': f'client_{client:02d}',
+            'date': pd.Timestamp('2024-01-01') + pd.to_timedelta(7 * t, 'D'),
+            'score': 20 - 0.2 * t + rng.normal(0, 0.03) * t ** 2 + rng.normal(0, 1, n),
+        }))
+    frames.append(pd.DataFrame({'client_id': ['single'], 'date': ['2024-01-01'], 'score': [12.0]}))
+    return pd.concat(frames).sample(frac=1, random_state=0)
+
+
+def test_cohort_matches_per_client_analysis(cohort):
+    analyzer = LongitudinalAnalyzer()
+
+    result = analyzer.analyze_cohort_trajectories(cohort, prediction_periods=3)
+
+    for client, data in cohort[cohort.client_id != 'single'].groupby('client_id'):
+        expected = analyzer.analyze_trajectory(data, prediction_periods=3)
+        row = result.loc[client]
+        assert row.trajectory_type == expected.trajectory_type
+        assert row.interpretation == expected.interpretation
+        assert row.model_fit == pytest.approx(expected.model_fit, abs=1e-6)
+        assert row.rate_of_change == pytest.approx(expected.rate_of_change, abs=1e-6)
+        for i, prediction in enumerate(expected.predicted_values, start=1):
+            assert str(row[f'prediction_date_{i}'])[:10] == prediction['date']
+            assert row[f'predicted_value_{i}'] == pytest.approx(prediction['predicted_value'], abs=1e-6)
+            assert row[f'ci_upper_{i}'] == pytest.approx(prediction['confidence_interval'][1], abs=1e-6)
+
+
+def test_cohort_flags_clients_with_one_measurement(cohort):
+    result = LongitudinalAnalyzer().analyze_cohort_trajectories(cohort)
+
+    single = result.loc['single']
+    assert single.interpretation == 'insufficient_data'
+    assert single.baseline_value == 12.0
+    assert np.isnan(single.rate_of_change)
+
+
+def test_cohort_without_complete_rows_returns_empty_frame(cohort):
+    analyzer = LongitudinalAnalyzer()
+    expected = analyzer.analyze_cohort_trajectories(cohort, prediction_periods=2)
+
+    for data in (cohort.iloc[:0], cohort.assign(score=np.nan)):
+        result = analyzer.analyze_cohort_trajectories(data, prediction_periods=2)
+        assert result.empty
+        assert list(result.columns) == list(expected.columns)
+        assert result.index.name == 'client_id'
+
+
+@pytest.fixture
+def interventions(cohort):
+    clients = sorted(cohort.client_id.unique())
+    return pd.DataFrame({
+        'client_id': clients + ['unknown'],
+        'intervention_name': 'CBT module',
+        'start_date': pd.Timestamp('2024-02-15'),
+    })
+
+
+def test_cohort_interventions_match_per_client_analysis(cohort, interventions):
+    analyzer = LongitudinalAnalyzer()
+    original = cohort.copy()
+
+    result = analyzer.analyze_cohort_interventions(cohort, interventions)
+
+    pd.testing.assert_frame_equal(cohort, original)
+    for index, intervention in interventions.iterrows():
+        data = cohort[cohort.client_id == intervention.client_id]
+        expected = analyzer.analyze_intervention_effectiveness(
+            data, intervention.start_date.to_pydatetime(), intervention.intervention_name
+        )
+        row = result.loc[index]
+        assert row.interpretation == expected.interpretation
+        assert row.effect_size == pytest.approx(expected.effect_size)
+        assert row.p_value == pytest.approx(expected.p_value)
+        assert row.change == pytest.approx(expected.change)
+
+
+def test_bootstrap_intervals_are_seeded_and_bracket_the_change(cohort, interventions):
+    analyzer = LongitudinalAnalyzer()
+    kwargs = dict(resampling='bootstrap', n_resamples=200, random_state=11)
+
+    serial = analyzer.analyze_cohort_interventions(cohort, interventions, n_jobs=1, **kwargs)
+    repeated = analyzer.analyze_cohort_interventions(cohort, interventions, n_jobs=1, **kwargs)
+
+    evaluated = serial[serial.interpretation != 'insufficient_data']
+    assert len(evaluated) > 0
+    assert (evaluated.ci_lower <= evaluated.change).all()
+    assert (evaluated.change <= evaluated.ci_upper).all()
+    np.testing.assert_array_equal(serial.ci_lower, repeated.ci_lower)
+    assert serial.loc[serial.client_id == 'unknown', 'ci_lower'].isna().all()
@@ -0,0 +1,70 @@
+"""
+Tests for the unified Prometheus registry and /metrics access control
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.core import metrics_registry
+from app.core.metrics_registry import render_metrics, scrape_allowed
+
+ROOT = Path(__file__).resolve().parents[1]
+
+INTERNAL = ["127.0.0.1/32", "::1/128", "10.0.0.0/8"]
+
+WORKER = """
+from app.core import metrics_registry
+for _ in range({n}):
+    metrics_registry.observe_request("GET", "/api/v1/teams", 200, 0.02)
+metrics_registry.observe_task("generate_report", True, 3.0)
+"""
+
+
+@pytest.mark.parametrize("host, forwarded, allowed", [
+    ("127.0.0.1", False, True),
+    ("10.2.3.4", False, True),
+    ("::1", False, True),
+    ("10.2.3.4", True, False),
+    ("203.0.113.9", False, False),
+    ("testclient", False, False),
+    (None, False, False),
+])
+def test_scrape_allowed_only_for_direct_internal_clients(host, forwarded, allowed):
+    assert scrape_allowed(host, INTERNAL, forwarded=forwarded) is allowed
+
+
+def test_invalid_networks_are_skipped():
+    assert scrape_allowed("10.0.0.1", ["not-a-network", "10.0.0.0/8"])
+    assert not scrape_allowed("10.0.0.1", ["not-a-network"])
+
+
+def test_multiprocess_scrape_aggregates_every_worker(tmp_path, monkeypatch):
+    pytest.importorskip("prometheus_client")
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path),
+           "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")]))}
+    for n in (3, 4):
+        subprocess.run([sys.executable, "-c", WORKER.format(n=n)], env=env, cwd=ROOT, check=True)
+
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    body, content_type = render_metrics()
+    text = body.decode()
+
+    assert content_type.startswith("text/plain")
+    assert ('psychsync_http_request_duration_seconds_count'
+            '{endpoint="/api/v1/teams",method="GET",status="200"} 7.0') in text
+    assert 'psychsync_task_duration_seconds_count{status="success",task="generate_report"} 2.0' in text
+
+
+def test_openmetrics_format_when_requested(monkeypatch):
+    pytest.importorskip("prometheus_client")
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+    metrics_registry.observe_operation("unit_test_op", 0.01)
+
+    body, content_type = render_metrics("application/openmetrics-text; version=1.0.0")
+
+    assert content_type.startswith("application/openmetrics-text")
+    assert body.rstrip().endswith(b"# EOF")
+    assert b'psychsync_operation_duration_seconds_count{operation="unit_test_op"}' in body
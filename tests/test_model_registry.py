@@ -0,0 +1,72 @@
+"""
+Tests for the versioned prediction model registry
+"""
+import threading
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+
+from ai.predictor import OutcomePredictor, generate_synthetic_training_data
+from app.services.model_registry import ModelRegistry
+
+
+@pytest.fixture(scope="module")
+def trained_predictor():
+    X, y = generate_synthetic_training_data(n_samples=200)
+    predictor = OutcomePredictor(model_type='linear')
+    predictor.train(X, y)
+    return predictor
+
+
+def test_get_loads_current_version_once(tmp_path, trained_predictor):
+    registry = ModelRegistry(model_dir=str(tmp_path), reload_seconds=3600)
+    registry.publish('outcome', trained_predictor, 'v1')
+
+    first = registry.get('outcome')
+    assert first.version == 'v1'
+    assert first.predictor.is_trained
+    assert registry.get('outcome') is first
+    assert registry.get('dropout') is None
+
+
+def test_version_bump_swaps_model(tmp_path, trained_predictor):
+    registry = ModelRegistry(model_dir=str(tmp_path), reload_seconds=0)
+    registry.publish('outcome', trained_predictor, 'v9')
+    assert registry.load_all()['outcome'] == 'v9'
+
+    registry.publish('outcome', trained_predictor, 'v10', activate=False)
+    assert registry.active_version('outcome') == 'v9'
+    assert registry.versions('outcome') == ['v9', 'v10']
+
+    registry.publish('outcome', trained_predictor, 'v10')
+    # The served model stays put until the background load finishes
+    assert registry.get('outcome').version in ('v9', 'v10')
+    for thread in threading.enumerate():
+        if thread.name == 'model-load-outcome':
+            thread.join()
+    assert registry.get('outcome').version == 'v10'
+
+
+def test_load_all_keeps_models_preloaded_before_fork(tmp_path, trained_predictor):
+    registry = ModelRegistry(model_dir=str(tmp_path))
+    registry.publish('outcome', trained_predictor, 'v1')
+    registry.load_all()
+    preloaded = registry.get('outcome')
+
+    assert registry.load_all()['outcome'] == 'v1'
+    assert registry.get('outcome') is preloaded
+
+
+def test_mmap_only_maps_plain_array_attributes(tmp_path):
+    X, y = generate_synthetic_training_data(n_samples=200)
+    forest = OutcomePredictor(model_type='random_forest')
+    forest.train(X, y)
+    registry = ModelRegistry(model_dir=str(tmp_path))
+    registry.publish('outcome', forest, 'v1')
+
+    loaded = registry.get('outcome').predictor
+
+    assert isinstance(loaded.scaler.mean_, np.memmap)
+    assert not isinstance(loaded.model.estimators_[0].tree_.value, np.memmap)
@@ -0,0 +1,135 @@
+"""
+Tests for request latency histograms and the rolling metrics window
+"""
+import math
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.core import monitoring
+from app.core.monitoring import LatencyHistogram, MetricsCollector, RequestMetrics
+
+# Bucket midpoints sit within sqrt(GROWTH) of any value in the bucket
+MAX_RELATIVE_ERROR = math.sqrt(LatencyHistogram.GROWTH) - 1
+
+NOW = datetime(2026, 3, 1, 12, 0, 30)
+
+
+def _nearest_rank(samples, percentile):
+    ordered = np.sort(samples)
+    return ordered[max(1, math.ceil(len(ordered) * percentile / 100)) - 1]
+
+
+def _request(timestamp, duration=0.05, status_code=200, path="/api/v1/users/1", route="/api/v1/users/{id}"):
+    return RequestMetrics(
+        request_id="r",
+        method="GET",
+        path=path,
+        status_code=status_code,
+        duration=duration,
+        timestamp=timestamp,
+        route=route,
+    )
+
+
+def _stats_at(collector, now, **kwargs):
+    class FrozenDatetime(datetime):
+        @classmethod
+        def utcnow(cls):
+            return now
+
+    with patch.object(monitoring, "datetime", FrozenDatetime):
+        return collector.get_request_stats(**kwargs)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_percentiles_within_bucket_error(seed):
+    samples = np.random.default_rng(seed).lognormal(mean=-3, sigma=1.5, size=20_000)
+    samples = samples[(samples > LatencyHistogram.MIN_VALUE) & (samples < LatencyHistogram.MAX_VALUE)]
+    histogram = LatencyHistogram()
+    for value in samples:
+        histogram.record(float(value))
+
+    for percentile in (1, 25, 50, 90, 95, 99, 99.9, 100):
+        expected = _nearest_rank(samples, percentile)
+        assert histogram.percentile(percentile) == pytest.approx(expected, rel=MAX_RELATIVE_ERROR)
+    assert histogram.total == pytest.approx(samples.sum())
+
+
+def test_percentiles_clamp_to_recorded_range():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(99) == 0.0
+
+    histogram.record(0.0123)
+    assert {histogram.percentile(p) for p in (1, 50, 100)} == {0.0123}
+
+    histogram.record(2.5)
+    assert histogram.percentile(50) == 0.0123
+    assert histogram.percentile(100) == pytest.approx(2.5, rel=MAX_RELATIVE_ERROR)
+
+
+def test_merge_matches_recording_into_one_histogram():
+    samples = np.random.default_rng(7).exponential(0.2, size=1000)
+    merged, left, right = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for i, value in enumerate(samples):
+        merged.record(float(value))
+        (left if i % 2 else right).record(float(value))
+
+    left.merge(right)
+
+    assert list(left.counts) == list(merged.counts)
+    assert (left.count, left.min, left.max) == (merged.count, merged.min, merged.max)
+
+
+def test_window_only_counts_recent_slots():
+    collector = MetricsCollector(window_minutes=5)
+    collector.record_request(_request(NOW - timedelta(minutes=4), status_code=500))
+    collector.record_request(_request(NOW, duration=0.1))
+    collector.record_request(_request(NOW, duration=0.3))
+
+    stats = _stats_at(collector, NOW, minutes=5)
+    last_minute = _stats_at(collector, NOW, minutes=1)
+
+    assert (stats["total_requests"], stats["error_rate"]) == (3, pytest.approx(100 / 3))
+    assert stats["status_codes"] == {"500": 1, "200": 2}
+    assert (last_minute["total_requests"], last_minute["error_rate"]) == (2, 0)
+    assert last_minute["avg_duration"] == pytest.approx(0.2)
+
+
+def test_window_rollover_recycles_stale_slots():
+    collector = MetricsCollector(window_minutes=5)
+    for _ in range(3):
+        collector.record_request(_request(NOW))
+
+    # Five minutes later the same ring slot is reused for the new minute
+    later = NOW + timedelta(minutes=5)
+    assert _stats_at(collector, later, minutes=5)["total_requests"] == 0
+
+    collector.record_request(_request(later, duration=1.0))
+    stats = _stats_at(collector, later, minutes=60)
+
+    assert stats["total_requests"] == 1
+    assert stats["requests_per_minute"] == pytest.approx(1 / 5)
+    assert collector.endpoint_stats["GET /api/v1/users/{id}"]["count"] == 4
+
+
+def test_path_filter_selects_endpoints():
+    collector = MetricsCollector(window_minutes=5)
+    collector.record_request(_request(NOW))
+    collector.record_request(_request(NOW, path="/api/v1/teams", route="/api/v1/teams", status_code=503))
+
+    stats = _stats_at(collector, NOW, path_filter="/teams")
+
+    assert (stats["total_requests"], stats["error_rate"], stats["status_codes"]) == (1, 100, {"503": 1})
+
+
+def test_unmatched_paths_share_one_endpoint_key():
+    collector = MetricsCollector(window_minutes=5)
+    for path in ("/wp-admin", "/.env", "/phpmyadmin/index.php"):
+        collector.record_request(_request(NOW, path=path, route=None, status_code=404))
+
+    assert list(collector.endpoint_stats) == ["GET unmatched"]
+    assert collector.endpoint_stats["GET unmatched"]["count"] == 3
+    assert collector.error_counts == {"404_unmatched": 3}
@@ -0,0 +1,140 @@
+"""
+Tests for monthly partition naming and retention arithmetic
+"""
+import asyncio
+import importlib.util
+from datetime import date
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.partitioning import (
+    PARTITION_KEY_CANDIDATES,
+    PartitionedTable,
+    add_months,
+    ensure_partitions,
+    partition_key_column,
+    partition_month,
+    partition_name,
+)
+
+MIGRATION = Path(__file__).parents[1] / "alembic" / "versions" / "008_partition_communication_tables.py"
+
+
+def test_add_months_crosses_year_boundaries():
+    assert add_months(date(2026, 11, 17), 3) == date(2027, 2, 1)
+    assert add_months(date(2026, 1, 31), -1) == date(2025, 12, 1)
+    assert add_months(date(2026, 6, 1), -12) == date(2025, 6, 1)
+
+
+def test_partition_month_round_trips_names():
+    name = partition_name('email_metadata', date(2026, 3, 1))
+
+    assert name == 'email_metadata_p2026_03'
+    assert partition_month('email_metadata', name) == date(2026, 3, 1)
+    assert partition_month('email_metadata', 'email_metadata_default') is None
+    assert partition_month('communication_analysis', name) is None
+
+
+def test_partition_key_column_takes_first_candidate_present():
+    assert partition_key_column('email_metadata', ['id', 'created_at', 'date_sent']) == 'date_sent'
+    assert partition_key_column('communication_analysis', ['id']) is None
+
+
+def _load_migration():
+    pytest.importorskip("alembic")
+    spec = importlib.util.spec_from_file_location("partition_migration", MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_migration_shares_partition_keys_and_refuses_null_keys():
+    migration = _load_migration()
+    assert migration.PARTITIONED_TABLES is PARTITION_KEY_CANDIDATES
+
+    inspector = MagicMock()
+    inspector.get_columns.return_value = [{'name': 'id'}, {'name': 'date_received'}]
+    bind = MagicMock()
+    # Not yet partitioned, then 3 rows without a date_received
+    bind.execute.return_value.scalar.side_effect = [None, 3]
+    with patch.object(migration, "op") as op, patch.object(migration.sa, "inspect", return_value=inspector):
+        op.get_bind.return_value = bind
+        with pytest.raises(RuntimeError, match="3 rows with no date_received"):
+            migration._convert('email_metadata')
+
+    op.execute.assert_not_called()
+
+
+class _FakeConnection:
+    """Records statements; answers catalog and default-partition probes"""
+
+    def __init__(self, partitions, default_rows_in):
+        self.partitions = partitions
+        self.default_rows_in = default_rows_in
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        self.statements.append(sql)
+        result = MagicMock()
+        if "FROM pg_inherits" in sql:
+            result.__iter__.return_value = iter([(p,) for p in self.partitions])
+        elif "pg_partitioned_table" in sql:
+            result.scalar_one.return_value = "date_received"
+        elif "_default WHERE" in sql and sql.startswith("SELECT"):
+            result.scalar.return_value = 1 if params["start"] in self.default_rows_in else None
+        return result
+
+
+def test_ensure_partitions_moves_rows_out_of_default_partition():
+    conn = _FakeConnection(['email_metadata_default', 'email_metadata_p2026_10'], {date(2026, 11, 1)})
+    spec = PartitionedTable('email_metadata', 12)
+
+    created = asyncio.run(ensure_partitions(conn, spec, months_ahead=2, today=date(2026, 10, 18)))
+
+    assert created == ['email_metadata_p2026_11', 'email_metadata_p2026_12']
+    ddl = [s for s in conn.statements if not s.lstrip().startswith("SELECT")]
+    assert ddl[0].startswith("DO $$ BEGIN ALTER TABLE email_metadata DETACH PARTITION email_metadata_default;")
+    assert "INSERT INTO email_metadata_p2026_11 OVERRIDING SYSTEM VALUE SELECT * FROM email_metadata_default " \
+           "WHERE date_received >= '2026-11-01' AND date_received < '2026-12-01'" in ddl[0]
+    assert "ATTACH PARTITION email_metadata_default DEFAULT" in ddl[0]
+    assert ddl[1].startswith("CREATE TABLE IF NOT EXISTS email_metadata_p2026_12 PARTITION OF email_metadata")
+
+
+def _fake_async_engine():
+    conn = MagicMock()
+    conn.execution_options = AsyncMock(return_value=conn)
+    connect = MagicMock()
+    connect.__aenter__ = AsyncMock(return_value=conn)
+    connect.__aexit__ = AsyncMock(return_value=False)
+    engine = MagicMock(connect=MagicMock(return_value=connect), dispose=AsyncMock())
+    return engine, conn
+
+
+def test_maintain_partitions_task_is_registered_and_scheduled():
+    pytest.importorskip("celery")
+    from app.core.celery_worker import celery_app
+    from app.tasks import scoring_scheduler  # noqa: F401 - registers the task
+
+    assert "app.tasks.scoring_scheduler" in celery_app.conf.include
+    assert "tasks.maintain_partitions" in celery_app.tasks
+    assert celery_app.conf.beat_schedule["maintain-partitions"]["task"] == "tasks.maintain_partitions"
+    assert celery_app.conf.task_routes["tasks.maintain_partitions"] == {"queue": "maintenance"}
+
+
+def test_maintain_partitions_task_runs_maintenance_on_autocommit_connection():
+    pytest.importorskip("celery")
+    from app.tasks.scoring_scheduler import maintain_partitions
+
+    engine, conn = _fake_async_engine()
+    report = {"email_metadata": {"created": ["email_metadata_p2026_12"], "dropped": []}}
+    with patch("sqlalchemy.ext.asyncio.create_async_engine", return_value=engine), \
+            patch("app.core.partitioning.maintain_partitions", AsyncMock(return_value=report)) as run:
+        result = maintain_partitions.apply().get()
+
+    assert result == {"status": "success", "tables": report}
+    conn.execution_options.assert_awaited_once_with(isolation_level="AUTOCOMMIT")
+    run.assert_awaited_once_with(conn)
+    engine.dispose.assert_awaited_once()
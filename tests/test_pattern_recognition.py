@@ -0,0 +1,126 @@
+"""
+Tests for persisted anomaly models and streaming change detection
+"""
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+
+import joblib
+
+from ai.pattern_recognition import AnomalyDetector, ChangePointState, PatternDetector, PopulationAnomalyModel
+
+
+def _series(seed=0):
+    rng = np.random.default_rng(seed)
+    values = list(10 + rng.normal(0, 0.5, 60))
+    values[30] += 6
+    values += list(11.5 + rng.normal(0, 0.5, 20))
+    timestamps = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(len(values))]
+    return values, timestamps
+
+
+def test_streaming_changes_match_across_incremental_calls():
+    values, timestamps = _series()
+    detector = AnomalyDetector()
+
+    full = detector.detect_sudden_changes(values, timestamps)
+
+    state, indices = None, []
+    for start in range(0, len(values), 7):
+        result = detector.detect_sudden_changes(values[start:start + 7], timestamps[start:start + 7], state=state)
+        state = ChangePointState.from_dict(result["state"].to_dict())
+        indices += [start + change["index"] for change in result.get("changes", [])]
+
+    assert indices == [change["index"] for change in full["changes"]]
+    spike = next(c for c in full["changes"] if c["index"] == 30)
+    assert spike["change_type"] == "spike" and spike["direction"] == "increase"
+    assert any(c["change_type"] == "shift" and c["index"] >= 60 for c in full["changes"])
+
+
+def test_population_model_scores_new_points_after_round_trip(tmp_path):
+    rng = np.random.default_rng(1)
+    population = [{"sentiment": v} for v in rng.normal(0, 0.2, 500)]
+    model = PopulationAnomalyModel(["sentiment"]).fit(population)
+    path = tmp_path / "anomaly.joblib"
+    model.save_model(str(path))
+    restored = PopulationAnomalyModel.load_model(str(path))
+
+    result = AnomalyDetector().detect_anomalies(
+        [{"sentiment": 0.05, "timestamp": "a"}, {"sentiment": -3.0, "timestamp": "b"}],
+        ["sentiment"],
+        population_model=restored
+    )
+
+    assert result["total_points"] == 2
+    assert [a["timestamp"] for a in result["anomalies"]] == ["b"]
+    assert result["anomalies"][0]["severity"] == "critical"
+
+
+def _profiles(centers, per_cluster, seed=2):
+    rng = np.random.default_rng(seed)
+    keys = ["avg_sentiment", "sentiment_variance", "session_frequency", "engagement_score", "symptom_severity"]
+    return [
+        dict(zip(keys, rng.normal(center, 0.05)))
+        for center in centers
+        for _ in range(per_cluster)
+    ]
+
+
+def test_large_population_clustering_selects_k_and_groups_members():
+    centers = [[-0.8, 0.1, 1, 0.2, 0.9], [0.0, 0.3, 3, 0.5, 0.5], [0.7, 0.1, 5, 0.9, 0.1]]
+    profiles = _profiles(centers, 400)
+
+    result = PatternDetector().cluster_large_population(
+        profiles, n_clusters=None, k_range=(2, 5), batch_size=256, silhouette_sample_size=500, n_jobs=1
+    )
+
+    assert result["n_clusters"] == 3
+    assert set(result["k_selection"]) == {"2", "3", "4", "5"}
+    assert result["silhouette_score"] > 0.6
+    members = [c["member_ids"] for c in result["clusters"].values()]
+    assert sorted(len(m) for m in members) == [400, 400, 400]
+    assert sorted(i for m in members for i in m) == list(range(1200))
+    for cluster in result["clusters"].values():
+        ids = cluster["member_ids"]
+        expected = np.mean([profiles[i]["avg_sentiment"] for i in ids])
+        assert cluster["characteristics"]["avg_sentiment"] == pytest.approx(expected)
+
+
+def test_large_population_k_selection_runs_in_parallel_by_default():
+    centers = [[-0.8, 0.1, 1, 0.2, 0.9], [0.7, 0.1, 5, 0.9, 0.1]]
+    profiles = _profiles(centers, 150)
+    detector = PatternDetector()
+
+    with patch("ai.pattern_recognition.joblib.Parallel", wraps=joblib.Parallel) as parallel:
+        result = detector.cluster_large_population(profiles, n_clusters=None, k_range=(2, 3))
+    serial = detector.cluster_large_population(profiles, n_clusters=None, k_range=(2, 3), n_jobs=1)
+
+    assert parallel.call_args.kwargs["n_jobs"] == -1
+    assert result["k_selection"] == serial["k_selection"]
+
+
+@pytest.mark.parametrize("length", [8, 11])
+def test_short_series_fall_back_to_batch_z_scores(length):
+    values = [10.0, 10.2, 9.9, 10.1, 16.0, 16.1, 15.9, 16.0, 16.2, 16.0, 15.9][:length]
+    timestamps = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(length)]
+    detector = AnomalyDetector()
+
+    result = detector.detect_sudden_changes(values, timestamps)
+
+    assert result["sufficient_data"] is True
+    assert [(c["index"], c["direction"]) for c in result["changes"]] == [(4, "increase")]
+
+    # A continued series is only scored once the streaming detector is warm
+    continued = detector.detect_sudden_changes([16.0], [timestamps[-1] + timedelta(days=1)],
+                                               state=result["state"])
+    assert continued["sufficient_data"] is (length + 1 > detector.change_detector.warmup + 1)
+
+
+def test_too_short_series_is_insufficient():
+    timestamps = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(4)]
+
+    assert AnomalyDetector().detect_sudden_changes([1.0, 2.0, 9.0, 2.0], timestamps)["sufficient_data"] is False
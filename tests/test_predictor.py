@@ -0,0 +1,59 @@
+"""
+Tests for batch prediction in ai.predictor
+"""
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+
+from ai.predictor import ClientFeatures, DropoutPredictor, OutcomePredictor, generate_synthetic_training_data
+
+
+def _clients(X):
+    return [
+        ClientFeatures(
+            age=int(row[0]), gender='male' if row[1] else 'female', baseline_severity=row[2],
+            diagnosis_code='F32.1', comorbidity_count=int(row[3]), sessions_attended=int(row[4]),
+            homework_completion_rate=row[5], therapeutic_alliance_score=row[6], medication_adherence=row[7],
+            current_severity=row[8], weeks_in_treatment=int(row[9]), missed_sessions=int(row[10]),
+            between_session_contacts=int(row[11]), crisis_contacts=int(row[12])
+        )
+        for row in X
+    ]
+
+
+def test_feature_matrix_matches_row_vectors():
+    X, _ = generate_synthetic_training_data(n_samples=20)
+    clients = _clients(X)
+
+    matrix = ClientFeatures.to_feature_matrix(clients)
+
+    assert matrix.shape == (20, len(ClientFeatures.get_feature_names()))
+    np.testing.assert_allclose(matrix, np.vstack([c.to_feature_vector() for c in clients]))
+
+
+def test_outcome_batch_matches_single_predictions():
+    X, y = generate_synthetic_training_data(n_samples=300)
+    predictor = OutcomePredictor(model_type='random_forest')
+    predictor.train(X, y)
+    clients = _clients(X[:25])
+
+    batch = predictor.predict_batch(clients)
+
+    assert [r.predicted_value for r in batch] == pytest.approx(
+        [predictor.predict_outcome(c).predicted_value for c in clients]
+    )
+    assert predictor.predict_batch([]) == []
+
+
+def test_dropout_batch_risk_levels():
+    X, y = generate_synthetic_training_data(n_samples=300)
+    labels = (y < np.median(y)).astype(int)
+    predictor = DropoutPredictor()
+    predictor.train(X, labels)
+
+    for result in predictor.predict_batch(_clients(X[:25])):
+        probability = result['dropout_probability']
+        expected = ('low' if probability < 0.2 else 'moderate' if probability < 0.5
+                    else 'high' if probability < 0.7 else 'very_high')
+        assert result['risk_level'] == expected
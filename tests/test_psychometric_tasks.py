@@ -0,0 +1,78 @@
+"""
+Tests for psychometric Celery task registration and anomaly model training
+"""
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("celery")
+pytest.importorskip("scipy")
+pytest.importorskip("sklearn")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.celery_worker import celery_app
+from app.db.models.psychometric_session import PsychometricSession, ProgressReport
+from app.tasks import psychometric_tasks as tasks
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://")
+    PsychometricSession.__table__.create(engine)
+    ProgressReport.__table__.create(engine)
+    factory = sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
+    with patch.object(tasks, "SessionLocal", factory):
+        yield factory
+    engine.dispose()
+
+
+def _add_sessions(factory, client_id, count, days_ago=1):
+    with factory() as db:
+        db.add_all([
+            PsychometricSession(
+                client_id=client_id,
+                session_date=datetime.utcnow() - timedelta(days=days_ago, hours=i),
+                session_type="therapy",
+                sentiment_analysis={"overall_score": (i % 5) / 5},
+                emotion_analysis={"dominant_emotion": "neutral"},
+            )
+            for i in range(count)
+        ])
+        db.commit()
+
+
+def test_tasks_are_registered_scheduled_and_routed():
+    celery_app.loader.import_default_modules()
+
+    for name in ("analyze_session_async", "generate_progress_report_async",
+                 "train_anomaly_model", "detect_anomalies_batch"):
+        assert name in celery_app.tasks
+    assert celery_app.conf.beat_schedule["train-anomaly-model"]["task"] == "train_anomaly_model"
+    assert celery_app.conf.task_routes["train_anomaly_model"] == {"queue": "maintenance"}
+
+
+def test_train_anomaly_model_publishes_fitted_model(session_factory):
+    _add_sessions(session_factory, "c1", 8)
+    _add_sessions(session_factory, "c2", 6)
+    _add_sessions(session_factory, "c3", 5, days_ago=120)
+
+    with patch.object(tasks.model_registry, "publish") as publish:
+        result = tasks.train_anomaly_model.apply(kwargs={"scope": "org1", "client_ids": ["c1", "c2", "c3"]}).get()
+
+    assert (result["status"], result["data_points"]) == ("success", 14)
+    name, model, version = publish.call_args.args
+    assert name == result["model"] == tasks.anomaly_model_name("org1", tasks.ANOMALY_FEATURES)
+    assert version == result["version"]
+
+
+def test_train_anomaly_model_skips_small_scopes(session_factory):
+    _add_sessions(session_factory, "c1", 9)
+
+    with patch.object(tasks.model_registry, "publish") as publish:
+        result = tasks.train_anomaly_model.apply().get()
+
+    assert result == {"status": "skipped", "scope": "all", "data_points": 9}
+    publish.assert_not_called()
@@ -0,0 +1,74 @@
+"""
+Tests for query plan signatures and baseline diffs
+"""
+from app.core.query_benchmark import (
+    QueryBenchmarkResult,
+    compare_to_baseline,
+    load_plan,
+    plan_signature,
+)
+
+
+INDEX_PLAN = [{
+    "Plan": {
+        "Node Type": "Limit",
+        "Plans": [{
+            "Node Type": "Index Scan",
+            "Parent Relationship": "Outer",
+            "Index Name": "idx_user_org_active",
+            "Relation Name": "users",
+        }],
+    },
+    "Execution Time": 0.4,
+}]
+
+SEQ_PLAN = [{
+    "Plan": {
+        "Node Type": "Limit",
+        "Plans": [{
+            "Node Type": "Seq Scan",
+            "Parent Relationship": "Outer",
+            "Relation Name": "users",
+        }],
+    },
+    "Execution Time": 12.0,
+}]
+
+
+def _result(raw_plan, execution_ms):
+    signature = plan_signature(load_plan(raw_plan))
+    return QueryBenchmarkResult(
+        name="org_members",
+        execution_ms=execution_ms,
+        plan_signature=signature,
+        plan_hash="|".join(signature),
+    )
+
+
+def _baseline(result):
+    return {"queries": {result.name: {
+        "plan_hash": result.plan_hash,
+        "plan_signature": result.plan_signature,
+        "execution_ms": result.execution_ms,
+    }}}
+
+
+def test_plan_signature_ignores_costs_and_timings():
+    assert plan_signature(load_plan(INDEX_PLAN)) == [
+        "Limit",
+        "  Index Scan using idx_user_org_active on users",
+    ]
+
+
+def test_plan_flip_and_slowdown_are_reported():
+    baseline = _baseline(_result(INDEX_PLAN, 0.4))
+
+    regressions = compare_to_baseline([_result(SEQ_PLAN, 12.0)], baseline)
+
+    assert {r.kind for r in regressions} == {"plan_changed", "slower"}
+
+
+def test_small_jitter_is_not_a_regression():
+    baseline = _baseline(_result(INDEX_PLAN, 0.4))
+
+    assert compare_to_baseline([_result(INDEX_PLAN, 0.9)], baseline) == []
@@ -0,0 +1,241 @@
+"""
+Tests for SQL fingerprinting and N+1 query detection
+"""
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app.core.monitoring import get_query_source, reset_query_source, set_query_source
+from app.core.query_monitor import (
+    DatabaseMonitor,
+    NPlusOneDetector,
+    NPlusOneError,
+    fingerprint_statement,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+    yield engine
+    engine.dispose()
+
+
+def test_fingerprint_strips_literals_and_collapses_lists():
+    assert fingerprint_statement(
+        "SELECT * FROM users WHERE id IN (1, 2, 3) AND name = 'o''brien'"
+    ) == "SELECT * FROM users WHERE id IN (...) AND name = ?"
+
+    assert fingerprint_statement(
+        "SELECT users.id FROM users WHERE users.id = %(id_1)s LIMIT %(param_1)s"
+    ) == fingerprint_statement(
+        "SELECT users.id FROM users WHERE users.id = 42 LIMIT 1"
+    )
+
+    assert fingerprint_statement(
+        "INSERT INTO t (a, b) VALUES ($1, $2), ($3, $4)"
+    ) == "INSERT INTO t (a, b) VALUES (?, ?), ..."
+
+
+def test_detector_flags_repeated_queries(engine, monkeypatch):
+    import app.core.query_monitor as query_monitor
+
+    detector = NPlusOneDetector(enabled=True, threshold=3, raise_on_violation=True)
+    monkeypatch.setattr(query_monitor, "n_plus_one_detector", detector)
+
+    with pytest.raises(NPlusOneError) as exc_info:
+        with detector.scope("GET /items"):
+            with engine.connect() as conn:
+                for item_id in range(5):
+                    conn.execute(text(f"SELECT name FROM items WHERE id = {item_id}"))
+
+    assert "5x in GET /items" in str(exc_info.value)
+    assert "test_query_monitor.py" in str(exc_info.value)
+
+
+def test_detector_ignores_distinct_queries(engine, monkeypatch):
+    import app.core.query_monitor as query_monitor
+
+    detector = NPlusOneDetector(enabled=True, threshold=3, raise_on_violation=True)
+    monkeypatch.setattr(query_monitor, "n_plus_one_detector", detector)
+
+    with detector.scope("GET /items"):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT name FROM items WHERE id IN (1, 2, 3, 4, 5)"))
+            conn.execute(text("SELECT count(*) FROM items"))
+
+    assert detector.violations == []
+
+
+def test_top_queries_aggregate_by_fingerprint():
+    monitor = DatabaseMonitor()
+    for item_id, duration in [(1, 0.01), (2, 0.03), (3, 0.02)]:
+        monitor.record_query(f"SELECT name FROM items WHERE id = {item_id}", duration, rows=1)
+    monitor.record_query("SELECT count(*) FROM items", 0.5, rows=1)
+    monitor.record_query("DELETE FROM items WHERE id = 9", 0.02, error=True)
+
+    top = {row['fingerprint']: row for row in monitor.get_top_queries()}
+    assert len(top) == 3
+
+    lookup = top["SELECT name FROM items WHERE id = ?"]
+    assert lookup['calls'] == 3
+    assert lookup['rows'] == 3
+    assert lookup['total_time'] == pytest.approx(0.06)
+    assert lookup['mean_time'] == pytest.approx(0.02)
+    assert lookup['max_time'] >= 0.03
+    assert lookup['sample'] == "SELECT name FROM items WHERE id = 1"
+
+    assert top["DELETE FROM items WHERE id = ?"]['errors'] == 1
+    assert monitor.get_stats()['distinct_fingerprints'] == 3
+
+
+def test_top_queries_ordering_and_limit():
+    monitor = DatabaseMonitor()
+    for item_id in range(4):
+        monitor.record_query(f"SELECT name FROM items WHERE id = {item_id}", 0.01)
+    monitor.record_query("SELECT count(*) FROM items", 0.5)
+
+    by_total = monitor.get_top_queries(order_by='total_time')
+    assert by_total[0]['fingerprint'] == "SELECT count(*) FROM items"
+
+    by_calls = monitor.get_top_queries(order_by='calls')
+    assert by_calls[0]['fingerprint'] == "SELECT name FROM items WHERE id = ?"
+
+    assert len(monitor.get_top_queries(limit=1)) == 1
+
+    with pytest.raises(ValueError):
+        monitor.get_top_queries(order_by='sources_count')
+
+    monitor.reset_fingerprints()
+    assert monitor.get_top_queries() == []
+
+
+def test_record_query_captures_source():
+    monitor = DatabaseMonitor()
+    monitor.record_query("SELECT 1", 0.01)
+
+    token = set_query_source("task app.tasks.scoring_scheduler.score_all")
+    try:
+        monitor.record_query("SELECT 2", 0.01)
+        monitor.record_query("SELECT 3", 0.01)
+    finally:
+        reset_query_source(token)
+
+    token = set_query_source(lambda: "GET /api/v1/teams/{team_id}")
+    try:
+        monitor.record_query("SELECT 4", 0.01)
+    finally:
+        reset_query_source(token)
+
+    assert get_query_source() == 'unknown'
+    [row] = monitor.get_top_queries()
+    assert row['calls'] == 4
+    assert row['sources'] == {
+        "task app.tasks.scoring_scheduler.score_all": 2,
+        'unknown': 1,
+        "GET /api/v1/teams/{team_id}": 1,
+    }
+    assert list(row['sources'])[0] == "task app.tasks.scoring_scheduler.score_all"
+
+
+def test_request_middleware_attributes_queries_to_route_template(monkeypatch):
+    import app.core.query_monitor as query_monitor
+    from app.core.monitoring import RequestMonitoringMiddleware
+
+    # Sync routes run in a threadpool; share the one in-memory database across threads
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+
+    monitor = DatabaseMonitor()
+    monkeypatch.setattr(query_monitor, "db_monitor", monitor)
+
+    app = FastAPI()
+    app.add_middleware(RequestMonitoringMiddleware)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        with engine.connect() as conn:
+            conn.execute(text(f"SELECT name FROM items WHERE id = {item_id}"))
+        return {}
+
+    with TestClient(app) as client:
+        assert client.get("/items/1").status_code == 200
+        assert client.get("/items/2").status_code == 200
+
+    [row] = [
+        row for row in monitor.get_top_queries()
+        if row['fingerprint'] == "SELECT name FROM items WHERE id = ?"
+    ]
+    assert row['sources'] == {"GET /items/{item_id}": 2}
+    engine.dispose()
+
+
+@pytest.fixture
+def admin_client(monkeypatch):
+    from app.api import deps
+    from app.api.v1.endpoints import admin
+
+    monitor = DatabaseMonitor()
+    monitor.record_query("SELECT name FROM items WHERE id = 1", 0.01)
+    monitor.record_query("SELECT name FROM items WHERE id = 2", 0.01)
+    monitor.record_query("SELECT count(*) FROM items", 0.5)
+    monkeypatch.setattr(admin, "db_monitor", monitor)
+
+    app = FastAPI()
+    app.include_router(admin.router, prefix="/api/v1/admin")
+    current = {}
+    app.dependency_overrides[deps.get_current_active_user] = lambda: current['user']
+
+    def client_for(**user):
+        current['user'] = SimpleNamespace(is_active=True, **user)
+        return TestClient(app)
+
+    client_for.monitor = monitor
+    return client_for
+
+
+def test_query_stats_requires_superuser(admin_client):
+    client = admin_client(is_superuser=False)
+
+    assert client.get("/api/v1/admin/db/query-stats").status_code == 403
+    assert client.delete("/api/v1/admin/db/query-stats").status_code == 403
+    assert len(admin_client.monitor.fingerprints) == 2
+
+
+def test_query_stats_requires_authentication():
+    from app.api.v1.endpoints import admin
+
+    app = FastAPI()
+    app.include_router(admin.router, prefix="/api/v1/admin")
+
+    response = TestClient(app).get("/api/v1/admin/db/query-stats")
+    assert response.status_code == 401
+
+
+def test_query_stats_for_superuser(admin_client):
+    client = admin_client(is_superuser=True)
+
+    response = client.get("/api/v1/admin/db/query-stats", params={"order_by": "calls", "limit": 1})
+    assert response.status_code == 200
+    body = response.json()
+    assert body['summary']['total_queries'] == 3
+    assert [row['fingerprint'] for row in body['queries']] == ["SELECT name FROM items WHERE id = ?"]
+    assert body['queries'][0]['calls'] == 2
+
+    assert client.get(
+        "/api/v1/admin/db/query-stats", params={"order_by": "sample"}
+    ).status_code == 422
+
+    assert client.delete("/api/v1/admin/db/query-stats").status_code == 204
+    assert admin_client.monitor.get_top_queries() == []
@@ -0,0 +1,55 @@
+"""
+Tests for the report rendering service
+"""
+import pytest
+
+pytest.importorskip("reportlab")
+pytest.importorskip("matplotlib")
+
+from app.services.report_rendering_service import ReportJob, ReportRenderingService
+
+
+def _progress_job(client_id, scores):
+    return ReportJob(
+        kind='client_progress',
+        label=client_id,
+        payload={
+            'client_info': {'client_id': client_id},
+            'assessment_scores': [{'date': f"2026-01-0{i + 1}", 'score': s} for i, s in enumerate(scores)],
+            'session_summary': {'total_sessions': len(scores)}
+        }
+    )
+
+
+def test_bulk_render_reuses_store_and_isolates_failures(tmp_path):
+    service = ReportRenderingService(output_dir=str(tmp_path), max_workers=2)
+    jobs = [_progress_job(f"client_{i}", [20 - i, 15, 10]) for i in range(4)]
+    jobs.append(ReportJob(kind='unknown', payload={}, label='bad'))
+    calls = []
+
+    first = service.render_bulk(jobs, progress=lambda done, total: calls.append((done, total)))
+    second = service.render_bulk(jobs[:4])
+
+    assert [r.label for r in first] == ['client_0', 'client_1', 'client_2', 'client_3', 'bad']
+    assert all(r.path and not r.cached for r in first[:4])
+    assert first[4].error and first[4].path is None
+    assert open(first[0].path, 'rb').read(4) == b'%PDF'
+    assert calls[-1] == (5, 5)
+    assert [r.path for r in second] == [r.path for r in first[:4]]
+    assert all(r.cached for r in second)
+    assert len(list((tmp_path / 'charts').rglob('*.png'))) == 4
+
+
+def _render_in_daemon(output_dir):
+    service = ReportRenderingService(output_dir=output_dir, max_workers=2)
+    return [r.path for r in service.render_bulk([_progress_job(f"client_{i}", [12, 9 - i]) for i in range(3)])]
+
+
+def test_bulk_render_runs_inside_daemonic_celery_worker(tmp_path):
+    billiard = pytest.importorskip("billiard")
+
+    with billiard.Pool(1) as pool:
+        paths = pool.apply(_render_in_daemon, (str(tmp_path),))
+
+    assert len(paths) == 3
+    assert all(open(path, 'rb').read(4) == b'%PDF' for path in paths)
@@ -0,0 +1,181 @@
+"""
+Tests for organization, month-end and export report tasks
+"""
+import csv
+from datetime import datetime
+from unittest.mock import MagicMock, PropertyMock, patch
+from uuid import UUID
+
+import pytest
+
+pytest.importorskip("celery")
+pytest.importorskip("reportlab")
+pytest.importorskip("matplotlib")
+
+from celery.backends.base import DisabledBackend
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.celery_worker import celery_app
+from app.db.models.assessment import AssessmentResponse, ResponseStatus
+from app.db.models.user import User  # noqa: F401 - resolves AssessmentResponse relationships
+from app.services.report_rendering_service import RenderedReport, ReportRenderingService
+from app.tasks import scoring_scheduler
+
+
+def _query(rows):
+    """Query chain mock whose filters and joins end in rows"""
+    query = MagicMock()
+    query.filter.return_value = query.join.return_value = query.order_by.return_value = query
+    query.all.return_value = rows
+    return query
+
+
+def _run(task, db, **kwargs):
+    with patch.object(scoring_scheduler, "SessionLocal", return_value=db):
+        return task.apply(kwargs=kwargs).get()
+
+
+@pytest.fixture
+def eager_chords():
+    """Eagerly applied chords join their header without a result store"""
+    backend = DisabledBackend(app=celery_app)
+    with patch.object(type(celery_app), "backend", new_callable=PropertyMock, return_value=backend):
+        yield
+
+
+def test_report_tasks_are_registered_scheduled_and_routed():
+    assert "app.tasks.scoring_scheduler" in celery_app.conf.include
+    for name in ("tasks.generate_organization_reports", "tasks.render_report_chunk",
+                 "tasks.summarize_organization_reports", "tasks.generate_month_end_reports",
+                 "tasks.export_assessment_responses"):
+        assert name in celery_app.tasks
+        assert celery_app.conf.task_routes[name] == {"queue": "reports"}
+    assert celery_app.conf.beat_schedule["generate-month-end-reports"]["task"] == "tasks.generate_month_end_reports"
+
+
+def test_organization_reports_fan_out_one_job_per_member_plus_summary(eager_chords):
+    members = [(1, "Ada"), (2, "Grace"), (3, "Linus")]
+    rows = [
+        (1, datetime(2026, 3, 1), {"total_score": 20}, "PHQ-9"),
+        (1, datetime(2026, 3, 15), {"total_score": 15}, "PHQ-9"),
+        (2, datetime(2026, 3, 2), None, "PHQ-9"),
+    ]
+    db = MagicMock()
+    db.query.side_effect = [_query(members), _query(rows)]
+
+    def render_bulk(jobs, progress, max_workers):
+        progress(len(jobs), len(jobs))
+        return [
+            RenderedReport(label=job.label, key=job.label, path=f"/reports/{job.label}.pdf",
+                           cached=job.label == "1", error="boom" if job.label == "3" else None)
+            for job in jobs
+        ]
+
+    with patch("app.services.report_rendering_service.report_rendering_service") as service, \
+            patch.object(scoring_scheduler.render_report_chunk, "update_state") as update_state:
+        service.render_bulk.side_effect = render_bulk
+        result = _run(scoring_scheduler.generate_organization_reports, db,
+                      organization_id="org1", chunk_size=3)
+
+    calls = service.render_bulk.call_args_list
+    assert [len(call.args[0]) for call in calls] == [3, 1]
+    assert all(call.kwargs["max_workers"] == 1 for call in calls)
+    jobs = [job for call in calls for job in call.args[0]]
+    assert [job.kind for job in jobs] == ["client_progress"] * 3 + ["outcome_summary"]
+    assert jobs[0].payload["assessment_scores"] == [
+        {"date": "2026-03-01", "assessment": "PHQ-9", "score": 20},
+        {"date": "2026-03-15", "assessment": "PHQ-9", "score": 15},
+    ]
+    assert jobs[-1].payload["summary_stats"] == {"total_clients": 3, "active_clients": 1, "avg_improvement": 25.0}
+    assert result == {
+        "status": "success",
+        "organization_id": "org1",
+        "total": 4,
+        "rendered": 2,
+        "cached": 1,
+        "failed": ["3"],
+        "summary_report": "/reports/organization:org1.pdf",
+    }
+    assert [call.kwargs["meta"] for call in update_state.call_args_list] == [
+        {"organization_id": "org1", "done": 3, "total": 3},
+        {"organization_id": "org1", "done": 1, "total": 1},
+    ]
+    db.close.assert_called_once()
+
+
+def test_organization_reports_render_through_the_real_service(eager_chords, tmp_path):
+    members = [(1, "Ada"), (2, "Grace")]
+    rows = [
+        (1, datetime(2026, 3, 1), {"total_score": 20}, "PHQ-9"),
+        (2, datetime(2026, 3, 2), {"total_score": 12}, "PHQ-9"),
+    ]
+    db = MagicMock()
+    db.query.side_effect = [_query(members), _query(rows)]
+    service = ReportRenderingService(output_dir=str(tmp_path), max_workers=3)
+
+    task = scoring_scheduler.generate_organization_reports
+    with patch("app.services.report_rendering_service.report_rendering_service", service), \
+            patch.object(scoring_scheduler.render_report_chunk, "update_state"):
+        result = _run(task, db, organization_id="org1", chunk_size=2)
+
+    assert (result["status"], result["total"], result["rendered"], result["failed"]) == ("success", 3, 3, [])
+    assert open(result["summary_report"], "rb").read(4) == b"%PDF"
+
+
+def test_month_end_reports_queue_every_organization():
+    db = MagicMock()
+    organization_id = UUID("6f1c2d1e-3a4b-4c5d-8e9f-0a1b2c3d4e5f")
+    db.query.return_value = _query([(organization_id,), (7,)])
+
+    with patch.object(scoring_scheduler.generate_organization_reports, "delay") as delay:
+        result = _run(scoring_scheduler.generate_month_end_reports, db)
+
+    assert result == {"status": "success", "organizations_queued": 2}
+    assert [call.args for call in delay.call_args_list] == [(str(organization_id),), ("7",)]
+
+
+@pytest.fixture
+def responses_db():
+    engine = create_engine("sqlite://")
+    AssessmentResponse.__table__.create(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        db.add_all([
+            AssessmentResponse(id=i, assessment_id=1 + i % 2, respondent_id=i, responses={"1": i},
+                               status=ResponseStatus.COMPLETED, completed_at=datetime(2026, 3, i))
+            for i in range(1, 6)
+        ])
+        db.commit()
+    yield factory
+    engine.dispose()
+
+
+def test_export_assessment_responses_streams_rows_to_csv(responses_db, tmp_path):
+    task = scoring_scheduler.export_assessment_responses
+    with patch.object(scoring_scheduler, "SessionLocal", responses_db), \
+            patch.object(scoring_scheduler.settings, "REPORT_OUTPUT_DIR", str(tmp_path)):
+        result = task.apply(kwargs={"assessment_id": 2}).get()
+        unsupported = task.apply(kwargs={"export_format": "json"}).get()
+
+    with open(result["file"]) as f:
+        rows = list(csv.DictReader(f))
+    assert (result["status"], result["format"], result["rows"]) == ("success", "csv", 3)
+    assert [row["id"] for row in rows] == ["1", "3", "5"]
+    assert rows[0]["status"] == ResponseStatus.COMPLETED.value
+    assert unsupported == {"status": "error", "message": "Unsupported export format: json"}
+
+
+def test_export_assessment_responses_writes_parquet_with_column_types(responses_db, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    task = scoring_scheduler.export_assessment_responses
+    with patch.object(scoring_scheduler, "SessionLocal", responses_db), \
+            patch.object(scoring_scheduler.settings, "REPORT_OUTPUT_DIR", str(tmp_path)):
+        result = task.apply(kwargs={"export_format": "parquet"}).get()
+
+    table = pq.read_table(result["file"])
+    assert result["rows"] == 5
+    assert str(table.schema.field("id").type) == "int64"
+    assert str(table.schema.field("scored_at").type) == "timestamp[us]"
+    assert table.column("status").to_pylist()[0] == ResponseStatus.COMPLETED.value
+    assert table.column("responses").to_pylist()[0] == '{"1": 1}'
@@ -0,0 +1,202 @@
+"""
+Clinical assessment scoring: fixed expected scores for the per-response
+score_* methods and score_batch, plus parity between the two paths
+"""
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.assessments.scoring_engine import INSTRUMENT_SPECS, ScoringEngine
+
+
+@pytest.fixture
+def engine():
+    return ScoringEngine()
+
+
+def _as_responses(row):
+    return {item: float(value) for item, value in enumerate(row, start=1) if not np.isnan(value)}
+
+
+def _as_row(spec, responses):
+    row = np.full(spec['n_items'], np.nan)
+    for item, value in responses.items():
+        row[item - 1] = value
+    return row
+
+
+def _assert_matches(score, batch, index):
+    expected = batch.row(index)
+    assert score.total_score == pytest.approx(expected['total_score'])
+    assert score.severity_level == expected['severity_level']
+    if score.subscale_scores:
+        assert score.subscale_scores == pytest.approx(expected['subscale_scores'])
+
+
+# (instrument, responses, total, severity, clinical significance, subscales),
+# worked from the published scoring rules; these match the per-instrument
+# implementations that predate score_batch
+EXPECTED_SCORES = [
+    ('phq9', {1: 3, 2: 2, 3: 1, 4: 0, 5: 2, 6: 1, 7: 3, 8: 0, 9: 1}, 13, "Moderate", "moderate", {}),
+    ('phq9', {1: 3, 2: 3, 3: 3, 4: 1}, 10, "Moderate", "moderate", {}),
+    ('phq9', {1: 3, 2: 3, 3: 3}, 9, "Mild", "mild", {}),
+    ('phq9', {1: 1, 2: 1}, 2, "None-Minimal", "none", {}),
+    ('gad7', {i: 2 for i in range(1, 8)}, 14, "Moderate", "moderate", {}),
+    ('gad7', {i: 3 for i in range(1, 8)}, 21, "Severe", "severe", {}),
+    ('dass21', {i: i % 4 for i in range(1, 22)}, 62, "Moderate", "moderate",
+     {'depression': 18, 'anxiety': 24, 'stress': 20}),
+    ('dass21', {3: 3, 5: 3, 10: 3, 13: 3, 16: 2}, 28, "Severe", "severe",
+     {'depression': 28, 'anxiety': 0, 'stress': 0}),
+    ('bdi', {i: i % 4 for i in range(1, 22)}, 31, "Severe", "severe", {}),
+    ('bdi', {i: 1 for i in range(1, 11)}, 10, "Minimal", "none", {}),
+    ('audit', {1: 2, 2: 1, 3: 1, 4: 0, 5: 1, 6: 0, 7: 1, 8: 1, 9: 2, 10: 0}, 9, "Hazardous Drinking", "moderate", {}),
+    ('audit', {1: 4, 2: 4}, 8, "Hazardous Drinking", "moderate", {}),
+    ('audit', {1: 4, 2: 3}, 7, "Low Risk", "none", {}),
+    ('audit', {1: 4, 2: 4, 3: 4, 4: 2, 5: 2, 6: 1, 7: 1, 8: 2, 9: 4, 10: 4}, 28, "Alcohol Dependence", "severe", {}),
+    ('ace', {1: 1, 2: 0, 3: 1, 4: 0, 5: 0, 6: 1, 7: 0, 8: 0, 9: 0, 10: 0}, 3, "Moderate ACE Exposure", "mild", {}),
+    ('ace', {1: 1, 2: 1, 3: 1, 4: 1}, 4, "High ACE Exposure", "severe", {}),
+    ('ace', {i: 1 for i in range(1, 11)}, 10, "High ACE Exposure", "severe", {}),
+    ('stai', {i: 1 + i % 4 for i in range(1, 41)}, 100, "Moderate Anxiety", "moderate",
+     {'state_anxiety': 50, 'trait_anxiety': 50}),
+    ('stai', {**{i: 1 for i in range(1, 21)}, **{i: 4 for i in range(21, 41)}}, 100, "High Anxiety", "severe",
+     {'state_anxiety': 20, 'trait_anxiety': 80}),
+    ('stai', {i: 2 for i in range(1, 21)}, 40, "Moderate Anxiety", "moderate",
+     {'state_anxiety': 40, 'trait_anxiety': 0}),
+    ('pcl5', {i: i % 5 for i in range(1, 21)}, 40, "Probable PTSD", "moderate",
+     {'intrusion': 10, 'avoidance': 3, 'negative_alterations': 17, 'arousal_reactivity': 10}),
+    ('pcl5', {i: 2 for i in range(1, 21)}, 40, "Probable PTSD", "moderate",
+     {'intrusion': 10, 'avoidance': 4, 'negative_alterations': 14, 'arousal_reactivity': 12}),
+    ('eq', {i: i % 3 for i in range(1, 41)}, 40, "Average Empathy", "none", {}),
+    ('eq', {i: 2 for i in range(1, 30)}, 58, "High Empathy", "none", {}),
+    ('iat', {i: 1 + i % 5 for i in range(1, 21)}, 60, "Frequent Problems", "moderate", {}),
+    ('iat', {i: 4 for i in range(1, 21)}, 80, "Significant Problems", "severe", {}),
+    ('pcq', {i: 1 + i % 6 for i in range(1, 25)}, 84, "Moderate PsyCap", "none",
+     {'hope': 21, 'efficacy': 21, 'resilience': 21, 'optimism': 21}),
+    ('pcq', {i: 5 for i in range(1, 25)}, 120, "High PsyCap", "none",
+     {'hope': 30, 'efficacy': 30, 'resilience': 30, 'optimism': 30}),
+    ('msi', {i: 1 for i in range(1, 151)}, 150, "Variable", "moderate", {}),
+]
+
+
+def test_expected_scores_cover_every_batch_instrument():
+    assert {case[0] for case in EXPECTED_SCORES} == set(INSTRUMENT_SPECS)
+
+
+@pytest.mark.parametrize(
+    "instrument,responses,total,severity,significance,subscales", EXPECTED_SCORES,
+    ids=[f"{case[0]}-{case[2]}" for case in EXPECTED_SCORES]
+)
+def test_scores_match_fixed_expectations(engine, instrument, responses, total, severity, significance, subscales):
+    score = engine.score_assessment(instrument, responses)
+
+    assert score.total_score == total
+    assert score.severity_level == severity
+    assert score.clinical_significance == significance
+    assert score.subscale_scores == subscales
+
+    batch = engine.score_batch(instrument, _as_row(INSTRUMENT_SPECS[instrument], responses)[np.newaxis, :])
+    row = batch.row(0)
+    assert row['total_score'] == total
+    assert row['severity_level'] == severity
+    assert row['clinical_significance'] == significance
+    for name, value in subscales.items():
+        assert row['subscale_scores'][name] == value
+
+
+@pytest.mark.parametrize("instrument", sorted(INSTRUMENT_SPECS))
+def test_matrix_and_dataframe_batches_agree(engine, instrument):
+    spec = INSTRUMENT_SPECS[instrument]
+    rng = np.random.default_rng(spec['n_items'])
+    matrix = rng.integers(0, 5, size=(50, spec['n_items'])).astype(float)
+    matrix[rng.random(matrix.shape) < 0.1] = np.nan
+
+    batch = engine.score_batch(instrument, matrix)
+    frame_batch = engine.score_batch(instrument, pd.DataFrame(matrix, columns=range(1, spec['n_items'] + 1)))
+
+    assert len(batch) == 50
+    np.testing.assert_array_equal(frame_batch.total_score, batch.total_score)
+    np.testing.assert_array_equal(frame_batch.severity_level, batch.severity_level)
+    for i, row in enumerate(matrix):
+        _assert_matches(engine.score_assessment(instrument, _as_responses(row)), batch, i)
+
+
+def _row_for_basis(spec, basis):
+    """A responses row whose severity basis (total or max subscale) equals ``basis``"""
+    row = np.zeros(spec['n_items'])
+    if spec['total'] == 'count_endorsed':
+        row[:int(basis)] = 1
+        return row
+
+    if spec.get('severity_basis') == 'max_subscale':
+        items = next(iter(spec['subscales'].values()))
+        basis = basis / spec.get('subscale_multiplier', 1)
+    elif spec['total'] == 'subscales':
+        items = [item for subscale in spec['subscales'].values() for item in subscale]
+    else:
+        items = spec.get('total_items', range(1, spec['n_items'] + 1))
+
+    for item in items:
+        value = min(basis, 6)
+        row[item - 1] = value
+        basis -= value
+    assert basis == 0
+    return row
+
+
+@pytest.mark.parametrize("instrument", sorted(k for k, v in INSTRUMENT_SPECS.items() if v['severity_cutoffs']))
+def test_severity_bands_switch_exactly_at_cutoffs(engine, instrument):
+    spec = INSTRUMENT_SPECS[instrument]
+    step = spec.get('subscale_multiplier', 1) if spec.get('severity_basis') == 'max_subscale' else 1
+
+    for band, cutoff in enumerate(spec['severity_cutoffs']):
+        below, at = _row_for_basis(spec, cutoff - step), _row_for_basis(spec, cutoff)
+        batch = engine.score_batch(instrument, np.vstack([below, at]))
+
+        assert list(batch.severity_level) == spec['severity_labels'][band:band + 2]
+        for i, row in enumerate((below, at)):
+            _assert_matches(engine.score_assessment(instrument, _as_responses(row)), batch, i)
+
+
+def test_reverse_scored_items_match_between_paths(engine):
+    spec = {**INSTRUMENT_SPECS['stai'], 'reverse_items': [1, 3, 21, 40], 'item_range': (1, 4)}
+    matrix = np.full((3, 40), 2.0)
+    matrix[0, [0, 2]] = [1, 4]     # reversed to 4 and 1
+    matrix[1, [20, 39]] = [4, 4]   # both reversed to 1
+    matrix[2, 0] = np.nan          # unanswered reversed item still scores 0
+
+    with patch.dict(INSTRUMENT_SPECS, {'stai': spec}):
+        batch = engine.score_batch('stai', matrix)
+        singles = [engine.score_stai(_as_responses(row)) for row in matrix]
+
+    # Reversed items score (1 + 4) - value, so an answered 2 becomes 3
+    assert batch.subscale_scores['state_anxiety'].tolist() == [4 + 1 + 18 * 2, 2 * 3 + 18 * 2, 3 + 18 * 2]
+    assert batch.subscale_scores['trait_anxiety'].tolist() == [2 * 3 + 18 * 2, 1 + 1 + 18 * 2, 2 * 3 + 18 * 2]
+    for i, score in enumerate(singles):
+        _assert_matches(score, batch, i)
+
+
+def test_string_item_keys_score_like_integer_keys(engine):
+    responses = {1: 3, 2: 2, 3: 1, 9: 1}
+
+    by_int = engine.score_phq9(responses)
+    by_str = engine.score_phq9({str(item): value for item, value in responses.items()})
+
+    assert (by_str.total_score, by_str.severity_level) == (by_int.total_score, by_int.severity_level) == (7, "Mild")
+    assert by_str.recommendations[0].startswith("⚠️ SUICIDE RISK")
+
+
+@pytest.mark.parametrize("item", [0, -1, "0", 10])
+def test_out_of_range_item_keys_are_rejected(engine, item):
+    # Item 0 used to wrap onto item 9 and raise a false suicide-risk alert
+    with pytest.raises(ValueError, match="between 1 and 9"):
+        engine.score_phq9({item: 1, 1: 1})
+
+
+def test_out_of_range_batch_columns_are_rejected(engine):
+    with pytest.raises(ValueError, match="between 1 and 21"):
+        engine.score_batch('dass21', pd.DataFrame([[1, 2]], columns=[0, 1]))
+
+    with pytest.raises(ValueError, match="at most 7"):
+        engine.score_batch('gad7', np.ones((2, 8)))
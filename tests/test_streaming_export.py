@@ -0,0 +1,96 @@
+"""
+Tests for the streaming exporters
+"""
+import csv
+from collections import namedtuple
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+from app.reports.generate_report import StreamingExporter, arrow_schema
+
+
+def _rows(n):
+    for i in range(n):
+        yield {'id': i, 'score': i * 0.5, 'answers': {'q1': i % 3}, 'completed_at': datetime(2026, 1, 1, tzinfo=timezone.utc)}
+
+
+def test_csv_streams_mapping_and_tuple_rows(tmp_path):
+    path = tmp_path / "responses.csv"
+
+    written = StreamingExporter.export_csv(_rows(2500), str(path), metadata={'source': 'test'}, chunk_size=100)
+
+    with open(path) as f:
+        lines = f.read().splitlines()
+    body = list(csv.reader(lines[4:]))
+    assert written == 2500
+    assert lines[0] == "# PsychSync Data Export"
+    assert body[0] == ['id', 'score', 'answers', 'completed_at']
+    assert body[-1][:3] == ['2499', '1249.5', '{"q1": 0}']
+
+    Row = namedtuple('Row', 'id score')
+    tuple_path = tmp_path / "tuples.csv"
+    assert StreamingExporter.export_csv((Row(i, i) for i in range(3)), str(tuple_path)) == 3
+    assert tuple_path.read_text().splitlines()[0] == "id,score"
+
+
+def test_excel_write_only_export(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    path = tmp_path / "responses.xlsx"
+
+    counts = StreamingExporter.export_excel({'Responses': _rows(50)}, str(path))
+
+    sheet = openpyxl.load_workbook(path)['Responses']
+    assert counts == {'Responses': 50}
+    assert sheet.max_row == 51
+    assert sheet.cell(row=51, column=3).value == '{"q1": 1}'
+
+
+def test_parquet_export_keeps_schema_across_chunks(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "responses.parquet"
+    rows = ({'id': i, 'note': None if i < 10 else f"n{i}"} for i in range(25))
+
+    written = StreamingExporter.export_parquet(rows, str(path), chunk_size=10)
+
+    parquet_file = pq.ParquetFile(path)
+    table = parquet_file.read()
+    assert written == 25
+    assert parquet_file.num_row_groups == 3
+    assert table.column('note').to_pylist()[-1] == "n24"
+
+
+def test_parquet_export_rejects_values_the_inferred_schema_would_truncate(tmp_path):
+    pytest.importorskip("pyarrow.parquet")
+    rows = [{'id': 1, 'score': 4}, {'id': 2, 'score': 5.5}]
+
+    with pytest.raises(ValueError, match="'score'"):
+        StreamingExporter.export_parquet(rows, str(tmp_path / "scores.parquet"), chunk_size=1)
+
+
+def test_parquet_export_uses_schema_from_statement_columns(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    from sqlalchemy import JSON, Boolean, Column, DateTime, Float, Integer, MetaData, Numeric, String, Table, select
+
+    scores = Table(
+        'scores', MetaData(),
+        Column('id', Integer), Column('score', Float), Column('weight', Numeric(5, 2)),
+        Column('label', String), Column('flagged', Boolean), Column('taken_at', DateTime), Column('answers', JSON)
+    )
+    schema = arrow_schema(select(scores))
+    rows = [
+        {'id': 1, 'score': 4, 'weight': None, 'label': None, 'flagged': None, 'taken_at': None, 'answers': None},
+        {'id': 2, 'score': 5.5, 'weight': 0.5, 'label': 'b', 'flagged': True,
+         'taken_at': datetime(2026, 1, 1), 'answers': {'q1': 2}},
+    ]
+
+    StreamingExporter.export_parquet(rows, str(tmp_path / "scores.parquet"), chunk_size=1, schema=schema)
+
+    table = pq.read_table(tmp_path / "scores.parquet")
+    assert [str(t) for t in table.schema.types] == [
+        'int64', 'double', 'double', 'string', 'bool', 'timestamp[us]', 'string'
+    ]
+    assert table.column('score').to_pylist() == [4.0, 5.5]
+    assert table.column('answers').to_pylist() == [None, '{"q1": 2}']
@@ -0,0 +1,115 @@
+"""
+Tests for outbound webhook delivery
+"""
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("flask")
+pytest.importorskip("schedule")
+
+from app.integrations.hris.webhook_scheduler import WebhookEndpoint, WebhookSender
+
+
+def _sender(handler, endpoints, **kwargs):
+    sender = WebhookSender(
+        webhook_urls=[endpoint.url for endpoint in endpoints],
+        secret_key="secret",
+        endpoints=endpoints,
+        transport=httpx.MockTransport(handler),
+        **kwargs
+    )
+    sender.engine.backoff_base = 0
+    return sender
+
+
+def test_batch_endpoint_receives_coalesced_events():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200)
+
+    sender = _sender(handler, [
+        WebhookEndpoint(url="https://batch.example/hook", supports_batch=True, max_batch_size=2),
+        WebhookEndpoint(url="https://single.example/hook"),
+    ])
+    try:
+        results = sender.send_webhooks([("employee.created", {"n": i}) for i in range(5)])
+    finally:
+        sender.close()
+
+    batch_bodies = [json.loads(r.content) for r in requests if r.url.host == "batch.example"]
+    single_bodies = [json.loads(r.content) for r in requests if r.url.host == "single.example"]
+
+    assert results == {
+        "https://batch.example/hook": {"delivered": 5, "failed": 0},
+        "https://single.example/hook": {"delivered": 5, "failed": 0},
+    }
+    assert sorted(body["count"] for body in batch_bodies) == [1, 2, 2]
+    assert len(single_bodies) == 5
+    event_ids = {body["event_id"] for body in single_bodies}
+    assert len(event_ids) == 5
+    assert event_ids == {e["event_id"] for body in batch_bodies for e in body["events"]}
+
+
+def test_transient_failures_are_retried():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request.headers["X-Webhook-Attempt"])
+        return httpx.Response(503 if len(attempts) < 3 else 200)
+
+    sender = _sender(handler, [WebhookEndpoint(url="https://flaky.example/hook")])
+    try:
+        result = sender.send_webhook("leave.requested", {"leave_id": "L1"})
+    finally:
+        sender.close()
+
+    assert result == {"https://flaky.example/hook": True}
+    assert attempts == ["1", "2", "3"]
+    assert sender.get_dead_letters() == []
+
+
+def test_exhausted_and_permanent_failures_are_dead_lettered():
+    calls = {"down.example": 0, "reject.example": 0}
+
+    def handler(request):
+        calls[request.url.host] += 1
+        return httpx.Response(500 if request.url.host == "down.example" else 400)
+
+    sender = _sender(handler, [
+        WebhookEndpoint(url="https://down.example/hook"),
+        WebhookEndpoint(url="https://reject.example/hook"),
+    ], max_retries=2)
+    try:
+        result = sender.enqueue_webhook("employee.created", {"employee_id": "E1"}).result(timeout=10)
+    finally:
+        sender.close()
+
+    dead = {letter.url: letter for letter in sender.get_dead_letters()}
+
+    assert result == {
+        "https://down.example/hook": {"delivered": 0, "failed": 1},
+        "https://reject.example/hook": {"delivered": 0, "failed": 1},
+    }
+    assert calls == {"down.example": 3, "reject.example": 1}
+    assert (dead["https://down.example/hook"].attempts, dead["https://down.example/hook"].last_error) == (3, "HTTP 500")
+    assert dead["https://reject.example/hook"].attempts == 1
+
+
+def test_dead_letter_store_keeps_only_the_newest_payloads():
+    sender = _sender(lambda request: httpx.Response(400), [WebhookEndpoint(url="https://reject.example/hook")],
+                     max_dead_letters=3)
+    try:
+        for i in range(5):
+            assert sender.send_webhook("employee.updated", {"n": i}) == {"https://reject.example/hook": False}
+    finally:
+        sender.close()
+
+    dead = sender.get_dead_letters()
+
+    assert len(dead) == 3
+    assert sender.engine.dropped_dead_letters == 2
+    assert [json.loads(letter.payload)["data"]["n"] for letter in dead] == [2, 3, 4]